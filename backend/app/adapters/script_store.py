@@ -0,0 +1,273 @@
+"""
+Script store - A job's script as separately addressable records
+
+``script.json`` holds the whole script (every section with its narration,
+segments and code paths) in one indented document, so looking at a section
+parses all of them and changing one field rewrites hundreds of KB for long
+scripts. The store keeps the same data split up inside the job directory:
+
+    script_store/meta.json          wrapper metadata (mode, languages), the
+                                    script fields other than its sections,
+                                    and the section ids in order
+    script_store/sections/<i>.json  one record per section
+
+Saving a whole script only rewrites the records whose content changed,
+updating a section writes that section's record, and reading one section
+reads one small file. ``export()`` produces the legacy ``script.json``
+(same shape as before, wrapped or not); it is written on whole-script saves
+and brought up to date after section updates on demand.
+
+New jobs use the store when SCRIPT_STORE_ENABLED is set; a job that has a
+store keeps using it either way, so its records never go stale.
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+SCRIPT_STORE_DIRNAME = "script_store"
+LEGACY_SCRIPT_FILENAME = "script.json"
+
+
+def script_store_enabled() -> bool:
+    """Whether new scripts are saved as records (SCRIPT_STORE_ENABLED, default off)"""
+    raw = os.getenv("SCRIPT_STORE_ENABLED")
+    if raw is None:
+        return False
+    return raw.strip().lower() in {"1", "true", "yes", "on"}
+
+
+def _dumps(data: Any) -> str:
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+
+
+def _write_atomic(path: Path, text: str) -> None:
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(text)
+    os.replace(tmp_path, path)
+
+
+def _read_text(path: Path) -> Optional[str]:
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return f.read()
+    except FileNotFoundError:
+        return None
+
+
+def _split_script(script: Dict[str, Any]) -> Tuple[Optional[Dict[str, Any]], Dict[str, Any]]:
+    """(wrapper fields or None, inner script) of a wrapped or unwrapped script."""
+    inner = script.get("script")
+    if isinstance(inner, dict) and ("sections" in inner or "title" in inner):
+        return {key: value for key, value in script.items() if key != "script"}, inner
+    return None, script
+
+
+def can_store(script: Any) -> bool:
+    """Whether ``script`` has the shape the store can split (dict with section dicts)."""
+    if not isinstance(script, dict):
+        return False
+    _, inner = _split_script(script)
+    sections = inner.get("sections", [])
+    return isinstance(sections, list) and all(isinstance(section, dict) for section in sections)
+
+
+class ScriptStore:
+    """A job's script as a metadata record plus one record per section."""
+
+    def __init__(self, job_dir: Path):
+        self.job_dir = Path(job_dir)
+        self.root = self.job_dir / SCRIPT_STORE_DIRNAME
+        self.meta_path = self.root / "meta.json"
+        self.sections_dir = self.root / "sections"
+        self.legacy_path = self.job_dir / LEGACY_SCRIPT_FILENAME
+
+    def exists(self) -> bool:
+        return self.meta_path.exists()
+
+    def section_path(self, index: int) -> Path:
+        return self.sections_dir / f"{index}.json"
+
+    # ------------------------------------------------------------------
+    # Writing
+    # ------------------------------------------------------------------
+
+    def save(self, script: Dict[str, Any], export: bool = True) -> int:
+        """Store a whole script; returns the number of section records rewritten.
+
+        Records whose content is unchanged are left alone; when nothing
+        changed at all the revision stays and the metadata is not rewritten.
+        With ``export`` the legacy ``script.json`` is rewritten as well (when
+        changed or stale).
+        """
+        if not can_store(script):
+            raise ValueError("Script cannot be split into section records")
+        wrapper, inner = _split_script(script)
+        sections: List[Dict[str, Any]] = inner.get("sections", [])
+        self.sections_dir.mkdir(parents=True, exist_ok=True)
+
+        written = removed = 0
+        for index, section in enumerate(sections):
+            text = _dumps(section)
+            path = self.section_path(index)
+            if _read_text(path) != text:
+                _write_atomic(path, text)
+                written += 1
+        for stale in self.sections_dir.glob("*.json"):
+            if not stale.stem.isdigit() or int(stale.stem) >= len(sections):
+                stale.unlink(missing_ok=True)
+                removed += 1
+
+        previous = self.load_meta() if self.exists() else None
+        content = {
+            "wrapper": wrapper,
+            # Sections keep their place in the key order for the export
+            "script": {key: (None if key == "sections" else value) for key, value in inner.items()},
+            "section_ids": [section.get("id") for section in sections],
+        }
+        changed = (
+            previous is None
+            or written
+            or removed
+            or any(_dumps(previous.get(key)) != _dumps(value) for key, value in content.items())
+        )
+        if changed:
+            previous = previous or {}
+            meta = {
+                **content,
+                "revision": previous.get("revision", 0) + 1,
+                "exported_revision": previous.get("exported_revision"),
+            }
+        else:
+            meta = previous
+
+        exporting = export and (
+            changed
+            or meta.get("exported_revision") != meta.get("revision")
+            or not self.legacy_path.exists()
+        )
+        if exporting:
+            self._export(self._assemble(meta, sections))
+            meta["exported_revision"] = meta["revision"]
+        if changed or exporting:
+            _write_atomic(self.meta_path, _dumps(meta))
+        return written
+
+    def update_section(self, index: int, fields: Dict[str, Any]) -> bool:
+        """Set ``fields`` on one section record.
+
+        Only that record is rewritten (the metadata too when the section id
+        changes). Returns False when the section is missing or nothing
+        changed. The legacy export is left stale until ``export()``.
+        """
+        section = self.load_section(index)
+        if section is None or all(section.get(key) == value for key, value in fields.items()):
+            return False
+        section.update(fields)
+        _write_atomic(self.section_path(index), _dumps(section))
+
+        meta = self.load_meta()
+        section_ids = meta.get("section_ids", [])
+        if "id" in fields and index < len(section_ids):
+            section_ids[index] = fields["id"]
+        meta["revision"] = meta.get("revision", 0) + 1
+        _write_atomic(self.meta_path, _dumps(meta))
+        return True
+
+    def update_script_fields(self, fields: Dict[str, Any]) -> bool:
+        """Set top-level script fields (title, ...) without touching sections."""
+        fields = {key: value for key, value in fields.items() if key != "sections"}
+        meta = self.load_meta()
+        inner = meta["script"]
+        if all(inner.get(key) == value for key, value in fields.items()):
+            return False
+        inner.update(fields)
+        meta["revision"] = meta.get("revision", 0) + 1
+        _write_atomic(self.meta_path, _dumps(meta))
+        return True
+
+    # ------------------------------------------------------------------
+    # Reading
+    # ------------------------------------------------------------------
+
+    def load_meta(self) -> Dict[str, Any]:
+        """The metadata record (raises FileNotFoundError without a store)."""
+        with open(self.meta_path, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    def section_count(self) -> int:
+        return len(self.load_meta().get("section_ids", []))
+
+    def load_section(self, index: int) -> Optional[Dict[str, Any]]:
+        """One section record, or None when there is no such section."""
+        if index < 0:
+            return None
+        text = _read_text(self.section_path(index))
+        return json.loads(text) if text is not None else None
+
+    def find_section(self, section_id: str) -> Optional[Tuple[int, Dict[str, Any]]]:
+        """(index, section) of the section with ``section_id``, reading only that record."""
+        section_ids = self.load_meta().get("section_ids", [])
+        if section_id not in section_ids:
+            return None
+        index = section_ids.index(section_id)
+        section = self.load_section(index)
+        return (index, section) if section is not None else None
+
+    def load_sections(self, count: Optional[int] = None) -> List[Dict[str, Any]]:
+        if count is None:
+            count = self.section_count()
+        sections = []
+        for index in range(count):
+            section = self.load_section(index)
+            if section is None:
+                raise FileNotFoundError(f"Missing section record {self.section_path(index)}")
+            sections.append(section)
+        return sections
+
+    def load(self) -> Dict[str, Any]:
+        """The whole script in the shape it was saved in (wrapped or not)."""
+        meta = self.load_meta()
+        return self._assemble(meta, self.load_sections(len(meta.get("section_ids", []))))
+
+    @staticmethod
+    def _assemble(meta: Dict[str, Any], sections: List[Dict[str, Any]]) -> Dict[str, Any]:
+        inner = dict(meta["script"])
+        if "sections" in inner:
+            inner["sections"] = sections
+        wrapper = meta.get("wrapper")
+        if wrapper is None:
+            return inner
+        return {"script": inner, **wrapper}
+
+    # ------------------------------------------------------------------
+    # Legacy export
+    # ------------------------------------------------------------------
+
+    def is_exported(self) -> bool:
+        """Whether ``script.json`` reflects the latest records."""
+        meta = self.load_meta()
+        return meta.get("exported_revision") == meta.get("revision") and self.legacy_path.exists()
+
+    def export(self, force: bool = False) -> bool:
+        """Write the legacy ``script.json`` if it is stale; returns True when written."""
+        meta = self.load_meta()
+        if not force and meta.get("exported_revision") == meta.get("revision") and self.legacy_path.exists():
+            return False
+        self._export(self._assemble(meta, self.load_sections(len(meta.get("section_ids", [])))))
+        meta["exported_revision"] = meta.get("revision")
+        _write_atomic(self.meta_path, _dumps(meta))
+        return True
+
+    def _export(self, script: Dict[str, Any]) -> None:
+        _write_atomic(self.legacy_path, json.dumps(script, indent=2, ensure_ascii=False))
+
+
+def uses_script_store(job_dir: Path) -> bool:
+    """Whether whole-script saves of a job go to its store.
+
+    Readers use the store whenever it exists and ``script.json`` otherwise.
+    """
+    return ScriptStore(job_dir).exists() or script_store_enabled()
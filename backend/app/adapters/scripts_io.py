@@ -3,22 +3,37 @@ Script file I/O utilities (adapter layer).
 
 Centralizes reading and writing of job script data. Kept outside core/ so
 infrastructure concerns stay separate from cross-cutting helpers.
+
+Jobs with a script store (see script_store) are read from and written to its
+records; the others use script.json.
 """
 
 import json
+import os
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Tuple
 
 from fastapi import HTTPException
 
 from app.config import OUTPUT_DIR
 
+from .script_store import ScriptStore, can_store, uses_script_store
+
 
 def _script_path(job_id: str) -> Path:
     """Construct the path to a job's script.json file."""
     return OUTPUT_DIR / job_id / "script.json"
 
 
+def _script_store(job_id: str) -> ScriptStore:
+    return ScriptStore(OUTPUT_DIR / job_id)
+
+
+def script_exists(job_id: str) -> bool:
+    """Whether a job has a script (store records or script.json)."""
+    return _script_store(job_id).exists() or _script_path(job_id).exists()
+
+
 def unwrap_script(script: Dict[str, Any]) -> Dict[str, Any]:
     """
     Unwrap a script from its wrapper format if necessary.
@@ -49,16 +64,7 @@ def load_script(job_id: str) -> Dict[str, Any]:
     
     Returns the unwrapped script with title, sections, etc. at top level.
     """
-    path = _script_path(job_id)
-    if not path.exists():
-        raise HTTPException(status_code=404, detail=f"Script not found for job {job_id}")
-
-    try:
-        with open(path, "r", encoding="utf-8") as f:
-            raw_script = json.load(f)
-        return unwrap_script(raw_script)
-    except json.JSONDecodeError as exc:
-        raise HTTPException(status_code=500, detail=f"Invalid script JSON: {exc}") from exc
+    return unwrap_script(load_script_raw(job_id))
 
 
 def load_script_raw(job_id: str) -> Dict[str, Any]:
@@ -67,25 +73,42 @@ def load_script_raw(job_id: str) -> Dict[str, Any]:
     
     Use this when you need access to metadata like mode, output_language, etc.
     """
-    path = _script_path(job_id)
+    store = _script_store(job_id)
+    path = store.meta_path if store.exists() else _script_path(job_id)
     if not path.exists():
         raise HTTPException(status_code=404, detail=f"Script not found for job {job_id}")
 
     try:
+        if store.exists():
+            return store.load()
         with open(path, "r", encoding="utf-8") as f:
             return json.load(f)
+    except FileNotFoundError as exc:
+        raise HTTPException(status_code=500, detail=f"Incomplete script store: {exc}") from exc
     except json.JSONDecodeError as exc:
         raise HTTPException(status_code=500, detail=f"Invalid script JSON: {exc}") from exc
 
 
 def save_script(job_id: str, script: Dict[str, Any]) -> None:
-    """Write script data to script.json file."""
+    """Write script data (store records and script.json, or script.json only)."""
+    job_dir = OUTPUT_DIR / job_id
+    if uses_script_store(job_dir) and can_store(script):
+        ScriptStore(job_dir).save(script)
+        return
     path = _script_path(job_id)
     path.parent.mkdir(parents=True, exist_ok=True)
     with open(path, "w", encoding="utf-8") as f:
         json.dump(script, f, indent=2)
 
 
+def export_script(job_id: str) -> bool:
+    """Bring a store-backed job's script.json up to date; True when rewritten."""
+    store = _script_store(job_id)
+    if not store.exists():
+        return False
+    return store.export()
+
+
 def get_script_metadata(script: Dict[str, Any]) -> Dict[str, Any]:
     """
     Extract common metadata fields from a script structure.
@@ -102,19 +125,83 @@ def get_script_metadata(script: Dict[str, Any]) -> Dict[str, Any]:
 
 
 def load_section_script(job_id: str, section_id: str) -> Dict[str, Any]:
-    """Load a specific section's data from a job's script.json."""
-    script = load_script(job_id)  # Already unwrapped
-    for section in script.get("sections", []):
-        if section.get("id") == section_id:
-            return section
+    """Load a specific section's data from a job's script."""
+    store = _script_store(job_id)
+    if store.exists():
+        found = store.find_section(section_id)
+        if found is not None:
+            return found[1]
+    else:
+        script = load_script(job_id)  # Already unwrapped
+        for section in script.get("sections", []):
+            if section.get("id") == section_id:
+                return section
     raise HTTPException(status_code=404, detail=f"Section {section_id} not found for job {job_id}")
 
 
+def load_script_section(job_id: str, section_index: int) -> Tuple[Dict[str, Any], int]:
+    """
+    Load one section of a job's script by index.
+
+    Returns ``(section, total_sections)``; a store-backed job only reads the
+    metadata and that section's record.
+    """
+    store = _script_store(job_id)
+    if store.exists():
+        total = store.section_count()
+        section = store.load_section(section_index) if section_index < total else None
+    else:
+        sections = load_script(job_id).get("sections", [])
+        total = len(sections)
+        section = sections[section_index] if 0 <= section_index < total else None
+    if section is None:
+        raise HTTPException(status_code=404, detail="Section not found")
+    return section, total
+
+
+def update_section_fields(job_id: str, section_id: str, fields: Dict[str, Any]) -> bool:
+    """
+    Set ``fields`` on one section of a job's script.
+
+    Store-backed jobs rewrite only that section's record (script.json is
+    brought up to date by ``export_script``). Otherwise the wrapper metadata
+    (mode, languages) is preserved, and the file is only rewritten
+    (atomically) when a value actually changes. Returns True when the script
+    was written; False when the script or section is missing or nothing
+    changed.
+    """
+    store = _script_store(job_id)
+    if store.exists():
+        found = store.find_section(section_id)
+        return found is not None and store.update_section(found[0], fields)
+
+    path = _script_path(job_id)
+    if not path.exists():
+        return False
+    raw_script = load_script_raw(job_id)
+    for section in unwrap_script(raw_script).get("sections", []):
+        if section.get("id") != section_id:
+            continue
+        if all(section.get(key) == value for key, value in fields.items()):
+            return False
+        section.update(fields)
+        tmp_path = path.with_suffix(".json.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(raw_script, f, indent=2)
+        os.replace(tmp_path, path)
+        return True
+    return False
+
+
 __all__ = [
     "load_script",
     "load_script_raw",
     "save_script",
+    "export_script",
+    "script_exists",
     "get_script_metadata",
     "load_section_script",
+    "load_script_section",
+    "update_section_fields",
     "unwrap_script",
 ]
@@ -7,8 +7,13 @@ These are not business logic, but rather infrastructure and common patterns.
 Organization:
     - logging.py: Structured logging configuration and utilities
     - security.py: Security utilities (sanitization, validation)
-    - files.py: File system operations and discovery
+    - files.py: File system operations, discovery and zero-copy placement
     - media.py: Media file utilities (duration, info)
+    - cancellation.py: Job-scoped cancellation and process-group control
+    - admission.py: Priority classes and fair-share render/LLM admission
+    - job_events.py: In-process job progress events for live streaming
+    - serialization.py: Fast JSON encoding/decoding and the default response class
+    - deadlines.py: Per-section and per-stage time budgets
     - scripts.py: Script file I/O for jobs
     - validation.py: Input validation utilities
 
@@ -26,6 +31,63 @@ from .logging import (
     LogTimer,
 )
 
+# Cancellation
+from .cancellation import (
+    CancellationToken,
+    JobCancelledError,
+    get_cancellation_registry,
+    cancel_job,
+    get_current_token,
+    bind_cancellation_token,
+    raise_if_cancelled,
+    track_process,
+    kill_process_tree,
+    run_process,
+    run_process_async,
+)
+
+# Priority admission
+from .admission import (
+    PriorityClass,
+    AdmissionController,
+    parse_priority,
+    priority_scope,
+    get_current_priority,
+    get_render_admission,
+    get_llm_admission,
+)
+
+# Job progress events
+from .job_events import (
+    JobEvent,
+    JobEventBus,
+    JobEventSubscription,
+    get_job_event_bus,
+    publish_job_event,
+    format_sse,
+)
+
+# JSON serialization
+from .serialization import (
+    FastJSONResponse,
+    dumps_json,
+    dumps_json_bytes,
+    json_backend,
+    loads_json,
+    read_json,
+    write_json,
+)
+
+# Deadlines
+from .deadlines import (
+    Deadline,
+    DeadlineExceededError,
+    deadline_scope,
+    get_current_deadline,
+    remaining_budget,
+    run_with_deadline,
+)
+
 # Security
 from .security import (
     sanitize_filename,
@@ -58,6 +120,7 @@ from .files import (
     find_file_by_id,
     ensure_directory,
     get_file_extension,
+    place_file,
 )
 
 # Media utilities
@@ -71,8 +134,12 @@ from .scripts import (
     load_script,
     load_script_raw,
     save_script,
+    export_script,
+    script_exists,
     get_script_metadata,
     load_section_script,
+    load_script_section,
+    update_section_fields,
     unwrap_script,
 )
 
@@ -137,6 +204,48 @@ __all__ = [
     "set_job_id",
     "clear_context",
     "LogTimer",
+    # Cancellation
+    "CancellationToken",
+    "JobCancelledError",
+    "get_cancellation_registry",
+    "cancel_job",
+    "get_current_token",
+    "bind_cancellation_token",
+    "raise_if_cancelled",
+    "track_process",
+    "kill_process_tree",
+    "run_process",
+    "run_process_async",
+    # Priority admission
+    "PriorityClass",
+    "AdmissionController",
+    "parse_priority",
+    "priority_scope",
+    "get_current_priority",
+    "get_render_admission",
+    "get_llm_admission",
+    # Job progress events
+    "JobEvent",
+    "JobEventBus",
+    "JobEventSubscription",
+    "get_job_event_bus",
+    "publish_job_event",
+    "format_sse",
+    # JSON serialization
+    "FastJSONResponse",
+    "dumps_json",
+    "dumps_json_bytes",
+    "json_backend",
+    "loads_json",
+    "read_json",
+    "write_json",
+    # Deadlines
+    "Deadline",
+    "DeadlineExceededError",
+    "deadline_scope",
+    "get_current_deadline",
+    "remaining_budget",
+    "run_with_deadline",
     # Security
     "sanitize_filename",
     "validate_job_id",
@@ -159,6 +268,7 @@ __all__ = [
     "find_file_by_id",
     "ensure_directory",
     "get_file_extension",
+    "place_file",
     # Media
     "get_media_duration",
     "get_video_info",
@@ -166,8 +276,12 @@ __all__ = [
     "load_script",
     "load_script_raw",
     "save_script",
+    "export_script",
+    "script_exists",
     "get_script_metadata",
     "load_section_script",
+    "load_script_section",
+    "update_section_fields",
     "unwrap_script",
     # Validation
     "validate_file_type",
@@ -0,0 +1,215 @@
+"""
+Priority admission - Fair-share access to render and LLM capacity
+
+Work is tagged with a PriorityClass (interactive, normal, bulk). Shared
+AdmissionControllers hand out render and LLM slots:
+- waiting interactive work is admitted before normal, normal before bulk
+- interactive work may burst above capacity so a single-section fix never
+  waits behind a full job's renders
+- bulk work may hold at most a fixed share of the slots
+
+The current priority is carried in a context variable, so everything spawned
+for a job (section tasks, LLM calls) inherits it.
+"""
+
+import asyncio
+import os
+import threading
+from collections import deque
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from enum import Enum
+from typing import Any, Deque, Dict, Optional
+
+from .logging import get_logger
+
+logger = get_logger(__name__, component="admission")
+
+
+class PriorityClass(str, Enum):
+    """Scheduling class of a job or sub-task"""
+    INTERACTIVE = "interactive"  # editor actions: fix, regenerate, recompile
+    NORMAL = "normal"            # full video generation
+    BULK = "bulk"                # batch work, capped share of capacity
+
+
+# Admission order when several classes are waiting
+_ADMISSION_ORDER = (PriorityClass.INTERACTIVE, PriorityClass.NORMAL, PriorityClass.BULK)
+
+_current_priority: ContextVar[PriorityClass] = ContextVar(
+    "priority_class", default=PriorityClass.NORMAL
+)
+
+
+def parse_priority(value: Any, default: PriorityClass = PriorityClass.NORMAL) -> PriorityClass:
+    """Parse a priority class name, falling back to ``default``"""
+    if isinstance(value, PriorityClass):
+        return value
+    try:
+        return PriorityClass(str(value).strip().lower())
+    except ValueError:
+        return default
+
+
+def get_current_priority() -> PriorityClass:
+    return _current_priority.get()
+
+
+@contextmanager
+def priority_scope(priority: Any):
+    """Run the enclosed block (and tasks it creates) under ``priority``"""
+    reset = _current_priority.set(parse_priority(priority))
+    try:
+        yield _current_priority.get()
+    finally:
+        _current_priority.reset(reset)
+
+
+def _env_int(name: str, default: int, minimum: int) -> int:
+    raw = os.getenv(name)
+    if raw is None:
+        return default
+    try:
+        return max(int(raw), minimum)
+    except (TypeError, ValueError):
+        return default
+
+
+def _env_float(name: str, default: float, minimum: float, maximum: float) -> float:
+    raw = os.getenv(name)
+    if raw is None:
+        return default
+    try:
+        return min(max(float(raw), minimum), maximum)
+    except (TypeError, ValueError):
+        return default
+
+
+class AdmissionController:
+    """Priority-aware counting semaphore with a bulk share cap.
+
+    Must be used from a single event loop.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        capacity: int,
+        bulk_share: float = 0.5,
+        interactive_burst: int = 1,
+    ):
+        self.name = name
+        self.capacity = max(1, capacity)
+        self.bulk_limit = max(1, int(self.capacity * bulk_share))
+        self.interactive_burst = max(0, interactive_burst)
+        self._active: Dict[PriorityClass, int] = {p: 0 for p in PriorityClass}
+        self._waiters: Dict[PriorityClass, Deque[asyncio.Future]] = {
+            p: deque() for p in PriorityClass
+        }
+
+    @property
+    def active(self) -> int:
+        return sum(self._active.values())
+
+    def _limit_for(self, priority: PriorityClass) -> int:
+        if priority == PriorityClass.INTERACTIVE:
+            return self.capacity + self.interactive_burst
+        return self.capacity
+
+    def _can_admit(self, priority: PriorityClass) -> bool:
+        if self.active >= self._limit_for(priority):
+            return False
+        if priority == PriorityClass.BULK and self._active[PriorityClass.BULK] >= self.bulk_limit:
+            return False
+        return True
+
+    def _dispatch(self) -> None:
+        """Grant free slots to waiters, highest class first, FIFO within a class"""
+        for priority in _ADMISSION_ORDER:
+            waiters = self._waiters[priority]
+            while waiters and self._can_admit(priority):
+                future = waiters.popleft()
+                if future.done():
+                    continue
+                self._active[priority] += 1
+                future.set_result(None)
+            if waiters:
+                # A blocked higher class keeps lower classes from overtaking it,
+                # except bulk blocked only by its own share cap
+                if priority != PriorityClass.BULK:
+                    return
+
+    async def acquire(self, priority: Optional[PriorityClass] = None) -> PriorityClass:
+        priority = parse_priority(priority or get_current_priority())
+        future = asyncio.get_running_loop().create_future()
+        self._waiters[priority].append(future)
+        self._dispatch()
+
+        if not future.done():
+            logger.debug(f"Waiting for {self.name} slot", extra={
+                "priority": priority.value,
+                "active": self.active,
+                "capacity": self.capacity,
+            })
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                self.release(priority)
+            else:
+                try:
+                    self._waiters[priority].remove(future)
+                except ValueError:
+                    pass
+            raise
+        return priority
+
+    def release(self, priority: PriorityClass) -> None:
+        self._active[priority] = max(0, self._active[priority] - 1)
+        self._dispatch()
+
+    @asynccontextmanager
+    async def slot(self, priority: Optional[PriorityClass] = None):
+        """Hold one slot for the duration of the block"""
+        granted = await self.acquire(priority)
+        try:
+            yield granted
+        finally:
+            self.release(granted)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "capacity": self.capacity,
+            "bulk_limit": self.bulk_limit,
+            "active": {p.value: n for p, n in self._active.items()},
+            "waiting": {p.value: len(w) for p, w in self._waiters.items()},
+        }
+
+
+_controllers: Dict[str, AdmissionController] = {}
+_controllers_lock = threading.Lock()
+
+
+def _get_controller(name: str, capacity_env: str, default_capacity: int) -> AdmissionController:
+    with _controllers_lock:
+        controller = _controllers.get(name)
+        if controller is None:
+            controller = AdmissionController(
+                name,
+                capacity=_env_int(capacity_env, default_capacity, 1),
+                bulk_share=_env_float("BULK_CAPACITY_SHARE", 0.5, 0.0, 1.0),
+                interactive_burst=_env_int("INTERACTIVE_BURST_SLOTS", 1, 0),
+            )
+            _controllers[name] = controller
+        return controller
+
+
+def get_render_admission() -> AdmissionController:
+    """Shared admission for Manim renders / dry-runs and heavy ffmpeg encodes"""
+    return _get_controller("render", "RENDER_CONCURRENCY", os.cpu_count() or 4)
+
+
+def get_llm_admission() -> AdmissionController:
+    """Shared admission for LLM requests"""
+    return _get_controller("llm", "LLM_CONCURRENCY", 16)
@@ -0,0 +1,337 @@
+"""
+Job-scoped cancellation - Cooperative cancellation for long-running jobs
+
+A CancellationToken is opened per job and bound to the current async context,
+so every stage spawned for that job (section tasks, render threads) observes
+the same token without threading it through each call signature.
+
+Cancelling a token:
+- cancels the asyncio tasks started through ``token.run()``
+- kills the process group of every tracked subprocess (manim, ffmpeg, ...)
+- makes ``raise_if_cancelled()`` / ``run_process()`` raise JobCancelledError
+"""
+
+import asyncio
+import os
+import signal
+import subprocess
+import sys
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Set, TypeVar
+
+from .exceptions import EduVizError
+from .logging import get_logger
+
+logger = get_logger(__name__, component="cancellation")
+
+T = TypeVar("T")
+
+_current_token: ContextVar[Optional["CancellationToken"]] = ContextVar(
+    "cancellation_token", default=None
+)
+
+
+class JobCancelledError(EduVizError):
+    """Raised when work is abandoned because its job was cancelled."""
+
+    def __init__(self, job_id: Optional[str], reason: Optional[str] = None):
+        self.job_id = job_id
+        self.reason = reason or "cancelled"
+        super().__init__(f"Job {job_id} cancelled: {self.reason}")
+
+
+def _process_group_kwargs() -> Dict[str, Any]:
+    """Popen kwargs that start the child in its own process group."""
+    if sys.platform == "win32":
+        return {"creationflags": subprocess.CREATE_NEW_PROCESS_GROUP}
+    return {"start_new_session": True}
+
+
+def kill_process_tree(process: Any) -> None:
+    """Kill a subprocess together with every child it spawned.
+
+    Accepts both ``subprocess.Popen`` and ``asyncio.subprocess.Process``.
+    Processes started with ``_process_group_kwargs()`` lead their own group,
+    so killing the group also reaps LaTeX/ffmpeg children spawned by manim.
+    """
+    if getattr(process, "returncode", None) is not None:
+        return
+    pid = getattr(process, "pid", None)
+    try:
+        if sys.platform == "win32":
+            if isinstance(pid, int):
+                subprocess.run(
+                    ["taskkill", "/F", "/T", "/PID", str(pid)],
+                    capture_output=True,
+                    timeout=10,
+                )
+            else:
+                process.kill()
+        elif isinstance(pid, int):
+            os.killpg(pid, signal.SIGKILL)
+        else:
+            process.kill()
+    except ProcessLookupError:
+        pass
+    except Exception as e:
+        logger.warning(f"Failed to kill process {pid}: {e}")
+
+
+class CancellationToken:
+    """Cancellation state shared by all work belonging to a single job."""
+
+    def __init__(self, job_id: Optional[str] = None):
+        self.job_id = job_id
+        self.reason: Optional[str] = None
+        self._event = threading.Event()
+        self._lock = threading.Lock()
+        self._processes: Set[Any] = set()
+        self._tasks: Set[asyncio.Task] = set()
+
+    @property
+    def is_cancelled(self) -> bool:
+        return self._event.is_set()
+
+    def cancel(self, reason: str = "cancelled") -> bool:
+        """Cancel the job. Safe to call from any thread, idempotent.
+
+        Returns:
+            True if this call cancelled the token, False if it already was.
+        """
+        with self._lock:
+            if self._event.is_set():
+                return False
+            self.reason = reason
+            self._event.set()
+            processes = list(self._processes)
+            tasks = list(self._tasks)
+
+        logger.info(f"Cancelling job {self.job_id}: {reason}", extra={
+            "job_id": self.job_id,
+            "reason": reason,
+            "processes": len(processes),
+            "tasks": len(tasks),
+        })
+
+        for process in processes:
+            kill_process_tree(process)
+        for task in tasks:
+            if not task.done():
+                task.get_loop().call_soon_threadsafe(task.cancel)
+        return True
+
+    def raise_if_cancelled(self) -> None:
+        if self._event.is_set():
+            raise JobCancelledError(self.job_id, self.reason)
+
+    @contextmanager
+    def track(self, process: Any):
+        """Register a running subprocess so cancellation can kill it.
+
+        If the token is already cancelled the process is killed immediately.
+        """
+        with self._lock:
+            cancelled = self._event.is_set()
+            if not cancelled:
+                self._processes.add(process)
+        if cancelled:
+            kill_process_tree(process)
+        try:
+            yield process
+        finally:
+            with self._lock:
+                self._processes.discard(process)
+
+    async def run(self, awaitable: Awaitable[T]) -> T:
+        """Await work in a child task that is cancelled with the token.
+
+        Raises:
+            JobCancelledError: if the token is cancelled before or while
+                the work runs.
+        """
+        self.raise_if_cancelled()
+        task = asyncio.ensure_future(awaitable)
+        with self._lock:
+            self._tasks.add(task)
+        try:
+            return await task
+        except asyncio.CancelledError:
+            current = asyncio.current_task()
+            if self.is_cancelled and not (current and current.cancelling()):
+                raise JobCancelledError(self.job_id, self.reason) from None
+            raise
+        finally:
+            with self._lock:
+                self._tasks.discard(task)
+
+
+class CancellationRegistry:
+    """Process-wide map of job_id -> CancellationToken for in-flight jobs."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._tokens: Dict[str, CancellationToken] = {}
+
+    def open(self, job_id: str) -> CancellationToken:
+        """Return the live token for a job, replacing a cancelled one."""
+        with self._lock:
+            token = self._tokens.get(job_id)
+            if token is None or token.is_cancelled:
+                token = CancellationToken(job_id)
+                self._tokens[job_id] = token
+            return token
+
+    def get(self, job_id: str) -> Optional[CancellationToken]:
+        with self._lock:
+            return self._tokens.get(job_id)
+
+    def release(self, token: CancellationToken) -> None:
+        """Forget a token once its job has finished running."""
+        with self._lock:
+            if self._tokens.get(token.job_id) is token:
+                del self._tokens[token.job_id]
+
+    def cancel(self, job_id: str, reason: str = "cancelled") -> bool:
+        """Cancel a running job. Returns False if the job is not running."""
+        token = self.get(job_id)
+        if token is None:
+            return False
+        return token.cancel(reason)
+
+    def cancel_all(self, reason: str = "shutdown") -> int:
+        with self._lock:
+            tokens = list(self._tokens.values())
+        return sum(1 for token in tokens if token.cancel(reason))
+
+
+_registry = CancellationRegistry()
+
+
+def get_cancellation_registry() -> CancellationRegistry:
+    return _registry
+
+
+def cancel_job(job_id: str, reason: str = "cancelled") -> bool:
+    """Cancel the in-flight work of a job, if any."""
+    return _registry.cancel(job_id, reason)
+
+
+def get_current_token() -> Optional[CancellationToken]:
+    return _current_token.get()
+
+
+@contextmanager
+def bind_cancellation_token(token: Optional[CancellationToken]):
+    """Make ``token`` the current token for this context (and child tasks)."""
+    reset = _current_token.set(token)
+    try:
+        yield token
+    finally:
+        _current_token.reset(reset)
+
+
+def raise_if_cancelled() -> None:
+    """Raise JobCancelledError if the current job has been cancelled."""
+    token = _current_token.get()
+    if token is not None:
+        token.raise_if_cancelled()
+
+
+@contextmanager
+def track_process(process: Any, token: Optional[CancellationToken] = None):
+    """Track an already-started subprocess against the current token.
+
+    The process is also killed if the block exits with an exception (for
+    example a timeout or asyncio cancellation) while it is still running.
+    """
+    token = token or _current_token.get()
+    try:
+        if token is None:
+            yield process
+        else:
+            with token.track(process):
+                yield process
+    except BaseException:
+        kill_process_tree(process)
+        raise
+
+
+def run_process(
+    cmd: Sequence[str],
+    *,
+    timeout: Optional[float] = None,
+    token: Optional[CancellationToken] = None,
+    capture_output: bool = False,
+    text: bool = False,
+    check: bool = False,
+    _on_start: Optional[Callable[[subprocess.Popen], None]] = None,
+    **popen_kwargs: Any,
+) -> subprocess.CompletedProcess:
+    """Cancellable drop-in for ``subprocess.run``.
+
+    The child runs in its own process group; on timeout or cancellation the
+    whole group is killed rather than just the direct child.
+
+    Raises:
+        subprocess.TimeoutExpired: if ``timeout`` elapses.
+        subprocess.CalledProcessError: if ``check`` and the exit code is non-zero.
+        JobCancelledError: if the token is cancelled before or during the run.
+    """
+    token = token or _current_token.get()
+    if token is not None:
+        token.raise_if_cancelled()
+
+    if capture_output:
+        popen_kwargs["stdout"] = subprocess.PIPE
+        popen_kwargs["stderr"] = subprocess.PIPE
+    popen_kwargs.update(_process_group_kwargs())
+
+    with subprocess.Popen(cmd, text=text, **popen_kwargs) as process:
+        if _on_start is not None:
+            _on_start(process)
+        with track_process(process, token):
+            try:
+                stdout, stderr = process.communicate(timeout=timeout)
+            except subprocess.TimeoutExpired:
+                kill_process_tree(process)
+                process.communicate()
+                raise
+        retcode = process.poll()
+
+    if token is not None:
+        token.raise_if_cancelled()
+
+    if check and retcode:
+        raise subprocess.CalledProcessError(retcode, cmd, output=stdout, stderr=stderr)
+    return subprocess.CompletedProcess(cmd, retcode, stdout, stderr)
+
+
+async def run_process_async(
+    cmd: Sequence[str],
+    *,
+    timeout: Optional[float] = None,
+    token: Optional[CancellationToken] = None,
+    **kwargs: Any,
+) -> subprocess.CompletedProcess:
+    """Run ``run_process`` in a worker thread.
+
+    Uses a thread rather than asyncio subprocesses to avoid ProactorEventLoop
+    issues on Windows. If the awaiting task is cancelled the child process
+    group is killed instead of being left to run in the background.
+    """
+    started: List[subprocess.Popen] = []
+    try:
+        return await asyncio.to_thread(
+            run_process,
+            cmd,
+            timeout=timeout,
+            token=token or _current_token.get(),
+            _on_start=started.append,
+            **kwargs,
+        )
+    except asyncio.CancelledError:
+        for process in started:
+            kill_process_tree(process)
+        raise
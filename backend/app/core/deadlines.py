@@ -0,0 +1,125 @@
+"""
+Deadlines - Per-section and per-stage time budgets
+
+A Deadline is opened per section and bound to the current async context (like
+the cancellation token), so every stage of that section - LLM calls, dry-runs,
+Vision QC - can bound its own wait by the time the section has left.
+
+Stages run through ``run_with_deadline()``, which enforces the smaller of the
+stage budget and the remaining section budget and raises
+DeadlineExceededError on expiry. Callers decide how to degrade.
+"""
+
+import asyncio
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Awaitable, Optional, TypeVar
+
+from .exceptions import PipelineError
+from .logging import get_logger
+
+logger = get_logger(__name__, component="deadlines")
+
+T = TypeVar("T")
+
+_current_deadline: ContextVar[Optional["Deadline"]] = ContextVar(
+    "deadline", default=None
+)
+
+
+class DeadlineExceededError(PipelineError):
+    """Raised when a stage or section runs out of its time budget."""
+
+    def __init__(self, stage: str, budget: Optional[float] = None):
+        self.stage = stage
+        self.budget = budget
+        detail = f" ({budget:.0f}s budget)" if budget is not None else ""
+        super().__init__(f"Deadline exceeded in stage '{stage}'{detail}")
+
+
+class Deadline:
+    """An absolute point in (monotonic) time by which work must finish."""
+
+    def __init__(self, seconds: float, name: str = "deadline"):
+        self.name = name
+        self.seconds = seconds
+        self.expires_at = time.monotonic() + seconds
+
+    def remaining(self) -> float:
+        return max(self.expires_at - time.monotonic(), 0.0)
+
+    @property
+    def expired(self) -> bool:
+        return time.monotonic() >= self.expires_at
+
+    def bound(self, seconds: Optional[float]) -> float:
+        """The smaller of ``seconds`` and the remaining budget"""
+        remaining = self.remaining()
+        return remaining if seconds is None else min(seconds, remaining)
+
+
+def get_current_deadline() -> Optional[Deadline]:
+    return _current_deadline.get()
+
+
+@contextmanager
+def deadline_scope(seconds: Optional[float], name: str = "deadline"):
+    """Bind a deadline for the enclosed block (and tasks it creates).
+
+    A nested scope never extends an outer one. ``seconds=None`` or ``<= 0``
+    leaves the current deadline unchanged.
+    """
+    outer = _current_deadline.get()
+    if not seconds or seconds <= 0:
+        yield outer
+        return
+
+    deadline = Deadline(seconds, name)
+    if outer is not None and outer.expires_at < deadline.expires_at:
+        deadline = outer
+    reset = _current_deadline.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _current_deadline.reset(reset)
+
+
+def remaining_budget(seconds: Optional[float] = None) -> Optional[float]:
+    """Budget for the next operation: ``seconds`` capped by the current deadline.
+
+    Returns None when neither a stage budget nor a deadline applies.
+    """
+    deadline = _current_deadline.get()
+    if deadline is None:
+        return seconds
+    return deadline.bound(seconds)
+
+
+async def run_with_deadline(
+    awaitable: Awaitable[T],
+    stage: str,
+    seconds: Optional[float] = None,
+) -> T:
+    """Await ``awaitable`` within the stage budget and the current deadline.
+
+    Raises:
+        DeadlineExceededError: if the budget runs out first. The awaited work
+            is cancelled (tracked subprocesses are killed by their owners).
+    """
+    budget = remaining_budget(seconds)
+    if budget is None:
+        return await awaitable
+    if budget <= 0:
+        if asyncio.iscoroutine(awaitable):
+            awaitable.close()
+        raise DeadlineExceededError(stage, 0.0)
+
+    try:
+        return await asyncio.wait_for(awaitable, timeout=budget)
+    except asyncio.TimeoutError:
+        logger.warning(f"Stage '{stage}' exceeded its {budget:.0f}s budget", extra={
+            "stage": stage,
+            "budget_seconds": round(budget, 1),
+        })
+        raise DeadlineExceededError(stage, budget) from None
@@ -1,10 +1,36 @@
 """
 File utilities - File operations and discovery
+
+``place_file`` puts a file's content at another path without copying bytes
+where the filesystem allows it, trying in order:
+
+    rename    - ``move=True`` on the same filesystem
+    reflink   - copy-on-write clone (btrfs, XFS, ...; Linux FICLONE)
+    hardlink  - only with ``link=True`` (and FILE_PLACEMENT_HARDLINKS on)
+    copy      - byte copy, e.g. across filesystems
+
+A hardlinked destination shares its inode with the source: writing either
+file in place changes both. Callers only pass ``link=True`` when both files
+are replaced atomically (temp file + rename) rather than rewritten.
 """
 
-from typing import Optional, List
+import errno
+import os
+import shutil
+import sys
+from typing import Optional, List, Union
 from pathlib import Path
 
+from .runtime import parse_bool_env
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - not available on Windows
+    fcntl = None
+
+# ioctl(dest_fd, FICLONE, src_fd) from linux/fs.h
+_FICLONE = 0x40049409
+
 
 def find_file_by_id(file_id: str, upload_dir: Path, extensions: List[str]) -> Optional[Path]:
     """Find an uploaded file by its ID, trying different extensions
@@ -47,3 +73,75 @@ def get_file_extension(file_path: Path) -> str:
         Extension including dot (e.g., '.pdf')
     """
     return file_path.suffix.lower()
+
+
+def _reflink(src: Path, dst: Path) -> bool:
+    """Clone ``src`` into a new file ``dst``; False (and no ``dst``) if unsupported"""
+    if fcntl is None or not sys.platform.startswith("linux"):
+        return False
+    try:
+        with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+            fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+    except OSError:
+        dst.unlink(missing_ok=True)
+        return False
+    shutil.copystat(src, dst)
+    return True
+
+
+def _hardlinks_enabled() -> bool:
+    return parse_bool_env(os.getenv("FILE_PLACEMENT_HARDLINKS"), default=True)
+
+
+def place_file(
+    src: Union[str, Path],
+    dst: Union[str, Path],
+    *,
+    move: bool = False,
+    link: bool = False,
+) -> str:
+    """Put the content of ``src`` at ``dst`` as cheaply as possible
+    
+    Args:
+        src: Source file
+        dst: Destination file (replaced atomically if it exists)
+        move: ``src`` is not needed afterwards (rename, or remove it after copying)
+        link: Allow a hardlink (see the module docstring)
+        
+    Returns:
+        The method used: 'rename', 'reflink', 'hardlink' or 'copy'
+    """
+    src, dst = Path(src), Path(dst)
+    if move:
+        try:
+            os.replace(src, dst)
+            return "rename"
+        except OSError as e:
+            if e.errno != errno.EXDEV:
+                raise
+
+    # Build the new file next to dst and rename it over, so an existing dst
+    # (possibly sharing an inode with another file) is never written through
+    tmp = dst.with_name(f".{dst.name}.{os.getpid()}.placing")
+    tmp.unlink(missing_ok=True)
+    try:
+        if _reflink(src, tmp):
+            method = "reflink"
+        else:
+            method = "copy"
+            if link and not move and _hardlinks_enabled():
+                try:
+                    os.link(src, tmp)
+                    method = "hardlink"
+                except OSError:
+                    pass
+            if method == "copy":
+                shutil.copy2(src, tmp)
+        os.replace(tmp, dst)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+    if move:
+        src.unlink(missing_ok=True)
+    return method
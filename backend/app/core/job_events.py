@@ -0,0 +1,257 @@
+"""
+Job progress events - In-process publish/subscribe for live job progress
+
+Clients used to poll ``/job/{id}/details``, which reloads the script and
+stats every section directory on each request. Instead, the job managers and
+the ProgressTracker publish small events here as a job advances, and
+``GET /job/{id}/events`` pushes them to subscribers as server-sent events.
+
+Every job has its own increasing event ids and keeps its last
+JOB_EVENTS_HISTORY events, so a reconnecting client (``Last-Event-ID``) gets
+exactly what it missed; a longer gap is answered with a snapshot. The latest
+state per job (job fields, current stage, finished sections) is kept as
+well, which makes the snapshot endpoint a dictionary lookup.
+
+Events are per process. Jobs run by task worker processes reach the API
+process through ``sync_job``: an idle stream re-reads the job record and
+publishes it when it changed.
+"""
+
+import asyncio
+import os
+import threading
+import time
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+from typing import Any, Deque, Dict, List, Optional, Set
+
+from .logging import get_logger
+from .serialization import dumps_json
+
+logger = get_logger(__name__, component="job_events")
+
+DEFAULT_EVENT_HISTORY = 200
+DEFAULT_MAX_CHANNELS = 256
+SUBSCRIBER_QUEUE_SIZE = 256
+
+JOB_EVENT = "job"
+STAGE_EVENT = "stage"
+SECTION_EVENT = "section"
+DELETED_EVENT = "deleted"
+
+
+def _env_int(name: str, default: int, minimum: int) -> int:
+    try:
+        return max(int(os.getenv(name, default)), minimum)
+    except ValueError:
+        return default
+
+
+@dataclass
+class JobEvent:
+    """One progress event of a job."""
+    id: int
+    job_id: str
+    type: str
+    data: Dict[str, Any]
+    timestamp: float = field(default_factory=time.time)
+
+
+def format_sse(event_type: str, data: Dict[str, Any], event_id: Optional[int] = None) -> str:
+    """Encode one server-sent event."""
+    lines = []
+    if event_id is not None:
+        lines.append(f"id: {event_id}")
+    lines.append(f"event: {event_type}")
+    lines.append(f"data: {dumps_json(data)}")
+    return "\n".join(lines) + "\n\n"
+
+
+class JobEventSubscription:
+    """Events of one job delivered to one asyncio consumer."""
+
+    def __init__(self, bus: "JobEventBus", job_id: str, loop: asyncio.AbstractEventLoop):
+        self.bus = bus
+        self.job_id = job_id
+        self.loop = loop
+        self.queue: "asyncio.Queue[JobEvent]" = asyncio.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE)
+        # Set when events were dropped because the consumer fell behind
+        self.lagged = False
+
+    def _deliver(self, event: JobEvent) -> None:
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            self.lagged = True
+
+    def reset(self) -> None:
+        """Drop queued events after a resync."""
+        while not self.queue.empty():
+            self.queue.get_nowait()
+        self.lagged = False
+
+    async def get(self, timeout: float) -> Optional[JobEvent]:
+        """The next event, or None after ``timeout`` seconds without one."""
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    def close(self) -> None:
+        self.bus._unsubscribe(self)
+
+
+class _JobChannel:
+    def __init__(self, history: int):
+        self.next_id = 1
+        self.events: Deque[JobEvent] = deque(maxlen=history)
+        self.job: Dict[str, Any] = {}
+        self.stage: Optional[Dict[str, Any]] = None
+        self.completed_sections: Set[int] = set()
+        self.total_sections: Optional[int] = None
+        self.subscribers: Set[JobEventSubscription] = set()
+
+
+class JobEventBus:
+    """Per-job event history, latest state and subscribers."""
+
+    def __init__(self, history: Optional[int] = None, max_channels: int = DEFAULT_MAX_CHANNELS):
+        self.history = history or _env_int("JOB_EVENTS_HISTORY", DEFAULT_EVENT_HISTORY, 1)
+        self.max_channels = max_channels
+        self._channels: "OrderedDict[str, _JobChannel]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _channel(self, job_id: str) -> _JobChannel:
+        channel = self._channels.get(job_id)
+        if channel is None:
+            channel = self._channels[job_id] = _JobChannel(self.history)
+            self._prune()
+        else:
+            self._channels.move_to_end(job_id)
+        return channel
+
+    def _prune(self) -> None:
+        """Forget the least recently active jobs nobody is listening to."""
+        excess = len(self._channels) - self.max_channels
+        for job_id in list(self._channels):
+            if excess <= 0:
+                break
+            if not self._channels[job_id].subscribers:
+                del self._channels[job_id]
+                excess -= 1
+
+    def publish(self, job_id: str, event_type: str, data: Dict[str, Any]) -> JobEvent:
+        """Record an event and deliver it to the job's subscribers (thread-safe)."""
+        with self._lock:
+            channel = self._channel(job_id)
+            event = JobEvent(id=channel.next_id, job_id=job_id, type=event_type, data=dict(data))
+            channel.next_id += 1
+            channel.events.append(event)
+            self._apply(channel, event)
+            subscribers = list(channel.subscribers)
+
+        for subscription in subscribers:
+            try:
+                subscription.loop.call_soon_threadsafe(subscription._deliver, event)
+            except RuntimeError:
+                # The subscriber's event loop is gone
+                self._unsubscribe(subscription)
+        return event
+
+    @staticmethod
+    def _apply(channel: _JobChannel, event: JobEvent) -> None:
+        if event.type == JOB_EVENT:
+            channel.job.update(event.data)
+        elif event.type == STAGE_EVENT:
+            channel.stage = dict(event.data)
+        elif event.type == SECTION_EVENT:
+            channel.completed_sections.add(event.data["section_index"])
+            if event.data.get("total_sections"):
+                channel.total_sections = event.data["total_sections"]
+        elif event.type == DELETED_EVENT:
+            channel.job = {}
+            channel.stage = None
+            channel.completed_sections.clear()
+
+    def sync_job(self, job_id: str, fields: Dict[str, Any]) -> Optional[JobEvent]:
+        """Publish a job's record if it is newer than the last published state.
+
+        Lets streams pick up updates made by other processes; concurrent
+        streams of the same job publish a change only once.
+        """
+        with self._lock:
+            channel = self._channels.get(job_id)
+            if channel is not None and channel.job.get("updated_at") == fields.get("updated_at"):
+                return None
+        return self.publish(job_id, JOB_EVENT, fields)
+
+    def events_since(self, job_id: str, last_id: int) -> Optional[List[JobEvent]]:
+        """Events after ``last_id``, or None when they are no longer all kept."""
+        with self._lock:
+            channel = self._channels.get(job_id)
+            if channel is None:
+                return None
+            if last_id >= channel.next_id:
+                # Ids from before a restart
+                return None
+            oldest = channel.events[0].id if channel.events else channel.next_id
+            if last_id + 1 < oldest:
+                return None
+            return [event for event in channel.events if event.id > last_id]
+
+    def snapshot(self, job_id: str) -> Dict[str, Any]:
+        """Latest known state of a job, with the id of its last event."""
+        with self._lock:
+            channel = self._channels.get(job_id)
+            if channel is None:
+                return {
+                    "job_id": job_id,
+                    "last_event_id": 0,
+                    "job": {},
+                    "stage": None,
+                    "completed_sections": [],
+                    "total_sections": None,
+                }
+            return {
+                "job_id": job_id,
+                "last_event_id": channel.next_id - 1,
+                "job": dict(channel.job),
+                "stage": dict(channel.stage) if channel.stage else None,
+                "completed_sections": sorted(channel.completed_sections),
+                "total_sections": channel.total_sections,
+            }
+
+    def subscribe(self, job_id: str) -> JobEventSubscription:
+        """Subscribe the running event loop to a job's events."""
+        subscription = JobEventSubscription(self, job_id, asyncio.get_running_loop())
+        with self._lock:
+            self._channel(job_id).subscribers.add(subscription)
+        return subscription
+
+    def _unsubscribe(self, subscription: JobEventSubscription) -> None:
+        with self._lock:
+            channel = self._channels.get(subscription.job_id)
+            if channel is not None:
+                channel.subscribers.discard(subscription)
+
+
+_job_event_bus: Optional[JobEventBus] = None
+_bus_lock = threading.Lock()
+
+
+def get_job_event_bus() -> JobEventBus:
+    """Get the process-wide job event bus."""
+    global _job_event_bus
+    if _job_event_bus is None:
+        with _bus_lock:
+            if _job_event_bus is None:
+                _job_event_bus = JobEventBus()
+    return _job_event_bus
+
+
+def publish_job_event(job_id: str, event_type: str, data: Dict[str, Any]) -> None:
+    """Publish a job event; never raises into the publishing pipeline."""
+    try:
+        get_job_event_bus().publish(job_id, event_type, data)
+    except Exception as e:
+        logger.warning(f"Failed to publish job event: {e}", extra={"job_id": job_id})
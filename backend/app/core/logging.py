@@ -10,7 +10,6 @@ Provides consistent logging across the entire application with:
 
 import logging
 import sys
-import json
 import os
 from typing import Any, Dict, Optional
 from datetime import datetime, UTC
@@ -18,6 +17,8 @@ from contextvars import ContextVar
 from pathlib import Path
 from logging.handlers import RotatingFileHandler
 
+from .serialization import dumps_json
+
 SENSITIVE_KEY_TOKENS = ("password", "secret", "token", "api_key", "apikey", "authorization")
 
 # Context variable for request correlation
@@ -108,7 +109,7 @@ class StructuredFormatter(logging.Formatter):
         if extra:
             log_data["extra"] = _sanitize_for_logging("extra", extra)
 
-        return json.dumps(log_data)
+        return dumps_json(log_data, default=str)
 
 
 def _is_sensitive_key(key: str) -> bool:
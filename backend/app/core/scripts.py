@@ -8,8 +8,12 @@ from app.adapters.scripts_io import (  # type: ignore F401
     load_script,
     load_script_raw,
     save_script,
+    export_script,
+    script_exists,
     get_script_metadata,
     load_section_script,
+    load_script_section,
+    update_section_fields,
     unwrap_script,
 )
 
@@ -17,7 +21,11 @@ __all__ = [
     "load_script",
     "load_script_raw",
     "save_script",
+    "export_script",
+    "script_exists",
     "get_script_metadata",
     "load_section_script",
+    "load_script_section",
+    "update_section_fields",
     "unwrap_script",
 ]
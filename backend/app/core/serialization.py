@@ -0,0 +1,157 @@
+"""
+JSON serialization - One encoder/decoder for persistence and API responses
+
+Job files, scripts, video_info.json, analysis results, structured log
+records and API responses are all JSON; stdlib ``json`` (especially with
+``indent=2``) shows up in profiles of both the pipeline and the API. Every
+one of them goes through ``dumps_json``/``loads_json`` here, backed by the fastest
+library available:
+
+    orjson   - when installed (preferred)
+    msgspec  - when installed and orjson is not
+    stdlib   - always available; also forced with JSON_BACKEND=stdlib
+
+Output is the same JSON for every backend: UTF-8 (never ``\\uXXXX`` escapes),
+compact separators, or two-space indentation with ``indent=True``. Values the
+fast backends reject (integers beyond 64 bits, exotic key types) fall back to
+the stdlib encoder instead of failing.
+"""
+
+import json
+import os
+import uuid
+from pathlib import Path
+from typing import Any, Callable, Optional, Union
+
+from fastapi.responses import JSONResponse
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover - optional dependency
+    msgspec = None
+
+JSON_BACKENDS = ("orjson", "msgspec", "stdlib")
+
+Default = Optional[Callable[[Any], Any]]
+
+
+def _select_backend() -> str:
+    requested = (os.getenv("JSON_BACKEND") or "auto").strip().lower()
+    available = {"orjson": orjson is not None, "msgspec": msgspec is not None, "stdlib": True}
+    if requested in available and available[requested]:
+        return requested
+    return next(name for name in JSON_BACKENDS if available[name])
+
+
+_backend = _select_backend()
+
+
+def json_backend() -> str:
+    """Name of the JSON backend in use (orjson, msgspec or stdlib)."""
+    return _backend
+
+
+def set_json_backend(name: Optional[str] = None) -> str:
+    """Switch the backend (None: re-read JSON_BACKEND); returns the one selected."""
+    global _backend
+    if name is not None and name not in JSON_BACKENDS:
+        raise ValueError(f"Unknown JSON backend: {name}")
+    if name is None:
+        _backend = _select_backend()
+    elif (name == "orjson" and orjson is None) or (name == "msgspec" and msgspec is None):
+        raise ValueError(f"JSON backend not installed: {name}")
+    else:
+        _backend = name
+    return _backend
+
+
+def _stdlib_dumps(obj: Any, indent: bool, default: Default) -> str:
+    if indent:
+        return json.dumps(obj, indent=2, ensure_ascii=False, default=default)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"), default=default)
+
+
+def dumps_json_bytes(obj: Any, *, indent: bool = False, default: Default = None) -> bytes:
+    """Encode ``obj`` as UTF-8 JSON bytes."""
+    if _backend == "orjson":
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        try:
+            return orjson.dumps(obj, default=default, option=option)
+        except orjson.JSONEncodeError:
+            pass
+    elif _backend == "msgspec":
+        try:
+            data = msgspec.json.encode(obj, enc_hook=default)
+            return msgspec.json.format(data, indent=2) if indent else data
+        except (TypeError, ValueError, OverflowError, msgspec.EncodeError):
+            pass
+    return _stdlib_dumps(obj, indent, default).encode("utf-8")
+
+
+def dumps_json(obj: Any, *, indent: bool = False, default: Default = None) -> str:
+    """Encode ``obj`` as a JSON string."""
+    if _backend == "stdlib":
+        return _stdlib_dumps(obj, indent, default)
+    return dumps_json_bytes(obj, indent=indent, default=default).decode("utf-8")
+
+
+def loads_json(data: Union[str, bytes, bytearray]) -> Any:
+    """Decode JSON; invalid input raises ``json.JSONDecodeError``."""
+    if _backend == "orjson":
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError
+        return orjson.loads(data)
+    if _backend == "msgspec":
+        try:
+            return msgspec.json.decode(data)
+        except msgspec.DecodeError as exc:
+            raise json.JSONDecodeError(str(exc), data if isinstance(data, str) else "", 0) from exc
+    return json.loads(data)
+
+
+def read_json(path: Union[str, Path]) -> Any:
+    """Read and decode a JSON file."""
+    with open(path, "rb") as f:
+        return loads_json(f.read())
+
+
+def write_json(
+    path: Union[str, Path],
+    obj: Any,
+    *,
+    indent: bool = True,
+    atomic: bool = False,
+    default: Default = None,
+) -> None:
+    """Encode ``obj`` into a JSON file (``atomic``: temp file + rename).
+
+    Atomic writes use a temp name unique to the call, so processes writing
+    the same file concurrently never share (or rename away) each other's.
+    """
+    path = Path(path)
+    data = dumps_json_bytes(obj, indent=indent, default=default)
+    if not atomic:
+        with open(path, "wb") as f:
+            f.write(data)
+        return
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.{uuid.uuid4().hex}.tmp")
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse encoded with the fast backend (the app's default response class)."""
+
+    def render(self, content: Any) -> bytes:
+        return dumps_json_bytes(content)
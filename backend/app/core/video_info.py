@@ -7,13 +7,14 @@ to outputs directory. This metadata persists after job cleanup.
 Single Responsibility: Only manages video_info.json I/O operations.
 """
 
-import json
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 from app.config import OUTPUT_DIR
 
+from .serialization import read_json, write_json
+
 
 @dataclass
 class VideoChapter:
@@ -126,8 +127,7 @@ def save_video_info(info: VideoInfo) -> Path:
     path = _video_info_path(info.video_id)
     path.parent.mkdir(parents=True, exist_ok=True)
     
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(info.to_dict(), f, indent=2, ensure_ascii=False)
+    write_json(path, info.to_dict())
     
     return path
 
@@ -148,10 +148,9 @@ def load_video_info(video_id: str) -> Optional[VideoInfo]:
         return None
     
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        data = read_json(path)
         return VideoInfo.from_dict(data)
-    except (json.JSONDecodeError, OSError):
+    except (ValueError, OSError):
         return None
 
 
@@ -222,8 +221,7 @@ def save_error_info(info: ErrorInfo) -> Path:
     path = _error_info_path(info.job_id)
     path.parent.mkdir(parents=True, exist_ok=True)
     
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(info.to_dict(), f, indent=2, ensure_ascii=False)
+    write_json(path, info.to_dict())
     
     return path
 
@@ -236,10 +234,9 @@ def load_error_info(job_id: str) -> Optional[ErrorInfo]:
         return None
     
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        data = read_json(path)
         return ErrorInfo.from_dict(data)
-    except (json.JSONDecodeError, OSError):
+    except (ValueError, OSError):
         return None
 
 
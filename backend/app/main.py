@@ -33,9 +33,11 @@ from .routes import (
     jobs_router,
     sections_router,
     translation_router,
+    themes_router,
 
 )
 from .core import (
+    FastJSONResponse,
     setup_logging,
     get_logger,
     set_request_id,
@@ -97,6 +99,7 @@ app = FastAPI(
     description=API_DESCRIPTION,
     version=API_VERSION,
     lifespan=lifespan,
+    default_response_class=FastJSONResponse,
 )
 
 
@@ -183,6 +186,7 @@ app.include_router(generation_router)
 app.include_router(jobs_router)
 app.include_router(sections_router)
 app.include_router(translation_router)
+app.include_router(themes_router)
 
 
 
@@ -21,6 +21,7 @@ class GenerationRequest(BaseModel):
     document_context: str = "auto"  # "standalone", "series" (alias: "part-of-series"), or "auto"
     pipeline: str = "default"  # Named pipeline from GET /pipelines
     resume_job_id: Optional[str] = None  # If provided, resume this job
+    priority: str = "normal"  # "normal" or "bulk" (bulk work gets a capped capacity share)
 
 
 class GeneratedVideo(BaseModel):
@@ -8,6 +8,7 @@ from .generation import router as generation_router
 from .jobs import router as jobs_router
 from .sections import router as sections_router
 from .translation import router as translation_router
+from .themes import router as themes_router
 from .auth import router as auth_router
 
 
@@ -19,4 +20,5 @@ __all__ = [
     "jobs_router",
     "sections_router",
     "translation_router",
+    "themes_router",
 ]
@@ -8,13 +8,15 @@ enabling easier testing and potential future database migration.
 import os
 import json
 from pathlib import Path
-from fastapi import APIRouter, HTTPException
-from fastapi.responses import FileResponse
+from typing import Optional
+from fastapi import APIRouter, HTTPException, Request, Response
+from fastapi.responses import FileResponse, StreamingResponse
 
 from app.config import OUTPUT_DIR
-from app.core import validate_path_within_directory
+from app.core import validate_path_within_directory, load_script
 from app.models import JobResponse, DetailedProgress, JobUpdateRequest
 from app.services.features.jobs.service import JobService
+from app.routes.jobs_helpers import conditional_response
 from app.services.pipeline.audio import TTSEngine
 
 router = APIRouter(tags=["jobs"])
@@ -129,21 +131,38 @@ async def get_available_voices(language: str = "en"):
 
 
 @router.get("/jobs")
-async def list_all_jobs():
+async def list_all_jobs(
+    status: Optional[str] = None,
+    q: Optional[str] = None,
+    sort: Optional[str] = None,
+    order: Optional[str] = None,
+    limit: Optional[int] = None,
+    offset: int = 0,
+):
     """
     List all jobs and completed videos.
+
+    Filter with ``status`` (comma-separated) and ``q`` (title), order with
+    ``sort`` (created_at, updated_at, title, total_duration, status) and
+    ``order`` (asc/desc, newest first by default), page with ``limit``/``offset``.
     """
     service = JobService()
-    return service.list_all_jobs()
+    return service.list_all_jobs(status, q, sort, order, limit, offset)
 
 
 @router.get("/jobs/completed")
-async def list_completed_jobs():
+async def list_completed_jobs(
+    q: Optional[str] = None,
+    sort: Optional[str] = None,
+    order: Optional[str] = None,
+    limit: Optional[int] = None,
+    offset: int = 0,
+):
     """
-    List only completed jobs with videos.
+    List only completed jobs with videos (same query parameters as /jobs, without status).
     """
     service = JobService()
-    return service.list_completed_jobs()
+    return service.list_completed_jobs(q, sort, order, limit, offset)
 
 
 @router.delete("/job/{job_id}")
@@ -161,34 +180,72 @@ async def delete_failed_jobs():
 
 
 @router.get("/job/{job_id}/script")
-async def get_job_script(job_id: str):
-    """Get the script for a job"""
-    # This acts as a simple pass-through to core utility, but arguably could be in service too.
-    # For consistency with the pattern, let's keep it here as a direct utility usage or move it?
-    # The 'service.get_job_details' handles script loading internally.
-    # The original route just called 'load_script(job_id)'.
-    # We'll just call the utility directly as it's a read operation, 
-    # OR we could add 'get_script' to service. 
-    # Given the strict rules, let's just use load_script directly since it's a 'core' utility, 
-    # but to be perfectly clean, let's rely on the service if we want to centralize access.
-    # However, 'load_script' is imported from core.
-    from app.core import load_script
-    return load_script(job_id)
+async def get_job_script(job_id: str, request: Request, response: Response):
+    """Get the script for a job (ETag / If-None-Match aware)"""
+    service = JobService()
+    revision = service.script_revision(job_id)
+    return conditional_response(
+        request, response, ("script", job_id), revision, lambda: load_script(job_id)
+    )
 
 
 @router.get("/job/{job_id}/details", response_model=DetailedProgress)
-async def get_job_details(job_id: str):
+async def get_job_details(job_id: str, request: Request, response: Response):
     """
     Get detailed progress information for a job including all sections.
+
+    Carries an ETag of the job's revision; polls with a matching
+    If-None-Match get 304, unchanged jobs are served from memory.
+    """
+    service = JobService()
+    revision = service.job_details_revision(job_id)
+    return conditional_response(
+        request, response, ("details", job_id), revision, lambda: service.get_job_details(job_id)
+    )
+
+
+@router.get("/job/{job_id}/progress")
+async def get_job_progress(job_id: str):
+    """
+    Current progress of a job, cheap enough to fetch before opening /events.
     """
     service = JobService()
-    return service.get_job_details(job_id)
+    return service.get_progress_snapshot(job_id)
+
+
+@router.get("/job/{job_id}/events")
+async def stream_job_events(job_id: str, request: Request, last_event_id: Optional[int] = None):
+    """
+    Stream a job's progress as server-sent events.
+
+    Reconnecting clients resume from the ``Last-Event-ID`` header (or the
+    ``last_event_id`` query parameter, e.g. from the progress snapshot).
+    """
+    service = JobService()
+    service.get_progress_snapshot(job_id)  # 400/404 before the stream starts
+
+    header = request.headers.get("last-event-id")
+    if header and header.isdigit():
+        last_event_id = int(header)
+
+    return StreamingResponse(
+        service.stream_job_events(job_id, last_event_id, request.is_disconnected),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
 
 
 @router.get("/job/{job_id}/section/{section_index}")
-async def get_section_details(job_id: str, section_index: int):
+async def get_section_details(job_id: str, section_index: int, request: Request, response: Response):
     """Get full details for a specific section including full narration and code"""
     service = JobService()
-    return service.get_section_details(job_id, section_index)
+    revision = service.section_details_revision(job_id, section_index)
+    return conditional_response(
+        request,
+        response,
+        ("section", job_id, section_index),
+        revision,
+        lambda: service.get_section_details(job_id, section_index),
+    )
 
 
@@ -5,14 +5,48 @@ Extracted from routes/jobs.py to reduce function complexity and improve readabil
 Each function handles a specific aspect of job processing.
 """
 
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Callable, Hashable
+
+from fastapi import Request, Response
 
 from app.config import OUTPUT_DIR
 from app.models import SectionProgress
 from app.core import load_script
+from app.services.features.jobs.revisions import get_response_cache
 from app.utils.section_status import read_status_details as _read_section_status
 
 
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Whether an If-None-Match header names ``etag`` (weak comparison)."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    bare = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == bare for tag in if_none_match.split(","))
+
+
+def conditional_response(
+    request: Request,
+    response: Response,
+    cache_key: Hashable,
+    revision: str,
+    build: Callable[[], Any],
+) -> Any:
+    """
+    Serve ``build()`` under a revision ETag.
+
+    Answers 304 when the client already has the revision; otherwise returns
+    the response cached for this revision, building it on a miss.
+    """
+    etag = f'W/"{revision}"'
+    if _etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers={"ETag": etag, "Cache-Control": "no-cache"})
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = "no-cache"
+    return get_response_cache().get_or_build(cache_key, revision, build)
+
+
 def get_stage_from_status(status: str) -> str:
     """
     Map job status to display stage.
@@ -3,48 +3,43 @@ Section management and editing routes with security hardening
 """
 
 import os
-import re
-import asyncio
 import subprocess
-import shutil
 from pathlib import Path
 from typing import List
-from fastapi import APIRouter, HTTPException, BackgroundTasks
+from fastapi import APIRouter, HTTPException, BackgroundTasks, Request, Response
 from fastapi.responses import PlainTextResponse, FileResponse
 from pydantic import BaseModel
 
 from ..config import OUTPUT_DIR, GEMINI_API_KEY
-from ..services.infrastructure.orchestration import JobStatus, get_job_manager
-from ..core import load_script, load_section_script, save_script
+from ..services.infrastructure.orchestration import JobStatus, get_job_manager, refresh_job_summary
+from ..core import export_script, load_script, load_section_script, update_section_fields
 from ..core import validate_job_id, validate_path_within_directory
 from ..core import job_is_final_only
+from ..core import load_video_info
 from ..core import assert_runtime_tools_available
 from ..core import get_logger
+from .jobs_helpers import conditional_response
+from ..core import PriorityClass, get_llm_admission
+from ..services.features.jobs.revisions import job_files_revision
+from ..services.pipeline.assembly import JobRecompiler
+from ..services.pipeline.assembly.recompile import resolve_sections
+from ..services.pipeline.assembly.section_tasks import (
+    SECTION_RENDER_TIMEOUT,
+    SectionRenderError,
+    SectionTask,
+    SectionTaskStatus,
+    find_scene_class,
+    find_scene_file,
+    get_section_task_registry,
+    render_section_video,
+    section_video_path,
+)
 
 logger = get_logger(__name__, component="sections_routes")
 
 router = APIRouter(tags=["sections"])
 
 
-async def _run_subprocess_async(
-    cmd: list[str],
-    *,
-    capture_output: bool = True,
-    text: bool = True,
-    timeout: int | float | None = None,
-    cwd: str | None = None,
-):
-    """Run subprocess.run in a worker thread to avoid blocking the event loop."""
-    return await asyncio.to_thread(
-        subprocess.run,
-        cmd,
-        capture_output=capture_output,
-        text=text,
-        timeout=timeout,
-        cwd=cwd,
-    )
-
-
 class CodeUpdateRequest(BaseModel):
     code: str = ""
     manim_code: str = ""
@@ -57,11 +52,12 @@ class FixCodeRequest(BaseModel):
 
 
 @router.get("/job/{job_id}/sections")
-async def get_job_sections(job_id: str):
+async def get_job_sections(job_id: str, request: Request, response: Response):
     """
     Get all section files for a job (for editing)
     
     Security: Validates job_id and ensures paths stay within OUTPUT_DIR
+    Served with a revision ETag (304 on a matching If-None-Match).
     """
     # Security: Validate job_id format
     if not validate_job_id(job_id):
@@ -82,6 +78,17 @@ async def get_job_sections(job_id: str):
     if not sections_dir.exists():
         raise HTTPException(status_code=404, detail="Sections not found")
 
+    return conditional_response(
+        request,
+        response,
+        ("sections", job_id),
+        job_files_revision(job_id),
+        lambda: _collect_job_sections(job_id, sections_dir),
+    )
+
+
+def _collect_job_sections(job_id: str, sections_dir: Path) -> dict:
+    """Script metadata, code and media paths of every section folder."""
     # Load script.json for metadata and ordering
     script_sections = []
     try:
@@ -199,21 +206,8 @@ async def update_section_code(job_id: str, section_id: str, request: CodeUpdateR
     with open(code_path, "w", encoding="utf-8") as f:
         f.write(code)
 
-    # Update script.json if present
-    try:
-        script = load_script(job_id)
-    except HTTPException as exc:
-        if exc.status_code == 404:
-            script = None
-        else:
-            raise
-
-    if script:
-        for section in script.get("sections", []):
-            if section.get("id") == section_id:
-                section["manim_code"] = code
-                break
-        save_script(job_id, script)
+    # Update the section in script.json if present
+    update_section_fields(job_id, section_id, {"manim_code": code})
 
     return {"message": "Code updated successfully"}
 
@@ -250,6 +244,68 @@ async def get_file_content(path: str):
         return PlainTextResponse(content, headers=headers)
 
 
+def _ordered_sections(job_id: str, sections_dir: Path) -> List[dict]:
+    """Script sections in video order (directory listing when there is no script)"""
+    ordered_sections = []
+    try:
+        script = load_script(job_id)
+        ordered_sections = sorted(
+            script.get("sections", []),
+            key=lambda s: s.get("order", 0)
+        )
+    except HTTPException as exc:
+        # Fall back to directory listing when script is missing or unreadable
+        if exc.status_code != 404:
+            print(f"Error reading script.json: {exc.detail}")
+    except Exception as e:
+        print(f"Error reading script.json: {e}")
+
+    if not ordered_sections:
+        for section_folder in sorted(os.listdir(sections_dir)):
+            section_path = sections_dir / section_folder
+            if section_path.is_dir():
+                ordered_sections.append({"id": section_folder})
+    return ordered_sections
+
+
+async def _splice_into_final_video(job_id: str, section_id: str) -> bool:
+    """Splice a re-rendered section into the existing final video.
+
+    Only the edited section is re-merged with its audio; the chapters in
+    video_info.json (and the job result) are updated in place. Returns False
+    when the final video has to be recompiled instead.
+    """
+    job_dir = OUTPUT_DIR / job_id
+    sections_dir = job_dir / "sections"
+    ordered_sections = _ordered_sections(job_id, sections_dir)
+    section_index = next(
+        (i for i, sec in enumerate(ordered_sections) if sec.get("id") == section_id), None
+    )
+    if section_index is None:
+        return False
+
+    sections = resolve_sections(sections_dir, ordered_sections)
+    spliced = await JobRecompiler(job_id, job_dir).splice_section(sections, section_index)
+    if spliced is None:
+        return False
+
+    # Another splice of this job may have finished after this one: copy the
+    # chapters as they are on disk now rather than this splice's snapshot
+    info = load_video_info(job_id)
+    chapters = [ch.to_dict() for ch in info.chapters] if info else spliced.chapters
+    duration = info.duration if info else spliced.duration
+    job = get_job_manager().get_job(job_id)
+    if job and job.result:
+        for video_result in job.result:
+            if isinstance(video_result, dict) and "chapters" in video_result:
+                video_result["chapters"] = chapters
+                video_result["duration"] = duration
+        get_job_manager().update_job(job_id, result=job.result)
+    export_script(job_id)
+    refresh_job_summary(job_id)
+    return True
+
+
 @router.post("/job/{job_id}/recompile")
 async def recompile_job(job_id: str, background_tasks: BackgroundTasks):
     """Recompile a job's video from existing section files"""
@@ -273,138 +329,23 @@ async def recompile_job(job_id: str, background_tasks: BackgroundTasks):
         try:
             get_job_manager().update_job(job_id, JobStatus.COMPOSING_VIDEO, 50, "Recompiling video...")
 
-            ordered_sections = []
-            try:
-                script = load_script(job_id)
-                ordered_sections = sorted(
-                    script.get("sections", []),
-                    key=lambda s: s.get("order", 0)
-                )
-            except HTTPException as exc:
-                # Fall back to directory listing when script is missing or unreadable
-                if exc.status_code != 404:
-                    print(f"Error reading script.json: {exc.detail}")
-            except Exception as e:
-                print(f"Error reading script.json: {e}")
-
-            if not ordered_sections:
-                for section_folder in sorted(os.listdir(sections_dir)):
-                    section_path = sections_dir / section_folder
-                    if section_path.is_dir():
-                        ordered_sections.append({"id": section_folder})
-
+            ordered_sections = _ordered_sections(job_id, sections_dir)
             if not ordered_sections:
                 get_job_manager().update_job(job_id, JobStatus.FAILED, 0, "No sections found to recompile")
                 return
 
-            concat_file = job_dir / "concat_list.txt"
-            combined_files = []
-
-            for i, sec in enumerate(ordered_sections):
-                section_id = sec.get("id")
-                section_path = sections_dir / section_id
-
-                video_file = sec.get("video")
-                audio_file = sec.get("audio")
-
-                if video_file and not os.path.exists(video_file):
-                    video_file = None
-                if audio_file and not os.path.exists(audio_file):
-                    audio_file = None
-
-                if not video_file and section_path.is_dir():
-                    for root, dirs, files in os.walk(section_path):
-                        for f in files:
-                            if f.endswith(".mp4"):
-                                video_file = os.path.join(root, f)
-                                break
-                        if video_file:
-                            break
-
-                if not audio_file and section_path.is_dir():
-                    for f in os.listdir(section_path):
-                        if f.endswith(".mp3"):
-                            audio_file = str(section_path / f)
-                            break
-
-                if not video_file:
-                    print(f"Skipping section {section_id}: no video found")
-                    continue
-
-                combined = job_dir / f"combined_{i:03d}.mp4"
-
-                if audio_file:
-                    async def get_duration(file_path):
-                        try:
-                            probe_cmd = ["ffprobe", "-v", "error", "-show_entries", "format=duration",
-                                        "-of", "default=noprint_wrappers=1:nokey=1", file_path]
-                            result = await _run_subprocess_async(probe_cmd, timeout=30)
-                            return float(result.stdout.strip())
-                        except:
-                            return 0.0
-
-                    video_duration = await get_duration(video_file)
-                    audio_duration = await get_duration(audio_file)
-
-                    if video_duration >= audio_duration:
-                        cmd = [
-                            "ffmpeg", "-y",
-                            "-i", video_file,
-                            "-i", audio_file,
-                            "-c:v", "libx264",
-                            "-c:a", "aac",
-                            "-shortest",
-                            str(combined)
-                        ]
-                    else:
-                        cmd = [
-                            "ffmpeg", "-y",
-                            "-i", video_file,
-                            "-i", audio_file,
-                            "-filter_complex", "[0:v]tpad=stop=-1:stop_mode=clone,setpts=PTS-STARTPTS[v]",
-                            "-map", "[v]",
-                            "-map", "1:a:0",
-                            "-c:v", "libx264",
-                            "-c:a", "aac",
-                            "-t", str(audio_duration),
-                            str(combined)
-                        ]
-                else:
-                    cmd = [
-                        "ffmpeg", "-y",
-                        "-i", video_file,
-                        "-c", "copy",
-                        str(combined)
-                    ]
-
-                result = await _run_subprocess_async(cmd)
-                if result.returncode != 0:
-                    print(f"ffmpeg error for section {section_id}: {result.stderr}")
-
-                if combined.exists():
-                    combined_files.append(str(combined))
-
-            if not combined_files:
-                get_job_manager().update_job(job_id, JobStatus.FAILED, 0, "No combined section videos produced")
-                return
+            sections = resolve_sections(sections_dir, ordered_sections)
+            result = await JobRecompiler(job_id, job_dir).run(sections)
 
-            with open(concat_file, "w") as f:
-                for p in combined_files:
-                    f.write(f"file '{p}'\n")
-
-            final_video = job_dir / "final_video.mp4"
-            cmd = [
-                "ffmpeg", "-y",
-                "-f", "concat",
-                "-safe", "0",
-                "-i", str(concat_file),
-                "-c", "copy",
-                str(final_video)
-            ]
-            result = await _run_subprocess_async(cmd)
-
-            if final_video.exists():
+            if result.final_video:
+                logger.info(
+                    f"Recompiled {job_id}: {result.merged} merged, {result.reused} reused, "
+                    f"{result.skipped} failed"
+                )
+                export_script(job_id)
                 get_job_manager().update_job(job_id, JobStatus.COMPLETED, 100, "Video recompiled successfully!")
+            elif result.merged + result.reused == 0:
+                get_job_manager().update_job(job_id, JobStatus.FAILED, 0, "No combined section videos produced")
             else:
                 get_job_manager().update_job(job_id, JobStatus.FAILED, 0, "Failed to create final video")
 
@@ -462,15 +403,16 @@ async def fix_section_code(job_id: str, section_id: str, request: FixCodeRequest
             print(f"Error processing frame {i}: {e}")
 
     try:
-        fixed_code = await generate_content_with_images(
-            client=client,
-            model="gemini-3-flash-preview",
-            prompt=user_prompt,
-            image_bytes_list=image_bytes_list,
-            system_instruction=system_prompt,
-            temperature=0.3,
-            types_module=types,
-        )
+        async with get_llm_admission().slot(PriorityClass.INTERACTIVE):
+            fixed_code = await generate_content_with_images(
+                client=client,
+                model="gemini-3-flash-preview",
+                prompt=user_prompt,
+                image_bytes_list=image_bytes_list,
+                system_instruction=system_prompt,
+                temperature=0.3,
+                types_module=types,
+            )
 
         if not fixed_code:
             raise HTTPException(status_code=500, detail="Failed to generate fixed code")
@@ -488,9 +430,16 @@ async def fix_section_code(job_id: str, section_id: str, request: FixCodeRequest
         raise HTTPException(status_code=500, detail=f"Gemini error: {str(e)}")
 
 
-@router.post("/job/{job_id}/section/{section_id}/regenerate")
-async def regenerate_section(job_id: str, section_id: str):
-    """Regenerate the video for a single section using its current Manim code"""
+@router.post("/job/{job_id}/section/{section_id}/regenerate", status_code=202)
+async def regenerate_section(job_id: str, section_id: str, update_final: bool = True):
+    """Regenerate the video for a single section using its current Manim code
+
+    The render runs as a background task (see section_tasks); the response is
+    the task handle, polled via GET /job/{job_id}/section-tasks/{task_id}.
+    With ``update_final`` the new section is spliced into the existing final
+    video (see JobRecompiler.splice_section); the task's
+    ``final_video_updated`` is False when a recompile is needed instead.
+    """
     assert_runtime_tools_available(("manim",), context="section regeneration")
 
     sections_dir = OUTPUT_DIR / job_id / "sections" / section_id
@@ -504,108 +453,56 @@ async def regenerate_section(job_id: str, section_id: str):
     if not sections_dir.exists():
         raise HTTPException(status_code=404, detail="Section not found")
 
-    try:
-        code_file = None
-        section_index = 0
-        for f in os.listdir(sections_dir):
-            if f.endswith(".py") and f.startswith("scene"):
-                code_file = sections_dir / f
-                idx_match = re.search(r"scene_(\d+)\.py", f)
-                if idx_match:
-                    section_index = int(idx_match.group(1))
-                break
-
-        if not code_file:
-            raise HTTPException(status_code=404, detail="No Manim code file found in section")
-
-        with open(code_file, "r") as f:
-            code = f.read()
-
-        class_match = re.search(r"class\s+(\w+)\s*\(", code)
-        if not class_match:
-            raise HTTPException(status_code=400, detail="Could not find Scene class in code")
-
-        class_name = class_match.group(1)
-
-        existing_video = None
-        for f in os.listdir(sections_dir):
-            if f.endswith(".mp4"):
-                existing_video = f
-                break
-
-        output_video_name = existing_video or f"section_{section_index}.mp4"
-        output_video = sections_dir / output_video_name
-
-        if output_video.exists():
-            output_video.unlink()
-
-        for subdir in ["videos", "media", "images", "Tex", "texts"]:
-            subdir_path = sections_dir / subdir
-            if subdir_path.exists():
-                shutil.rmtree(subdir_path)
-
-        output_name = output_video_name.replace(".mp4", "")
-        cmd = [
-            "manim",
-            "-ql",
-            "--media_dir", str(sections_dir),
-            "-o", output_name,
-            str(code_file),
-            class_name
-        ]
-
-        result = await _run_subprocess_async(
-            cmd,
-            cwd=str(sections_dir),
-            timeout=120,
-        )
+    scene = find_scene_file(sections_dir)
+    if not scene:
+        raise HTTPException(status_code=404, detail="No Manim code file found in section")
+    code_file, section_index = scene
 
-        if result.returncode != 0:
-            raise HTTPException(status_code=500, detail=f"Manim render failed: {result.stderr[:500]}")
-
-        video_found = False
-        media_videos_dir = sections_dir / "videos"
-        if media_videos_dir.exists():
-            for root, dirs, files in os.walk(media_videos_dir):
-                for f in files:
-                    if f.endswith(".mp4"):
-                        src = os.path.join(root, f)
-                        shutil.move(src, str(output_video))
-                        video_found = True
-                        break
-                if video_found:
-                    break
-            shutil.rmtree(media_videos_dir)
-
-        if not video_found and not output_video.exists():
-            raise HTTPException(status_code=500, detail="Manim did not produce a video file")
+    with open(code_file, "r", encoding="utf-8") as f:
+        class_name = find_scene_class(f.read())
+    if not class_name:
+        raise HTTPException(status_code=400, detail="Could not find Scene class in code")
 
+    output_video = section_video_path(sections_dir, section_index)
+
+    async def run_regeneration(task: SectionTask) -> None:
+        task.update(SectionTaskStatus.RENDERING, 10, "Rendering section")
         try:
-            script = load_script(job_id)
-        except HTTPException as exc:
-            if exc.status_code == 404:
-                script = None
-            else:
-                raise
+            await render_section_video(sections_dir, code_file, class_name, output_video)
+        except subprocess.TimeoutExpired:
+            raise SectionRenderError(
+                f"Manim render timed out after {SECTION_RENDER_TIMEOUT} seconds"
+            ) from None
+        task.video_path = str(output_video)
+
+        update_section_fields(job_id, section_id, {"video": str(output_video)})
+
+        # Editing fast path: splice the new section into the final video
+        if update_final and (OUTPUT_DIR / job_id / "final_video.mp4").exists():
+            task.update(SectionTaskStatus.SPLICING, 70, "Updating final video")
+            try:
+                task.final_video_updated = await _splice_into_final_video(job_id, section_id)
+            except Exception as e:
+                logger.warning(f"Splicing section {section_id} failed: {e}")
 
-        if script:
-            for section in script.get("sections", []):
-                if section.get("id") == section_id:
-                    section["video"] = str(output_video)
-                    break
-            save_script(job_id, script)
+    task = get_section_task_registry().submit(job_id, section_id, run_regeneration)
+    return {
+        "message": "Section regeneration started",
+        **task.to_dict(),
+    }
 
-        return {
-            "message": "Section regenerated successfully",
-            "section_id": section_id,
-            "video_path": str(output_video)
-        }
 
-    except HTTPException:
-        raise
-    except subprocess.TimeoutExpired:
-        raise HTTPException(status_code=500, detail="Manim render timed out after 2 minutes")
-    except Exception as e:
-        import traceback
-        traceback.print_exc()
-        raise HTTPException(status_code=500, detail=f"Regeneration failed: {str(e)}")
+@router.get("/job/{job_id}/section-tasks")
+async def list_section_tasks(job_id: str):
+    """Section regeneration tasks of a job, newest first"""
+    tasks = get_section_task_registry().list_for_job(job_id)
+    return {"tasks": [task.to_dict() for task in tasks]}
+
+
+@router.get("/job/{job_id}/section-tasks/{task_id}")
+async def get_section_task(job_id: str, task_id: str):
+    """Status and progress of a section regeneration task"""
+    task = get_section_task_registry().get(task_id)
+    if task is None or task.job_id != job_id:
+        raise HTTPException(status_code=404, detail="Task not found")
+    return task.to_dict()
@@ -0,0 +1,154 @@
+"""
+Theme routes - re-render a finished video in another style
+"""
+
+import os
+import shutil
+from pathlib import Path
+from typing import Set, Tuple
+
+from fastapi import APIRouter, HTTPException, BackgroundTasks
+from pydantic import BaseModel
+
+from ..config import OUTPUT_DIR
+from ..services.features.retheme import (
+    RethemedVideoGenerator,
+    read_retheme_progress,
+    theme_output_dir,
+)
+from ..services.pipeline.animation.config import STYLE_ALIASES, normalize_theme_style
+from ..core import (
+    load_script,
+    get_logger,
+    job_intermediate_artifacts_available,
+    job_is_final_only,
+    assert_runtime_tools_available,
+)
+
+logger = get_logger(__name__, component="themes")
+
+router = APIRouter(tags=["themes"])
+
+# (job_id, style) pairs being rethemed in this process
+_active_rethemes: Set[Tuple[str, str]] = set()
+
+# Kept after a finished retheme; progress.json keeps its status readable
+_KEEP_AFTER_RETHEME = {"final_video.mp4", "progress.json"}
+
+
+class RethemeRequest(BaseModel):
+    style: str
+
+
+class RethemeResponse(BaseModel):
+    job_id: str
+    style: str
+    status: str
+    message: str
+
+
+def _cleanup_theme_artifacts(theme_dir: Path) -> None:
+    """Remove section renders once the rethemed video is assembled."""
+    for entry in theme_dir.iterdir():
+        if entry.name in _KEEP_AFTER_RETHEME:
+            continue
+        if entry.is_dir():
+            shutil.rmtree(entry, ignore_errors=True)
+        else:
+            entry.unlink(missing_ok=True)
+
+
+@router.get("/job/{job_id}/themes")
+async def get_job_themes(job_id: str):
+    """List the rethemed versions of a job's video"""
+    job_dir = OUTPUT_DIR / job_id
+    if not job_dir.exists():
+        raise HTTPException(status_code=404, detail="Job not found")
+
+    themes = []
+    themes_dir = job_dir / "themes"
+    if themes_dir.exists():
+        for style in sorted(os.listdir(themes_dir)):
+            theme_dir = themes_dir / style
+            if not theme_dir.is_dir():
+                continue
+            has_video = (theme_dir / "final_video.mp4").exists()
+            progress = read_retheme_progress(theme_dir)
+            themes.append({
+                "style": style,
+                "has_video": has_video,
+                "video_url": f"/outputs/{job_id}/themes/{style}/final_video.mp4" if has_video else None,
+                "status": "completed" if has_video else (progress or {}).get("status", "pending"),
+                "progress": progress,
+            })
+
+    return {"job_id": job_id, "themes": themes}
+
+
+@router.post("/job/{job_id}/retheme", response_model=RethemeResponse, status_code=202)
+async def create_retheme(job_id: str, request: RethemeRequest, background_tasks: BackgroundTasks):
+    """Re-render a completed video in another style.
+
+    The sections' validated code is recolored deterministically and rendered
+    again with the original narration; no script or animation is regenerated.
+    """
+    assert_runtime_tools_available(("manim", "ffmpeg", "ffprobe"), context="retheme")
+
+    raw_style = (request.style or "").strip().lower()
+    if raw_style not in STYLE_ALIASES:
+        raise HTTPException(status_code=400, detail=f"Unknown style: {request.style}")
+    style = normalize_theme_style(raw_style)
+
+    job_dir = OUTPUT_DIR / job_id
+    if not job_dir.exists():
+        raise HTTPException(status_code=404, detail="Job not found")
+    if not (job_dir / "final_video.mp4").exists():
+        raise HTTPException(status_code=400, detail="Original video not yet generated")
+    if not job_intermediate_artifacts_available(job_id):
+        if job_is_final_only(job_id):
+            raise HTTPException(
+                status_code=409,
+                detail=(
+                    "This job was cleaned to final-video-only retention. "
+                    "Changing the style requires script and section artifacts."
+                ),
+            )
+        raise HTTPException(status_code=400, detail="Job artifacts are incomplete for a style change")
+    if (job_id, style) in _active_rethemes:
+        raise HTTPException(status_code=409, detail=f"Style change to {style} already in progress")
+
+    theme_dir = theme_output_dir(job_dir, style)
+    if (theme_dir / "final_video.mp4").exists():
+        return RethemeResponse(
+            job_id=job_id,
+            style=style,
+            status="completed",
+            message=f"Video already available in {style}",
+        )
+
+    _active_rethemes.add((job_id, style))
+    background_tasks.add_task(run_retheme, job_id, style)
+    return RethemeResponse(
+        job_id=job_id,
+        style=style,
+        status="processing",
+        message=f"Style change to {style} started",
+    )
+
+
+async def run_retheme(job_id: str, style: str) -> None:
+    """Produce the job's video in ``style`` under ``themes/<style>/``."""
+    theme_dir = theme_output_dir(OUTPUT_DIR / job_id, style)
+    try:
+        script = load_script(job_id)
+        generator = RethemedVideoGenerator(job_id, str(theme_dir), style)
+        final_video = await generator.generate(script)
+        if final_video:
+            _cleanup_theme_artifacts(theme_dir)
+            logger.info(f"Style change to {style} complete", extra={"job_id": job_id})
+        else:
+            logger.warning(f"Style change to {style} failed", extra={"job_id": job_id})
+    except Exception as e:
+        logger.error(f"Style change to {style} failed: {e}", extra={"job_id": job_id}, exc_info=True)
+    finally:
+        _active_rethemes.discard((job_id, style))
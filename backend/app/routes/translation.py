@@ -6,18 +6,25 @@ import os
 import json
 import asyncio
 import shutil
-from typing import Optional, Dict, Any
+from pathlib import Path
+from typing import Optional, Dict, Any, List
 from fastapi import APIRouter, HTTPException, BackgroundTasks
 from pydantic import BaseModel
 
 from ..config import OUTPUT_DIR
-from ..services.features.translation import get_translation_service
-from ..services.pipeline.audio import TTSEngine, create_tts_engine
+from ..services.features.translation import (
+    get_translation_service,
+    read_translation_progress,
+    resolve_source_sections,
+    translation_concurrency,
+    TranslatedVideoGenerator,
+)
+from ..services.pipeline.audio import create_tts_engine
 from ..services.pipeline.animation import ManimGenerator
 from ..core import (
-    get_media_duration,
     load_script,
     load_script_raw,
+    script_exists,
     job_intermediate_artifacts_available,
     job_is_final_only,
     assert_runtime_tools_available,
@@ -43,6 +50,16 @@ class TranslationResponse(BaseModel):
     message: str
 
 
+class BatchTranslationRequest(BaseModel):
+    target_languages: List[str]
+    voices: Optional[Dict[str, str]] = None  # language -> voice
+
+
+class BatchTranslationResponse(BaseModel):
+    job_id: str
+    translations: List[TranslationResponse]
+
+
 def get_voice_for_language(language: str) -> str:
     """Get appropriate TTS voice for a language"""
     return get_translation_default_voice(language)
@@ -76,6 +93,20 @@ def _cleanup_translation_artifacts(translation_dir: str) -> None:
                 pass
 
 
+def _load_resumable_script(script_path: Path, source_language: str) -> Optional[Dict[str, Any]]:
+    """Translated script left by an interrupted run, if it can be resumed"""
+    if not script_path.exists():
+        return None
+    try:
+        with open(script_path, "r", encoding="utf-8") as f:
+            script = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if script.get("translated_from") != source_language or not script.get("sections"):
+        return None
+    return script
+
+
 @router.get("/job/{job_id}/translations")
 async def get_job_translations(job_id: str):
     """Get all available translations for a job"""
@@ -93,18 +124,19 @@ async def get_job_translations(job_id: str):
                 script_path = lang_path / "script.json"
                 video_path = lang_path / "final_video.mp4"
 
+                progress = None if video_path.exists() else read_translation_progress(lang_path)
                 translations.append({
                     "language": lang_dir,
                     "has_script": script_path.exists(),
                     "has_video": video_path.exists(),
-                    "video_url": f"/outputs/{job_id}/translations/{lang_dir}/final_video.mp4" if video_path.exists() else None
+                    "video_url": f"/outputs/{job_id}/translations/{lang_dir}/final_video.mp4" if video_path.exists() else None,
+                    "status": "completed" if video_path.exists() else (progress or {}).get("status", "pending"),
+                    "progress": progress,
                 })
 
     original_language = "en"
-    script_path = job_dir / "script.json"
-    if script_path.exists():
-        with open(script_path, "r") as f:
-            script = json.load(f)
+    if script_exists(job_id):
+        script = load_script_raw(job_id)
         original_language = script.get("source_language", script.get("language", "en"))
 
     return {
@@ -114,9 +146,8 @@ async def get_job_translations(job_id: str):
     }
 
 
-@router.post("/job/{job_id}/translate", response_model=TranslationResponse)
-async def create_translation(job_id: str, request: TranslationRequest, background_tasks: BackgroundTasks):
-    """Start translation of a completed video to a new language"""
+def _assert_translatable(job_id: str) -> Path:
+    """Validate that a job can be translated and return its output directory"""
     assert_runtime_tools_available(("manim", "ffmpeg", "ffprobe"), context="translation generation")
 
     job_dir = OUTPUT_DIR / job_id
@@ -138,62 +169,23 @@ async def create_translation(job_id: str, request: TranslationRequest, backgroun
             )
         raise HTTPException(status_code=400, detail="Job artifacts are incomplete for translation")
 
-    script_path = job_dir / "script.json"
-    if not script_path.exists():
+    if not script_exists(job_id):
         raise HTTPException(status_code=400, detail="Script not found for this job")
 
-    target_language = request.target_language
-    translation_id = f"{job_id}_{target_language}"
+    return job_dir
 
-    translation_dir = job_dir / "translations" / target_language
-    translation_dir.mkdir(parents=True, exist_ok=True)
 
-    async def run_translation():
-        try:
-            translation_service = get_translation_service()
-
-            # Load script using the centralized loader that handles unwrapping
-            original_script = load_script(job_id)
-            
-            # For source language, try to get from raw script metadata first
-            try:
-                raw_script = load_script_raw(job_id)
-                source_language = raw_script.get("output_language", raw_script.get("detected_language", "en"))
-            except:
-                source_language = original_script.get("source_language", original_script.get("language", "en"))
-
-            print(f"[Translation] Starting translation from {source_language} to {target_language}")
-
-            translated_script = await translation_service.translate_script(
-                original_script,
-                target_language,
-                source_language
-            )
-
-            translated_script_path = translation_dir / "script.json"
-            with open(translated_script_path, "w", encoding="utf-8") as f:
-                json.dump(translated_script, f, indent=2, ensure_ascii=False)
-
-            print("[Translation] Script translated, now generating video...")
-
-            voice = request.voice if request.voice else get_voice_for_language(target_language)
-
-            await generate_translated_video(
-                job_id,
-                translated_script,
-                str(translation_dir),
-                target_language,
-                voice
-            )
-
-            print(f"[Translation] Translation complete for {target_language}")
+@router.post("/job/{job_id}/translate", response_model=TranslationResponse)
+async def create_translation(job_id: str, request: TranslationRequest, background_tasks: BackgroundTasks):
+    """Start translation of a completed video to a new language"""
+    job_dir = _assert_translatable(job_id)
 
-        except Exception as e:
-            print(f"[Translation] Error: {e}")
-            import traceback
-            traceback.print_exc()
+    target_language = request.target_language
+    translation_id = f"{job_id}_{target_language}"
+    (job_dir / "translations" / target_language).mkdir(parents=True, exist_ok=True)
 
-    background_tasks.add_task(run_translation)
+    voice = request.voice if request.voice else get_voice_for_language(target_language)
+    background_tasks.add_task(run_translations, job_id, {target_language: voice})
 
     return TranslationResponse(
         job_id=job_id,
@@ -204,205 +196,119 @@ async def create_translation(job_id: str, request: TranslationRequest, backgroun
     )
 
 
-async def generate_translated_video(
-    job_id: str,
-    translated_script: Dict[str, Any],
-    output_dir: str,
-    target_language: str,
-    voice: str
-):
-    """Generate video from translated script with translated Manim animations"""
-    from ..services.features.translation import TranslationService
-
-    tts_engine = create_tts_engine()
-    manim_gen = ManimGenerator()
-    translation_service = TranslationService()
+@router.post("/job/{job_id}/translate/batch", response_model=BatchTranslationResponse)
+async def create_translations(job_id: str, request: BatchTranslationRequest, background_tasks: BackgroundTasks):
+    """Start translation of a completed video into several languages at once.
 
-    source_language = translated_script.get("translated_from", "en")
-
-    sections = translated_script.get("sections", [])
-    section_videos = []
-
-    for i, section in enumerate(sections):
-        print(f"[Translation] Processing section {i+1}/{len(sections)}")
+    The source script, section directories and Manim code analysis are shared
+    by all languages, and their sections share one concurrency limit.
+    """
+    job_dir = _assert_translatable(job_id)
 
-        section_dir = os.path.join(output_dir, f"section_{i}")
-        os.makedirs(section_dir, exist_ok=True)
+    languages = [lang for lang in dict.fromkeys(request.target_languages) if lang]
+    if not languages:
+        raise HTTPException(status_code=400, detail="No target languages given")
 
-        narration = section.get("tts_narration", section.get("narration", ""))
-        if not narration:
-            continue
+    voices = request.voices or {}
+    targets = {lang: voices.get(lang) or get_voice_for_language(lang) for lang in languages}
+    for lang in languages:
+        (job_dir / "translations" / lang).mkdir(parents=True, exist_ok=True)
 
-        audio_path = os.path.join(section_dir, "audio.mp3")
+    background_tasks.add_task(run_translations, job_id, targets)
 
-        try:
-            await tts_engine.generate_speech(
-                text=narration,
-                output_path=audio_path,
-                voice=voice
+    return BatchTranslationResponse(
+        job_id=job_id,
+        translations=[
+            TranslationResponse(
+                job_id=job_id,
+                translation_id=f"{job_id}_{lang}",
+                target_language=lang,
+                status="processing",
+                message=f"Translation to {lang} started"
             )
-        except Exception as e:
-            print(f"[Translation] TTS error for section {i}: {e}")
-            continue
-
-        audio_duration = await get_media_duration(audio_path)
-
-        # Find original section directory
-        original_section_dir = None
-        section_video_path = section.get("video", "")
-        section_audio_path = section.get("audio", "")
-
-        if section_video_path and os.path.exists(section_video_path):
-            original_section_dir = os.path.dirname(section_video_path)
-        elif section_audio_path and os.path.exists(section_audio_path):
-            original_section_dir = os.path.dirname(section_audio_path)
-
-        if not original_section_dir or not os.path.isdir(original_section_dir):
-            section_id_dir = section.get("id")
-            possible_dirs = []
-            if section_id_dir:
-                possible_dirs.append(os.path.join(str(OUTPUT_DIR), job_id, "sections", section_id_dir))
-            possible_dirs.append(os.path.join(str(OUTPUT_DIR), job_id, "sections", f"section_{i}"))
-
-            for sd in possible_dirs:
-                if os.path.isdir(sd):
-                    original_section_dir = sd
-                    break
-
-        if not original_section_dir:
-            original_section_dir = os.path.join(str(OUTPUT_DIR), job_id, "sections", section.get("id", f"section_{i}"))
-
-        original_manim_path = ""
-        if os.path.isdir(original_section_dir):
-            for f in os.listdir(original_section_dir):
-                if f.startswith("scene") and f.endswith(".py"):
-                    original_manim_path = os.path.join(original_section_dir, f)
-                    break
+            for lang in languages
+        ]
+    )
 
-        original_manim = section.get("manim_code", "")
 
-        if not original_manim and original_manim_path and os.path.exists(original_manim_path):
-            with open(original_manim_path, "r") as f:
-                original_manim = f.read()
+async def run_translations(job_id: str, targets: Dict[str, str]) -> None:
+    """Translate a job into each ``{language: voice}`` of ``targets``.
 
-        video_path = None
+    The script is loaded and the original sections are resolved once; the
+    scripts are translated together and each language's video is then
+    produced concurrently under one shared section limit. Languages with a
+    saved translation resume from it.
+    """
+    job_dir = OUTPUT_DIR / job_id
+    try:
+        translation_service = get_translation_service()
 
-        if original_manim:
-            try:
-                translated_manim = await translation_service.translate_manim_code(
-                    original_manim,
-                    target_language,
-                    source_language
-                )
-
-                translated_manim_path = os.path.join(section_dir, "scene.py")
-                with open(translated_manim_path, "w", encoding="utf-8") as f:
-                    f.write(translated_manim)
-
-                video_path = await manim_gen.render_from_code(
-                    translated_manim,
-                    section_dir,
-                    section_index=i
-                )
-
-            except Exception as e:
-                print(f"[Translation] Manim translation/render error: {e}")
-                video_path = None
-
-        if not video_path or not os.path.exists(video_path):
-            original_section_video = os.path.join(original_section_dir, "final_section.mp4") if original_section_dir else ""
-            if not os.path.exists(original_section_video):
-                original_section_video = section.get("video", "")
-
-            if os.path.exists(original_section_video):
-                video_path = original_section_video
-            else:
-                continue
-
-        video_duration = await get_media_duration(video_path)
-        output_video = os.path.join(section_dir, "translated_section.mp4")
-
-        if audio_duration > video_duration * 0.9 and audio_duration < video_duration * 1.5:
-            speed_factor = video_duration / audio_duration
-            cmd = [
-                "ffmpeg", "-y",
-                "-i", video_path,
-                "-i", audio_path,
-                "-filter_complex", f"[0:v]setpts={1/speed_factor}*PTS[v]",
-                "-map", "[v]",
-                "-map", "1:a",
-                "-c:v", "libx264",
-                "-c:a", "aac",
-                "-shortest",
-                output_video
-            ]
-        elif audio_duration > video_duration * 1.5:
-            extend_duration = audio_duration - video_duration
-            cmd = [
-                "ffmpeg", "-y",
-                "-i", video_path,
-                "-i", audio_path,
-                "-filter_complex", f"[0:v]tpad=stop_mode=clone:stop_duration={extend_duration}[v]",
-                "-map", "[v]",
-                "-map", "1:a",
-                "-c:v", "libx264",
-                "-c:a", "aac",
-                output_video
-            ]
-        else:
-            silence_duration = video_duration - audio_duration
-            cmd = [
-                "ffmpeg", "-y",
-                "-i", video_path,
-                "-i", audio_path,
-                "-filter_complex", f"[1:a]apad=pad_dur={silence_duration}[a]",
-                "-map", "0:v",
-                "-map", "[a]",
-                "-c:v", "libx264",
-                "-c:a", "aac",
-                "-t", str(video_duration),
-                output_video
-            ]
+        # Load script using the centralized loader that handles unwrapping
+        original_script = load_script(job_id)
 
+        # For source language, try to get from raw script metadata first
         try:
-            process = await asyncio.create_subprocess_exec(
-                *cmd,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE
+            raw_script = load_script_raw(job_id)
+            source_language = raw_script.get("output_language", raw_script.get("detected_language", "en"))
+        except Exception:
+            source_language = original_script.get("source_language", original_script.get("language", "en"))
+
+        translated_scripts: Dict[str, Dict[str, Any]] = {}
+        for lang in targets:
+            translation_dir = job_dir / "translations" / lang
+            translation_dir.mkdir(parents=True, exist_ok=True)
+            saved = _load_resumable_script(translation_dir / "script.json", source_language)
+            if saved is not None:
+                # Resume: keep the saved translation so finished sections still match it
+                print(f"[Translation] Resuming translation to {lang}")
+                translated_scripts[lang] = saved
+
+        pending = [lang for lang in targets if lang not in translated_scripts]
+        if pending:
+            print(f"[Translation] Starting translation from {source_language} to {', '.join(pending)}")
+            translated = await translation_service.translate_script_multi(
+                original_script,
+                pending,
+                source_language
             )
-            _, stderr = await asyncio.wait_for(process.communicate(), timeout=300)
+            for lang, translated_script in translated.items():
+                with open(job_dir / "translations" / lang / "script.json", "w", encoding="utf-8") as f:
+                    json.dump(translated_script, f, indent=2, ensure_ascii=False)
+            translated_scripts.update(translated)
 
-            if process.returncode == 0 and os.path.exists(output_video):
-                section_videos.append(output_video)
-            else:
-                print(f"[Translation] FFmpeg error: {stderr.decode()[:500]}")
-        except Exception as e:
-            print(f"[Translation] Error processing section {i}: {e}")
-
-    if section_videos:
-        final_video = os.path.join(output_dir, "final_video.mp4")
-
-        concat_file = os.path.join(output_dir, "concat.txt")
-        with open(concat_file, "w", encoding="utf-8") as f:
-            for video in section_videos:
-                f.write(f"file '{video}'\n")
-
-        cmd = [
-            "ffmpeg", "-y",
-            "-f", "concat",
-            "-safe", "0",
-            "-i", concat_file,
-            "-c", "copy",
-            final_video
-        ]
+        print("[Translation] Scripts translated, now generating videos...")
 
-        process = await asyncio.create_subprocess_exec(
-            *cmd,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE
-        )
-        await process.communicate()
+        source_sections = resolve_source_sections(job_id, original_script.get("sections", []))
+        semaphore = asyncio.Semaphore(translation_concurrency())
+        tts_engine = create_tts_engine()
+        manim_generator = ManimGenerator()
 
-        if os.path.exists(final_video):
-            _cleanup_translation_artifacts(output_dir)
-            print(f"[Translation] Final video created: {final_video}")
+        async def produce(lang: str) -> None:
+            output_dir = str(job_dir / "translations" / lang)
+            generator = TranslatedVideoGenerator(
+                job_id,
+                output_dir,
+                lang,
+                targets[lang],
+                semaphore=semaphore,
+                translation_service=translation_service,
+                tts_engine=tts_engine,
+                manim_generator=manim_generator,
+            )
+            final_video = await generator.generate(translated_scripts[lang], source_sections)
+            if final_video and os.path.exists(final_video):
+                _cleanup_translation_artifacts(output_dir)
+                print(f"[Translation] Translation complete for {lang}: {final_video}")
+            else:
+                print(f"[Translation] No video produced for {lang}")
+
+        languages = list(translated_scripts)
+        results = await asyncio.gather(*(produce(lang) for lang in languages), return_exceptions=True)
+        for lang, result in zip(languages, results):
+            if isinstance(result, Exception):
+                print(f"[Translation] Error for {lang}: {result}")
+
+    except Exception as e:
+        print(f"[Translation] Error: {e}")
+        import traceback
+        traceback.print_exc()
@@ -0,0 +1,133 @@
+"""
+Job response revisions - ETags and cached responses for job detail endpoints
+
+The job detail endpoints (details, section details, script, sections) rebuild
+their responses from disk on every request: parse script.json, glob every
+section directory, read status files and code. Polling clients mostly get
+the same answer again.
+
+A revision is a fingerprint of everything such a response is built from:
+the job record's state and the stat (mtime, size) of the job's script files
+and of the entries of its section directories. Computing it takes a few
+``stat`` calls and no file reads. Responses carry it as a weak ETag, a
+matching ``If-None-Match`` is answered with 304, and the built response is
+kept in memory per revision (JOB_RESPONSE_CACHE_SIZE entries, LRU), so
+unchanged jobs are served without touching their files again.
+"""
+
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Hashable, Iterable, List, Optional, Tuple
+
+from app.adapters.script_store import SCRIPT_STORE_DIRNAME
+from app.config import OUTPUT_DIR
+
+DEFAULT_CACHE_SIZE = 256
+
+_SCRIPT_FILES = ("script.json", "script_progress.json")
+
+
+def _stat_key(path: Path) -> Tuple[Any, ...]:
+    try:
+        st = path.stat()
+    except OSError:
+        return (path.name, None)
+    return (path.name, st.st_mtime_ns, st.st_size)
+
+
+def _dir_entries(path: Path) -> List[Tuple[Any, ...]]:
+    """Stat keys of the entries of a directory (not recursive)."""
+    entries = []
+    try:
+        with os.scandir(path) as it:
+            for entry in it:
+                try:
+                    st = entry.stat()
+                except OSError:
+                    continue
+                entries.append((entry.name, st.st_mtime_ns, st.st_size))
+    except OSError:
+        return []
+    entries.sort()
+    return entries
+
+
+def job_files_revision(
+    job_id: str,
+    state: Iterable[Any] = (),
+    sections: bool = True,
+    section_index: Optional[int] = None,
+) -> str:
+    """Fingerprint of a job's script files, section files and ``state``.
+
+    ``sections`` covers every section directory; ``section_index`` only that
+    section's directory (and its merged video).
+    """
+    job_dir = OUTPUT_DIR / job_id
+    sections_dir = job_dir / "sections"
+    store_dir = job_dir / SCRIPT_STORE_DIRNAME
+    parts: List[Any] = [tuple(state)]
+    parts.extend(_stat_key(job_dir / name) for name in _SCRIPT_FILES)
+    # A script store rewrites its meta.json with every record change
+    parts.append(_stat_key(store_dir / "meta.json"))
+
+    if section_index is not None:
+        parts.append(_stat_key(sections_dir / f"merged_{section_index}.mp4"))
+        parts.append(_dir_entries(sections_dir / str(section_index)))
+    elif sections:
+        for name, *stat in _dir_entries(sections_dir):
+            parts.append((name, *stat))
+            child = sections_dir / name
+            if child.is_dir():
+                parts.append(_dir_entries(child))
+
+    return hashlib.blake2b(repr(parts).encode("utf-8"), digest_size=12).hexdigest()
+
+
+class ResponseCache:
+    """Built responses by key, valid for one revision each (LRU)."""
+
+    def __init__(self, max_entries: Optional[int] = None):
+        if max_entries is None:
+            try:
+                max_entries = int(os.getenv("JOB_RESPONSE_CACHE_SIZE", DEFAULT_CACHE_SIZE))
+            except ValueError:
+                max_entries = DEFAULT_CACHE_SIZE
+        self.max_entries = max(max_entries, 0)
+        self._entries: "OrderedDict[Hashable, Tuple[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_or_build(self, key: Hashable, revision: str, build: Callable[[], Any]) -> Any:
+        """The cached response for ``revision``, or ``build()`` (then cached)."""
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None and cached[0] == revision:
+                self._entries.move_to_end(key)
+                return cached[1]
+
+        value = build()
+        if self.max_entries:
+            with self._lock:
+                self._entries[key] = (revision, value)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+        return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+_response_cache: Optional[ResponseCache] = None
+
+
+def get_response_cache() -> ResponseCache:
+    """Get the shared response cache of this process."""
+    global _response_cache
+    if _response_cache is None:
+        _response_cache = ResponseCache()
+    return _response_cache
@@ -4,19 +4,34 @@ Business logic for job management, extracted from routes to follow clean archite
 """
 
 import json
+import os
 import shutil
+from dataclasses import asdict
 from pathlib import Path
-from typing import List, Optional, Dict, Any, Tuple
+from typing import AsyncIterator, Awaitable, Callable, List, Optional, Dict, Any, Tuple
 
 from fastapi import HTTPException
 
 from app.config import OUTPUT_DIR
 from app.models import JobResponse, DetailedProgress, SectionProgress
-from app.services.infrastructure.storage import FileBasedJobRepository
+from app.services.infrastructure.storage import FileBasedJobRepository, SqliteJobRepository
+from app.services.infrastructure.orchestration import (
+    build_job_summary,
+    filter_job_summaries,
+    get_job_summary_index,
+    get_task_queue,
+    job_summary_index_enabled,
+    parse_status_filter,
+    refresh_job_summary,
+    sqlite_job_store_enabled,
+    task_queue_enabled,
+    validate_listing_params,
+)
+from app.services.infrastructure.orchestration.job_manager import ACTIVE_STATUSES
 from app.services.pipeline.audio import TTSEngine
 from app.core import (
     load_script,
-    get_script_metadata,
+    load_script_section,
     validate_job_id,
     validate_path_within_directory,
     load_video_info,
@@ -24,17 +39,21 @@ from app.core import (
     list_all_failures,
     save_video_info,
     save_script,
+    cancel_job,
+    get_job_event_bus,
+    format_sse,
 )
 from app.routes.jobs_helpers import (
     get_stage_from_status,
     build_sections_progress,
     get_current_section_index,
 )
+from app.services.features.jobs.revisions import job_files_revision
 
 
 class JobService:
     def __init__(self):
-        self.repo = FileBasedJobRepository()
+        self.repo = SqliteJobRepository() if sqlite_job_store_enabled() else FileBasedJobRepository()
 
     def get_job_status(self, job_id: str) -> JobResponse:
         """Get the status of a video generation job."""
@@ -77,6 +96,9 @@ class JobService:
                 updated_any = True
         except HTTPException:
             pass
+
+        if updated_any:
+            refresh_job_summary(job_id)
             
         if not job and not updated_any:
             raise HTTPException(status_code=404, detail="Job not found")
@@ -153,171 +175,116 @@ class JobService:
         
         raise HTTPException(status_code=404, detail="Section video not found")
 
-    def list_all_jobs(self) -> Dict[str, List[Dict[str, Any]]]:
-        """List all jobs and completed videos."""
-        jobs_list = self.repo.list_all()
-        seen_ids = set()
-        jobs = []
-
-        # Process active jobs from job_data
-        for job in jobs_list:
-            seen_ids.add(job.id)
-            job_dict = {
-                "id": job.id,
-                "status": job.status,
-                "progress": job.progress,
-                "message": job.message,
-                "created_at": job.created_at,
-                "updated_at": job.updated_at,
-                "result": job.result,
-                "error": job.error,
-            }
-
-            video_path = OUTPUT_DIR / job.id / "final_video.mp4"
-            job_dict["video_exists"] = video_path.exists()
-            job_dict["video_url"] = f"/outputs/{job.id}/final_video.mp4" if job_dict["video_exists"] else None
-
-            # Try video_info.json first (survives cleanup), fallback to script.json
-            video_info = load_video_info(job.id)
-            if video_info:
-                job_dict["title"] = video_info.title
-                job_dict["total_duration"] = video_info.duration
-                job_dict["sections_count"] = len(video_info.chapters)
-                job_dict["thumbnail_url"] = video_info.thumbnail_url
-            else:
-                try:
-                    script = load_script(job.id)
-                    job_dict.update(get_script_metadata(script))
-                except HTTPException:
-                    pass
+    def list_all_jobs(
+        self,
+        status: Optional[str] = None,
+        q: Optional[str] = None,
+        sort: Optional[str] = None,
+        order: Optional[str] = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+    ) -> Dict[str, Any]:
+        """List jobs and completed videos, filtered, sorted and paginated.
+
+        ``status`` is a comma-separated list of statuses and ``q`` matches
+        titles; the default order is newest first and without ``limit``
+        every matching job is returned.
+        """
+        return self._list_jobs(parse_status_filter(status), q, sort, order, limit, offset, completed_only=False)
+
+    def list_completed_jobs(
+        self,
+        q: Optional[str] = None,
+        sort: Optional[str] = None,
+        order: Optional[str] = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+    ) -> Dict[str, Any]:
+        """List only completed jobs with videos, filtered, sorted and paginated."""
+        return self._list_jobs((), q, sort, order, limit, offset, completed_only=True)
+
+    def _list_jobs(
+        self,
+        statuses: Tuple[str, ...],
+        q: Optional[str],
+        sort: Optional[str],
+        order: Optional[str],
+        limit: Optional[int],
+        offset: int,
+        completed_only: bool,
+    ) -> Dict[str, Any]:
+        sort_field, descending = validate_listing_params(sort, order, limit, offset)
+        params = dict(
+            statuses=statuses,
+            query=q,
+            completed_only=completed_only,
+            sort=sort_field,
+            descending=descending,
+            limit=limit,
+            offset=offset,
+        )
 
-            jobs.append(job_dict)
+        if job_summary_index_enabled():
+            jobs, total = get_job_summary_index().query(**params)
+            self._overlay_live_progress(jobs)
+        else:
+            jobs, total = filter_job_summaries(self._scan_job_summaries(), **params)
 
-        # Add completed videos without job_data (orphaned after cleanup)
-        for video_info in list_all_videos():
-            if video_info.video_id in seen_ids:
-                continue
-            
-            video_path = OUTPUT_DIR / video_info.video_id / "final_video.mp4"
-            if not video_path.exists():
-                continue
-            
-            jobs.append({
-                "id": video_info.video_id,
-                "status": "completed",
-                "progress": 100,
-                "message": "Video ready",
-                "created_at": video_info.created_at or "",
-                "updated_at": video_info.created_at or "",
-                "result": None,
-                "error": None,
-                "video_exists": True,
-                "video_url": f"/outputs/{video_info.video_id}/final_video.mp4",
-                "title": video_info.title,
-                "total_duration": video_info.duration,
-                "sections_count": len(video_info.chapters),
-                "thumbnail_url": video_info.thumbnail_url,
-            })
-            seen_ids.add(video_info.video_id)
-
-        # Add persistent failures (job data cleaned but error persisted)
-        for error_info in list_all_failures():
-            if error_info.job_id in seen_ids:
-                continue
+        return {"jobs": jobs, "total": total, "offset": offset, "limit": limit}
 
-            jobs.append({
-                "id": error_info.job_id,
-                "status": "failed",
-                "progress": 0,
-                "message": error_info.error_message,
-                "created_at": error_info.timestamp,
-                "updated_at": error_info.timestamp,
-                "result": None,
-                "error": error_info.error_message,
-                "video_exists": False,
-                "video_url": None,
-                "title": error_info.title or f"Failed Job ({error_info.job_id[:8]})",
-            })
-
-        return {"jobs": jobs}
-
-    def list_completed_jobs(self) -> Dict[str, List[Dict[str, Any]]]:
-        """List only completed jobs with videos."""
-        jobs_list = self.repo.list_completed()
+    def _scan_job_summaries(self) -> List[Dict[str, Any]]:
+        """Summaries of every job record and orphaned output, read from disk."""
+        summaries = []
         seen_ids = set()
-        completed = []
 
-        for job in jobs_list:
+        for job in self.repo.list_all():
             seen_ids.add(job.id)
-            video_path = OUTPUT_DIR / job.id / "final_video.mp4"
-            if not video_path.exists():
-                continue
-
-            job_dict = {
-                "id": job.id,
-                "status": job.status,
-                "progress": job.progress,
-                "message": job.message,
-                "created_at": job.created_at,
-                "updated_at": job.updated_at,
-                "result": job.result,
-                "error": job.error,
-                "video_url": f"/outputs/{job.id}/final_video.mp4",
-            }
-
-            # Try video_info.json first (survives cleanup), fallback to script.json
-            video_info = load_video_info(job.id)
-            if video_info:
-                job_dict["title"] = video_info.title
-                job_dict["total_duration"] = video_info.duration
-                job_dict["sections_count"] = len(video_info.chapters)
-                job_dict["thumbnail_url"] = video_info.thumbnail_url
-            else:
-                try:
-                    script = load_script(job.id)
-                    job_dict.update(get_script_metadata(script))
-                except HTTPException:
-                    pass
-
-            completed.append(job_dict)
+            summaries.append(build_job_summary(job.id, asdict(job)))
 
-        # Add orphaned videos (video exists but job_data cleaned)
-        for video_info in list_all_videos():
-            if video_info.video_id in seen_ids:
+        # Completed videos and persisted failures whose job data was cleaned
+        orphan_ids = [info.video_id for info in list_all_videos()]
+        orphan_ids += [info.job_id for info in list_all_failures()]
+        for job_id in orphan_ids:
+            if job_id in seen_ids:
                 continue
-            
-            video_path = OUTPUT_DIR / video_info.video_id / "final_video.mp4"
-            if not video_path.exists():
+            seen_ids.add(job_id)
+            summary = build_job_summary(job_id, None)
+            if summary:
+                summaries.append(summary)
+
+        return summaries
+
+    def _overlay_live_progress(self, jobs: List[Dict[str, Any]]) -> None:
+        """Indexed rows of running jobs get their current progress and message."""
+        active = {status.value for status in ACTIVE_STATUSES}
+        for summary in jobs:
+            if summary["status"] not in active:
                 continue
-            
-            completed.append({
-                "id": video_info.video_id,
-                "status": "completed",
-                "progress": 100,
-                "message": "Video ready",
-                "created_at": video_info.created_at or "",
-                "updated_at": video_info.created_at or "",
-                "result": None,
-                "error": None,
-                "video_url": f"/outputs/{video_info.video_id}/final_video.mp4",
-                "title": video_info.title,
-                "total_duration": video_info.duration,
-                "sections_count": len(video_info.chapters),
-                "thumbnail_url": video_info.thumbnail_url,
-            })
-
-        return {"jobs": completed}
+            job = self.repo.get(summary["id"])
+            if job:
+                summary.update(
+                    status=job.status,
+                    progress=job.progress,
+                    message=job.message,
+                    updated_at=job.updated_at,
+                )
 
     def delete_job(self, job_id: str) -> Dict[str, Any]:
         """Delete a job and its associated files."""
         if not validate_job_id(job_id):
             raise HTTPException(status_code=400, detail="Invalid job ID format")
 
+        # Stop in-flight work (and its renders) before removing its files
+        cancel_job(job_id, reason="deleted")
+        if task_queue_enabled():
+            # Queued tasks lose their lease; worker processes abandon them
+            get_task_queue().cancel_job(job_id)
         deleted = self.repo.delete(job_id)
 
         output_path = (OUTPUT_DIR / job_id).resolve()
         if validate_path_within_directory(output_path, OUTPUT_DIR) and output_path.exists():
             shutil.rmtree(output_path)
+        refresh_job_summary(job_id)
 
         return {"message": f"Job {job_id} deleted successfully", "deleted": deleted}
 
@@ -333,11 +300,106 @@ class JobService:
                 output_path = (OUTPUT_DIR / job.id).resolve()
                 if validate_path_within_directory(output_path, OUTPUT_DIR) and output_path.exists():
                     shutil.rmtree(output_path)
+                refresh_job_summary(job.id)
 
                 deleted_count += 1
 
         return {"message": f"Deleted {deleted_count} failed jobs", "deleted_count": deleted_count}
 
+    def get_progress_snapshot(self, job_id: str) -> Dict[str, Any]:
+        """Current progress of a job without reading its script or sections.
+
+        The job fields come from the job record; the current stage and the
+        finished sections from the events published in this process. Pass
+        ``last_event_id`` to the event stream to continue from here.
+        """
+        if not validate_job_id(job_id):
+            raise HTTPException(status_code=400, detail="Invalid job ID format")
+        job = self.repo.get(job_id)
+        if not job:
+            raise HTTPException(status_code=404, detail="Job not found")
+
+        snapshot = get_job_event_bus().snapshot(job_id)
+        snapshot["job"] = _job_event_fields(job)
+        return snapshot
+
+    async def stream_job_events(
+        self,
+        job_id: str,
+        last_event_id: Optional[int] = None,
+        is_disconnected: Optional[Callable[[], Awaitable[bool]]] = None,
+    ) -> AsyncIterator[str]:
+        """Server-sent events of a job's progress, until the client disconnects.
+
+        Starts with the events after ``last_event_id`` when they are still
+        kept, otherwise with a ``snapshot`` event. While no event arrives the
+        job record is re-read every JOB_EVENTS_HEARTBEAT_SECONDS, which picks
+        up progress made by worker processes and keeps the connection alive.
+        """
+        bus = get_job_event_bus()
+        heartbeat = _heartbeat_seconds()
+        subscription = bus.subscribe(job_id)
+        try:
+            yield f"retry: {int(heartbeat * 1000)}\n\n"
+
+            backlog = bus.events_since(job_id, last_event_id) if last_event_id is not None else None
+            if backlog is None:
+                snapshot = self.get_progress_snapshot(job_id)
+                last_sent = snapshot["last_event_id"]
+                yield format_sse("snapshot", snapshot, last_sent)
+            else:
+                last_sent = last_event_id
+                for event in backlog:
+                    last_sent = event.id
+                    yield format_sse(event.type, event.data, event.id)
+
+            while not (is_disconnected and await is_disconnected()):
+                event = await subscription.get(timeout=heartbeat)
+                if subscription.lagged:
+                    subscription.reset()
+                    snapshot = self.get_progress_snapshot(job_id)
+                    last_sent = snapshot["last_event_id"]
+                    yield format_sse("snapshot", snapshot, last_sent)
+                    continue
+                if event is None:
+                    job = self.repo.get(job_id)
+                    if job is None:
+                        yield format_sse("deleted", {"job_id": job_id})
+                        return
+                    if not bus.sync_job(job_id, _job_event_fields(job)):
+                        yield ": keep-alive\n\n"
+                    continue
+                if event.id <= last_sent:
+                    # Already sent as part of the backlog or snapshot
+                    continue
+                last_sent = event.id
+                yield format_sse(event.type, event.data, event.id)
+                if event.type == "deleted":
+                    return
+        finally:
+            subscription.close()
+
+    def job_details_revision(self, job_id: str) -> str:
+        """Revision of a job's details: its state, script and section files."""
+        if not validate_job_id(job_id):
+            raise HTTPException(status_code=400, detail="Invalid job ID format")
+        job = self.repo.get(job_id)
+        if not job:
+            raise HTTPException(status_code=404, detail="Job not found")
+        return job_files_revision(job_id, state=(job.status, job.progress, job.message, job.updated_at))
+
+    def section_details_revision(self, job_id: str, section_index: int) -> str:
+        """Revision of one section's details: the script and the section's files."""
+        if not validate_job_id(job_id):
+            raise HTTPException(status_code=400, detail="Invalid job ID format")
+        return job_files_revision(job_id, section_index=section_index)
+
+    def script_revision(self, job_id: str) -> str:
+        """Revision of a job's script."""
+        if not validate_job_id(job_id):
+            raise HTTPException(status_code=400, detail="Invalid job ID format")
+        return job_files_revision(job_id, sections=False)
+
     def get_job_details(self, job_id: str) -> DetailedProgress:
         """Get detailed progress information for a job including all sections."""
         job = self.repo.get(job_id)
@@ -456,13 +518,7 @@ class JobService:
         if not validate_job_id(job_id):
             raise HTTPException(status_code=400, detail="Invalid job ID format")
 
-        script = load_script(job_id)
-
-        sections = script.get("sections", [])
-        if section_index < 0 or section_index >= len(sections):
-            raise HTTPException(status_code=404, detail="Section not found")
-
-        section = sections[section_index]
+        section, _ = load_script_section(job_id, section_index)
         section_id = section.get("id", f"section_{section_index}")
         sections_dir = OUTPUT_DIR / job_id / "sections"
         if not validate_path_within_directory(sections_dir, OUTPUT_DIR):
@@ -561,3 +617,21 @@ class JobService:
             return payload if isinstance(payload, dict) else {}
         except Exception:
             return {}
+
+
+def _job_event_fields(job) -> Dict[str, Any]:
+    """A job record's fields as published in progress events."""
+    return {
+        "status": job.status,
+        "progress": job.progress,
+        "message": job.message,
+        "error": job.error,
+        "updated_at": job.updated_at,
+    }
+
+
+def _heartbeat_seconds() -> float:
+    try:
+        return max(float(os.getenv("JOB_EVENTS_HEARTBEAT_SECONDS", 5.0)), 0.5)
+    except ValueError:
+        return 5.0
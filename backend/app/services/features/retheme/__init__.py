@@ -0,0 +1,19 @@
+"""Retheme feature - re-render a finished video in another theme."""
+
+from .manim_theme import RethemeError, detect_theme_style, retheme_manim_code
+from .video_rethemer import (
+    RethemedVideoGenerator,
+    read_retheme_progress,
+    retheme_concurrency,
+    theme_output_dir,
+)
+
+__all__ = [
+    "RethemeError",
+    "detect_theme_style",
+    "retheme_manim_code",
+    "RethemedVideoGenerator",
+    "read_retheme_progress",
+    "retheme_concurrency",
+    "theme_output_dir",
+]
@@ -0,0 +1,123 @@
+"""
+Manim Theme - Deterministic palette/background rewrite of section code
+
+A theme only changes colors: the camera background, the Mobject/Text default
+colors injected at the top of ``construct`` and the palette colors the LLM
+stages were told to use (THEME_PROMPT_SPECS). Moving finished code to another
+theme is therefore a syntax-tree rewrite (see ColorLiteralTransformer and
+ThemeSetupTransformer in the refinement CST fixer), not a new generation:
+
+- palette hex literals map role by role (background, primary and secondary
+  text, accents by index) to the target palette
+- between light and dark themes, pure white/black foreground colors map to
+  the target's primary text color so they stay readable
+- the previous theme setup statements are replaced by the target's
+"""
+
+import re
+from typing import Dict, List, Optional, Tuple
+
+import libcst as cst
+
+from app.core import get_logger
+from app.services.pipeline.animation.config import THEME_PROMPT_SPECS, normalize_theme_style
+from app.services.pipeline.animation.generation.core.code_helpers import (
+    get_theme_setup_code,
+    get_theme_text_defaults_code,
+)
+from app.services.pipeline.animation.generation.refinement.cst_fixer import (
+    ColorLiteralTransformer,
+    ThemeSetupTransformer,
+)
+
+logger = get_logger(__name__, component="manim_theme")
+
+DEFAULT_SOURCE_STYLE = "3b1b"
+
+_BACKGROUND_ASSIGNMENT = re.compile(
+    r"self\.camera\.background_color\s*=\s*['\"](#[0-9A-Fa-f]{6})['\"]"
+)
+
+# Foreground extremes that only read well on one kind of background
+_DARK_THEME_FOREGROUND = ("#FFFFFF", "WHITE")
+_LIGHT_THEME_FOREGROUND = ("#000000", "BLACK")
+
+
+class RethemeError(Exception):
+    """Section code cannot be moved to another theme"""
+
+
+def _is_light(hex_color: str) -> bool:
+    r, g, b = (int(hex_color[i:i + 2], 16) for i in (1, 3, 5))
+    return (0.299 * r + 0.587 * g + 0.114 * b) / 255 > 0.5
+
+
+def detect_theme_style(manim_code: str) -> Optional[str]:
+    """The theme whose background the code sets, if it is a known one"""
+    match = _BACKGROUND_ASSIGNMENT.search(manim_code or "")
+    if not match:
+        return None
+    background = match.group(1).upper()
+    for style, spec in THEME_PROMPT_SPECS.items():
+        if spec["background"].upper() == background:
+            return style
+    return None
+
+
+def theme_color_maps(source_style: str, target_style: str) -> Tuple[Dict[str, str], Dict[str, str]]:
+    """Hex and color-constant replacements that move ``source_style`` code to ``target_style``"""
+    source = THEME_PROMPT_SPECS[normalize_theme_style(source_style)]
+    target = THEME_PROMPT_SPECS[normalize_theme_style(target_style)]
+
+    hex_map: Dict[str, str] = {}
+    for role in ("background", "primary_text", "secondary_text"):
+        hex_map.setdefault(source[role].upper(), target[role])
+    for old, new in zip(source["accents"], target["accents"]):
+        hex_map.setdefault(old.upper(), new)
+
+    name_map: Dict[str, str] = {}
+    source_light = _is_light(source["background"])
+    if source_light != _is_light(target["background"]):
+        hex_color, name = _LIGHT_THEME_FOREGROUND if source_light else _DARK_THEME_FOREGROUND
+        hex_map.setdefault(hex_color, target["primary_text"])
+        name_map[name] = target["primary_text"]
+    return hex_map, name_map
+
+
+def theme_setup_statements(style: str) -> List[str]:
+    """Statements that set ``style`` up at the start of ``construct``"""
+    code = get_theme_setup_code(style) + get_theme_text_defaults_code(style)
+    return [
+        line.strip() for line in code.splitlines()
+        if line.strip() and not line.strip().startswith("#")
+    ]
+
+
+def retheme_manim_code(manim_code: str, target_style: str, source_style: Optional[str] = None) -> str:
+    """Rewrite finished scene code from its theme to ``target_style``.
+
+    ``source_style`` defaults to the theme detected from the code's background.
+
+    Raises:
+        RethemeError: if the code does not parse or has no ``construct`` method.
+    """
+    target = normalize_theme_style(target_style)
+    source = normalize_theme_style(
+        source_style or detect_theme_style(manim_code) or DEFAULT_SOURCE_STYLE
+    )
+    try:
+        module = cst.parse_module(manim_code)
+    except cst.ParserSyntaxError as e:
+        raise RethemeError(f"Cannot parse scene code: {e}") from e
+
+    if source != target:
+        # Colors first: the new setup statements must not be remapped again
+        module = module.visit(ColorLiteralTransformer(*theme_color_maps(source, target)))
+
+    setup = ThemeSetupTransformer(theme_setup_statements(target))
+    module = module.visit(setup)
+    if not setup.constructs:
+        raise RethemeError("Scene code has no construct() method")
+
+    logger.debug("Rethemed scene code", extra={"source_style": source, "target_style": target})
+    return module.code
@@ -0,0 +1,279 @@
+"""
+Rethemed Video Generator - Produces a job's video in another theme
+
+Changing the style of a finished job does not need the LLM pipeline: each
+section's validated scene code is rewritten to the new palette
+(retheme_manim_code), re-rendered and merged with the section's original
+narration audio, and the sections are concatenated again. Nothing is
+regenerated, so the timing - and therefore the audio - still matches.
+
+Output goes to ``<job>/themes/<style>/``: ``section_{i}/themed_section.mp4``
+per section (reused by a re-run, so an interrupted retheme resumes),
+``progress.json`` and ``final_video.mp4``. A retheme only succeeds if every
+section could be moved; a video mixing two themes is never assembled.
+"""
+
+import asyncio
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from app.core import get_logger, get_media_duration, place_file, run_process_async, JobCancelledError
+from app.core import PriorityClass
+from app.services.features.translation.video_translator import (
+    SourceSection,
+    resolve_source_sections,
+)
+from app.services.pipeline.animation.config import RENDER_TIMEOUT, normalize_theme_style
+from app.services.pipeline.assembly.ffmpeg import build_merge_no_cut_cmd
+from app.services.pipeline.assembly.section_tasks import find_scene_class, render_section_video
+
+from .manim_theme import RethemeError, retheme_manim_code
+
+logger = get_logger(__name__, component="rethemed_video")
+
+SECTION_VIDEO_NAME = "themed_section.mp4"
+PROGRESS_FILE_NAME = "progress.json"
+FFMPEG_TIMEOUT = 300
+
+# Narration files a finished section directory may hold, in preference order
+_SECTION_AUDIO_NAMES = ("section_audio.mp3", "audio.mp3")
+
+
+def retheme_concurrency() -> int:
+    """Sections rethemed in parallel (RETHEME_MAX_CONCURRENT)"""
+    try:
+        return max(1, int(os.getenv("RETHEME_MAX_CONCURRENT", "3")))
+    except ValueError:
+        return 3
+
+
+def theme_output_dir(job_dir: Path, style: str) -> Path:
+    return Path(job_dir) / "themes" / normalize_theme_style(style)
+
+
+def read_retheme_progress(theme_dir: Path) -> Optional[Dict[str, Any]]:
+    """Load the progress file of a retheme, if present"""
+    try:
+        with open(Path(theme_dir) / PROGRESS_FILE_NAME, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def find_section_audio(section: Dict[str, Any], original_section_dir: str) -> Optional[str]:
+    """The narration audio a section was assembled with"""
+    audio = section.get("audio", "")
+    if audio and os.path.exists(audio):
+        return audio
+    for name in _SECTION_AUDIO_NAMES:
+        path = os.path.join(original_section_dir, name)
+        if os.path.exists(path):
+            return path
+    return None
+
+
+class RethemedVideoGenerator:
+    """Re-renders and assembles the sections of a job in another theme."""
+
+    def __init__(
+        self,
+        job_id: str,
+        output_dir: str,
+        style: str,
+        source_style: Optional[str] = None,
+        max_concurrent: Optional[int] = None,
+    ):
+        self.job_id = job_id
+        self.output_dir = Path(output_dir)
+        self.style = normalize_theme_style(style)
+        # Detected per section from its code when not given
+        self.source_style = source_style
+        self.max_concurrent = max_concurrent or retheme_concurrency()
+        self.semaphore = asyncio.Semaphore(self.max_concurrent)
+
+        self._progress: Dict[str, Any] = {}
+
+    async def generate(
+        self,
+        script: Dict[str, Any],
+        source_sections: Optional[List[SourceSection]] = None,
+    ) -> Optional[str]:
+        """Produce ``final_video.mp4`` of the script's sections in the new theme.
+
+        Returns:
+            Path of the final video, or None if any section could not be moved
+        """
+        sections = script.get("sections", [])
+        if source_sections is None:
+            source_sections = resolve_source_sections(self.job_id, sections)
+        total = len(sections)
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+
+        cached = {
+            i for i in range(total)
+            if (self._section_dir(i) / SECTION_VIDEO_NAME).exists()
+        }
+        self._progress = {
+            "status": "processing",
+            "style": self.style,
+            "total_sections": total,
+            "completed_sections": len(cached),
+            "cached_sections": sorted(cached),
+            "failed_sections": [],
+            "started_at": time.time(),
+        }
+        self._write_progress()
+
+        logger.info(f"Retheming video to {self.style}", extra={
+            "job_id": self.job_id,
+            "total_sections": total,
+            "cached_sections": len(cached),
+            "max_concurrent": self.max_concurrent,
+        })
+
+        async def run_section(i: int, section: Dict[str, Any]) -> Optional[str]:
+            if i in cached:
+                return str(self._section_dir(i) / SECTION_VIDEO_NAME)
+            async with self.semaphore:
+                try:
+                    video = await self._process_section(i, section, source_sections[i])
+                except JobCancelledError:
+                    raise
+                except Exception as e:
+                    logger.error(f"Rethemed section {i} failed: {e}", extra={
+                        "job_id": self.job_id,
+                        "section_index": i,
+                    })
+                    video = None
+            self._record_section(i, video is not None)
+            return video
+
+        results = await asyncio.gather(*(run_section(i, s) for i, s in enumerate(sections)))
+
+        final_video = None
+        if results and all(results):
+            final_video = await self._concat(results)
+        self._progress["status"] = "completed" if final_video else "failed"
+        self._progress["finished_at"] = time.time()
+        self._write_progress()
+        return final_video
+
+    # ------------------------------------------------------------------
+    # Section processing
+    # ------------------------------------------------------------------
+
+    def _section_dir(self, index: int) -> Path:
+        return self.output_dir / f"section_{index}"
+
+    async def _process_section(
+        self,
+        index: int,
+        section: Dict[str, Any],
+        source: SourceSection,
+    ) -> Optional[str]:
+        """Rewrite, re-render and merge one section with its original audio"""
+        if not source.manim_code:
+            raise RethemeError("No scene code stored for this section")
+        class_name = find_scene_class(source.manim_code)
+        if not class_name:
+            raise RethemeError("No scene class found in the section code")
+
+        section_dir = self._section_dir(index)
+        section_dir.mkdir(parents=True, exist_ok=True)
+        code = retheme_manim_code(source.manim_code, self.style, self.source_style)
+        code_file = section_dir / f"scene_{index}.py"
+        code_file.write_text(code, encoding="utf-8")
+
+        rendered = await render_section_video(
+            section_dir,
+            code_file,
+            class_name,
+            section_dir / f"rendered_{index}.mp4",
+            timeout=RENDER_TIMEOUT,
+            priority=PriorityClass.NORMAL,
+        )
+
+        output_video = section_dir / SECTION_VIDEO_NAME
+        audio_path = find_section_audio(section, source.original_section_dir)
+        if audio_path is None:
+            # Sections without narration are assembled from the video alone
+            os.replace(rendered, output_video)
+            return str(output_video)
+        return await self._merge(str(rendered), audio_path, section_dir)
+
+    async def _merge(self, video_path: str, audio_path: str, section_dir: Path) -> Optional[str]:
+        """Merge the re-rendered video with the original audio (written atomically)"""
+        output_video = section_dir / SECTION_VIDEO_NAME
+        partial_video = section_dir / f"partial_{SECTION_VIDEO_NAME}"
+
+        cmd = build_merge_no_cut_cmd(
+            video_path=video_path,
+            audio_path=audio_path,
+            video_duration=await get_media_duration(video_path),
+            audio_duration=await get_media_duration(audio_path),
+            output_path=str(partial_video),
+        )
+        result = await run_process_async(
+            cmd, timeout=FFMPEG_TIMEOUT, capture_output=True, text=True, errors="replace"
+        )
+        if result.returncode != 0 or not partial_video.exists():
+            logger.warning(f"FFmpeg merge failed: {(result.stderr or '')[:500]}")
+            partial_video.unlink(missing_ok=True)
+            return None
+
+        os.replace(partial_video, output_video)
+        return str(output_video)
+
+    async def _concat(self, section_videos: List[str]) -> Optional[str]:
+        final_video = self.output_dir / "final_video.mp4"
+        partial_video = self.output_dir / "partial_final_video.mp4"
+        if len(section_videos) == 1:
+            # Section videos and the final video are only ever replaced
+            await asyncio.to_thread(place_file, section_videos[0], final_video, link=True)
+            return str(final_video)
+
+        concat_file = self.output_dir / "concat.txt"
+        with open(concat_file, "w", encoding="utf-8") as f:
+            for video in section_videos:
+                f.write(f"file '{video}'\n")
+
+        cmd = [
+            "ffmpeg", "-y",
+            "-f", "concat",
+            "-safe", "0",
+            "-i", str(concat_file),
+            "-c", "copy",
+            str(partial_video)
+        ]
+        result = await run_process_async(cmd, timeout=FFMPEG_TIMEOUT, capture_output=True)
+        if result.returncode != 0 or not partial_video.exists():
+            logger.error("Rethemed video concat failed", extra={"job_id": self.job_id})
+            partial_video.unlink(missing_ok=True)
+            return None
+        os.replace(partial_video, final_video)
+        return str(final_video)
+
+    # ------------------------------------------------------------------
+    # Progress
+    # ------------------------------------------------------------------
+
+    def _record_section(self, index: int, success: bool) -> None:
+        if success:
+            self._progress["completed_sections"] += 1
+        else:
+            self._progress["failed_sections"].append(index)
+        self._write_progress()
+
+    def _write_progress(self) -> None:
+        self._progress["updated_at"] = time.time()
+        path = self.output_dir / PROGRESS_FILE_NAME
+        tmp_path = path.with_suffix(".json.tmp")
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self._progress, f)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Failed to write retheme progress: {e}")
@@ -1,5 +1,23 @@
 """Translation feature - translate videos to other languages."""
 
+from .translation_memory import TranslationMemory, get_translation_memory
 from .translation_service import TranslationService, get_translation_service
+from .video_translator import (
+    TranslatedVideoGenerator,
+    SourceSection,
+    read_translation_progress,
+    resolve_source_sections,
+    translation_concurrency,
+)
 
-__all__ = ["TranslationService", "get_translation_service"]
+__all__ = [
+    "TranslationMemory",
+    "get_translation_memory",
+    "TranslationService",
+    "get_translation_service",
+    "TranslatedVideoGenerator",
+    "SourceSection",
+    "read_translation_progress",
+    "resolve_source_sections",
+    "translation_concurrency",
+]
@@ -0,0 +1,152 @@
+"""
+Manim Text - Structural extraction and reinsertion of on-screen text
+
+Translatable strings are located with LibCST (see DisplayTextCollector in the
+refinement CST fixer) instead of regular expressions, so escaped quotes, raw
+strings, nested calls and keyword arguments are handled exactly, and the
+translated code is regenerated from the syntax tree - it always parses.
+
+Tex strings are split into text and ``$...$`` math segments; only the text
+segments are translated. For non-Latin targets Tex is first rewritten into
+Text/MathTex (TexSplitTransformer), since those scripts cannot go through
+LaTeX.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import libcst as cst
+
+from app.core import get_logger
+from app.services.pipeline.animation.generation.refinement.cst_fixer import (
+    DisplayTextCollector,
+    StringLiteralReplacer,
+    TexSplitTransformer,
+    is_math_segment,
+    split_math_segments,
+)
+
+logger = get_logger(__name__, component="manim_text")
+
+# Constructors rendered through LaTeX, whose math segments must not be translated
+_LATEX_CONSTRUCTORS = frozenset({"Tex"})
+
+
+@dataclass(frozen=True)
+class TextSlot:
+    """One string literal and the segments of it that get translated."""
+    node: cst.SimpleString
+    segments: Tuple[str, ...]
+    translatable: Tuple[int, ...]
+
+
+@dataclass(frozen=True)
+class ManimTextAnalysis:
+    """Language-independent part of a Manim code translation.
+
+    ``code`` is the code to patch (after the non-Latin Tex conversion, if
+    any). ``module`` is its syntax tree, or None when the code does not parse
+    (nothing is translated then).
+    """
+    code: str
+    module: Optional[cst.Module]
+    slots: Tuple[TextSlot, ...]
+
+    @property
+    def texts(self) -> List[str]:
+        """Strings to translate, in slot order (surrounding whitespace stripped)"""
+        return [
+            slot.segments[i].strip()
+            for slot in self.slots
+            for i in slot.translatable
+        ]
+
+
+def _is_translatable(segment: str, latex: bool) -> bool:
+    # Skip very short strings or bullet characters
+    if len(segment.strip()) <= 2:
+        return False
+    if latex:
+        # Text around LaTeX commands is left alone rather than risk breaking them
+        return not is_math_segment(segment) and not any(c in segment for c in "\\{}")
+    return True
+
+
+def _slot(node: cst.SimpleString, constructor: str, value: str, convert_tex: bool) -> Optional[TextSlot]:
+    if constructor in _LATEX_CONSTRUCTORS:
+        if convert_tex:
+            # Tex left after the conversion mixes text and math in a way that
+            # could not be split; translating it would break rendering
+            return None
+        segments = tuple(split_math_segments(value))
+        translatable = tuple(
+            i for i, segment in enumerate(segments) if _is_translatable(segment, latex=True)
+        )
+    else:
+        segments = (value,)
+        translatable = (0,) if _is_translatable(value, latex=False) else ()
+    if not translatable:
+        return None
+    return TextSlot(node=node, segments=segments, translatable=translatable)
+
+
+def convert_tex_for_non_latin(manim_code: str) -> str:
+    """Rewrite Tex() so its text renders with Text() (code unchanged if it does not parse)."""
+    try:
+        module = cst.parse_module(manim_code)
+    except cst.ParserSyntaxError as e:
+        logger.warning("Cannot parse Manim code for Tex conversion", extra={"error": str(e)})
+        return manim_code
+    transformer = TexSplitTransformer()
+    converted = module.visit(transformer)
+    return converted.code if transformer.count else manim_code
+
+
+def analyze_manim_code(manim_code: str, is_non_latin: bool) -> ManimTextAnalysis:
+    """Locate the translatable text literals of ``manim_code``."""
+    code = convert_tex_for_non_latin(manim_code) if is_non_latin else manim_code
+    try:
+        module = cst.parse_module(code)
+    except cst.ParserSyntaxError as e:
+        logger.warning("Cannot parse Manim code, text left untranslated", extra={"error": str(e)})
+        return ManimTextAnalysis(code=code, module=None, slots=())
+
+    collector = DisplayTextCollector()
+    module.visit(collector)
+
+    slots = []
+    for node, constructor, value in collector.literals:
+        slot = _slot(node, constructor, value, convert_tex=is_non_latin)
+        if slot is not None:
+            slots.append(slot)
+    return ManimTextAnalysis(code=code, module=module, slots=tuple(slots))
+
+
+def _keep_whitespace(original: str, translated: str) -> str:
+    stripped = original.strip()
+    if not stripped:
+        return original
+    start = original.index(stripped)
+    return original[:start] + translated.strip() + original[start + len(stripped):]
+
+
+def apply_translations(analysis: ManimTextAnalysis, translations: Sequence[str]) -> str:
+    """Reinsert ``translations`` (ordered like ``analysis.texts``) into the code."""
+    if analysis.module is None or not analysis.slots:
+        return analysis.code
+
+    remaining = iter(translations)
+    replacements: Dict[cst.SimpleString, str] = {}
+    for slot in analysis.slots:
+        segments = list(slot.segments)
+        for i in slot.translatable:
+            translated = next(remaining, None)
+            if translated:
+                segments[i] = _keep_whitespace(segments[i], translated)
+        value = "".join(segments)
+        if value != "".join(slot.segments):
+            replacements[slot.node] = value
+
+    if not replacements:
+        return analysis.code
+    return analysis.module.visit(StringLiteralReplacer(replacements)).code
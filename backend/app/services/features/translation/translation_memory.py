@@ -0,0 +1,253 @@
+"""
+Translation Memory - Persistent cache of translated strings
+
+Titles, labels and recurring phrases show up across sections, across
+re-translations of the same job and across jobs generated from the same
+document. The TranslationService looks every string up here before calling
+the LLM and only sends the misses.
+
+Entries are keyed on (normalized source text, source language, target
+language, model, domain). The domain separates strings translated with
+different prompts (narration, on-screen Manim text, speakable TTS text), since
+the same source string legitimately translates differently in each.
+
+The store is a small SQLite database (WAL, short-lived connections), so the
+API and worker processes share it safely.
+"""
+
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+import unicodedata
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+from app.config import JOB_DATA_DIR
+from app.core import get_logger, parse_bool_env
+
+logger = get_logger(__name__, component="translation_memory")
+
+DEFAULT_MEMORY_PATH = JOB_DATA_DIR / "translation_memory.db"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS translations (
+    key TEXT PRIMARY KEY,
+    source_text TEXT NOT NULL,
+    translated_text TEXT NOT NULL,
+    source_language TEXT NOT NULL,
+    target_language TEXT NOT NULL,
+    model TEXT NOT NULL,
+    domain TEXT NOT NULL,
+    hit_count INTEGER NOT NULL DEFAULT 0,
+    created_at REAL NOT NULL,
+    last_used_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_translations_langs ON translations (source_language, target_language);
+"""
+
+# SQLite limits the number of host parameters per statement
+_LOOKUP_CHUNK = 500
+
+
+def normalize_text(text: str) -> str:
+    """Normalization used for the cache key (NFC, collapsed whitespace)"""
+    return " ".join(unicodedata.normalize("NFC", text).split())
+
+
+def translation_memory_enabled() -> bool:
+    """Whether translations are cached (TRANSLATION_MEMORY_ENABLED, default on)"""
+    return parse_bool_env(os.getenv("TRANSLATION_MEMORY_ENABLED"), default=True)
+
+
+class TranslationMemory:
+    """Exact-match translation cache with batch lookups and hit statistics."""
+
+    def __init__(self, db_path: Optional[Path] = None):
+        self.db_path = Path(db_path) if db_path else DEFAULT_MEMORY_PATH
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        conn = sqlite3.connect(str(self.db_path), timeout=30, isolation_level=None)
+        try:
+            conn.execute("PRAGMA synchronous=NORMAL")
+            yield conn
+        finally:
+            conn.close()
+
+    @staticmethod
+    def make_key(
+        text: str,
+        source_language: str,
+        target_language: str,
+        model: str,
+        domain: str,
+    ) -> str:
+        material = "\x1f".join(
+            (normalize_text(text), source_language, target_language, model, domain)
+        )
+        return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+    # ------------------------------------------------------------------
+    # Lookup / store
+    # ------------------------------------------------------------------
+
+    def lookup(
+        self,
+        text: str,
+        source_language: str,
+        target_language: str,
+        model: str,
+        domain: str = "text",
+    ) -> Optional[str]:
+        return self.lookup_many([text], source_language, target_language, model, domain)[0]
+
+    def lookup_many(
+        self,
+        texts: Sequence[str],
+        source_language: str,
+        target_language: str,
+        model: str,
+        domain: str = "text",
+    ) -> List[Optional[str]]:
+        """Cached translations for ``texts``, None for each miss (order preserved)."""
+        if not texts:
+            return []
+        keys = [self.make_key(t, source_language, target_language, model, domain) for t in texts]
+
+        found: Dict[str, str] = {}
+        try:
+            with self._connect() as conn:
+                unique_keys = list(dict.fromkeys(keys))
+                for start in range(0, len(unique_keys), _LOOKUP_CHUNK):
+                    chunk = unique_keys[start:start + _LOOKUP_CHUNK]
+                    placeholders = ",".join("?" * len(chunk))
+                    rows = conn.execute(
+                        f"SELECT key, translated_text FROM translations WHERE key IN ({placeholders})",
+                        chunk,
+                    ).fetchall()
+                    found.update(rows)
+
+                if found:
+                    now = time.time()
+                    conn.executemany(
+                        "UPDATE translations SET hit_count = hit_count + 1, last_used_at = ? WHERE key = ?",
+                        [(now, key) for key in found],
+                    )
+        except sqlite3.Error as e:
+            logger.warning(f"Translation memory lookup failed: {e}")
+            found = {}
+
+        results = [found.get(key) for key in keys]
+        hits = sum(1 for r in results if r is not None)
+        with self._lock:
+            self._hits += hits
+            self._misses += len(results) - hits
+        return results
+
+    def store_many(
+        self,
+        pairs: Sequence[Tuple[str, str]],
+        source_language: str,
+        target_language: str,
+        model: str,
+        domain: str = "text",
+    ) -> int:
+        """Remember ``(source_text, translated_text)`` pairs. Returns rows written."""
+        now = time.time()
+        rows = [
+            (
+                self.make_key(source, source_language, target_language, model, domain),
+                source,
+                translated,
+                source_language,
+                target_language,
+                model,
+                domain,
+                now,
+                now,
+            )
+            for source, translated in pairs
+            if source and source.strip() and translated
+        ]
+        if not rows:
+            return 0
+        try:
+            with self._connect() as conn:
+                conn.executemany(
+                    """
+                    INSERT INTO translations (
+                        key, source_text, translated_text, source_language, target_language,
+                        model, domain, created_at, last_used_at
+                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    ON CONFLICT(key) DO UPDATE SET
+                        translated_text = excluded.translated_text,
+                        last_used_at = excluded.last_used_at
+                    """,
+                    rows,
+                )
+        except sqlite3.Error as e:
+            logger.warning(f"Translation memory store failed: {e}")
+            return 0
+        return len(rows)
+
+    def store(
+        self,
+        text: str,
+        translated: str,
+        source_language: str,
+        target_language: str,
+        model: str,
+        domain: str = "text",
+    ) -> None:
+        self.store_many([(text, translated)], source_language, target_language, model, domain)
+
+    # ------------------------------------------------------------------
+    # Statistics
+    # ------------------------------------------------------------------
+
+    def stats(self) -> Dict[str, float]:
+        """Hit statistics for this process plus totals from the database"""
+        with self._lock:
+            hits, misses = self._hits, self._misses
+        lookups = hits + misses
+        entries = total_hits = 0
+        try:
+            with self._connect() as conn:
+                entries, total_hits = conn.execute(
+                    "SELECT COUNT(*), COALESCE(SUM(hit_count), 0) FROM translations"
+                ).fetchone()
+        except sqlite3.Error:
+            pass
+        return {
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": round(hits / lookups, 3) if lookups else 0.0,
+            "entries": entries,
+            "total_hits": total_hits,
+        }
+
+
+_translation_memory: Optional[TranslationMemory] = None
+
+
+def get_translation_memory() -> Optional[TranslationMemory]:
+    """Shared translation memory, or None when disabled."""
+    global _translation_memory
+    if not translation_memory_enabled():
+        return None
+    if _translation_memory is None:
+        path = os.getenv("TRANSLATION_MEMORY_PATH")
+        _translation_memory = TranslationMemory(Path(path) if path else None)
+    return _translation_memory
@@ -1,31 +1,178 @@
 """
 Translation Service - Translates video narration and Manim text to different languages
 Uses lightweight Gemini model for efficient translation
+
+Every string is looked up in the translation memory first; only strings not
+translated before are sent to the LLM.
 """
 
 import json
 import asyncio
 import re
-from typing import Dict, Any, List, Optional
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Awaitable, Callable, Dict, Any, List, Optional, Tuple
 
+from app.config.models import get_model_config
 from app.core import LANGUAGE_NAMES, get_logger
 
+from .manim_text import (
+    ManimTextAnalysis,
+    analyze_manim_code,
+    apply_translations,
+    convert_tex_for_non_latin,
+)
+from .translation_memory import TranslationMemory, get_translation_memory
+
+# Translates a batch of strings; None marks a string the LLM did not return
+BatchRequest = Callable[[List[str]], Awaitable[List[Optional[str]]]]
+
+# Texts of one script section and where each came from (e.g. ("title",))
+SectionTexts = Tuple[List[str], List[tuple]]
+
+# Manim code analyses kept for reuse across target languages
+_MANIM_ANALYSIS_CACHE_SIZE = 256
+
+
+@lru_cache(maxsize=4096)
+def _latex_to_spoken(text: str) -> str:
+    return TranslationService._latex_to_spoken_uncached(text)
+
 
 class TranslationService:
     """Translates video content to different languages"""
 
-    def __init__(self):
+    def __init__(self, memory: Optional[TranslationMemory] = None):
         # Use centralized prompting engine
         from app.services.infrastructure.llm import PromptingEngine, PromptConfig
         self.engine = PromptingEngine("translation")
         self.prompt_config = PromptConfig(temperature=0.3, timeout=60.0)
+        self.model_name = get_model_config("translation").model_name
+        self.memory = memory if memory is not None else get_translation_memory()
         self.logger = get_logger(__name__, component="translation_service")
+        self._manim_analyses: "OrderedDict[Tuple[str, bool], ManimTextAnalysis]" = OrderedDict()
+
+    async def _translate_with_memory(
+        self,
+        texts: List[str],
+        source_language: str,
+        target_language: str,
+        domain: str,
+        request: BatchRequest,
+        fallback: Optional[Callable[[str], str]] = None,
+    ) -> List[str]:
+        """Serve ``texts`` from the translation memory, translating only misses.
+
+        Identical missing strings are sent once. Strings the LLM did not
+        translate are replaced by ``fallback(text)`` (the original by default)
+        and are not remembered.
+        """
+        if not texts:
+            return []
+
+        cached: List[Optional[str]] = [None] * len(texts)
+        if self.memory is not None:
+            cached = await asyncio.to_thread(
+                self.memory.lookup_many, texts, source_language, target_language, self.model_name, domain
+            )
+
+        missing = list(dict.fromkeys(t for t, c in zip(texts, cached) if c is None))
+        translated: Dict[str, Optional[str]] = {}
+        if missing:
+            translated = dict(zip(missing, await request(missing)))
+            if self.memory is not None:
+                pairs = [(text, result) for text, result in translated.items() if result]
+                await asyncio.to_thread(
+                    self.memory.store_many, pairs, source_language, target_language, self.model_name, domain
+                )
+
+        if len(missing) < len(texts):
+            self.logger.debug("Translation memory hits", extra={
+                "domain": domain,
+                "hits": len(texts) - sum(1 for c in cached if c is None),
+                "requested": len(missing),
+            })
+
+        fallback = fallback or (lambda text: text)
+        results = []
+        for text, hit in zip(texts, cached):
+            value = hit if hit is not None else translated.get(text)
+            results.append(value if value is not None else fallback(text))
+        return results
+
+    async def translate_script_multi(
+        self,
+        script: Dict[str, Any],
+        target_languages: List[str],
+        source_language: Optional[str] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """Translate a script into several languages at once.
+
+        Source texts are collected once and the languages are translated
+        concurrently. Languages whose translation raised are left out of the
+        result.
+        """
+        section_texts = [self.collect_section_texts(s) for s in script.get("sections", [])]
+        languages = list(dict.fromkeys(target_languages))
+        results = await asyncio.gather(
+            *(
+                self.translate_script(script, lang, source_language, section_texts=section_texts)
+                for lang in languages
+            ),
+            return_exceptions=True,
+        )
+
+        translated: Dict[str, Dict[str, Any]] = {}
+        for lang, result in zip(languages, results):
+            if isinstance(result, Exception):
+                self.logger.error("Script translation failed", extra={
+                    "target_language": lang,
+                    "error": str(result)
+                })
+            else:
+                translated[lang] = result
+        return translated
+
+    @staticmethod
+    def collect_section_texts(section: Dict[str, Any]) -> SectionTexts:
+        """Collect the translatable texts of a section with their key paths."""
+        texts = []
+        text_keys = []  # Track where each text came from
+
+        if section.get("title"):
+            texts.append(section["title"])
+            text_keys.append(("title",))
+
+        # Prefer tts_narration (TTS-ready text)
+        if section.get("tts_narration"):
+            texts.append(section["tts_narration"])
+            text_keys.append(("tts_narration",))
+        elif section.get("narration"):
+            texts.append(section["narration"])
+            text_keys.append(("narration",))
+
+        # Narration segments
+        if section.get("narration_segments"):
+            for j, seg in enumerate(section["narration_segments"]):
+                if seg.get("text"):
+                    texts.append(seg["text"])
+                    text_keys.append(("narration_segments", j, "text"))
+
+        # Key concepts
+        if section.get("key_concepts"):
+            for j, concept in enumerate(section["key_concepts"]):
+                if concept:
+                    texts.append(concept)
+                    text_keys.append(("key_concepts", j))
+
+        return texts, text_keys
 
     async def translate_script(
         self,
         script: Dict[str, Any],
         target_language: str,
-        source_language: Optional[str] = None
+        source_language: Optional[str] = None,
+        section_texts: Optional[List[SectionTexts]] = None
     ) -> Dict[str, Any]:
         """Translate an entire script to target language.
         
@@ -36,6 +183,7 @@ class TranslationService:
             script: Original script with sections
             target_language: Target language code (e.g., 'fr', 'es')
             source_language: Source language code (auto-detected if not provided)
+            section_texts: Pre-collected texts per section (see collect_section_texts)
         
         Returns:
             Translated script with same structure
@@ -77,35 +225,11 @@ class TranslationService:
                 """Translate all texts in a single section."""
                 translated = json.loads(json.dumps(section))  # Deep copy
 
-                # Collect texts from this section
-                texts = []
-                text_keys = []  # Track where each text came from
-
-                if section.get("title"):
-                    texts.append(section["title"])
-                    text_keys.append(("title",))
-
-                # Prefer tts_narration (TTS-ready text)
-                if section.get("tts_narration"):
-                    texts.append(section["tts_narration"])
-                    text_keys.append(("tts_narration",))
-                elif section.get("narration"):
-                    texts.append(section["narration"])
-                    text_keys.append(("narration",))
-
-                # Narration segments
-                if section.get("narration_segments"):
-                    for j, seg in enumerate(section["narration_segments"]):
-                        if seg.get("text"):
-                            texts.append(seg["text"])
-                            text_keys.append(("narration_segments", j, "text"))
-
-                # Key concepts
-                if section.get("key_concepts"):
-                    for j, concept in enumerate(section["key_concepts"]):
-                        if concept:
-                            texts.append(concept)
-                            text_keys.append(("key_concepts", j))
+                # Source texts are language-independent; batch callers pass them in
+                if section_texts is not None:
+                    texts, text_keys = section_texts[idx]
+                else:
+                    texts, text_keys = self.collect_section_texts(section)
 
                 if not texts:
                     return (idx, translated)
@@ -167,7 +291,9 @@ class TranslationService:
         translated_script["output_language"] = target_language
         translated_script["translated_from"] = source_language
 
-        self.logger.info("Translation complete")
+        self.logger.info("Translation complete", extra={
+            "translation_memory": self.memory.stats() if self.memory is not None else None
+        })
         return translated_script
 
     async def _translate_section_texts(
@@ -181,6 +307,23 @@ class TranslationService:
         
         Provides context and warnings about code patterns to avoid mistranslation.
         """
+        return await self._translate_with_memory(
+            texts,
+            source_language,
+            target_language,
+            "narration",
+            lambda missing: self._request_section_texts(
+                missing, source_language, target_language, section_context
+            ),
+        )
+
+    async def _request_section_texts(
+        self,
+        texts: List[str],
+        source_language: str,
+        target_language: str,
+        section_context: str = ""
+    ) -> List[Optional[str]]:
         if not texts:
             return []
 
@@ -231,13 +374,13 @@ class TranslationService:
                     self.logger.warning("Missing translated block, using original", extra={
                         "block_index": i
                     })
-                    translated_texts.append(texts[i])
+                    translated_texts.append(None)
 
             return translated_texts
 
         except Exception as e:
             self.logger.error("Translation failed", extra={"error": str(e)})
-            return texts
+            return [None] * len(texts)
 
     # Non-Latin scripts that can't mix with LaTeX in Tex()
     NON_LATIN_LANGUAGES = {
@@ -254,12 +397,13 @@ class TranslationService:
     ) -> str:
         """Translate text-containing objects in Manim code to target language.
         
-        This extracts text content from Text(), MarkupText(), Paragraph(), and Title()
-        calls, translates them in batch with context, and replaces them back.
-        The code structure is preserved exactly.
+        This extracts the string literals of Text(), MarkupText(), Paragraph(),
+        Title() and Tex() calls from the syntax tree, translates them in batch
+        with context, and reinserts them structurally. Only the literals change;
+        Tex math segments are never sent for translation.
         
         For non-Latin languages, Tex() with mixed text/math is converted to
-        separate Text() and MathTex() objects with .next_to() positioning.
+        separate Text() and MathTex() objects arranged in a VGroup.
         
         Args:
             manim_code: Original Manim Python code
@@ -285,44 +429,16 @@ class TranslationService:
             "target_language": target_language
         })
 
-        # For non-Latin languages, first handle Tex() with mixed content
-        if is_non_latin:
-            self.logger.info("Converting Tex for non-Latin language", extra={
-                "target_language": target_language
-            })
-            manim_code = await self._convert_tex_for_non_latin(manim_code, target_language, source_language)
-
-        # Extract all text-containing Manim objects with their positions
-        # Match Text(), MarkupText(), Paragraph(), Title() with string arguments
-        text_pattern = r'(Text|MarkupText|Paragraph|Title)\s*\(\s*(["\'])((?:(?!\2)[^\\]|\\.)*)\2'
+        # The analysis depends only on the code and the script class, so a
+        # batch of target languages shares it
+        analysis = await self._analyze_manim_code(manim_code, is_non_latin)
+        manim_code = analysis.code
 
-        matches = list(re.finditer(text_pattern, manim_code))
-        self.logger.info("Found text object matches", extra={"match_count": len(matches)})
-
-        if not matches:
-            self.logger.info("No text objects found in Manim code")
-            return manim_code
-
-        # Extract the text content (group 3 is the string content)
-        texts_to_translate = []
-        match_info = []  # Store (match_object, func_name, quote_char, original_text)
-
-        for match in matches:
-            func_name = match.group(1)  # Text, MarkupText, Paragraph, or Title
-            quote_char = match.group(2)  # ' or "
-            text_content = match.group(3)  # The actual string content
-
-            # Skip very short strings or bullet characters
-            if len(text_content.strip()) <= 2:
-                continue
-
-            texts_to_translate.append(text_content)
-            match_info.append((match, func_name, quote_char, text_content))
-
-        if not texts_to_translate:
+        if not analysis.slots:
             self.logger.info("No translatable text objects found")
             return manim_code
 
+        texts_to_translate = analysis.texts
         self.logger.info("Found text objects to translate", extra={
             "text_count": len(texts_to_translate)
         })
@@ -334,24 +450,23 @@ class TranslationService:
             target_language
         )
 
-        # Replace texts in reverse order to preserve positions
-        result = manim_code
-        for (match, func_name, quote_char, original_text), translated_text in zip(
-            reversed(match_info), reversed(translated_texts)
-        ):
-            # Escape quotes in translated text to match the quote style
-            if quote_char == '"':
-                safe_translated = translated_text.replace('\\', '\\\\').replace('"', '\\"')
-            else:
-                safe_translated = translated_text.replace('\\', '\\\\').replace("'", "\\'")
+        return apply_translations(analysis, translated_texts)
 
-            # Build the replacement: Text("translated")
-            new_match = f'{func_name}({quote_char}{safe_translated}{quote_char}'
+    async def _analyze_manim_code(self, manim_code: str, is_non_latin: bool) -> ManimTextAnalysis:
+        """Find the translatable text literals of ``manim_code`` (memoized)."""
+        cache_key = (manim_code, is_non_latin)
+        cached = self._manim_analyses.get(cache_key)
+        if cached is not None:
+            self._manim_analyses.move_to_end(cache_key)
+            return cached
 
-            # Replace at exact position
-            result = result[:match.start()] + new_match + result[match.end():]
+        analysis = analyze_manim_code(manim_code, is_non_latin)
+        self.logger.info("Found text literals", extra={"literal_count": len(analysis.slots)})
 
-        return result
+        self._manim_analyses[cache_key] = analysis
+        if len(self._manim_analyses) > _MANIM_ANALYSIS_CACHE_SIZE:
+            self._manim_analyses.popitem(last=False)
+        return analysis
 
     async def _convert_tex_for_non_latin(
         self,
@@ -362,70 +477,10 @@ class TranslationService:
         """Convert Tex() with mixed text/math to separate Text() + MathTex() for non-Latin scripts.
         
         Non-Latin scripts (Armenian, Arabic, Chinese, etc.) cannot be mixed with LaTeX
-        in a single Tex() call. This function finds such cases and converts them to
-        VGroup with Text() and MathTex() positioned with .arrange() or .next_to().
+        in a single Tex() call. Such calls are rewritten on the syntax tree into a
+        VGroup of Text() and MathTex() parts arranged with .arrange().
         """
-        # Find Tex() calls that contain both text and math ($...$)
-        # Pattern: Tex(r"text $math$ more text", ...)
-        tex_pattern = r'(\s*)(\w+)\s*=\s*Tex\s*\(\s*r?(["\'])((?:(?!\3)[^\\]|\\.)*)\3([^)]*)\)'
-
-        def convert_tex_match(match):
-            indent = match.group(1)
-            var_name = match.group(2)
-            quote = match.group(3)
-            content = match.group(4)
-            rest_args = match.group(5)  # e.g., ", font_size=32"
-
-            # Check if content has both text and math
-            if '$' not in content:
-                # No math, just convert Tex to Text
-                return f'{indent}{var_name} = Text({quote}{content}{quote}{rest_args})'
-
-            # Split content by $...$ math segments
-            parts = re.split(r'(\$[^$]+\$)', content)
-
-            if len(parts) <= 1:
-                # No actual splitting happened
-                return match.group(0)
-
-            # Filter empty parts
-            parts = [p for p in parts if p.strip()]
-
-            if len(parts) == 1:
-                # Only one part (all math or all text)
-                if parts[0].startswith('$'):
-                    math_content = parts[0][1:-1]  # Remove $ signs
-                    return f'{indent}{var_name} = MathTex(r"{math_content}"{rest_args})'
-                else:
-                    return f'{indent}{var_name} = Text({quote}{parts[0]}{quote}{rest_args})'
-
-            # Multiple parts - create VGroup with arranged elements
-            lines = []
-            element_names = []
-
-            for i, part in enumerate(parts):
-                elem_name = f'_tex_part_{i}'
-                element_names.append(elem_name)
-
-                if part.startswith('$') and part.endswith('$'):
-                    # Math part
-                    math_content = part[1:-1]
-                    lines.append(f'{indent}{elem_name} = MathTex(r"{math_content}")')
-                else:
-                    # Text part - this will be translated later
-                    safe_part = part.replace('"', '\\"')
-                    lines.append(f'{indent}{elem_name} = Text("{safe_part}", font_size=28)')
-
-            # Create VGroup and arrange horizontally
-            elements_str = ', '.join(element_names)
-            lines.append(f'{indent}{var_name} = VGroup({elements_str}).arrange(RIGHT, buff=0.15)')
-
-            return '\n'.join(lines)
-
-        # Apply conversion
-        result = re.sub(tex_pattern, convert_tex_match, manim_code)
-
-        return result
+        return convert_tex_for_non_latin(manim_code)
 
     async def _translate_manim_texts(
         self,
@@ -438,6 +493,20 @@ class TranslationService:
         These are display texts from Text(), MarkupText(), Paragraph(), Title() 
         that appear in the video, not narration.
         """
+        return await self._translate_with_memory(
+            texts,
+            source_language,
+            target_language,
+            "manim",
+            lambda missing: self._request_manim_texts(missing, source_language, target_language),
+        )
+
+    async def _request_manim_texts(
+        self,
+        texts: List[str],
+        source_language: str,
+        target_language: str
+    ) -> List[Optional[str]]:
         if not texts:
             return []
 
@@ -485,13 +554,13 @@ class TranslationService:
                     self.logger.warning("Missing translated block, using original", extra={
                         "block_index": i
                     })
-                    translated_texts.append(texts[i])
+                    translated_texts.append(None)
 
             return translated_texts
 
         except Exception as e:
             self.logger.error("Manim text translation failed", extra={"error": str(e)})
-            return texts
+            return [None] * len(texts)
 
     async def _translate_text(
         self,
@@ -507,6 +576,33 @@ class TranslationService:
             # Even for same language, still need to clean up LaTeX for TTS
             return self._convert_latex_to_spoken(text)
 
+        translated = await self._translate_with_memory(
+            [text],
+            source_language,
+            target_language,
+            "speakable",
+            lambda missing: self._request_speakable(missing, source_language, target_language),
+            fallback=self._convert_latex_to_spoken,  # Return cleaned original on failure
+        )
+        return translated[0]
+
+    async def _request_speakable(
+        self,
+        texts: List[str],
+        source_language: str,
+        target_language: str
+    ) -> List[Optional[str]]:
+        return [
+            await self._request_speakable_one(text, source_language, target_language)
+            for text in texts
+        ]
+
+    async def _request_speakable_one(
+        self,
+        text: str,
+        source_language: str,
+        target_language: str
+    ) -> Optional[str]:
         source_name = LANGUAGE_NAMES.get(source_language, source_language)
         target_name = LANGUAGE_NAMES.get(target_language, target_language)
 
@@ -549,16 +645,21 @@ class TranslationService:
             # Final cleanup - remove any remaining $ or LaTeX artifacts
             translated = self._convert_latex_to_spoken(translated)
 
-            return translated
+            return translated or None
 
         except Exception as e:
             self.logger.error("Translation failed", extra={"error": str(e)})
-            return self._convert_latex_to_spoken(text)  # Return cleaned original on failure
+            return None
 
     def _convert_latex_to_spoken(self, text: str) -> str:
-        """Convert LaTeX notation to spoken form for TTS (fallback/cleanup)"""
-        import re
+        """Convert LaTeX notation to spoken form for TTS (fallback/cleanup)
+
+        Pure and shared by all target languages, so results are memoized.
+        """
+        return _latex_to_spoken(text)
 
+    @staticmethod
+    def _latex_to_spoken_uncached(text: str) -> str:
         result = text
 
         # First, handle complex patterns with content inside braces
@@ -663,6 +764,20 @@ class TranslationService:
         if source_language == target_language:
             return items
 
+        return await self._translate_with_memory(
+            items,
+            source_language,
+            target_language,
+            "item",
+            lambda missing: self._request_items(missing, source_language, target_language),
+        )
+
+    async def _request_items(
+        self,
+        items: List[str],
+        source_language: str,
+        target_language: str
+    ) -> List[Optional[str]]:
         source_name = LANGUAGE_NAMES.get(source_language, source_language)
         target_name = LANGUAGE_NAMES.get(target_language, target_language)
 
@@ -705,11 +820,11 @@ class TranslationService:
                 return translated_items
             else:
                 self.logger.warning("Item count mismatch, falling back to individual translation")
-                return [await self._translate_text(item, source_language, target_language) for item in items]
+                return await self._request_speakable(items, source_language, target_language)
 
         except Exception as e:
             self.logger.error("List translation failed", extra={"error": str(e)})
-            return items
+            return [None] * len(items)
 
 
 # Singleton instance
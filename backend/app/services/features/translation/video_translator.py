@@ -0,0 +1,422 @@
+"""
+Translated Video Generator - Produces the video for a translated script
+
+Sections are independent (no LLM planning is needed, only TTS, Manim text
+translation, a re-render and an ffmpeg merge), so they are processed
+concurrently under a bounded limit. Renders still go through the shared
+render admission, so translations cannot starve regular generation.
+
+Each finished section is written atomically to
+``section_{i}/translated_section.mp4``; a re-run of the same translation
+reuses those files and only processes the missing sections. Per-section
+progress is written to ``progress.json`` in the translation directory.
+
+For multi-language batches the original section directories and Manim code
+are resolved once (``resolve_source_sections``) and all languages share one
+section semaphore.
+"""
+
+import asyncio
+import json
+import os
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from app.config import OUTPUT_DIR
+from app.core import get_logger, get_media_duration, place_file, run_process_async, JobCancelledError
+
+logger = get_logger(__name__, component="translated_video")
+
+SECTION_VIDEO_NAME = "translated_section.mp4"
+PROGRESS_FILE_NAME = "progress.json"
+FFMPEG_TIMEOUT = 300
+
+
+def translation_concurrency() -> int:
+    """Sections translated in parallel (TRANSLATION_MAX_CONCURRENT)"""
+    try:
+        return max(1, int(os.getenv("TRANSLATION_MAX_CONCURRENT", "3")))
+    except ValueError:
+        return 3
+
+
+@dataclass
+class SourceSection:
+    """Language-independent inputs of one section translation"""
+    original_section_dir: str
+    manim_code: str
+
+
+def _find_original_section_dir(job_id: str, index: int, section: Dict[str, Any]) -> str:
+    for key in ("video", "audio"):
+        path = section.get(key, "")
+        if path and os.path.exists(path) and os.path.isdir(os.path.dirname(path)):
+            return os.path.dirname(path)
+
+    sections_root = os.path.join(str(OUTPUT_DIR), job_id, "sections")
+    candidates = []
+    if section.get("id"):
+        candidates.append(os.path.join(sections_root, section["id"]))
+    candidates.append(os.path.join(sections_root, f"section_{index}"))
+    for candidate in candidates:
+        if os.path.isdir(candidate):
+            return candidate
+
+    return os.path.join(sections_root, section.get("id", f"section_{index}"))
+
+
+def _load_original_manim(section: Dict[str, Any], original_section_dir: str) -> str:
+    original_manim = section.get("manim_code", "")
+    if original_manim or not os.path.isdir(original_section_dir):
+        return original_manim
+
+    for name in os.listdir(original_section_dir):
+        if name.startswith("scene") and name.endswith(".py"):
+            with open(os.path.join(original_section_dir, name), "r") as f:
+                return f.read()
+    return ""
+
+
+def _resolve_source_section(job_id: str, index: int, section: Dict[str, Any]) -> SourceSection:
+    original_section_dir = _find_original_section_dir(job_id, index, section)
+    return SourceSection(
+        original_section_dir=original_section_dir,
+        manim_code=_load_original_manim(section, original_section_dir),
+    )
+
+
+def resolve_source_sections(job_id: str, sections: List[Dict[str, Any]]) -> List[SourceSection]:
+    """Locate the original section directory and Manim code of every section"""
+    return [_resolve_source_section(job_id, i, section) for i, section in enumerate(sections)]
+
+
+def read_translation_progress(translation_dir: Path) -> Optional[Dict[str, Any]]:
+    """Load the progress file of a translation, if present"""
+    try:
+        with open(Path(translation_dir) / PROGRESS_FILE_NAME, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+class TranslatedVideoGenerator:
+    """Renders and assembles the sections of one translated script."""
+
+    def __init__(
+        self,
+        job_id: str,
+        output_dir: str,
+        target_language: str,
+        voice: str,
+        max_concurrent: Optional[int] = None,
+        semaphore: Optional[asyncio.Semaphore] = None,
+        translation_service: Optional[Any] = None,
+        tts_engine: Optional[Any] = None,
+        manim_generator: Optional[Any] = None,
+    ):
+        self.job_id = job_id
+        self.output_dir = Path(output_dir)
+        self.target_language = target_language
+        self.voice = voice
+        self.max_concurrent = max_concurrent or translation_concurrency()
+        # A batch of languages passes one semaphore to bound them together
+        self.semaphore = semaphore or asyncio.Semaphore(self.max_concurrent)
+        self._translation_service = translation_service
+        self._tts_engine = tts_engine
+        self._manim_generator = manim_generator
+
+        self._progress: Dict[str, Any] = {}
+
+    # Heavy collaborators are created lazily so resumed runs that only need
+    # a concat never initialise TTS or the Manim pipeline
+
+    @property
+    def translation_service(self):
+        if self._translation_service is None:
+            from .translation_service import get_translation_service
+            self._translation_service = get_translation_service()
+        return self._translation_service
+
+    @property
+    def tts_engine(self):
+        if self._tts_engine is None:
+            from app.services.pipeline.audio import create_tts_engine
+            self._tts_engine = create_tts_engine()
+        return self._tts_engine
+
+    @property
+    def manim_generator(self):
+        if self._manim_generator is None:
+            from app.services.pipeline.animation import ManimGenerator
+            self._manim_generator = ManimGenerator()
+        return self._manim_generator
+
+    async def generate(
+        self,
+        translated_script: Dict[str, Any],
+        source_sections: Optional[List[SourceSection]] = None,
+    ) -> Optional[str]:
+        """Produce ``final_video.mp4`` for the translated script.
+
+        Args:
+            translated_script: Script in the target language
+            source_sections: Pre-resolved original sections (see
+                resolve_source_sections); resolved here when omitted
+
+        Returns:
+            Path of the final video, or None if no section could be produced
+        """
+        sections = translated_script.get("sections", [])
+        source_language = translated_script.get("translated_from", "en")
+        total = len(sections)
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+
+        cached = {
+            i for i in range(total)
+            if (self._section_dir(i) / SECTION_VIDEO_NAME).exists()
+        }
+        self._progress = {
+            "status": "processing",
+            "target_language": self.target_language,
+            "total_sections": total,
+            "completed_sections": len(cached),
+            "cached_sections": sorted(cached),
+            "failed_sections": [],
+            "started_at": time.time(),
+        }
+        self._write_progress()
+
+        logger.info(f"Generating translated video ({self.target_language})", extra={
+            "job_id": self.job_id,
+            "total_sections": total,
+            "cached_sections": len(cached),
+            "max_concurrent": self.max_concurrent,
+        })
+
+        async def run_section(i: int, section: Dict[str, Any]) -> Optional[str]:
+            if i in cached:
+                return str(self._section_dir(i) / SECTION_VIDEO_NAME)
+            async with self.semaphore:
+                try:
+                    if source_sections is not None and i < len(source_sections):
+                        source = source_sections[i]
+                    else:
+                        source = _resolve_source_section(self.job_id, i, section)
+                    video = await self._process_section(i, section, source, source_language)
+                except JobCancelledError:
+                    raise
+                except Exception as e:
+                    logger.error(f"Translated section {i} failed: {e}", extra={
+                        "job_id": self.job_id,
+                        "section_index": i,
+                    }, exc_info=True)
+                    video = None
+            self._record_section(i, video is not None)
+            return video
+
+        results = await asyncio.gather(*(run_section(i, s) for i, s in enumerate(sections)))
+        section_videos = [video for video in results if video]
+
+        final_video = await self._concat(section_videos) if section_videos else None
+        self._progress["status"] = "completed" if final_video else "failed"
+        self._progress["finished_at"] = time.time()
+        self._write_progress()
+        return final_video
+
+    # ------------------------------------------------------------------
+    # Section processing
+    # ------------------------------------------------------------------
+
+    def _section_dir(self, index: int) -> Path:
+        return self.output_dir / f"section_{index}"
+
+    async def _process_section(
+        self,
+        index: int,
+        section: Dict[str, Any],
+        source: SourceSection,
+        source_language: str,
+    ) -> Optional[str]:
+        """TTS, Manim text translation, re-render and merge of one section"""
+        section_dir = self._section_dir(index)
+        section_dir.mkdir(parents=True, exist_ok=True)
+
+        narration = section.get("tts_narration", section.get("narration", ""))
+        if not narration:
+            return None
+
+        audio_path = str(section_dir / "audio.mp3")
+        try:
+            await self.tts_engine.generate_speech(
+                text=narration,
+                output_path=audio_path,
+                voice=self.voice
+            )
+        except Exception as e:
+            logger.warning(f"TTS error for translated section {index}: {e}")
+            return None
+
+        audio_duration = await get_media_duration(audio_path)
+
+        original_section_dir = source.original_section_dir
+        original_manim = source.manim_code
+
+        video_path = None
+        if original_manim:
+            try:
+                translated_manim = await self.translation_service.translate_manim_code(
+                    original_manim,
+                    self.target_language,
+                    source_language
+                )
+                with open(section_dir / "scene.py", "w", encoding="utf-8") as f:
+                    f.write(translated_manim)
+
+                video_path = await self.manim_generator.render_from_code(
+                    translated_manim,
+                    str(section_dir),
+                    section_index=index
+                )
+            except Exception as e:
+                logger.warning(f"Manim translation/render error for section {index}: {e}")
+                video_path = None
+
+        if not video_path or not os.path.exists(video_path):
+            # Fall back to the original animation under the translated audio
+            video_path = os.path.join(original_section_dir, "final_section.mp4")
+            if not os.path.exists(video_path):
+                video_path = section.get("video", "")
+            if not video_path or not os.path.exists(video_path):
+                return None
+
+        video_duration = await get_media_duration(video_path)
+        return await self._merge(video_path, audio_path, video_duration, audio_duration, section_dir)
+
+    async def _merge(
+        self,
+        video_path: str,
+        audio_path: str,
+        video_duration: float,
+        audio_duration: float,
+        section_dir: Path,
+    ) -> Optional[str]:
+        """Fit the translated audio to the section video.
+
+        The output is written under a temporary name and renamed on success,
+        so an existing ``translated_section.mp4`` is always complete.
+        """
+        output_video = section_dir / SECTION_VIDEO_NAME
+        partial_video = section_dir / f"partial_{SECTION_VIDEO_NAME}"
+
+        if audio_duration > video_duration * 0.9 and audio_duration < video_duration * 1.5:
+            speed_factor = video_duration / audio_duration
+            cmd = [
+                "ffmpeg", "-y",
+                "-i", video_path,
+                "-i", audio_path,
+                "-filter_complex", f"[0:v]setpts={1/speed_factor}*PTS[v]",
+                "-map", "[v]",
+                "-map", "1:a",
+                "-c:v", "libx264",
+                "-c:a", "aac",
+                "-shortest",
+                str(partial_video)
+            ]
+        elif audio_duration > video_duration * 1.5:
+            extend_duration = audio_duration - video_duration
+            cmd = [
+                "ffmpeg", "-y",
+                "-i", video_path,
+                "-i", audio_path,
+                "-filter_complex", f"[0:v]tpad=stop_mode=clone:stop_duration={extend_duration}[v]",
+                "-map", "[v]",
+                "-map", "1:a",
+                "-c:v", "libx264",
+                "-c:a", "aac",
+                str(partial_video)
+            ]
+        else:
+            silence_duration = video_duration - audio_duration
+            cmd = [
+                "ffmpeg", "-y",
+                "-i", video_path,
+                "-i", audio_path,
+                "-filter_complex", f"[1:a]apad=pad_dur={silence_duration}[a]",
+                "-map", "0:v",
+                "-map", "[a]",
+                "-c:v", "libx264",
+                "-c:a", "aac",
+                "-t", str(video_duration),
+                str(partial_video)
+            ]
+
+        result = await run_process_async(
+            cmd, timeout=FFMPEG_TIMEOUT, capture_output=True, text=True, errors="replace"
+        )
+        if result.returncode != 0 or not partial_video.exists():
+            logger.warning(f"FFmpeg merge failed: {(result.stderr or '')[:500]}")
+            partial_video.unlink(missing_ok=True)
+            return None
+
+        os.replace(partial_video, output_video)
+        return str(output_video)
+
+    async def _concat(self, section_videos: List[str]) -> Optional[str]:
+        final_video = self.output_dir / "final_video.mp4"
+        partial_video = self.output_dir / "partial_final_video.mp4"
+        if len(section_videos) == 1:
+            # Section videos and the final video are only ever replaced, so
+            # a single section may share its file with the final video
+            await asyncio.to_thread(place_file, section_videos[0], final_video, link=True)
+            return str(final_video)
+
+        concat_file = self.output_dir / "concat.txt"
+        with open(concat_file, "w", encoding="utf-8") as f:
+            for video in section_videos:
+                f.write(f"file '{video}'\n")
+
+        cmd = [
+            "ffmpeg", "-y",
+            "-f", "concat",
+            "-safe", "0",
+            "-i", str(concat_file),
+            "-c", "copy",
+            str(partial_video)
+        ]
+        result = await run_process_async(cmd, timeout=FFMPEG_TIMEOUT, capture_output=True)
+        if result.returncode != 0 or not partial_video.exists():
+            logger.error("Translated video concat failed", extra={"job_id": self.job_id})
+            partial_video.unlink(missing_ok=True)
+            return None
+        os.replace(partial_video, final_video)
+        return str(final_video)
+
+    # ------------------------------------------------------------------
+    # Progress
+    # ------------------------------------------------------------------
+
+    def _record_section(self, index: int, success: bool) -> None:
+        if success:
+            self._progress["completed_sections"] += 1
+        else:
+            self._progress["failed_sections"].append(index)
+        total = self._progress["total_sections"]
+        logger.info(
+            f"Translated section {index + 1}/{total} {'done' if success else 'failed'} "
+            f"({self._progress['completed_sections']}/{total} complete)",
+            extra={"job_id": self.job_id, "section_index": index, "language": self.target_language},
+        )
+        self._write_progress()
+
+    def _write_progress(self) -> None:
+        self._progress["updated_at"] = time.time()
+        path = self.output_dir / PROGRESS_FILE_NAME
+        tmp_path = path.with_suffix(".json.tmp")
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self._progress, f)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Failed to write translation progress: {e}")
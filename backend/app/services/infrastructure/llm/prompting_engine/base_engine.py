@@ -6,6 +6,7 @@ response parsing, retries, and cost tracking.
 """
 
 import asyncio
+import os
 from typing import Dict, Any, Optional, List, Union
 from dataclasses import dataclass
 
@@ -14,10 +15,23 @@ from app.services.infrastructure.llm.gemini.client import (
     GenerationConfig as UnifiedGenerationConfig
 )
 from app.config.models import get_model_config, get_thinking_config
+from app.core import get_llm_admission, remaining_budget
 from app.services.infrastructure.llm.cost_tracker import CostTracker
 from app.services.infrastructure.parsing import parse_json_strict
 
 
+def _default_timeout() -> Optional[float]:
+    """Per-request timeout for calls without one (LLM_CALL_TIMEOUT, 0 disables)"""
+    try:
+        value = float(os.getenv("LLM_CALL_TIMEOUT", "300"))
+    except ValueError:
+        value = 300.0
+    return value if value > 0 else None
+
+
+DEFAULT_LLM_TIMEOUT = _default_timeout()
+
+
 @dataclass
 class PromptConfig:
     """Configuration for a prompt execution"""
@@ -148,33 +162,43 @@ class PromptingEngine:
         payload = contents if contents is not None else prompt
         
         for attempt in range(config.max_retries):
+            # Never wait past the current section deadline, and never forever
+            timeout = remaining_budget(config.timeout or DEFAULT_LLM_TIMEOUT)
+            if timeout is not None and timeout <= 0:
+                return {
+                    "success": False,
+                    "error": "Deadline exceeded",
+                    "context": context,
+                }
             try:
                 # Build generation config
                 gen_config = self._get_generation_config(config)
                 
                 # Get model - use client.models.generate_content for unified client
-                if config.timeout:
-                    response = await asyncio.wait_for(
-                        asyncio.to_thread(
+                # Admission: interactive work is served ahead of bulk jobs
+                async with get_llm_admission().slot():
+                    if timeout:
+                        response = await asyncio.wait_for(
+                            asyncio.to_thread(
+                                self.client.models.generate_content,
+                                model=model_name,
+                                contents=payload,
+                                tools=tools,
+                                config=gen_config,
+                                context=context
+                            ),
+                            timeout=timeout,
+                        )
+                    else:
+                        response = await asyncio.to_thread(
                             self.client.models.generate_content,
                             model=model_name,
                             contents=payload,
                             tools=tools,
                             config=gen_config,
                             context=context
-                        ),
-                        timeout=config.timeout,
-                    )
-                else:
-                    response = await asyncio.to_thread(
-                        self.client.models.generate_content,
-                        model=model_name,
-                        contents=payload,
-                        tools=tools,
-                        config=gen_config,
-                        context=context
-                    )
-                
+                        )
+
                 # Track costs
                 if hasattr(response, 'usage_metadata'):
                     usage = {
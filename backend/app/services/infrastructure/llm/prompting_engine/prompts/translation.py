@@ -138,7 +138,7 @@ These texts appear ON SCREEN in a video. Keep them concise and natural.
 
 RULES:
 1. Translate the meaning naturally, keep similar length
-2. These are Python strings - preserve any escape sequences: \\n, \\t, etc.
+2. Preserve line breaks and tabs exactly where they are
 3. DO NOT translate:
    - Variable placeholders: {{{{x}}}}, {{{{n}}}}, {{{{value}}}}
    - Mathematical symbols that should stay as-is
@@ -1,5 +1,46 @@
-"""Job orchestration - job management and tracking."""
+"""Job orchestration - job management, tracking and the durable task queue."""
 
 from .job_manager import JobManager, Job, JobStatus, get_job_manager
+from .sqlite_job_manager import SqliteJobManager, sqlite_job_store_enabled
+from .job_summary_index import (
+    JobSummaryIndex,
+    build_job_summary,
+    filter_job_summaries,
+    get_job_summary_index,
+    job_summary_index_enabled,
+    parse_status_filter,
+    refresh_job_summary,
+    validate_listing_params,
+)
+from .task_queue import (
+    SqliteTaskQueue,
+    QueuedTask,
+    TaskStatus,
+    get_task_queue,
+    task_queue_enabled,
+)
+from .task_worker import TaskWorker, TaskDeferred
 
-__all__ = ["JobManager", "Job", "JobStatus", "get_job_manager"]
+__all__ = [
+    "JobManager",
+    "Job",
+    "JobStatus",
+    "get_job_manager",
+    "SqliteJobManager",
+    "sqlite_job_store_enabled",
+    "JobSummaryIndex",
+    "build_job_summary",
+    "filter_job_summaries",
+    "get_job_summary_index",
+    "job_summary_index_enabled",
+    "parse_status_filter",
+    "refresh_job_summary",
+    "validate_listing_params",
+    "SqliteTaskQueue",
+    "QueuedTask",
+    "TaskStatus",
+    "get_task_queue",
+    "task_queue_enabled",
+    "TaskWorker",
+    "TaskDeferred",
+]
@@ -1,18 +1,29 @@
 """
 Job Manager - Track video generation jobs with file-based persistence.
+
+Progress updates of running jobs are written behind: the job is updated in
+memory (where reads are served from) and its file is rewritten at most once
+per JOB_WRITE_COALESCE_SECONDS window, on a background thread. Creating a
+job, reaching a settled state (completed, failed, interrupted) and flush()
+(called on shutdown) write through. Files are replaced atomically, so a
+crash never leaves a torn job file.
 """
 
-import json
+import atexit
 import os
+import threading
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 from threading import RLock
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional
 
 from app.config import JOB_DATA_DIR
+from app.core import publish_job_event, read_json, write_json
 from app.models.status import JobStatus
 
+from .job_summary_index import record_job_change
+
 
 def _env_int(name: str, default: int, minimum: int) -> int:
     raw = os.getenv(name)
@@ -24,6 +35,16 @@ def _env_int(name: str, default: int, minimum: int) -> int:
         return default
 
 
+def _env_float(name: str, default: float, minimum: float) -> float:
+    raw = os.getenv(name)
+    if raw is None:
+        return default
+    try:
+        return max(float(raw), minimum)
+    except (TypeError, ValueError):
+        return default
+
+
 ACTIVE_STATUSES = {
     JobStatus.PENDING,
     JobStatus.ANALYZING,
@@ -42,6 +63,7 @@ class Job:
     message: str = "Job created"
     result: Optional[List[Any]] = None
     error: Optional[str] = None
+    priority: str = "normal"
     created_at: str = field(default_factory=lambda: datetime.now().isoformat())
     updated_at: str = field(default_factory=lambda: datetime.now().isoformat())
 
@@ -53,10 +75,21 @@ class Job:
             "message": self.message,
             "result": self.result,
             "error": self.error,
+            "priority": self.priority,
             "created_at": self.created_at,
             "updated_at": self.updated_at,
         }
 
+    def event_fields(self) -> Dict[str, Any]:
+        """The fields published in progress events (see app.core.job_events)."""
+        return {
+            "status": self.status.value,
+            "progress": self.progress,
+            "message": self.message,
+            "error": self.error,
+            "updated_at": self.updated_at,
+        }
+
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "Job":
         return cls(
@@ -66,6 +99,7 @@ class Job:
             message=data.get("message", ""),
             result=data.get("result"),
             error=data.get("error"),
+            priority=data.get("priority", "normal"),
             created_at=data.get("created_at", datetime.now().isoformat()),
             updated_at=data.get("updated_at", datetime.now().isoformat()),
         )
@@ -74,14 +108,31 @@ class Job:
 class JobManager:
     """Manages video generation jobs with disk-first persistence and bounded RAM cache."""
 
-    def __init__(self, storage_dir: Optional[str] = None, cache_limit: Optional[int] = None):
+    def __init__(
+        self,
+        storage_dir: Optional[str] = None,
+        cache_limit: Optional[int] = None,
+        write_delay: Optional[float] = None,
+    ):
         self._storage_dir = Path(storage_dir) if storage_dir else JOB_DATA_DIR
         self._storage_dir.mkdir(parents=True, exist_ok=True)
         self._cache_limit = cache_limit if cache_limit is not None else _env_int("JOB_MANAGER_CACHE_LIMIT", 200, 25)
+        # 0 writes every update through
+        self._write_delay = (
+            write_delay if write_delay is not None
+            else _env_float("JOB_WRITE_COALESCE_SECONDS", 0.5, 0.0)
+        )
 
         self._jobs: Dict[str, Job] = {}
+        self._mtimes: Dict[str, Optional[int]] = {}
         self._known_job_ids: set[str] = set()
         self._lock = RLock()
+        # Jobs updated in memory but not on disk yet, and the pending flush
+        self._dirty: set[str] = set()
+        self._flush_timer: Optional[threading.Timer] = None
+        # Serializes snapshot + write so an older snapshot never lands last.
+        # Always taken before _lock.
+        self._write_lock = threading.Lock()
 
         self._index_jobs()
 
@@ -93,13 +144,40 @@ class JobManager:
     def _job_file(self, job_id: str) -> Path:
         return self._storage_dir / f"{job_id}.json"
 
+    def _file_mtime(self, job_id: str) -> Optional[int]:
+        try:
+            return self._job_file(job_id).stat().st_mtime_ns
+        except OSError:
+            return None
+
+    def _is_known(self, job_id: str) -> bool:
+        """Known to this process, or created since by another one (e.g. the API for a task worker)."""
+        if job_id in self._known_job_ids:
+            return True
+        if self._job_file(job_id).exists():
+            self._known_job_ids.add(job_id)
+            return True
+        return False
+
+    def _get_cached(self, job_id: str) -> Optional[Job]:
+        """Cached job, dropped if another process has rewritten its file since."""
+        job = self._jobs.get(job_id)
+        if job is None or job_id in self._dirty:
+            # Unwritten local changes are newer than the file
+            return job
+        if self._mtimes.get(job_id) != self._file_mtime(job_id):
+            self._jobs.pop(job_id, None)
+            return None
+        return job
+
     def _load_job_from_disk(self, job_id: str) -> Optional[Job]:
         job_file = self._job_file(job_id)
         if not job_file.exists():
             return None
         try:
-            with open(job_file, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            mtime = self._file_mtime(job_id)
+            data = read_json(job_file)
+            self._mtimes[job_id] = mtime
             return Job.from_dict(data)
         except Exception as e:
             print(f"Error loading job {job_file}: {e}")
@@ -123,34 +201,86 @@ class JobManager:
         evictable_ids = [
             job_id
             for job_id, job in self._jobs.items()
-            if not self._is_active_status(job.status)
+            if not self._is_active_status(job.status) and job_id not in self._dirty
         ]
         evictable_ids.sort(key=lambda j: self._sort_key_updated(self._jobs[j]))
 
         while len(self._jobs) > self._cache_limit and evictable_ids:
             stale_id = evictable_ids.pop(0)
             self._jobs.pop(stale_id, None)
+            self._mtimes.pop(stale_id, None)
 
     def _cache_job(self, job: Job) -> None:
         self._jobs[job.id] = job
         self._prune_cache()
 
-    def _save_job(self, job: Job) -> None:
-        """Save a job to disk."""
-        job_file = self._job_file(job.id)
+    def _save_job(self, job_id: str, data: Dict[str, Any]) -> None:
+        """Write a job snapshot to disk atomically (temp file + rename)."""
+        job_file = self._job_file(job_id)
         try:
-            with open(job_file, "w", encoding="utf-8") as f:
-                json.dump(job.to_dict(), f, indent=2, ensure_ascii=False)
-            self._known_job_ids.add(job.id)
+            write_json(job_file, data, atomic=True)
+            with self._lock:
+                self._known_job_ids.add(job_id)
+                self._mtimes[job_id] = self._file_mtime(job_id)
         except Exception as e:
-            print(f"Error saving job {job.id}: {e}")
+            print(f"Error saving job {job_id}: {e}")
+
+    def _persist(self, job_ids: Iterable[str]) -> None:
+        """Write the current state of ``job_ids`` now."""
+        with self._write_lock:
+            with self._lock:
+                snapshots = []
+                for job_id in job_ids:
+                    self._dirty.discard(job_id)
+                    job = self._jobs.get(job_id)
+                    if job is not None:
+                        snapshots.append((job_id, job.to_dict()))
+            for job_id, data in snapshots:
+                self._save_job(job_id, data)
+
+    def _store(self, job: Job, write_through: bool) -> None:
+        """Keep ``job`` in memory and write it now or with the next flush."""
+        with self._lock:
+            self._jobs[job.id] = job
+        if write_through:
+            self._persist([job.id])
+        else:
+            self._schedule_flush(job.id)
+        with self._lock:
+            self._prune_cache()
+
+    def _schedule_flush(self, job_id: str) -> None:
+        """Mark a job dirty; it is written with the others at the end of the window."""
+        with self._lock:
+            self._dirty.add(job_id)
+            if self._flush_timer is not None:
+                return
+            timer = threading.Timer(self._write_delay, self._flush_pending)
+            timer.daemon = True
+            self._flush_timer = timer
+        timer.start()
+
+    def _flush_pending(self) -> None:
+        with self._lock:
+            self._flush_timer = None
+            pending = list(self._dirty)
+        self._persist(pending)
+
+    def flush(self) -> None:
+        """Write every pending update now (shutdown, tests)."""
+        with self._lock:
+            timer, self._flush_timer = self._flush_timer, None
+            pending = list(self._dirty)
+        if timer is not None:
+            timer.cancel()
+        self._persist(pending)
 
     def get_interrupted_jobs(self) -> List[Job]:
         """Get jobs that were in progress when server stopped."""
         with self._lock:
             interrupted: List[Job] = []
             for job_id in list(self._known_job_ids):
-                job = self._jobs.get(job_id) or self._load_job_from_disk(job_id)
+                job = self._get_cached(job_id) or self._load_job_from_disk(job_id)
                 if not job:
                     continue
                 if job.status in ACTIVE_STATUSES:
@@ -161,29 +291,31 @@ class JobManager:
     def mark_interrupted_jobs_failed(self) -> None:
         """Mark all interrupted jobs as failed."""
         for job in self.get_interrupted_jobs():
-            job.status = JobStatus.FAILED
-            job.message = "Job was interrupted by server restart"
-            job.updated_at = datetime.now().isoformat()
             with self._lock:
-                self._save_job(job)
-                self._cache_job(job)
-
-    def create_job(self, job_id: str) -> Job:
-        """Create a new job."""
-        with self._lock:
-            job = Job(id=job_id)
-            self._save_job(job)
-            self._cache_job(job)
-            return job
+                job.status = JobStatus.FAILED
+                job.message = "Job was interrupted by server restart"
+                job.updated_at = datetime.now().isoformat()
+            self._store(job, write_through=True)
+            publish_job_event(job.id, "job", job.event_fields())
+            record_job_change(job.id, job.to_dict())
+
+    def create_job(self, job_id: str, priority: str = "normal") -> Job:
+        """Create a new job with a scheduling priority class."""
+        job = Job(id=job_id, priority=priority)
+        # Written through: other processes (task workers) look the job up on disk
+        self._store(job, write_through=True)
+        publish_job_event(job_id, "job", job.event_fields())
+        record_job_change(job_id, job.to_dict())
+        return job
 
     def get_job(self, job_id: str) -> Optional[Job]:
         """Get a job by ID."""
         with self._lock:
-            cached = self._jobs.get(job_id)
+            cached = self._get_cached(job_id)
             if cached:
                 return cached
 
-            if job_id not in self._known_job_ids:
+            if not self._is_known(job_id):
                 return None
 
             job = self._load_job_from_disk(job_id)
@@ -206,15 +338,16 @@ class JobManager:
     ) -> None:
         """Update job status."""
         with self._lock:
-            job = self._jobs.get(job_id)
+            job = self._get_cached(job_id)
             if not job:
-                if job_id not in self._known_job_ids:
+                if not self._is_known(job_id):
                     return
                 job = self._load_job_from_disk(job_id)
                 if not job:
                     self._known_job_ids.discard(job_id)
                     return
 
+            transition = status is not None and status != job.status
             if status is not None:
                 job.status = status
             if progress is not None:
@@ -227,12 +360,19 @@ class JobManager:
                 job.error = error
 
             job.updated_at = datetime.now().isoformat()
-            self._save_job(job)
-            self._cache_job(job)
+            write_through = self._write_delay <= 0 or not self._is_active_status(job.status)
+            job_data = job.to_dict() if transition else None
+            event_fields = job.event_fields()
+
+        self._store(job, write_through)
+        publish_job_event(job_id, "job", event_fields)
+        if job_data is not None:
+            record_job_change(job_id, job_data)
 
     def delete_job(self, job_id: str) -> Optional[Dict[str, Any]]:
         """Delete a job and return its data."""
-        with self._lock:
+        # The write lock keeps a flush in progress from recreating the file
+        with self._write_lock, self._lock:
             job = self._jobs.get(job_id)
             if not job and job_id in self._known_job_ids:
                 job = self._load_job_from_disk(job_id)
@@ -240,13 +380,18 @@ class JobManager:
             job_data = job.to_dict() if job else None
 
             self._jobs.pop(job_id, None)
+            self._mtimes.pop(job_id, None)
             self._known_job_ids.discard(job_id)
+            self._dirty.discard(job_id)
 
             job_file = self._job_file(job_id)
             if job_file.exists():
                 job_file.unlink()
 
-            return job_data
+        if job_data is not None:
+            publish_job_event(job_id, "deleted", {"job_id": job_id})
+        record_job_change(job_id, None)
+        return job_data
 
     def get_all_jobs(self) -> List[Job]:
         """Get all jobs from persistent storage."""
@@ -269,8 +414,20 @@ _job_manager_instance: Optional[JobManager] = None
 
 
 def get_job_manager() -> JobManager:
-    """Get the shared JobManager instance (singleton pattern)."""
+    """Get the shared JobManager instance (singleton pattern).
+
+    With JOB_STORE_SQLITE_ENABLED this is a SqliteJobManager, which has the
+    same public methods.
+    """
     global _job_manager_instance
     if _job_manager_instance is None:
-        _job_manager_instance = JobManager()
+        from .sqlite_job_manager import SqliteJobManager, sqlite_job_store_enabled
+
+        if sqlite_job_store_enabled():
+            path = os.getenv("JOB_STORE_PATH")
+            _job_manager_instance = SqliteJobManager(Path(path) if path else None)
+        else:
+            _job_manager_instance = JobManager()
+        # Pending progress writes must not be lost on a normal exit
+        atexit.register(_job_manager_instance.flush)
     return _job_manager_instance
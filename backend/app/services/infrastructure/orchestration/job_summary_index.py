@@ -0,0 +1,437 @@
+"""
+Job Summary Index - Materialized listing rows for the jobs endpoints
+
+Listing jobs used to load every job record and, for each one, check that its
+final video exists and read ``video_info.json`` (or parse the full
+``script.json``), then walk every output directory twice more for orphaned
+videos and persisted failures: the cost of ``/jobs`` grew with the history.
+
+With JOB_SUMMARY_INDEX_ENABLED, one summary row per job (status, title,
+duration, sections count, thumbnail, whether the video exists) is kept in a
+small SQLite database. The job managers refresh a job's row when it is
+created, changes status or is deleted; features that change the listed
+metadata (title edits, section splices, output deletion) call
+``refresh_job_summary``. Listings are then a single indexed query with
+filtering, sorting and pagination.
+
+Rows are only refreshed at transitions, so the progress and message of jobs
+still running are read from the job store by the caller. The index is built
+from the existing jobs and outputs the first time it is opened; delete the
+database file to rebuild it.
+"""
+
+import json
+import os
+import sqlite3
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from fastapi import HTTPException
+
+from app.config import JOB_DATA_DIR, OUTPUT_DIR
+from app.core import (
+    get_logger,
+    parse_bool_env,
+    load_script,
+    get_script_metadata,
+    load_video_info,
+    load_error_info,
+)
+from app.models.status import JobStatus
+
+logger = get_logger(__name__, component="job_summary_index")
+
+DEFAULT_SUMMARY_INDEX_PATH = JOB_DATA_DIR / "job_summaries.db"
+
+SORT_FIELDS = ("created_at", "updated_at", "title", "total_duration", "status")
+DEFAULT_SORT = "created_at"
+
+_BUILT_KEY = "built_at"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS job_summaries (
+    id TEXT PRIMARY KEY,
+    status TEXT NOT NULL,
+    progress REAL NOT NULL DEFAULT 0,
+    message TEXT NOT NULL DEFAULT '',
+    error TEXT,
+    result TEXT,
+    created_at TEXT NOT NULL DEFAULT '',
+    updated_at TEXT NOT NULL DEFAULT '',
+    title TEXT,
+    total_duration REAL,
+    sections_count INTEGER,
+    thumbnail_url TEXT,
+    video_exists INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS idx_summaries_status ON job_summaries (status, created_at);
+CREATE INDEX IF NOT EXISTS idx_summaries_created ON job_summaries (created_at);
+CREATE INDEX IF NOT EXISTS idx_summaries_updated ON job_summaries (updated_at);
+CREATE TABLE IF NOT EXISTS job_summary_meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+_COLUMNS = (
+    "id", "status", "progress", "message", "error", "result", "created_at", "updated_at",
+    "title", "total_duration", "sections_count", "thumbnail_url", "video_exists",
+)
+
+
+def job_summary_index_enabled() -> bool:
+    """Whether job listings use the summary index (JOB_SUMMARY_INDEX_ENABLED, default off)"""
+    return parse_bool_env(os.getenv("JOB_SUMMARY_INDEX_ENABLED"), default=False)
+
+
+def build_job_summary(job_id: str, job: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """The listing entry of a job, from its record and its output files.
+
+    Without a job record (cleaned up job data), a final video with
+    ``video_info.json`` is listed as completed and a persisted
+    ``error_info.json`` as failed; otherwise the job is not listed.
+    """
+    video_exists = (OUTPUT_DIR / job_id / "final_video.mp4").exists()
+    summary: Dict[str, Any] = {
+        "id": job_id,
+        "video_exists": video_exists,
+        "video_url": f"/outputs/{job_id}/final_video.mp4" if video_exists else None,
+        "title": None,
+        "total_duration": None,
+        "sections_count": None,
+        "thumbnail_url": None,
+    }
+
+    video_info = load_video_info(job_id)
+    if job is not None:
+        summary.update({
+            "status": job.get("status", "pending"),
+            "progress": job.get("progress", 0),
+            "message": job.get("message", ""),
+            "created_at": job.get("created_at", ""),
+            "updated_at": job.get("updated_at", ""),
+            "result": job.get("result"),
+            "error": job.get("error"),
+        })
+        # video_info.json survives cleanup; script.json is the fallback
+        if video_info:
+            summary.update(_video_info_fields(video_info))
+        else:
+            try:
+                summary.update(get_script_metadata(load_script(job_id)))
+            except HTTPException:
+                pass
+        return summary
+
+    if video_exists and video_info:
+        summary.update({
+            "status": "completed",
+            "progress": 100,
+            "message": "Video ready",
+            "created_at": video_info.created_at or "",
+            "updated_at": video_info.created_at or "",
+            "result": None,
+            "error": None,
+            **_video_info_fields(video_info),
+        })
+        return summary
+
+    error_info = load_error_info(job_id)
+    if error_info:
+        summary.update({
+            "status": "failed",
+            "progress": 0,
+            "message": error_info.error_message,
+            "created_at": error_info.timestamp,
+            "updated_at": error_info.timestamp,
+            "result": None,
+            "error": error_info.error_message,
+            "title": error_info.title or f"Failed Job ({job_id[:8]})",
+        })
+        return summary
+
+    return None
+
+
+def _video_info_fields(video_info) -> Dict[str, Any]:
+    return {
+        "title": video_info.title,
+        "total_duration": video_info.duration,
+        "sections_count": len(video_info.chapters),
+        "thumbnail_url": video_info.thumbnail_url,
+    }
+
+
+def parse_status_filter(status: Optional[str]) -> Tuple[str, ...]:
+    """Statuses of a comma-separated ``status`` query value (empty: all)."""
+    if not status:
+        return ()
+    statuses = tuple(s.strip().lower() for s in status.split(",") if s.strip())
+    valid = {s.value for s in JobStatus}
+    unknown = [s for s in statuses if s not in valid]
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown job status: {', '.join(unknown)}")
+    return statuses
+
+
+def validate_listing_params(sort: Optional[str], order: Optional[str], limit: Optional[int], offset: int) -> Tuple[str, bool]:
+    """Check listing parameters; returns the sort field and whether it is descending."""
+    sort = sort or DEFAULT_SORT
+    if sort not in SORT_FIELDS:
+        raise HTTPException(status_code=400, detail=f"Cannot sort by {sort}; use one of {', '.join(SORT_FIELDS)}")
+    order = (order or "desc").lower()
+    if order not in ("asc", "desc"):
+        raise HTTPException(status_code=400, detail="order must be asc or desc")
+    if limit is not None and limit < 1:
+        raise HTTPException(status_code=400, detail="limit must be at least 1")
+    if offset < 0:
+        raise HTTPException(status_code=400, detail="offset must not be negative")
+    return sort, order == "desc"
+
+
+def filter_job_summaries(
+    summaries: Iterable[Dict[str, Any]],
+    statuses: Sequence[str] = (),
+    query: Optional[str] = None,
+    completed_only: bool = False,
+    sort: str = DEFAULT_SORT,
+    descending: bool = True,
+    limit: Optional[int] = None,
+    offset: int = 0,
+) -> Tuple[List[Dict[str, Any]], int]:
+    """Filter, sort and page summaries in memory, as JobSummaryIndex.query does.
+
+    Returns the page and the number of matching summaries.
+    """
+    needle = query.lower() if query else None
+    matching = [
+        s for s in summaries
+        if (not statuses or s["status"] in statuses)
+        and (not completed_only or (s["status"] == "completed" and s["video_exists"]))
+        and (needle is None or needle in (s.get("title") or "").lower())
+    ]
+    # Missing values sort last whatever the direction, like NULLS LAST
+    present = [s for s in matching if s.get(sort) is not None]
+    missing = [s for s in matching if s.get(sort) is None]
+    present.sort(key=lambda s: (_sort_value(s[sort]), s["id"]), reverse=descending)
+    ordered = present + missing
+    end = offset + limit if limit is not None else None
+    return ordered[offset:end], len(matching)
+
+
+def _sort_value(value: Any) -> Any:
+    return value.lower() if isinstance(value, str) else value
+
+
+def _row_params(summary: Dict[str, Any]) -> tuple:
+    return (
+        summary["id"],
+        summary["status"],
+        summary.get("progress") or 0,
+        summary.get("message") or "",
+        summary.get("error"),
+        json.dumps(summary["result"], ensure_ascii=False) if summary.get("result") is not None else None,
+        summary.get("created_at") or "",
+        summary.get("updated_at") or "",
+        summary.get("title"),
+        summary.get("total_duration"),
+        summary.get("sections_count"),
+        summary.get("thumbnail_url"),
+        1 if summary.get("video_exists") else 0,
+    )
+
+
+def _summary_from_row(row: sqlite3.Row) -> Dict[str, Any]:
+    video_exists = bool(row["video_exists"])
+    return {
+        "id": row["id"],
+        "status": row["status"],
+        "progress": row["progress"],
+        "message": row["message"],
+        "created_at": row["created_at"],
+        "updated_at": row["updated_at"],
+        "result": json.loads(row["result"]) if row["result"] is not None else None,
+        "error": row["error"],
+        "video_exists": video_exists,
+        "video_url": f"/outputs/{row['id']}/final_video.mp4" if video_exists else None,
+        "title": row["title"],
+        "total_duration": row["total_duration"],
+        "sections_count": row["sections_count"],
+        "thumbnail_url": row["thumbnail_url"],
+    }
+
+
+class JobSummaryIndex:
+    """Materialized job listing rows in SQLite."""
+
+    def __init__(self, db_path: Optional[Path] = None):
+        self.db_path = Path(db_path) if db_path else DEFAULT_SUMMARY_INDEX_PATH
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        conn = sqlite3.connect(str(self.db_path), timeout=30, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        try:
+            conn.execute("PRAGMA synchronous=NORMAL")
+            yield conn
+        finally:
+            conn.close()
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        with self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+
+    def _upsert(self, conn: sqlite3.Connection, summary: Dict[str, Any]) -> None:
+        placeholders = ", ".join("?" for _ in _COLUMNS)
+        conn.execute(
+            f"INSERT OR REPLACE INTO job_summaries ({', '.join(_COLUMNS)}) VALUES ({placeholders})",
+            _row_params(summary),
+        )
+
+    def is_built(self) -> bool:
+        """Whether the index has been built from the existing jobs."""
+        with self._connect() as conn:
+            return conn.execute(
+                "SELECT 1 FROM job_summary_meta WHERE key = ?", (_BUILT_KEY,)
+            ).fetchone() is not None
+
+    def rebuild(self, jobs: Iterable[Dict[str, Any]]) -> int:
+        """Replace all rows with summaries of ``jobs`` and of orphaned outputs.
+
+        Returns the number of rows written.
+        """
+        jobs_by_id = {job["id"]: job for job in jobs}
+        job_ids = set(jobs_by_id)
+        if OUTPUT_DIR.exists():
+            job_ids.update(p.name for p in OUTPUT_DIR.iterdir() if p.is_dir())
+
+        summaries = []
+        for job_id in sorted(job_ids):
+            summary = build_job_summary(job_id, jobs_by_id.get(job_id))
+            if summary:
+                summaries.append(summary)
+
+        with self._transaction() as conn:
+            conn.execute("DELETE FROM job_summaries")
+            for summary in summaries:
+                self._upsert(conn, summary)
+            conn.execute(
+                "INSERT OR REPLACE INTO job_summary_meta (key, value) VALUES (?, ?)",
+                (_BUILT_KEY, datetime.now().isoformat()),
+            )
+
+        logger.info(f"Built job summary index with {len(summaries)} jobs", extra={"path": str(self.db_path)})
+        return len(summaries)
+
+    def refresh(self, job_id: str, job: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """Recompute a job's row from its record (None if deleted) and outputs."""
+        summary = build_job_summary(job_id, job)
+        with self._connect() as conn:
+            if summary:
+                self._upsert(conn, summary)
+            else:
+                conn.execute("DELETE FROM job_summaries WHERE id = ?", (job_id,))
+        return summary
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """The stored summary of a job."""
+        with self._connect() as conn:
+            row = conn.execute(
+                f"SELECT {', '.join(_COLUMNS)} FROM job_summaries WHERE id = ?", (job_id,)
+            ).fetchone()
+        return _summary_from_row(row) if row else None
+
+    def query(
+        self,
+        statuses: Sequence[str] = (),
+        query: Optional[str] = None,
+        completed_only: bool = False,
+        sort: str = DEFAULT_SORT,
+        descending: bool = True,
+        limit: Optional[int] = None,
+        offset: int = 0,
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """One page of summaries and the number of matching summaries."""
+        if sort not in SORT_FIELDS:
+            raise ValueError(f"Unsupported sort field: {sort}")
+
+        clauses: List[str] = []
+        params: List[Any] = []
+        if statuses:
+            clauses.append(f"status IN ({', '.join('?' for _ in statuses)})")
+            params.extend(statuses)
+        if completed_only:
+            clauses.append("status = 'completed' AND video_exists = 1")
+        if query:
+            escaped = query.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+            clauses.append("title LIKE ? ESCAPE '\\'")
+            params.append(f"%{escaped}%")
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+
+        direction = "DESC" if descending else "ASC"
+        sort_expr = f"{sort} COLLATE NOCASE" if sort in ("title", "status") else sort
+        order = f"{sort} IS NULL, {sort_expr} {direction}, id {direction}"
+
+        with self._connect() as conn:
+            total = conn.execute(f"SELECT COUNT(*) FROM job_summaries {where}", params).fetchone()[0]
+            rows = conn.execute(
+                f"SELECT {', '.join(_COLUMNS)} FROM job_summaries {where} "
+                f"ORDER BY {order} LIMIT ? OFFSET ?",
+                [*params, limit if limit is not None else -1, offset],
+            ).fetchall()
+        return [_summary_from_row(row) for row in rows], total
+
+
+_summary_index_instance: Optional[JobSummaryIndex] = None
+
+
+def get_job_summary_index() -> JobSummaryIndex:
+    """Get the shared summary index, built from the job store on first use."""
+    global _summary_index_instance
+    if _summary_index_instance is None:
+        path = os.getenv("JOB_SUMMARY_INDEX_PATH")
+        index = JobSummaryIndex(Path(path) if path else None)
+        if not index.is_built():
+            from .job_manager import get_job_manager
+
+            index.rebuild(get_job_manager().list_all_jobs())
+        _summary_index_instance = index
+    return _summary_index_instance
+
+
+def record_job_change(job_id: str, job: Optional[Dict[str, Any]]) -> None:
+    """Refresh a job's summary after a transition (no-op unless the index is enabled).
+
+    Called by the job managers with the job's data, or None once deleted.
+    Failures are logged: the job store stays the source of truth.
+    """
+    if not job_summary_index_enabled():
+        return
+    try:
+        get_job_summary_index().refresh(job_id, job)
+    except Exception as e:
+        logger.warning(f"Failed to refresh job summary: {e}", extra={"job_id": job_id})
+
+
+def refresh_job_summary(job_id: str) -> None:
+    """Refresh a job's summary after its outputs or metadata changed."""
+    if not job_summary_index_enabled():
+        return
+    from .job_manager import get_job_manager
+
+    job = get_job_manager().get_job(job_id)
+    record_job_change(job_id, job.to_dict() if job else None)
@@ -18,9 +18,10 @@ from app.core import (
     create_video_info_from_result,
     load_script,
     parse_bool_env,
+    get_cancellation_registry,
 )
 from app.models.status import JobStatus
-from app.services.infrastructure.orchestration import get_job_manager
+from app.services.infrastructure.orchestration import get_job_manager, get_task_queue, task_queue_enabled
 from app.services.infrastructure.storage import OutputCleanupService
 from app.services.pipeline.assembly import VideoGenerator
 from app.services.pipeline.assembly.ffmpeg import generate_thumbnail
@@ -53,7 +54,7 @@ class StartupManager:
 
         self.app.state.output_cleanup_task = None
         try:
-            self.cleanup_service.run_once()
+            # The first sweep runs right away, off the event loop
             self.app.state.output_cleanup_task = asyncio.create_task(self.cleanup_service.run_periodic())
         except Exception as exc:
             logger.error("Failed to initialize output cleanup", extra={"error": str(exc)}, exc_info=True)
@@ -63,6 +64,7 @@ class StartupManager:
 
         # Find and resume interrupted jobs
         interrupted_jobs = self.job_manager.get_interrupted_jobs()
+        task_queue = get_task_queue() if task_queue_enabled() else None
 
         for job in interrupted_jobs:
             job_id = job.id
@@ -71,6 +73,11 @@ class StartupManager:
                 continue
             resuming_jobs.add(job_id)
 
+            # Jobs with durable queue tasks are still owned by the workers
+            if task_queue is not None and task_queue.has_pending(job_id):
+                logger.info(f"[Startup] Job {job_id} is still queued, leaving it to task workers")
+                continue
+
             # Check what progress exists
             progress = self.video_generator.check_existing_progress(job_id)
 
@@ -92,6 +99,9 @@ class StartupManager:
     
     async def run_shutdown(self) -> None:
         """Stop background services gracefully."""
+        # Kill render/ffmpeg process groups of jobs still running
+        get_cancellation_registry().cancel_all(reason="shutdown")
+
         cleanup_task = getattr(self.app.state, "output_cleanup_task", None)
         if cleanup_task:
             cleanup_task.cancel()
@@ -100,6 +110,9 @@ class StartupManager:
             except asyncio.CancelledError:
                 pass
 
+        # Write progress updates still waiting in the write-behind window
+        self.job_manager.flush()
+
     async def _try_combine_job(self, job_id: str, progress: Dict[str, Any]):
         """Try to combine completed sections into final video"""
         
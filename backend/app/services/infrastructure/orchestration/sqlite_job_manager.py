@@ -0,0 +1,322 @@
+"""
+SQLite Job Manager - Job records in an embedded database
+
+Drop-in replacement for the file-based JobManager (same public methods),
+selected with JOB_STORE_SQLITE_ENABLED. The file-based manager keeps one JSON
+file per job, so listing jobs or scanning for interrupted ones reads every
+file, and its in-process cache has to be revalidated against file mtimes when
+several processes share the directory.
+
+Here every job is one row, indexed by status and ``updated_at``: status scans
+and listings are single queries, an update is one UPDATE statement, and the
+database (WAL mode, short-lived connections) is safe to share between
+uvicorn and task worker processes without any in-process cache.
+
+On first use the JSON job files of the job data directory are imported once;
+they are left in place, so switching back to the file-based manager only
+loses the changes made in between.
+"""
+
+import os
+import sqlite3
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+from app.config import JOB_DATA_DIR
+from app.core import (
+    dumps_json,
+    get_logger,
+    loads_json,
+    parse_bool_env,
+    publish_job_event,
+    read_json,
+)
+from app.models.status import JobStatus
+
+from .job_manager import ACTIVE_STATUSES, Job
+from .job_summary_index import job_summary_index_enabled, record_job_change
+
+logger = get_logger(__name__, component="job_store")
+
+DEFAULT_JOB_STORE_PATH = JOB_DATA_DIR / "jobs.db"
+
+_JSON_IMPORT_KEY = "json_import_completed_at"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id TEXT PRIMARY KEY,
+    status TEXT NOT NULL,
+    progress REAL NOT NULL DEFAULT 0,
+    message TEXT NOT NULL DEFAULT '',
+    result TEXT,
+    error TEXT,
+    priority TEXT NOT NULL DEFAULT 'normal',
+    created_at TEXT NOT NULL,
+    updated_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_jobs_status ON jobs (status, updated_at);
+CREATE INDEX IF NOT EXISTS idx_jobs_updated ON jobs (updated_at);
+CREATE TABLE IF NOT EXISTS job_store_meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+_COLUMNS = "id, status, progress, message, result, error, priority, created_at, updated_at"
+
+_UPDATE_JOB = """
+UPDATE jobs SET
+    status = COALESCE(?, status),
+    progress = COALESCE(?, progress),
+    message = COALESCE(?, message),
+    result = COALESCE(?, result),
+    error = COALESCE(?, error),
+    updated_at = ?
+WHERE id = ?
+"""
+
+
+def sqlite_job_store_enabled() -> bool:
+    """Whether jobs are kept in SQLite (JOB_STORE_SQLITE_ENABLED, default off)"""
+    return parse_bool_env(os.getenv("JOB_STORE_SQLITE_ENABLED"), default=False)
+
+
+def _job_from_row(row: sqlite3.Row) -> Job:
+    return Job(
+        id=row["id"],
+        status=JobStatus(row["status"]),
+        progress=row["progress"],
+        message=row["message"],
+        result=loads_json(row["result"]) if row["result"] is not None else None,
+        error=row["error"],
+        priority=row["priority"],
+        created_at=row["created_at"],
+        updated_at=row["updated_at"],
+    )
+
+
+def _job_params(job: Job) -> tuple:
+    return (
+        job.id,
+        job.status.value,
+        job.progress,
+        job.message,
+        dumps_json(job.result) if job.result is not None else None,
+        job.error,
+        job.priority,
+        job.created_at,
+        job.updated_at,
+    )
+
+
+class SqliteJobManager:
+    """Job records in SQLite, with the JobManager interface."""
+
+    def __init__(self, db_path: Optional[Path] = None, json_dir: Optional[Path] = None):
+        self.db_path = Path(db_path) if db_path else DEFAULT_JOB_STORE_PATH
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+
+        self.import_json_jobs(Path(json_dir) if json_dir else JOB_DATA_DIR)
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        conn = sqlite3.connect(str(self.db_path), timeout=30, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        try:
+            conn.execute("PRAGMA synchronous=NORMAL")
+            yield conn
+        finally:
+            conn.close()
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        with self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+
+    # ------------------------------------------------------------------
+    # One-time import
+    # ------------------------------------------------------------------
+
+    def import_json_jobs(self, json_dir: Path) -> int:
+        """Import the ``*.json`` job files of ``json_dir`` unless already done.
+
+        Jobs already in the database are kept. Returns the jobs imported.
+        """
+        jobs: List[Job] = []
+        with self._connect() as conn:
+            done = conn.execute(
+                "SELECT 1 FROM job_store_meta WHERE key = ?", (_JSON_IMPORT_KEY,)
+            ).fetchone()
+        if done:
+            return 0
+
+        for job_file in sorted(Path(json_dir).glob("*.json")):
+            try:
+                jobs.append(Job.from_dict(read_json(job_file)))
+            except Exception as e:
+                logger.warning(f"Skipping unreadable job file {job_file.name}: {e}")
+
+        with self._transaction() as conn:
+            # Another process may have finished the import meanwhile
+            if conn.execute(
+                "SELECT 1 FROM job_store_meta WHERE key = ?", (_JSON_IMPORT_KEY,)
+            ).fetchone():
+                return 0
+            imported = 0
+            for job in jobs:
+                imported += conn.execute(
+                    f"INSERT OR IGNORE INTO jobs ({_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    _job_params(job),
+                ).rowcount
+            conn.execute(
+                "INSERT INTO job_store_meta (key, value) VALUES (?, ?)",
+                (_JSON_IMPORT_KEY, datetime.now().isoformat()),
+            )
+
+        if imported:
+            logger.info(f"Imported {imported} job files into the job store", extra={"path": str(self.db_path)})
+        return imported
+
+    # ------------------------------------------------------------------
+    # JobManager interface
+    # ------------------------------------------------------------------
+
+    def _select(self, where: str = "", params: Iterable[Any] = (), order: str = "id") -> List[Job]:
+        with self._connect() as conn:
+            rows = conn.execute(
+                f"SELECT {_COLUMNS} FROM jobs {where} ORDER BY {order}", tuple(params)
+            ).fetchall()
+        return [_job_from_row(row) for row in rows]
+
+    def create_job(self, job_id: str, priority: str = "normal") -> Job:
+        """Create a new job with a scheduling priority class."""
+        job = Job(id=job_id, priority=priority)
+        with self._connect() as conn:
+            conn.execute(
+                f"INSERT OR REPLACE INTO jobs ({_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                _job_params(job),
+            )
+        publish_job_event(job_id, "job", job.event_fields())
+        record_job_change(job_id, job.to_dict())
+        return job
+
+    def get_job(self, job_id: str) -> Optional[Job]:
+        """Get a job by ID."""
+        jobs = self._select("WHERE id = ?", (job_id,))
+        return jobs[0] if jobs else None
+
+    def update_job(
+        self,
+        job_id: str,
+        status: Optional[JobStatus] = None,
+        progress: Optional[float] = None,
+        message: Optional[str] = None,
+        result: Optional[List[Any]] = None,
+        error: Optional[str] = None,
+    ) -> None:
+        """Update job status."""
+        params = (
+            status.value if status is not None else None,
+            progress,
+            message,
+            dumps_json(result) if result is not None else None,
+            error,
+            datetime.now().isoformat(),
+            job_id,
+        )
+        if status is None or not job_summary_index_enabled():
+            with self._connect() as conn:
+                updated = conn.execute(_UPDATE_JOB, params).rowcount
+            if updated:
+                self._publish_update(job_id, params)
+            return
+
+        # Status changes refresh the job's summary, so read the old status
+        with self._transaction() as conn:
+            row = conn.execute("SELECT status FROM jobs WHERE id = ?", (job_id,)).fetchone()
+            if row is None:
+                return
+            conn.execute(_UPDATE_JOB, params)
+        self._publish_update(job_id, params)
+        if row["status"] != status.value:
+            job = self.get_job(job_id)
+            if job:
+                record_job_change(job_id, job.to_dict())
+
+    @staticmethod
+    def _publish_update(job_id: str, params: tuple) -> None:
+        """Publish the fields an update changed (the others are unchanged)."""
+        status, progress, message, _, error, updated_at, _ = params
+        fields = {"status": status, "progress": progress, "message": message, "error": error}
+        fields = {key: value for key, value in fields.items() if value is not None}
+        publish_job_event(job_id, "job", {**fields, "updated_at": updated_at})
+
+    def delete_job(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Delete a job and return its data."""
+        with self._transaction() as conn:
+            row = conn.execute(f"SELECT {_COLUMNS} FROM jobs WHERE id = ?", (job_id,)).fetchone()
+            if row is None:
+                return None
+            conn.execute("DELETE FROM jobs WHERE id = ?", (job_id,))
+        publish_job_event(job_id, "deleted", {"job_id": job_id})
+        record_job_change(job_id, None)
+        return _job_from_row(row).to_dict()
+
+    def get_jobs_by_status(self, *statuses: JobStatus) -> List[Job]:
+        """Jobs in any of ``statuses``, most recently updated first."""
+        if not statuses:
+            return []
+        placeholders = ", ".join("?" for _ in statuses)
+        return self._select(
+            f"WHERE status IN ({placeholders})",
+            [status.value for status in statuses],
+            order="updated_at DESC",
+        )
+
+    def get_interrupted_jobs(self) -> List[Job]:
+        """Get jobs that were in progress when server stopped."""
+        return self.get_jobs_by_status(*ACTIVE_STATUSES)
+
+    def mark_interrupted_jobs_failed(self) -> None:
+        """Mark all interrupted jobs as failed."""
+        interrupted = self.get_interrupted_jobs()
+        active = [status.value for status in ACTIVE_STATUSES]
+        placeholders = ", ".join("?" for _ in active)
+        with self._connect() as conn:
+            conn.execute(
+                f"UPDATE jobs SET status = ?, message = ?, updated_at = ? WHERE status IN ({placeholders})",
+                (
+                    JobStatus.FAILED.value,
+                    "Job was interrupted by server restart",
+                    datetime.now().isoformat(),
+                    *active,
+                ),
+            )
+        for job in interrupted:
+            updated = self.get_job(job.id)
+            if updated:
+                publish_job_event(job.id, "job", updated.event_fields())
+                record_job_change(job.id, updated.to_dict())
+
+    def get_all_jobs(self) -> List[Job]:
+        """Get all jobs from persistent storage."""
+        return self._select()
+
+    def list_all_jobs(self) -> List[Dict[str, Any]]:
+        """List all jobs as dictionaries."""
+        return [job.to_dict() for job in self.get_all_jobs()]
+
+    def flush(self) -> None:
+        """Nothing to flush: every update is committed immediately."""
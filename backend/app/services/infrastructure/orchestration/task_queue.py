@@ -0,0 +1,479 @@
+"""
+Task Queue - Durable SQLite-backed queue for section-level pipeline work
+
+Generation work is split into small tasks (script, per-section TTS/animation,
+final assembly) that are persisted in a local SQLite database and executed by
+separate worker processes (see task_worker.py). Because the queue outlives the
+API process, a restart no longer loses in-flight jobs: unfinished tasks are
+simply picked up again.
+
+Delivery is at-least-once:
+- a claimed task is leased to one worker for a visibility timeout
+- the worker extends the lease with heartbeats while the task runs
+- a task whose lease expires (worker crashed or hung) becomes claimable again
+- failed tasks are retried with exponential backoff up to ``max_attempts``
+
+Handlers must therefore be idempotent; section tasks reuse completed outputs.
+"""
+
+import json
+import os
+import sqlite3
+import time
+import uuid
+from contextlib import contextmanager
+from dataclasses import dataclass
+from enum import Enum
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+from app.config import JOB_DATA_DIR
+from app.core import get_logger, parse_bool_env, parse_priority, PriorityClass
+
+logger = get_logger(__name__, component="task_queue")
+
+DEFAULT_QUEUE_PATH = JOB_DATA_DIR / "task_queue.db"
+DEFAULT_VISIBILITY_TIMEOUT = 120.0
+DEFAULT_MAX_ATTEMPTS = 3
+RETRY_BASE_DELAY = 5.0
+RETRY_MAX_DELAY = 300.0
+
+# Lower rank is claimed first
+_PRIORITY_RANK = {
+    PriorityClass.INTERACTIVE: 0,
+    PriorityClass.NORMAL: 1,
+    PriorityClass.BULK: 2,
+}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS tasks (
+    id TEXT PRIMARY KEY,
+    dedupe_key TEXT UNIQUE,
+    job_id TEXT,
+    kind TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    status TEXT NOT NULL,
+    priority INTEGER NOT NULL DEFAULT 1,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    max_attempts INTEGER NOT NULL DEFAULT 3,
+    available_at REAL NOT NULL,
+    lease_expires_at REAL,
+    worker_id TEXT,
+    heartbeat_at REAL,
+    result TEXT,
+    error TEXT,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_tasks_claim ON tasks (status, priority, available_at);
+CREATE INDEX IF NOT EXISTS idx_tasks_job ON tasks (job_id, kind);
+CREATE INDEX IF NOT EXISTS idx_tasks_lease ON tasks (status, lease_expires_at);
+"""
+
+
+class TaskStatus(str, Enum):
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+
+TERMINAL_TASK_STATUSES = {TaskStatus.SUCCEEDED, TaskStatus.FAILED, TaskStatus.CANCELLED}
+
+
+@dataclass
+class QueuedTask:
+    """A task row as seen by a worker"""
+    id: str
+    kind: str
+    payload: Dict[str, Any]
+    status: TaskStatus
+    job_id: Optional[str] = None
+    priority: int = 1
+    attempts: int = 0
+    max_attempts: int = DEFAULT_MAX_ATTEMPTS
+    available_at: float = 0.0
+    lease_expires_at: Optional[float] = None
+    worker_id: Optional[str] = None
+    result: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+    dedupe_key: Optional[str] = None
+
+    @property
+    def is_terminal(self) -> bool:
+        return self.status in TERMINAL_TASK_STATUSES
+
+    @classmethod
+    def from_row(cls, row: sqlite3.Row) -> "QueuedTask":
+        return cls(
+            id=row["id"],
+            kind=row["kind"],
+            payload=json.loads(row["payload"]),
+            status=TaskStatus(row["status"]),
+            job_id=row["job_id"],
+            priority=row["priority"],
+            attempts=row["attempts"],
+            max_attempts=row["max_attempts"],
+            available_at=row["available_at"],
+            lease_expires_at=row["lease_expires_at"],
+            worker_id=row["worker_id"],
+            result=json.loads(row["result"]) if row["result"] else None,
+            error=row["error"],
+            dedupe_key=row["dedupe_key"],
+        )
+
+
+def task_queue_enabled() -> bool:
+    """Whether generation runs through the durable queue (TASK_QUEUE_ENABLED)"""
+    return parse_bool_env(os.getenv("TASK_QUEUE_ENABLED"), default=False)
+
+
+def retry_delay(attempts: int) -> float:
+    """Exponential backoff after the given number of failed attempts"""
+    return min(RETRY_BASE_DELAY * (2 ** max(attempts - 1, 0)), RETRY_MAX_DELAY)
+
+
+class SqliteTaskQueue:
+    """
+    Durable task queue shared by the API and worker processes.
+
+    Every operation opens a short-lived connection, so an instance can be used
+    from any thread or process. Claims run inside ``BEGIN IMMEDIATE`` so two
+    workers never lease the same task.
+    """
+
+    def __init__(
+        self,
+        db_path: Optional[Path] = None,
+        visibility_timeout: float = DEFAULT_VISIBILITY_TIMEOUT,
+    ):
+        self.db_path = Path(db_path) if db_path else DEFAULT_QUEUE_PATH
+        self.visibility_timeout = visibility_timeout
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        conn = sqlite3.connect(str(self.db_path), timeout=30, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        try:
+            conn.execute("PRAGMA synchronous=NORMAL")
+            yield conn
+        finally:
+            conn.close()
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        with self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+
+    # ------------------------------------------------------------------
+    # Producer API
+    # ------------------------------------------------------------------
+
+    def enqueue(
+        self,
+        kind: str,
+        payload: Dict[str, Any],
+        job_id: Optional[str] = None,
+        priority: Any = PriorityClass.NORMAL,
+        max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+        delay: float = 0.0,
+        dedupe_key: Optional[str] = None,
+    ) -> str:
+        """Add a task and return its id.
+
+        If ``dedupe_key`` is given and a task with that key exists, nothing is
+        inserted and the existing task id is returned, which makes fan-out
+        from a retried parent task idempotent.
+        """
+        now = time.time()
+        task_id = uuid.uuid4().hex
+        with self._transaction() as conn:
+            if dedupe_key:
+                row = conn.execute(
+                    "SELECT id FROM tasks WHERE dedupe_key = ?", (dedupe_key,)
+                ).fetchone()
+                if row:
+                    return row["id"]
+            conn.execute(
+                """
+                INSERT INTO tasks (id, dedupe_key, job_id, kind, payload, status, priority,
+                                   attempts, max_attempts, available_at, created_at, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, 0, ?, ?, ?, ?)
+                """,
+                (
+                    task_id, dedupe_key, job_id, kind, json.dumps(payload),
+                    TaskStatus.QUEUED.value, _PRIORITY_RANK[parse_priority(priority)],
+                    max(1, max_attempts), now + delay, now, now,
+                ),
+            )
+
+        logger.debug(f"Enqueued {kind} task {task_id[:8]}", extra={
+            "task_id": task_id,
+            "job_id": job_id,
+            "kind": kind,
+        })
+        return task_id
+
+    def cancel_job(self, job_id: str) -> int:
+        """Cancel every unfinished task of a job.
+
+        Running tasks lose their lease, so the owning worker's next heartbeat
+        fails and it abandons the work.
+        """
+        with self._transaction() as conn:
+            cursor = conn.execute(
+                """
+                UPDATE tasks SET status = ?, lease_expires_at = NULL, updated_at = ?
+                WHERE job_id = ? AND status IN (?, ?)
+                """,
+                (TaskStatus.CANCELLED.value, time.time(), job_id,
+                 TaskStatus.QUEUED.value, TaskStatus.RUNNING.value),
+            )
+            return cursor.rowcount
+
+    def has_pending(self, job_id: str) -> bool:
+        """Whether a job still has queued or running tasks"""
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT 1 FROM tasks WHERE job_id = ? AND status IN (?, ?) LIMIT 1",
+                (job_id, TaskStatus.QUEUED.value, TaskStatus.RUNNING.value),
+            ).fetchone()
+            return row is not None
+
+    # ------------------------------------------------------------------
+    # Worker API
+    # ------------------------------------------------------------------
+
+    def claim(
+        self,
+        worker_id: str,
+        kinds: Optional[Iterable[str]] = None,
+        visibility_timeout: Optional[float] = None,
+    ) -> Optional[QueuedTask]:
+        """Lease the next available task (highest priority, oldest first)."""
+        now = time.time()
+        lease = now + (visibility_timeout or self.visibility_timeout)
+        query = "SELECT * FROM tasks WHERE status = ? AND available_at <= ?"
+        params: List[Any] = [TaskStatus.QUEUED.value, now]
+        kinds = list(kinds or [])
+        if kinds:
+            query += f" AND kind IN ({', '.join('?' for _ in kinds)})"
+            params.extend(kinds)
+        query += " ORDER BY priority, available_at, created_at LIMIT 1"
+
+        with self._transaction() as conn:
+            row = conn.execute(query, params).fetchone()
+            if row is None:
+                return None
+            conn.execute(
+                """
+                UPDATE tasks SET status = ?, attempts = attempts + 1, worker_id = ?,
+                                 lease_expires_at = ?, heartbeat_at = ?, updated_at = ?
+                WHERE id = ?
+                """,
+                (TaskStatus.RUNNING.value, worker_id, lease, now, now, row["id"]),
+            )
+            claimed = conn.execute("SELECT * FROM tasks WHERE id = ?", (row["id"],)).fetchone()
+
+        return QueuedTask.from_row(claimed)
+
+    def heartbeat(
+        self,
+        task_id: str,
+        worker_id: str,
+        visibility_timeout: Optional[float] = None,
+    ) -> bool:
+        """Extend a lease. Returns False if the worker no longer owns the task."""
+        now = time.time()
+        lease = now + (visibility_timeout or self.visibility_timeout)
+        with self._connect() as conn:
+            cursor = conn.execute(
+                """
+                UPDATE tasks SET lease_expires_at = ?, heartbeat_at = ?, updated_at = ?
+                WHERE id = ? AND worker_id = ? AND status = ?
+                """,
+                (lease, now, now, task_id, worker_id, TaskStatus.RUNNING.value),
+            )
+            return cursor.rowcount == 1
+
+    def complete(self, task_id: str, worker_id: str, result: Optional[Dict[str, Any]] = None) -> bool:
+        """Mark a leased task as succeeded"""
+        with self._connect() as conn:
+            cursor = conn.execute(
+                """
+                UPDATE tasks SET status = ?, result = ?, error = NULL,
+                                 lease_expires_at = NULL, updated_at = ?
+                WHERE id = ? AND worker_id = ? AND status = ?
+                """,
+                (TaskStatus.SUCCEEDED.value, json.dumps(result) if result is not None else None,
+                 time.time(), task_id, worker_id, TaskStatus.RUNNING.value),
+            )
+            return cursor.rowcount == 1
+
+    def fail(
+        self,
+        task_id: str,
+        worker_id: str,
+        error: str,
+        delay: Optional[float] = None,
+    ) -> Optional[TaskStatus]:
+        """Record a failed attempt.
+
+        The task is re-queued with exponential backoff while attempts remain,
+        otherwise it is marked failed. Returns the resulting status, or None if
+        the worker no longer owned the task.
+        """
+        now = time.time()
+        with self._transaction() as conn:
+            row = conn.execute(
+                "SELECT attempts, max_attempts FROM tasks WHERE id = ? AND worker_id = ? AND status = ?",
+                (task_id, worker_id, TaskStatus.RUNNING.value),
+            ).fetchone()
+            if row is None:
+                return None
+
+            if row["attempts"] < row["max_attempts"]:
+                status = TaskStatus.QUEUED
+                wait = retry_delay(row["attempts"]) if delay is None else delay
+            else:
+                status = TaskStatus.FAILED
+                wait = 0.0
+
+            conn.execute(
+                """
+                UPDATE tasks SET status = ?, error = ?, available_at = ?, worker_id = NULL,
+                                 lease_expires_at = NULL, updated_at = ?
+                WHERE id = ?
+                """,
+                (status.value, error, now + wait, now, task_id),
+            )
+        return status
+
+    def defer(self, task_id: str, worker_id: str, delay: float) -> bool:
+        """Put a leased task back without consuming an attempt.
+
+        Used by tasks that wait on others (e.g. assembly waiting for sections).
+        """
+        now = time.time()
+        with self._connect() as conn:
+            cursor = conn.execute(
+                """
+                UPDATE tasks SET status = ?, attempts = MAX(attempts - 1, 0), available_at = ?,
+                                 worker_id = NULL, lease_expires_at = NULL, updated_at = ?
+                WHERE id = ? AND worker_id = ? AND status = ?
+                """,
+                (TaskStatus.QUEUED.value, now + delay, now, task_id, worker_id,
+                 TaskStatus.RUNNING.value),
+            )
+            return cursor.rowcount == 1
+
+    def requeue_expired(self) -> List[QueuedTask]:
+        """Release tasks whose lease expired.
+
+        Tasks with attempts left go back to the queue; the rest are marked
+        failed and returned so the caller can run dead-letter handling.
+        """
+        now = time.time()
+        with self._transaction() as conn:
+            rows = conn.execute(
+                "SELECT * FROM tasks WHERE status = ? AND lease_expires_at < ?",
+                (TaskStatus.RUNNING.value, now),
+            ).fetchall()
+
+            dead: List[QueuedTask] = []
+            for row in rows:
+                error = f"Lease expired (worker {row['worker_id']} stopped heartbeating)"
+                if row["attempts"] < row["max_attempts"]:
+                    status = TaskStatus.QUEUED
+                else:
+                    status = TaskStatus.FAILED
+                conn.execute(
+                    """
+                    UPDATE tasks SET status = ?, error = ?, available_at = ?, worker_id = NULL,
+                                     lease_expires_at = NULL, updated_at = ?
+                    WHERE id = ?
+                    """,
+                    (status.value, error, now, now, row["id"]),
+                )
+                if status == TaskStatus.FAILED:
+                    task = QueuedTask.from_row(row)
+                    task.status = status
+                    task.error = error
+                    dead.append(task)
+
+        if rows:
+            logger.warning(f"Released {len(rows)} expired task lease(s)", extra={
+                "expired": len(rows),
+                "dead": len(dead),
+            })
+        return dead
+
+    # ------------------------------------------------------------------
+    # Inspection
+    # ------------------------------------------------------------------
+
+    def get(self, task_id: str) -> Optional[QueuedTask]:
+        with self._connect() as conn:
+            row = conn.execute("SELECT * FROM tasks WHERE id = ?", (task_id,)).fetchone()
+            return QueuedTask.from_row(row) if row else None
+
+    def list_tasks(
+        self,
+        job_id: Optional[str] = None,
+        kind: Optional[str] = None,
+        status: Optional[TaskStatus] = None,
+    ) -> List[QueuedTask]:
+        query = "SELECT * FROM tasks WHERE 1 = 1"
+        params: List[Any] = []
+        if job_id is not None:
+            query += " AND job_id = ?"
+            params.append(job_id)
+        if kind is not None:
+            query += " AND kind = ?"
+            params.append(kind)
+        if status is not None:
+            query += " AND status = ?"
+            params.append(TaskStatus(status).value)
+        query += " ORDER BY created_at"
+
+        with self._connect() as conn:
+            return [QueuedTask.from_row(row) for row in conn.execute(query, params).fetchall()]
+
+    def stats(self) -> Dict[str, int]:
+        """Task counts per status"""
+        counts = {status.value: 0 for status in TaskStatus}
+        with self._connect() as conn:
+            for row in conn.execute("SELECT status, COUNT(*) AS n FROM tasks GROUP BY status"):
+                counts[row["status"]] = row["n"]
+        return counts
+
+
+_task_queue_instance: Optional[SqliteTaskQueue] = None
+
+
+def get_task_queue() -> SqliteTaskQueue:
+    """Get the shared task queue (singleton per process)."""
+    global _task_queue_instance
+    if _task_queue_instance is None:
+        path = os.getenv("TASK_QUEUE_PATH")
+        try:
+            visibility = float(os.getenv("TASK_VISIBILITY_TIMEOUT", DEFAULT_VISIBILITY_TIMEOUT))
+        except ValueError:
+            visibility = DEFAULT_VISIBILITY_TIMEOUT
+        _task_queue_instance = SqliteTaskQueue(
+            Path(path) if path else None,
+            visibility_timeout=max(visibility, 5.0),
+        )
+    return _task_queue_instance
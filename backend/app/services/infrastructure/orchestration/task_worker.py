@@ -0,0 +1,169 @@
+"""
+Task Worker - Executes durable queue tasks in worker processes
+
+A TaskWorker claims tasks from the SqliteTaskQueue, runs the registered
+handler for the task kind and records the outcome. While a handler runs the
+worker heartbeats its lease; if the lease is lost (job cancelled, or the task
+was reclaimed after a stall) the handler's job token is cancelled so render
+and ffmpeg subprocesses are killed rather than orphaned.
+
+Workers are started as separate processes with ``python -m app.worker``.
+"""
+
+import asyncio
+import os
+import socket
+import uuid
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from app.core import (
+    get_logger,
+    set_job_id,
+    priority_scope,
+    PriorityClass,
+    JobCancelledError,
+    CancellationToken,
+    bind_cancellation_token,
+    get_cancellation_registry,
+)
+from .task_queue import QueuedTask, SqliteTaskQueue, TaskStatus
+
+logger = get_logger(__name__, component="task_worker")
+
+TaskHandler = Callable[[QueuedTask], Awaitable[Optional[Dict[str, Any]]]]
+DeadTaskHandler = Callable[[QueuedTask], Awaitable[None]]
+
+# Queue priority rank -> scheduling class for render/LLM admission
+_RANK_PRIORITY = {
+    0: PriorityClass.INTERACTIVE,
+    1: PriorityClass.NORMAL,
+    2: PriorityClass.BULK,
+}
+
+
+class TaskDeferred(Exception):
+    """Raised by a handler to re-queue its task without using an attempt."""
+
+    def __init__(self, delay: float = 2.0, reason: str = "waiting"):
+        self.delay = delay
+        self.reason = reason
+        super().__init__(reason)
+
+
+class TaskWorker:
+    """Claims and executes queue tasks, one at a time."""
+
+    def __init__(
+        self,
+        queue: SqliteTaskQueue,
+        handlers: Dict[str, TaskHandler],
+        worker_id: Optional[str] = None,
+        poll_interval: float = 1.0,
+        heartbeat_interval: Optional[float] = None,
+        on_dead: Optional[DeadTaskHandler] = None,
+    ):
+        self.queue = queue
+        self.handlers = handlers
+        self.worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:6]}"
+        self.poll_interval = poll_interval
+        self.heartbeat_interval = heartbeat_interval or max(queue.visibility_timeout / 4, 1.0)
+        self.on_dead = on_dead
+
+    async def run(self, stop_event: Optional[asyncio.Event] = None) -> None:
+        """Process tasks until ``stop_event`` is set."""
+        stop_event = stop_event or asyncio.Event()
+        logger.info(f"Task worker {self.worker_id} started", extra={
+            "worker_id": self.worker_id,
+            "kinds": sorted(self.handlers),
+        })
+        while not stop_event.is_set():
+            ran = await self.run_once()
+            if not ran:
+                try:
+                    await asyncio.wait_for(stop_event.wait(), timeout=self.poll_interval)
+                except asyncio.TimeoutError:
+                    pass
+        logger.info(f"Task worker {self.worker_id} stopped")
+
+    async def run_once(self) -> bool:
+        """Claim and execute at most one task. Returns True if a task ran."""
+        for task in await asyncio.to_thread(self.queue.requeue_expired):
+            await self._handle_dead(task)
+
+        task = await asyncio.to_thread(self.queue.claim, self.worker_id, list(self.handlers))
+        if task is None:
+            return False
+        await self.execute(task)
+        return True
+
+    async def execute(self, task: QueuedTask) -> None:
+        handler = self.handlers[task.kind]
+        token = get_cancellation_registry().open(task.job_id) if task.job_id else CancellationToken()
+        lease_lost = asyncio.Event()
+        heartbeat = asyncio.create_task(self._heartbeat(task, token, lease_lost))
+
+        logger.info(f"Running {task.kind} task {task.id[:8]} (attempt {task.attempts}/{task.max_attempts})", extra={
+            "task_id": task.id,
+            "job_id": task.job_id,
+            "kind": task.kind,
+            "attempt": task.attempts,
+        })
+
+        try:
+            if task.job_id:
+                set_job_id(task.job_id)
+            with bind_cancellation_token(token), \
+                    priority_scope(_RANK_PRIORITY.get(task.priority, PriorityClass.NORMAL)):
+                result = await token.run(handler(task))
+        except TaskDeferred as deferred:
+            await asyncio.to_thread(self.queue.defer, task.id, self.worker_id, deferred.delay)
+        except JobCancelledError as e:
+            # Lease lost or job cancelled: the task is no longer ours to record
+            logger.warning(f"Task {task.id[:8]} abandoned: {e.reason}", extra={
+                "task_id": task.id,
+                "job_id": task.job_id,
+                "lease_lost": lease_lost.is_set(),
+            })
+        except Exception as e:  # noqa: BLE001
+            logger.error(f"Task {task.id[:8]} failed: {e}", extra={
+                "task_id": task.id,
+                "job_id": task.job_id,
+                "kind": task.kind,
+            }, exc_info=True)
+            status = await asyncio.to_thread(self.queue.fail, task.id, self.worker_id, str(e))
+            if status == TaskStatus.FAILED:
+                task.status = status
+                task.error = str(e)
+                await self._handle_dead(task)
+        else:
+            await asyncio.to_thread(self.queue.complete, task.id, self.worker_id, result)
+        finally:
+            heartbeat.cancel()
+            try:
+                await heartbeat
+            except asyncio.CancelledError:
+                pass
+            if task.job_id:
+                get_cancellation_registry().release(token)
+
+    async def _heartbeat(self, task: QueuedTask, token: CancellationToken, lease_lost: asyncio.Event) -> None:
+        while True:
+            await asyncio.sleep(self.heartbeat_interval)
+            owned = await asyncio.to_thread(self.queue.heartbeat, task.id, self.worker_id)
+            if not owned:
+                lease_lost.set()
+                token.cancel("task lease lost")
+                return
+
+    async def _handle_dead(self, task: QueuedTask) -> None:
+        logger.error(f"Task {task.id[:8]} ({task.kind}) exhausted its attempts", extra={
+            "task_id": task.id,
+            "job_id": task.job_id,
+            "error": task.error,
+        })
+        if self.on_dead is None:
+            return
+        try:
+            await self.on_dead(task)
+        except Exception as e:  # noqa: BLE001
+            logger.error(f"Dead-task handler failed for {task.id[:8]}: {e}", exc_info=True)
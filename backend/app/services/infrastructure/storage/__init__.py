@@ -1,14 +1,30 @@
 """Storage layer - data persistence."""
 
-from .job_repository import JobRepository, FileBasedJobRepository, JobRecord
+from .job_repository import (
+    JobRepository,
+    FileBasedJobRepository,
+    SqliteJobRepository,
+    JobRecord,
+)
 from .output_cleanup import OutputCleanupService
 from .analysis_repository import AnalysisRepository, FileBasedAnalysisRepository
+from .artifact_store import (
+    SectionArtifact,
+    SectionArtifactStore,
+    get_section_artifact_store,
+    section_artifacts_enabled,
+)
 
 __all__ = [
     "JobRepository",
     "FileBasedJobRepository",
+    "SqliteJobRepository",
     "JobRecord",
     "OutputCleanupService",
     "AnalysisRepository",
     "FileBasedAnalysisRepository",
+    "SectionArtifact",
+    "SectionArtifactStore",
+    "get_section_artifact_store",
+    "section_artifacts_enabled",
 ]
@@ -4,13 +4,13 @@ Analysis repository - persistence for material analysis results.
 
 from __future__ import annotations
 
-import json
 import re
 from abc import ABC, abstractmethod
 from pathlib import Path
 from typing import Any, Dict, Optional
 
 from app.config import JOB_DATA_DIR
+from app.core import read_json, write_json
 
 
 class AnalysisRepository(ABC):
@@ -48,8 +48,7 @@ class FileBasedAnalysisRepository(AnalysisRepository):
         if not target:
             raise ValueError("analysis_id missing or invalid; expected [A-Za-z0-9_-]")
 
-        with open(target, "w", encoding="utf-8") as f:
-            json.dump(analysis, f, ensure_ascii=False, indent=2)
+        write_json(target, analysis)
 
     def get(self, analysis_id: str) -> Optional[Dict[str, Any]]:
         target = self._build_target(analysis_id)
@@ -59,8 +58,7 @@ class FileBasedAnalysisRepository(AnalysisRepository):
             return None
 
         try:
-            with open(target, "r", encoding="utf-8") as f:
-                payload = json.load(f)
+            payload = read_json(target)
             return payload if isinstance(payload, dict) else None
         except Exception:
             return None
@@ -0,0 +1,310 @@
+"""
+Section Artifact Store - Cross-job memoization of finished sections
+
+Regenerating the same document with the same settings rebuilds every section
+although the result would be identical. With the store enabled, a finished
+section's video, audio and scene code are kept under a content hash of
+everything that produced them (see section_artifact_key in the assembly
+orchestrator); a later job whose section hashes the same copies the files
+instead of running TTS, the LLM stages and the render again.
+
+Every job that produced or reused an artifact holds a reference to it. The
+OutputCleanupService releases a job's references when it deletes or prunes
+the job's outputs, and only deletes artifacts nobody references any more
+(after a grace period). Jobs get their own copies of the files (reflinks
+where the filesystem supports them, never hardlinks), so editing a job's
+section never modifies the shared artifact.
+
+Metadata and references live in a small SQLite database (WAL, short-lived
+connections), shared safely by the API and worker processes; the files live
+next to it under ``<key[:2]>/<key>/``.
+"""
+
+import json
+import os
+import shutil
+import sqlite3
+import time
+import uuid
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+from app.config import JOB_DATA_DIR
+from app.core import get_logger, parse_bool_env, place_file
+
+logger = get_logger(__name__, component="artifact_store")
+
+DEFAULT_STORE_DIR = JOB_DATA_DIR / "section_artifacts"
+DB_FILE_NAME = "artifacts.db"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS artifacts (
+    key TEXT PRIMARY KEY,
+    files TEXT NOT NULL,
+    metadata TEXT NOT NULL,
+    size_bytes INTEGER NOT NULL DEFAULT 0,
+    hit_count INTEGER NOT NULL DEFAULT 0,
+    created_at REAL NOT NULL,
+    last_used_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS artifact_refs (
+    key TEXT NOT NULL,
+    job_id TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    PRIMARY KEY (key, job_id)
+);
+CREATE INDEX IF NOT EXISTS idx_artifact_refs_job ON artifact_refs (job_id);
+"""
+
+
+def section_artifacts_enabled() -> bool:
+    """Whether finished sections are shared across jobs (SECTION_ARTIFACT_STORE_ENABLED, default off)"""
+    return parse_bool_env(os.getenv("SECTION_ARTIFACT_STORE_ENABLED"), default=False)
+
+
+@dataclass
+class SectionArtifact:
+    """A stored section: file paths by role (video, audio, manim_code, ...) plus metadata"""
+    key: str
+    files: Dict[str, Path]
+    metadata: Dict[str, Any] = field(default_factory=dict)
+
+
+class SectionArtifactStore:
+    """Content-addressed, reference-counted store of finished section files."""
+
+    def __init__(self, root: Optional[Path] = None):
+        self.root = Path(root) if root else DEFAULT_STORE_DIR
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.db_path = self.root / DB_FILE_NAME
+
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        conn = sqlite3.connect(str(self.db_path), timeout=30, isolation_level=None)
+        try:
+            conn.execute("PRAGMA synchronous=NORMAL")
+            yield conn
+        finally:
+            conn.close()
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        with self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+
+    def _artifact_dir(self, key: str) -> Path:
+        return self.root / key[:2] / key
+
+    def _artifact(self, key: str, files_json: str, metadata_json: str) -> SectionArtifact:
+        artifact_dir = self._artifact_dir(key)
+        files = {role: artifact_dir / name for role, name in json.loads(files_json).items()}
+        return SectionArtifact(key=key, files=files, metadata=json.loads(metadata_json))
+
+    # ------------------------------------------------------------------
+    # Lookup / store
+    # ------------------------------------------------------------------
+
+    def acquire(self, key: str, job_id: str) -> Optional[SectionArtifact]:
+        """The artifact stored under ``key``, referenced by ``job_id`` from now on.
+
+        Returns None on a miss. An artifact whose files went missing is
+        dropped and reported as a miss.
+        """
+        try:
+            with self._transaction() as conn:
+                row = conn.execute(
+                    "SELECT files, metadata FROM artifacts WHERE key = ?", (key,)
+                ).fetchone()
+                if row is None:
+                    return None
+                artifact = self._artifact(key, *row)
+                if not all(path.exists() for path in artifact.files.values()):
+                    logger.warning(f"Section artifact {key[:12]} is incomplete, dropping it")
+                    conn.execute("DELETE FROM artifacts WHERE key = ?", (key,))
+                    conn.execute("DELETE FROM artifact_refs WHERE key = ?", (key,))
+                    broken = True
+                else:
+                    now = time.time()
+                    conn.execute(
+                        "INSERT OR IGNORE INTO artifact_refs (key, job_id, created_at) VALUES (?, ?, ?)",
+                        (key, job_id, now),
+                    )
+                    conn.execute(
+                        "UPDATE artifacts SET hit_count = hit_count + 1, last_used_at = ? WHERE key = ?",
+                        (now, key),
+                    )
+                    broken = False
+        except sqlite3.Error as e:
+            logger.warning(f"Section artifact lookup failed: {e}")
+            return None
+
+        if broken:
+            shutil.rmtree(self._artifact_dir(key), ignore_errors=True)
+            return None
+        return artifact
+
+    def put(
+        self,
+        key: str,
+        job_id: str,
+        files: Dict[str, Path],
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> Optional[SectionArtifact]:
+        """Store copies of ``files`` (role -> path) under ``key``, referenced by ``job_id``.
+
+        If the key is already stored (another job finished the same section
+        first) the existing artifact is kept and referenced instead.
+        """
+        existing = self.acquire(key, job_id)
+        if existing is not None:
+            return existing
+
+        names: Dict[str, str] = {}
+        for role, path in files.items():
+            name = Path(path).name
+            names[role] = name if name not in names.values() else f"{role}_{name}"
+
+        artifact_dir = self._artifact_dir(key)
+        staging_dir = artifact_dir.parent / f".staging_{key}_{uuid.uuid4().hex[:8]}"
+        try:
+            staging_dir.mkdir(parents=True)
+            size_bytes = 0
+            for role, path in files.items():
+                target = staging_dir / names[role]
+                place_file(path, target)
+                size_bytes += target.stat().st_size
+            if artifact_dir.exists():
+                shutil.rmtree(artifact_dir)
+            os.replace(staging_dir, artifact_dir)
+        except OSError as e:
+            logger.warning(f"Could not store section artifact {key[:12]}: {e}")
+            shutil.rmtree(staging_dir, ignore_errors=True)
+            return None
+
+        now = time.time()
+        try:
+            with self._transaction() as conn:
+                conn.execute(
+                    """
+                    INSERT OR REPLACE INTO artifacts (
+                        key, files, metadata, size_bytes, created_at, last_used_at
+                    ) VALUES (?, ?, ?, ?, ?, ?)
+                    """,
+                    (key, json.dumps(names), json.dumps(metadata or {}), size_bytes, now, now),
+                )
+                conn.execute(
+                    "INSERT OR IGNORE INTO artifact_refs (key, job_id, created_at) VALUES (?, ?, ?)",
+                    (key, job_id, now),
+                )
+        except sqlite3.Error as e:
+            logger.warning(f"Could not record section artifact {key[:12]}: {e}")
+            return None
+
+        return SectionArtifact(
+            key=key,
+            files={role: artifact_dir / name for role, name in names.items()},
+            metadata=dict(metadata or {}),
+        )
+
+    @staticmethod
+    def materialize(artifact: SectionArtifact, dest_dir: Path) -> Dict[str, Path]:
+        """Copy the artifact's files into ``dest_dir``; returns the new paths by role"""
+        dest_dir.mkdir(parents=True, exist_ok=True)
+        placed: Dict[str, Path] = {}
+        for role, path in artifact.files.items():
+            target = dest_dir / path.name
+            place_file(path, target)
+            placed[role] = target
+        return placed
+
+    # ------------------------------------------------------------------
+    # Reference counting / garbage collection
+    # ------------------------------------------------------------------
+
+    def refcount(self, key: str) -> int:
+        with self._connect() as conn:
+            return conn.execute(
+                "SELECT COUNT(*) FROM artifact_refs WHERE key = ?", (key,)
+            ).fetchone()[0]
+
+    def release_job(self, job_id: str) -> int:
+        """Drop every reference held by ``job_id``. Returns references released."""
+        try:
+            with self._connect() as conn:
+                return conn.execute(
+                    "DELETE FROM artifact_refs WHERE job_id = ?", (job_id,)
+                ).rowcount
+        except sqlite3.Error as e:
+            logger.warning(f"Could not release section artifacts of job {job_id}: {e}")
+            return 0
+
+    def referencing_jobs(self) -> List[str]:
+        """Ids of the jobs holding at least one reference"""
+        with self._connect() as conn:
+            return [row[0] for row in conn.execute("SELECT DISTINCT job_id FROM artifact_refs")]
+
+    def release_jobs_except(self, live_job_ids: Iterable[str]) -> int:
+        """Drop the references of jobs not in ``live_job_ids`` (deleted elsewhere)"""
+        live = set(live_job_ids)
+        return sum(self.release_job(job_id) for job_id in self.referencing_jobs() if job_id not in live)
+
+    def collect_garbage(self, min_idle_hours: float, max_deletions: int) -> int:
+        """Delete unreferenced artifacts unused for ``min_idle_hours``. Returns artifacts deleted."""
+        cutoff = time.time() - min_idle_hours * 3600
+        try:
+            with self._transaction() as conn:
+                keys = [
+                    row[0] for row in conn.execute(
+                        """
+                        SELECT key FROM artifacts
+                        WHERE last_used_at < ?
+                          AND NOT EXISTS (SELECT 1 FROM artifact_refs r WHERE r.key = artifacts.key)
+                        ORDER BY last_used_at
+                        LIMIT ?
+                        """,
+                        (cutoff, max_deletions),
+                    )
+                ]
+                conn.executemany("DELETE FROM artifacts WHERE key = ?", [(key,) for key in keys])
+        except sqlite3.Error as e:
+            logger.warning(f"Section artifact garbage collection failed: {e}")
+            return 0
+
+        # Rows are gone first, so a concurrent acquire cannot reference them
+        for key in keys:
+            shutil.rmtree(self._artifact_dir(key), ignore_errors=True)
+        return len(keys)
+
+    def stats(self) -> Dict[str, int]:
+        with self._connect() as conn:
+            artifacts, size_bytes, hits = conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size_bytes), 0), COALESCE(SUM(hit_count), 0) FROM artifacts"
+            ).fetchone()
+            refs = conn.execute("SELECT COUNT(*) FROM artifact_refs").fetchone()[0]
+        return {"artifacts": artifacts, "size_bytes": size_bytes, "hits": hits, "references": refs}
+
+
+_section_artifact_store: Optional[SectionArtifactStore] = None
+
+
+def get_section_artifact_store() -> Optional[SectionArtifactStore]:
+    """Shared section artifact store, or None when disabled."""
+    global _section_artifact_store
+    if not section_artifacts_enabled():
+        return None
+    if _section_artifact_store is None:
+        path = os.getenv("SECTION_ARTIFACT_STORE_DIR")
+        _section_artifact_store = SectionArtifactStore(Path(path) if path else None)
+    return _section_artifact_store
@@ -8,13 +8,14 @@ This abstraction enables:
     - Consistent job data handling across the application
 
 The FileBasedJobRepository uses the existing JobManager as the underlying
-implementation, but other implementations (e.g., DatabaseJobRepository) can
-be swapped in without affecting the rest of the application.
+implementation; the SqliteJobRepository uses the SQLite job store
+(JOB_STORE_SQLITE_ENABLED) and answers listings with indexed queries.
 
 Classes:
     JobRecord: Data model for job information
     JobRepository: Abstract interface for job data access
     FileBasedJobRepository: File-based implementation using JobManager
+    SqliteJobRepository: SQLite implementation using SqliteJobManager
 """
 
 from abc import ABC, abstractmethod
@@ -22,6 +23,7 @@ from typing import Any, List, Optional
 from dataclasses import dataclass
 
 from app.services.infrastructure.orchestration.job_manager import JobStatus, get_job_manager
+from app.services.infrastructure.orchestration.sqlite_job_manager import SqliteJobManager
 
 
 @dataclass
@@ -38,6 +40,7 @@ class JobRecord:
         updated_at: ISO timestamp of last update
         result: Result data if job completed successfully
         error: Error message if job failed
+        priority: Scheduling priority class (interactive, normal, bulk)
     """
     id: str
     status: str
@@ -47,6 +50,7 @@ class JobRecord:
     updated_at: str
     result: Optional[List[Any]] = None
     error: Optional[str] = None
+    priority: str = "normal"
 
 
 class JobRepository(ABC):
@@ -148,7 +152,7 @@ class FileBasedJobRepository(JobRepository):
     File-based job repository using JobManager.
     
     This implementation stores job data in files using the existing JobManager.
-    Can be replaced with DatabaseJobRepository for production use.
+    Replaced by SqliteJobRepository when the SQLite job store is enabled.
     
     Implementation notes:
         - Uses JobManager as the underlying storage mechanism
@@ -224,4 +228,29 @@ class FileBasedJobRepository(JobRepository):
             error=job.error,
             created_at=job.created_at,
             updated_at=job.updated_at,
+            priority=getattr(job, "priority", "normal"),
         )
+
+
+class SqliteJobRepository(FileBasedJobRepository):
+    """
+    Job repository backed by the SQLite job store.
+
+    Reads go through single queries on the jobs table: listings do not load
+    every job one by one, and completed jobs come from the status index.
+    """
+
+    def __init__(self, job_manager: Optional[SqliteJobManager] = None):
+        """Initialize with the shared job manager, or a given SqliteJobManager."""
+        self.job_manager = job_manager or get_job_manager()
+
+    def list_all(self) -> List[JobRecord]:
+        """Retrieve all jobs in the system."""
+        return [self._to_record(job) for job in self.job_manager.get_all_jobs()]
+
+    def list_completed(self) -> List[JobRecord]:
+        """Retrieve only completed jobs, most recently updated first."""
+        return [
+            self._to_record(job)
+            for job in self.job_manager.get_jobs_by_status(JobStatus.COMPLETED)
+        ]
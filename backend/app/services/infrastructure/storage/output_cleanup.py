@@ -3,21 +3,60 @@ Output cleanup service.
 
 Deletes expired output directories and stale job metadata to prevent
 unbounded disk growth.
+
+When the section artifact store is enabled, a job's references to shared
+sections are released once its section files are deleted or pruned, and
+shared sections no job references any more are deleted after
+SECTION_ARTIFACT_RETENTION_HOURS.
+
+With OUTPUT_QUOTA_GB set, sweeps also measure each output directory they
+visit (sizes are cached in ``job_usage``; hardlinked files count once per
+directory) and, while the output directory is over quota, evict in
+least-recently-used order until usage is back under OUTPUT_QUOTA_TARGET_RATIO
+of the quota:
+first the intermediates of jobs that have a final video, then whole jobs.
+Running jobs are never evicted. With OUTPUT_ARCHIVE_INTERMEDIATES, pruning
+packs the small text intermediates (code, plans, scripts, logs) into
+intermediates.tar.gz instead of deleting them; media files are deleted.
+
+The periodic loop keeps sweeps off the event loop: a sweep runs in worker
+threads in slices of OUTPUT_CLEANUP_SLICE_SECONDS with a pause in between,
+resumes from a cursor when the previous one was cut short, and deletes trees
+file by file at a throttled rate (OUTPUT_CLEANUP_DELETE_MB_PER_SECOND,
+OUTPUT_CLEANUP_DELETE_FILES_PER_SECOND) so cleanup doesn't compete with
+renders for disk I/O. Every step of a sweep (an output directory, an
+evicted job, a released job, a deleted artifact or upload) checks the slice.
 """
 
 import asyncio
+import bisect
 import os
-import shutil
+import tarfile
+import time
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple
 
 from app.core import get_logger
 from app.models.status import JobStatus
-from app.services.infrastructure.orchestration import JobManager
+from app.services.infrastructure.orchestration import JobManager, refresh_job_summary
+
+from .artifact_store import SectionArtifactStore, get_section_artifact_store
 
 logger = get_logger(__name__, component="output_cleanup")
 
+ARCHIVE_NAME = "intermediates.tar.gz"
+
+# Entries of a job directory kept when it is pruned to its final video
+FINAL_ENTRIES = {
+    "final_video.mp4", "video_info.json", "error_info.json", "translations", "themes", "thumbnail.jpg",
+    ARCHIVE_NAME,
+}
+
+_ARCHIVE_SUFFIXES = {".py", ".json", ".jsonl", ".txt", ".log", ".md", ".srt", ".vtt", ".yaml", ".yml"}
+
+GIB = 1024 ** 3
+
 
 def _env_bool(name: str, default: bool) -> bool:
     raw = os.getenv(name)
@@ -46,13 +85,75 @@ def _env_float(name: str, default: float, minimum: float) -> float:
         return default
 
 
+def _dir_usage(path: Path, seen_inodes: Set[Tuple[int, int]]) -> int:
+    """Bytes of the files under ``path``; hardlinked files count once per ``seen_inodes``."""
+    total = 0
+    pending = [path]
+    while pending:
+        current = pending.pop()
+        try:
+            with os.scandir(current) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            pending.append(Path(entry.path))
+                            continue
+                        st = entry.stat(follow_symlinks=False)
+                    except OSError:
+                        continue
+                    if st.st_nlink > 1:
+                        inode = (st.st_dev, st.st_ino)
+                        if inode in seen_inodes:
+                            continue
+                        seen_inodes.add(inode)
+                    total += st.st_size
+        except OSError:
+            continue
+    return total
+
+
+class _DeleteThrottle:
+    """Token buckets for deleted bytes and files per second (0 = unlimited)."""
+
+    def __init__(self, bytes_per_second: float, files_per_second: float):
+        self.bytes_per_second = bytes_per_second
+        self.files_per_second = files_per_second
+        # One second of burst, so small trees are deleted without pauses
+        self._bytes = bytes_per_second
+        self._files = files_per_second
+        self._last = time.monotonic()
+
+    def consume(self, nbytes: int) -> None:
+        now = time.monotonic()
+        elapsed = now - self._last
+        self._last = now
+        delay = 0.0
+        if self.bytes_per_second:
+            self._bytes = min(self._bytes + elapsed * self.bytes_per_second, self.bytes_per_second) - nbytes
+            if self._bytes < 0:
+                delay = -self._bytes / self.bytes_per_second
+        if self.files_per_second:
+            self._files = min(self._files + elapsed * self.files_per_second, self.files_per_second) - 1
+            if self._files < 0:
+                delay = max(delay, -self._files / self.files_per_second)
+        if delay:
+            time.sleep(delay)
+
+
 class OutputCleanupService:
     """Cleanup old output artifacts and stale job records."""
 
-    def __init__(self, output_dir: Path, job_manager: JobManager, upload_dir: Path | None = None):
+    def __init__(
+        self,
+        output_dir: Path,
+        job_manager: JobManager,
+        upload_dir: Path | None = None,
+        artifact_store: SectionArtifactStore | None = None,
+    ):
         self.output_dir = Path(output_dir)
         self.upload_dir = Path(upload_dir) if upload_dir is not None else None
         self.job_manager = job_manager
+        self.artifact_store = artifact_store or get_section_artifact_store()
 
         self.enabled = _env_bool("OUTPUT_CLEANUP_ENABLED", True)
         self.keep_only_final = _env_bool("OUTPUT_KEEP_ONLY_FINAL", True)
@@ -65,6 +166,20 @@ class OutputCleanupService:
         self.upload_cleanup_enabled = _env_bool("UPLOAD_CLEANUP_ENABLED", True)
         self.upload_retention_hours = _env_float("UPLOAD_RETENTION_HOURS", 168.0, 1.0)
         self.upload_max_deletions = _env_int("UPLOAD_CLEANUP_MAX_DELETIONS", 100, 1)
+        self.artifact_retention_hours = _env_float("SECTION_ARTIFACT_RETENTION_HOURS", 168.0, 0.0)
+        self.quota_bytes = int(_env_float("OUTPUT_QUOTA_GB", 0.0, 0.0) * GIB)
+        self.quota_target_ratio = min(_env_float("OUTPUT_QUOTA_TARGET_RATIO", 0.9, 0.1), 1.0)
+        self.archive_intermediates = _env_bool("OUTPUT_ARCHIVE_INTERMEDIATES", False)
+        # Bytes per output directory, as measured when a sweep last visited it
+        self.job_usage: Dict[str, int] = {}
+        self.slice_seconds = _env_float("OUTPUT_CLEANUP_SLICE_SECONDS", 0.2, 0.01)
+        self.slice_pause_seconds = _env_float("OUTPUT_CLEANUP_SLICE_PAUSE_SECONDS", 0.1, 0.0)
+        self._throttle = _DeleteThrottle(
+            _env_float("OUTPUT_CLEANUP_DELETE_MB_PER_SECOND", 256.0, 0.0) * 1024 * 1024,
+            _env_float("OUTPUT_CLEANUP_DELETE_FILES_PER_SECOND", 2000.0, 0.0),
+        )
+        # Last output directory visited; the next sweep starts after it
+        self.cursor: Optional[str] = None
 
     @staticmethod
     def _hours_since(unix_ts: float, now_ts: float) -> float:
@@ -101,10 +216,37 @@ class OutputCleanupService:
             return age_hours >= self.failed_ttl_hours
         return False
 
-    @staticmethod
-    def _prune_translation_dirs(translations_dir: Path) -> int:
+    def _remove_tree(self, path: Path) -> None:
+        """Delete a directory tree (or file) at the throttled deletion rate."""
+        if path.is_symlink() or not path.is_dir():
+            try:
+                size = path.lstat().st_size
+            except FileNotFoundError:
+                return
+            path.unlink(missing_ok=True)
+            self._throttle.consume(size)
+            return
+
+        for root, dirs, files in os.walk(path, topdown=False):
+            for name in files:
+                file_path = os.path.join(root, name)
+                try:
+                    size = os.lstat(file_path).st_size
+                    os.unlink(file_path)
+                except FileNotFoundError:
+                    continue
+                self._throttle.consume(size)
+            for name in dirs:
+                dir_path = os.path.join(root, name)
+                if os.path.islink(dir_path):
+                    os.unlink(dir_path)
+                else:
+                    os.rmdir(dir_path)
+        os.rmdir(path)
+
+    def _prune_translation_dirs(self, translations_dir: Path) -> int:
         """
-        Keep only final_video.mp4 in each translation language folder.
+        Keep only final_video.mp4 in each translation language (or theme) folder.
         """
         removed_count = 0
         if not translations_dir.exists() or not translations_dir.is_dir():
@@ -124,45 +266,71 @@ class OutputCleanupService:
             for entry in lang_dir.iterdir():
                 if entry.name == "final_video.mp4":
                     continue
-                if entry.is_dir():
-                    shutil.rmtree(entry)
-                    removed_count += 1
-                else:
-                    entry.unlink(missing_ok=True)
-                    removed_count += 1
+                self._remove_tree(entry)
+                removed_count += 1
 
         return removed_count
 
-    @classmethod
-    def _prune_to_final_video(cls, output_path: Path) -> int:
+    @staticmethod
+    def _archive_entries(output_path: Path, entries: List[Path]) -> int:
+        """Pack the text files under ``entries`` into the job's archive; returns files packed."""
+        files: List[Path] = []
+        for entry in entries:
+            candidates = entry.rglob("*") if entry.is_dir() else [entry]
+            files.extend(
+                path for path in candidates
+                if path.suffix.lower() in _ARCHIVE_SUFFIXES and path.is_file() and not path.is_symlink()
+            )
+        if not files:
+            return 0
+
+        archive_path = output_path / ARCHIVE_NAME
+        tmp_path = output_path / f"{ARCHIVE_NAME}.tmp"
+        with tarfile.open(tmp_path, "w:gz") as archive:
+            if archive_path.exists():
+                # Keep what earlier prunes packed
+                with tarfile.open(archive_path, "r:gz") as previous:
+                    for member in previous.getmembers():
+                        if member.isfile():
+                            archive.addfile(member, previous.extractfile(member))
+            for path in files:
+                archive.add(path, arcname=str(path.relative_to(output_path)))
+        os.replace(tmp_path, archive_path)
+        return len(files)
+
+    def _prune_to_final_video(self, output_path: Path, archive: bool = False) -> int:
         """
-        Keep only final_video.mp4 (and translations/) in a completed job folder.
+        Keep only final_video.mp4 (and translations/, themes/) in a completed job folder.
+
+        With ``archive`` the text intermediates are packed into the job's
+        archive before they are removed.
         """
         removed_count = 0
-        keep_entries = {"final_video.mp4", "video_info.json", "error_info.json", "translations", "thumbnail.jpg"}
-
+        entries = []
         for entry in output_path.iterdir():
-            if entry.name in keep_entries:
-                if entry.name == "translations" and entry.is_dir():
-                    removed_count += cls._prune_translation_dirs(entry)
+            if entry.name in FINAL_ENTRIES:
+                if entry.name in ("translations", "themes") and entry.is_dir():
+                    removed_count += self._prune_translation_dirs(entry)
                 continue
-            if entry.is_dir():
-                shutil.rmtree(entry)
-                removed_count += 1
-            else:
-                entry.unlink(missing_ok=True)
-                removed_count += 1
+            entries.append(entry)
 
-        return removed_count
+        if archive and entries:
+            self._archive_entries(output_path, entries)
 
-    def _cleanup_uploads(self, now_ts: float) -> Dict[str, int]:
-        summary = {"deleted_uploads": 0, "upload_errors": 0}
+        for entry in entries:
+            self._remove_tree(entry)
+            removed_count += 1
 
+        return removed_count
+
+    def _iter_cleanup_uploads(
+        self, now_ts: float, summary: Dict[str, Any], slice_used: Callable[[], bool]
+    ) -> Iterator[Dict[str, Any]]:
         if not self.upload_cleanup_enabled or self.upload_dir is None:
-            return summary
+            return
 
         if not self.upload_dir.exists():
-            return summary
+            return
 
         deletions_left = self.upload_max_deletions
         for upload_file in sorted(self.upload_dir.iterdir(), key=lambda p: p.stat().st_mtime):
@@ -184,13 +352,38 @@ class OutputCleanupService:
                     "Failed to remove upload file",
                     extra={"path": str(upload_file), "error": str(exc)},
                 )
-                summary["upload_errors"] += 1
+                summary["errors"] += 1
+            if slice_used():
+                yield summary
+
+    def _iter_cleanup_artifacts(
+        self, summary: Dict[str, Any], slice_used: Callable[[], bool]
+    ) -> Iterator[Dict[str, Any]]:
+        """Release references of jobs whose sections are gone, then delete unreferenced artifacts."""
+        if self.artifact_store is None:
+            return
 
-        return summary
+        live_job_ids = {
+            p.name for p in self.output_dir.iterdir()
+            if p.is_dir() and (p / "sections").exists()
+        }
+        for job_id in self.artifact_store.referencing_jobs():
+            if job_id in live_job_ids:
+                continue
+            summary["released_artifact_refs"] += self.artifact_store.release_job(job_id)
+            if slice_used():
+                yield summary
 
-    def run_once(self) -> Dict[str, Any]:
-        """Run one cleanup pass and return summary statistics."""
-        summary = {
+        # One artifact per call, so each deletion is its own step
+        for _ in range(self.max_deletions):
+            if not self.artifact_store.collect_garbage(self.artifact_retention_hours, 1):
+                break
+            summary["deleted_artifacts"] += 1
+            if slice_used():
+                yield summary
+
+    def _new_summary(self) -> Dict[str, Any]:
+        return {
             "enabled": self.enabled,
             "keep_only_final": self.keep_only_final,
             "upload_cleanup_enabled": self.upload_cleanup_enabled,
@@ -198,77 +391,120 @@ class OutputCleanupService:
             "pruned_artifacts": 0,
             "deleted_uploads": 0,
             "deleted_job_records": 0,
+            "released_artifact_refs": 0,
+            "deleted_artifacts": 0,
+            "output_bytes": 0,
+            "quota_bytes": self.quota_bytes,
+            "quota_pruned_jobs": 0,
+            "quota_deleted_output_dirs": 0,
             "errors": 0,
         }
 
-        if not self.enabled:
-            return summary
-
-        if not self.output_dir.exists():
-            return summary
-
-        now_ts = datetime.now().timestamp()
-        jobs_by_id = {job["id"]: job for job in self.job_manager.list_all_jobs()}
-        deletions_left = self.max_deletions
-
-        output_dirs = [p for p in self.output_dir.iterdir() if p.is_dir()]
-        output_dirs.sort(key=lambda p: p.stat().st_mtime)
-
-        for output_path in output_dirs:
-            if deletions_left <= 0:
-                break
-
-            job_id = output_path.name
-            job = jobs_by_id.get(job_id)
-            status = job.get("status") if job else None
+    def _sweep_order(self) -> List[str]:
+        """Output directory names, starting after the cursor and wrapping around."""
+        names = sorted(entry.name for entry in os.scandir(self.output_dir) if entry.is_dir())
+        if self.cursor is None:
+            return names
+        split = bisect.bisect_right(names, self.cursor)
+        return names[split:] + names[:split]
+
+    def _sweep_output_dir(self, job_id: str, now_ts: float, summary: Dict[str, Any]) -> int:
+        """Prune or delete one output directory if due; returns the deletions used."""
+        output_path = self.output_dir / job_id
+        try:
             age_hours = self._hours_since(output_path.stat().st_mtime, now_ts)
+        except FileNotFoundError:
+            return 0
+        job = self.job_manager.get_job(job_id)
+        status = job.status.value if job else None
+
+        if (
+            status is None
+            and self.keep_only_final
+            and (output_path / "final_video.mp4").exists()
+        ):
+            try:
+                summary["pruned_artifacts"] += self._prune_to_final_video(
+                    output_path, archive=self.archive_intermediates
+                )
+                return 1
+            except Exception as exc:
+                logger.warning(
+                    "Failed to prune orphan output directory with final video",
+                    extra={"job_id": job_id, "path": str(output_path), "error": str(exc)},
+                )
+                summary["errors"] += 1
+            return 0
 
-            if (
-                status is None
-                and self.keep_only_final
-                and (output_path / "final_video.mp4").exists()
-            ):
-                try:
-                    summary["pruned_artifacts"] += self._prune_to_final_video(output_path)
-                    deletions_left -= 1
-                except Exception as exc:
-                    logger.warning(
-                        "Failed to prune orphan output directory with final video",
-                        extra={"job_id": job_id, "path": str(output_path), "error": str(exc)},
-                    )
-                    summary["errors"] += 1
-                continue
-
-            if status == JobStatus.COMPLETED.value and self.keep_only_final:
-                try:
-                    summary["pruned_artifacts"] += self._prune_to_final_video(output_path)
-                    deletions_left -= 1
-                except Exception as exc:
-                    logger.warning(
-                        "Failed to prune completed output directory",
-                        extra={"job_id": job_id, "path": str(output_path), "error": str(exc)},
-                    )
-                    summary["errors"] += 1
-                continue
-
-            if not self._should_delete_output(status, age_hours):
-                continue
-
+        if status == JobStatus.COMPLETED.value and self.keep_only_final:
             try:
-                shutil.rmtree(output_path)
-                summary["deleted_output_dirs"] += 1
-                deletions_left -= 1
+                summary["pruned_artifacts"] += self._prune_to_final_video(
+                    output_path, archive=self.archive_intermediates
+                )
+                return 1
             except Exception as exc:
                 logger.warning(
-                    "Failed to remove output directory",
+                    "Failed to prune completed output directory",
                     extra={"job_id": job_id, "path": str(output_path), "error": str(exc)},
                 )
                 summary["errors"] += 1
-                continue
+            return 0
 
-            if job:
-                self.job_manager.delete_job(job_id)
-                summary["deleted_job_records"] += 1
+        if not self._should_delete_output(status, age_hours):
+            return 0
+
+        try:
+            self._remove_tree(output_path)
+            summary["deleted_output_dirs"] += 1
+        except Exception as exc:
+            logger.warning(
+                "Failed to remove output directory",
+                extra={"job_id": job_id, "path": str(output_path), "error": str(exc)},
+            )
+            summary["errors"] += 1
+            return 0
+
+        if job:
+            self.job_manager.delete_job(job_id)
+            summary["deleted_job_records"] += 1
+        else:
+            refresh_job_summary(job_id)
+        return 1
+
+    def iter_sweep(self) -> Iterator[Dict[str, Any]]:
+        """
+        Run one cleanup sweep in time slices.
+
+        Yields the running summary whenever a slice of OUTPUT_CLEANUP_SLICE_SECONDS
+        is used up, and the final summary at the end. Output directories are
+        visited in name order starting after ``cursor``, so a sweep cut short by
+        the deletion budget is resumed where it stopped by the next one.
+        """
+        summary = self._new_summary()
+        if not self.enabled or not self.output_dir.exists():
+            yield summary
+            return
+
+        now_ts = datetime.now().timestamp()
+        deletions_left = self.max_deletions
+        slice_started = time.monotonic()
+
+        def slice_used() -> bool:
+            nonlocal slice_started
+            if time.monotonic() - slice_started < self.slice_seconds:
+                return False
+            slice_started = time.monotonic()
+            return True
+
+        for job_id in self._sweep_order():
+            if deletions_left <= 0:
+                break
+            deletions_left -= self._sweep_output_dir(job_id, now_ts, summary)
+            if self.quota_bytes:
+                self._measure_output_dir(job_id)
+            self.cursor = job_id
+            if slice_used():
+                yield summary
 
         if deletions_left > 0:
             for job in self.job_manager.list_all_jobs():
@@ -295,14 +531,153 @@ class OutputCleanupService:
                 self.job_manager.delete_job(job_id)
                 summary["deleted_job_records"] += 1
                 deletions_left -= 1
+                if slice_used():
+                    yield summary
 
-        upload_summary = self._cleanup_uploads(now_ts)
-        summary["deleted_uploads"] += upload_summary["deleted_uploads"]
-        summary["errors"] += upload_summary["upload_errors"]
+        if self.quota_bytes:
+            jobs_by_id = {job["id"]: job for job in self.job_manager.list_all_jobs()}
+            yield from self._iter_enforce_quota(jobs_by_id, summary, slice_used)
+
+        try:
+            yield from self._iter_cleanup_artifacts(summary, slice_used)
+        except Exception as exc:
+            logger.warning("Failed to clean up section artifacts", extra={"error": str(exc)})
+            summary["errors"] += 1
+
+        yield from self._iter_cleanup_uploads(now_ts, summary, slice_used)
 
         logger.info("Output cleanup pass complete", extra=summary)
+        yield summary
+
+    def run_once(self) -> Dict[str, Any]:
+        """Run one cleanup pass (blocking) and return summary statistics."""
+        summary: Dict[str, Any] = {}
+        for summary in self.iter_sweep():
+            pass
         return summary
 
+    async def run_sweep(self) -> Dict[str, Any]:
+        """Run one cleanup pass in worker threads, yielding the event loop between slices."""
+        sweep = self.iter_sweep()
+        summary: Dict[str, Any] = {}
+        while True:
+            progress = await asyncio.to_thread(next, sweep, None)
+            if progress is None:
+                return summary
+            summary = progress
+            await asyncio.sleep(self.slice_pause_seconds)
+
+    def _last_used(self, output_path: Path, job: Optional[Dict[str, Any]]) -> float:
+        """When a job's output was last written or its final video last read."""
+        times = []
+        for path in (output_path, output_path / "final_video.mp4"):
+            try:
+                st = path.stat()
+            except OSError:
+                continue
+            times.extend((st.st_mtime, st.st_atime) if path.is_file() else (st.st_mtime,))
+        updated_at = self._parse_iso(job.get("updated_at", "")) if job else None
+        if updated_at:
+            times.append(updated_at.timestamp())
+        return max(times, default=0.0)
+
+    @staticmethod
+    def _has_intermediates(output_path: Path) -> bool:
+        if not (output_path / "final_video.mp4").exists():
+            return False
+        return any(entry.name not in FINAL_ENTRIES for entry in output_path.iterdir())
+
+    def _measure_output_dir(self, job_id: str) -> None:
+        """Cache the bytes of one output directory in ``job_usage`` (dropped once it is gone)."""
+        output_path = self.output_dir / job_id
+        if output_path.is_dir():
+            self.job_usage[job_id] = _dir_usage(output_path, set())
+        else:
+            self.job_usage.pop(job_id, None)
+
+    def _iter_enforce_quota(
+        self,
+        jobs_by_id: Dict[str, Dict[str, Any]],
+        summary: Dict[str, Any],
+        slice_used: Callable[[], bool],
+    ) -> Iterator[Dict[str, Any]]:
+        """Evict least recently used outputs until usage is under the quota target."""
+        names = {entry.name for entry in os.scandir(self.output_dir) if entry.is_dir()}
+        for job_id in [job_id for job_id in self.job_usage if job_id not in names]:
+            del self.job_usage[job_id]
+        # Directories no sweep has measured yet (new, or past the deletion budget)
+        for job_id in sorted(names - self.job_usage.keys()):
+            self._measure_output_dir(job_id)
+            if slice_used():
+                yield summary
+
+        usage = self.job_usage
+        total = sum(usage.values())
+        summary["output_bytes"] = total
+        if total <= self.quota_bytes:
+            return
+
+        target = int(self.quota_bytes * self.quota_target_ratio)
+        candidates = sorted(
+            (
+                job_id for job_id in usage
+                if not self._is_active_status((jobs_by_id.get(job_id) or {}).get("status"))
+            ),
+            key=lambda job_id: self._last_used(self.output_dir / job_id, jobs_by_id.get(job_id)),
+        )
+        logger.warning(
+            "Output directory over quota, evicting least recently used outputs",
+            extra={"output_bytes": total, "quota_bytes": self.quota_bytes, "target_bytes": target},
+        )
+
+        # Intermediates first: the videos stay available
+        for job_id in candidates:
+            if total <= target:
+                break
+            output_path = self.output_dir / job_id
+            try:
+                if not self._has_intermediates(output_path):
+                    continue
+                self._prune_to_final_video(output_path, archive=self.archive_intermediates)
+            except Exception as exc:
+                logger.warning(
+                    "Failed to prune output directory over quota",
+                    extra={"job_id": job_id, "path": str(output_path), "error": str(exc)},
+                )
+                summary["errors"] += 1
+                continue
+            previous = usage.get(job_id, 0)
+            self._measure_output_dir(job_id)
+            total -= max(previous - usage.get(job_id, 0), 0)
+            summary["output_bytes"] = total
+            summary["quota_pruned_jobs"] += 1
+            if slice_used():
+                yield summary
+
+        # Then whole jobs
+        for job_id in candidates:
+            if total <= target:
+                break
+            output_path = self.output_dir / job_id
+            try:
+                self._remove_tree(output_path)
+            except Exception as exc:
+                logger.warning(
+                    "Failed to remove output directory over quota",
+                    extra={"job_id": job_id, "path": str(output_path), "error": str(exc)},
+                )
+                summary["errors"] += 1
+                continue
+            total -= usage.pop(job_id, 0)
+            summary["output_bytes"] = total
+            summary["quota_deleted_output_dirs"] += 1
+            if job_id in jobs_by_id:
+                self.job_manager.delete_job(job_id)
+            else:
+                refresh_job_summary(job_id)
+            if slice_used():
+                yield summary
+
     async def run_periodic(self) -> None:
         """Run cleanup in a periodic background loop."""
         if not self.enabled:
@@ -312,7 +687,7 @@ class OutputCleanupService:
         interval_seconds = self.interval_minutes * 60
         while True:
             try:
-                self.run_once()
+                await self.run_sweep()
             except asyncio.CancelledError:
                 raise
             except Exception as exc:
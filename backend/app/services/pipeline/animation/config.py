@@ -4,6 +4,16 @@ Animation Pipeline Configuration
 Centralized configuration for animation generation constants and settings.
 """
 
+import os
+
+
+def _env_seconds(name: str, default: float) -> float:
+    """Read a non-negative duration from the environment (0 disables it)."""
+    try:
+        return max(float(os.getenv(name, default)), 0.0)
+    except (TypeError, ValueError):
+        return default
+
 # =============================================================================
 # GENERATION SETTINGS
 # =============================================================================
@@ -179,6 +189,9 @@ VERIFICATION_TEMPERATURE = 0.4  # Low temp for consistent verdicts
 VERIFICATION_TIMEOUT = 30.0  # Seconds per verification batch
 VERIFICATION_MAX_RETRIES = 1  # Don't waste tokens retrying
 
+# Resume sections from checkpointed stage outputs (plan, code, refined code, render)
+ENABLE_STAGE_CHECKPOINTS = True
+
 # Vision QC settings (verification-only — no auto-fix loop)
 ENABLE_VISION_QC = True
 VISION_QC_MAX_FRAMES_PER_CALL = 4
@@ -189,6 +202,34 @@ VISION_QC_TIMEOUT = 60.0
 VISION_QC_MAX_OUTPUT_TOKENS = 2048
 VISION_QC_FRAME_DIR_NAME = "frames"
 
+# =============================================================================
+# DEADLINES & DEGRADATION
+# =============================================================================
+
+# Total time budget for one section, from TTS to the rendered video (0 = none)
+SECTION_DEADLINE = _env_seconds("SECTION_DEADLINE_SECONDS", 1500.0)
+
+# Per-stage budgets, always capped by what is left of the section deadline
+CHOREOGRAPHY_STAGE_TIMEOUT = _env_seconds("CHOREOGRAPHY_STAGE_TIMEOUT", 300.0)
+IMPLEMENTATION_STAGE_TIMEOUT = _env_seconds("IMPLEMENTATION_STAGE_TIMEOUT", 300.0)
+REFINEMENT_STAGE_TIMEOUT = _env_seconds("REFINEMENT_STAGE_TIMEOUT", 600.0)
+VISION_QC_STAGE_TIMEOUT = _env_seconds("VISION_QC_STAGE_TIMEOUT", 180.0)
+
+# What to do when a budget runs out (otherwise the section fails):
+# - skip_vision_qc: keep the first render without Visual QC verification
+# - accept_last_valid: render the last refined code with only spatial issues left
+# - title_card: render a minimal title card over the section narration
+DEGRADE_SKIP_VISION_QC = "skip_vision_qc"
+DEGRADE_ACCEPT_LAST_VALID = "accept_last_valid"
+DEGRADE_TITLE_CARD = "title_card"
+DEGRADATION_ACTIONS = frozenset(
+    action.strip().lower()
+    for action in os.getenv(
+        "DEADLINE_DEGRADATION", f"{DEGRADE_SKIP_VISION_QC},{DEGRADE_ACCEPT_LAST_VALID}"
+    ).split(",")
+    if action.strip()
+)
+
 # Error message handling
 MAX_ERROR_MESSAGE_LENGTH = 2000  # Max chars for runtime error messages (prevent truncation)
 
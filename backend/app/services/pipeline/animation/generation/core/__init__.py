@@ -6,18 +6,23 @@ from .exceptions import (
     AnimationError, ChoreographyError, ImplementationError, 
     RefinementError, RenderingError
 )
-from .code_helpers import clean_code, create_scene_file, extract_scene_name
+from .code_helpers import (
+    clean_code, create_scene_file, extract_scene_name, build_title_card_code
+)
 from .renderer import render_scene, validate_video_file, cleanup_output_artifacts
 from .file_manager import AnimationFileManager
+from .checkpoints import StageCheckpoints, hash_inputs, section_fingerprint
 
 __all__ = [
     # Exceptions
     "AnimationError", "ChoreographyError", "ImplementationError",
     "RefinementError", "RenderingError",
     # Code utilities
-    "clean_code", "create_scene_file", "extract_scene_name",
+    "clean_code", "create_scene_file", "extract_scene_name", "build_title_card_code",
     # Rendering
     "render_scene", "validate_video_file", "cleanup_output_artifacts",
     # File Management
-    "AnimationFileManager"
+    "AnimationFileManager",
+    # Stage checkpoints
+    "StageCheckpoints", "hash_inputs", "section_fingerprint",
 ]
@@ -0,0 +1,104 @@
+"""
+Stage checkpoints for animation generation
+
+Each section directory keeps ``checkpoints.json`` with the output of every
+finished stage (choreography plan, implemented code, refined code, rendered
+video) together with a hash of that stage's inputs. Each hash covers the
+previous stage's output, so on resume the pipeline reuses stages until the
+first one whose inputs changed, and re-runs from there.
+
+Saving a stage with a different output drops the checkpoints of the stages
+after it, since those were derived from the previous output.
+"""
+
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from app.core import get_logger
+
+logger = get_logger(__name__, component="stage_checkpoints")
+
+CHECKPOINT_FILE_NAME = "checkpoints.json"
+
+STAGE_CHOREOGRAPHY = "choreography"
+STAGE_IMPLEMENTATION = "implementation"
+STAGE_REFINEMENT = "refinement"
+STAGE_RENDER = "render"
+STAGES = (STAGE_CHOREOGRAPHY, STAGE_IMPLEMENTATION, STAGE_REFINEMENT, STAGE_RENDER)
+
+# Section keys written back by the pipeline itself; they are not stage inputs
+_SECTION_OUTPUT_KEYS = frozenset({
+    "video", "audio", "order", "manim_code", "manim_code_path", "choreography_plan_path",
+})
+
+
+def hash_inputs(*parts: Any) -> str:
+    """Stable hash of JSON-serializable stage inputs"""
+    material = json.dumps(parts, sort_keys=True, default=str, ensure_ascii=False)
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+def section_fingerprint(section: Dict[str, Any]) -> Dict[str, Any]:
+    """The parts of a section dict that feed generation"""
+    return {k: v for k, v in section.items() if k not in _SECTION_OUTPUT_KEYS}
+
+
+class StageCheckpoints:
+    """Stage outputs of one section, keyed by input hash."""
+
+    def __init__(self, section_dir: Path):
+        self.section_dir = Path(section_dir)
+        self.path = self.section_dir / CHECKPOINT_FILE_NAME
+        self._entries = self._read()
+
+    def _read(self) -> Dict[str, Dict[str, Any]]:
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    def _write(self) -> None:
+        self.section_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(".json.tmp")
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self._entries, f, ensure_ascii=False, indent=2)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logger.warning(f"Failed to write stage checkpoints: {e}")
+
+    def load(self, stage: str, input_hash: str) -> Optional[Dict[str, Any]]:
+        """The checkpoint of ``stage`` if it was produced from the same inputs"""
+        entry = self._entries.get(stage)
+        if not entry or entry.get("input_hash") != input_hash:
+            return None
+        return entry
+
+    def load_output(self, stage: str, input_hash: str) -> Optional[str]:
+        entry = self.load(stage, input_hash)
+        output = entry.get("output") if entry else None
+        return output or None
+
+    def save(self, stage: str, input_hash: str, output: Optional[str] = None, **extra: Any) -> None:
+        """Record the output of ``stage``; a changed output drops the checkpoints after it"""
+        previous = self._entries.get(stage)
+        if previous is None or previous.get("output") != output:
+            for later in STAGES[STAGES.index(stage) + 1:]:
+                self._entries.pop(later, None)
+        self._entries[stage] = {
+            "input_hash": input_hash,
+            "output": output,
+            "saved_at": time.time(),
+            **extra,
+        }
+        self._write()
+
+    def stages(self) -> List[str]:
+        """Checkpointed stages, in pipeline order"""
+        return [stage for stage in STAGES if stage in self._entries]
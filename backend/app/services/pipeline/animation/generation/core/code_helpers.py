@@ -135,6 +135,26 @@ def create_scene_file(code: str, section_id: str, duration: float, style: str =
     return code
 
 
+def build_title_card_code(scene_name: str, title: str, duration: float) -> str:
+    """Minimal title-card scene used when a section runs out of its deadline.
+
+    The narration audio is kept, so the card only has to hold for its length.
+    """
+    hold = max(float(duration) - 1.0, 0.5)
+    return (
+        "from manim import *\n"
+        "\n"
+        "\n"
+        f"class {scene_name}(Scene):\n"
+        "    def construct(self):\n"
+        f"        title = Text({title!r}, font_size=48)\n"
+        "        if title.width > 12:\n"
+        "            title.scale_to_fit_width(12)\n"
+        "        self.play(FadeIn(title), run_time=1)\n"
+        f"        self.wait({hold:.2f})\n"
+    )
+
+
 def fix_translated_code(code: str) -> str:
     """Fix common issues in translated Manim code"""
 
@@ -14,7 +14,7 @@ import sys
 from pathlib import Path
 from typing import Dict, Any, Optional, TYPE_CHECKING
 
-from app.core import get_logger
+from app.core import get_logger, JobCancelledError, run_process_async, get_render_admission
 from ...config import QUALITY_DIR_MAP, QUALITY_FLAGS, RENDER_TIMEOUT
 from .exceptions import RenderingError
 
@@ -121,9 +121,10 @@ async def render_scene(
 
     # 3. Execution
     try:
-        result = await asyncio.to_thread(
-            subprocess.run, cmd, capture_output=True, text=True, timeout=RENDER_TIMEOUT
-        )
+        async with get_render_admission().slot():
+            result = await run_process_async(
+                cmd, capture_output=True, text=True, timeout=RENDER_TIMEOUT
+            )
         
         # Log stdout for debugging (even on success)
         if result.stdout:
@@ -158,7 +159,7 @@ async def render_scene(
     except subprocess.TimeoutExpired:
         logger.error(f"Manim rendering timed out for section {section_index} (Limit: {RENDER_TIMEOUT}s)")
         raise RenderingError(f"Rendering timeout for section {section_index} after {RENDER_TIMEOUT}s")
-    except RenderingError:
+    except (RenderingError, JobCancelledError):
         # Re-raise our own exceptions
         raise
     except Exception as e:
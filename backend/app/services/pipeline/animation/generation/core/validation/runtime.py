@@ -7,7 +7,6 @@ Responsibilities:
 - Convert structured spatial output into typed ValidationIssue objects
 """
 
-import asyncio
 import json
 import os
 import re
@@ -18,7 +17,7 @@ import shutil
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
-from app.core import get_logger
+from app.core import get_logger, JobCancelledError, run_process_async, get_render_admission
 from ....config import MAX_ERROR_MESSAGE_LENGTH
 from .models import (
     IssueCategory,
@@ -137,15 +136,16 @@ class RuntimeValidator:
             if frames_dir:
                 env["MANIM_SPATIAL_OUTPUT_DIR"] = str(frames_dir)
             
-            # Use subprocess.run via thread to avoid ProactorEventLoop issues on Windows
-            result_proc = await asyncio.to_thread(
-                subprocess.run,
-                cmd,
-                capture_output=True,
-                text=True,
-                env=env,
-                timeout=180.0  # 180s timeout - dry-run can be slow with complex loops
-            )
+            # Runs in a worker thread and in its own process group so a job
+            # cancellation kills the dry-run together with any LaTeX children
+            async with get_render_admission().slot():
+                result_proc = await run_process_async(
+                    cmd,
+                    capture_output=True,
+                    text=True,
+                    env=env,
+                    timeout=180.0  # 180s timeout - dry-run can be slow with complex loops
+                )
 
             stderr_text = (
                 result_proc.stderr if isinstance(result_proc.stderr, str) else ""
@@ -192,7 +192,10 @@ class RuntimeValidator:
                 message="Execution timed out after 180s - check for large loops or complex operations",
             ))
             return result
-                
+
+        except JobCancelledError:
+            raise
+
         except Exception as e:
             logger.error(f"Runtime validation failed: {e}")
             result.add_issue(ValidationIssue(
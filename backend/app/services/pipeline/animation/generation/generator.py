@@ -11,7 +11,7 @@ Handles the multi-stage animation generation workflow:
 from typing import Dict, Any, Optional, List, Tuple
 from pathlib import Path
 
-from app.core import get_logger
+from app.core import get_logger, run_with_deadline, DeadlineExceededError
 from app.services.infrastructure.llm import PromptingEngine, CostTracker
 from app.utils.section_status import write_status, SectionState
 
@@ -21,14 +21,22 @@ from .core import (
     ImplementationError,
     RenderingError, 
     create_scene_file, 
+    build_title_card_code,
     render_scene,
     AnimationFileManager
 )
 from .core.validation import VisionValidator
+from .core import StageCheckpoints, hash_inputs
+from .core.checkpoints import STAGE_RENDER
 from .core.validation.models import ValidationIssue
 from ..config import (
     ENABLE_VISION_QC,
+    ENABLE_STAGE_CHECKPOINTS,
     MAX_CLEAN_RETRIES,
+    VISION_QC_STAGE_TIMEOUT,
+    DEGRADATION_ACTIONS,
+    DEGRADE_SKIP_VISION_QC,
+    DEGRADE_TITLE_CARD,
     normalize_theme_style,
     get_theme_prompt_info,
 )
@@ -164,14 +172,30 @@ class ManimGenerator:
         def status_callback(status: SectionState) -> None:
             write_status(section_dir, status)
 
-        final_manim_code = await self.orchestrator.generate(
-            section_input,
-            audio_duration,
-            context,
-            on_choreography_plan=on_choreography_plan,
-            on_raw_code=on_raw_code,
-            status_callback=status_callback
-        )
+        checkpoints = StageCheckpoints(section_dir) if ENABLE_STAGE_CHECKPOINTS else None
+
+        try:
+            final_manim_code = await self.orchestrator.generate(
+                section_input,
+                audio_duration,
+                context,
+                on_choreography_plan=on_choreography_plan,
+                on_raw_code=on_raw_code,
+                status_callback=status_callback,
+                checkpoints=checkpoints
+            )
+        except DeadlineExceededError as e:
+            if DEGRADE_TITLE_CARD not in DEGRADATION_ACTIONS:
+                raise
+            logger.warning(
+                f"Section {section_index} ran out of time ({e}), rendering a title card",
+                extra={"section_index": section_index, "degradation": DEGRADE_TITLE_CARD}
+            )
+            result = await self._render_title_card(
+                section_input, output_dir, section_index, audio_duration, normalized_style
+            )
+            result["degraded"] = [DEGRADE_TITLE_CARD]
+            return result
         
         # Check if generation succeeded
         if not final_manim_code or not final_manim_code.strip():
@@ -185,18 +209,52 @@ class ManimGenerator:
             )
 
         # Stage 4: Rendering (Production)
-        result = await self.process_code_and_render(
-            manim_code=final_manim_code,
-            section=section_input,
-            output_dir=output_dir,
-            section_index=section_index,
-            audio_duration=audio_duration,
-            style=normalized_style
-        )
+        render_hash = hash_inputs(final_manim_code, section_input.get("id"), audio_duration, normalized_style)
+        result = self._load_rendered(checkpoints, render_hash) if checkpoints else None
+        if result is not None:
+            logger.info(f"Reusing checkpointed render for section {section_index}")
+        else:
+            result = await self.process_code_and_render(
+                manim_code=final_manim_code,
+                section=section_input,
+                output_dir=output_dir,
+                section_index=section_index,
+                audio_duration=audio_duration,
+                style=normalized_style
+            )
+            if checkpoints is not None and not result.get("degraded"):
+                checkpoints.save(
+                    STAGE_RENDER,
+                    render_hash,
+                    output=result["video_path"],
+                    manim_code_path=result["manim_code_path"],
+                    code_hash=hash_inputs(result["manim_code"]),
+                    vision_issues=result.get("vision_issues", []),
+                )
         if choreography_plan_path:
             result["choreography_plan_path"] = choreography_plan_path
         return result
 
+    @staticmethod
+    def _load_rendered(checkpoints: StageCheckpoints, render_hash: str) -> Optional[Dict[str, Any]]:
+        """Result of a checkpointed render whose video and scene file are intact"""
+        entry = checkpoints.load(STAGE_RENDER, render_hash)
+        if not entry or not entry.get("output") or not Path(entry["output"]).exists():
+            return None
+        code_path = Path(entry.get("manim_code_path") or "")
+        try:
+            full_code = code_path.read_text(encoding="utf-8")
+        except OSError:
+            return None
+        if hash_inputs(full_code) != entry.get("code_hash"):
+            return None
+        return {
+            "video_path": entry["output"],
+            "manim_code": full_code,
+            "manim_code_path": str(code_path),
+            "vision_issues": entry.get("vision_issues", []),
+        }
+
     async def process_code_and_render(
         self,
         manim_code: str,
@@ -205,6 +263,7 @@ class ManimGenerator:
         section_index: int,
         audio_duration: Optional[float] = None,
         style: str = DEFAULT_THEME_CODE,
+        run_vision_qc: bool = True,
     ) -> Dict[str, Any]:
         """Validates, prepares, and renders Manim code.
         
@@ -250,69 +309,140 @@ class ManimGenerator:
             logger.error(f"Rendering stage failed to produce output for section {section_index}")
             raise RenderingError(f"Manim failed to render video for section {section_index}")
 
-        confirmed_vision_issues: List[ValidationIssue] = []
-        if ENABLE_VISION_QC:
-            vision_messages, confirmed_vision_issues = await self._run_vision_verification(
-                output_video=output_video,
-                output_dir=output_dir,
-                section_index=section_index,
-            )
-
-            # One-pass recovery loop: if Visual QC confirms real issues, try
-            # applying fixes and re-rendering once.
-            if confirmed_vision_issues:
-                logger.warning(
-                    f"Applying post-render fixes for {len(confirmed_vision_issues)} "
-                    f"Visual QC-confirmed issues in section {section_index}"
-                )
-                try:
-                    fixed_code, triage_stats = await self.orchestrator.refiner.apply_issues(
-                        code=full_code,
-                        issues=confirmed_vision_issues,
-                        section_title=section.get("title", f"section_{section_index}"),
-                        context={"section_index": section_index, "stage": "visual_qc_post_render"},
-                    )
-                except Exception as exc:
-                    logger.warning(f"Post-render fix application failed: {exc}")
-                    triage_stats = {"deterministic": 0, "llm": 0}
-                    fixed_code = full_code
-
-                if (
-                    fixed_code != full_code
-                    and (triage_stats.get("deterministic", 0) > 0 or triage_stats.get("llm", 0) > 0)
-                ):
-                    full_code = fixed_code
-                    code_file = self.file_manager.prepare_scene_file(
+        vision_messages: List[str] = []
+        degraded: List[str] = []
+        if ENABLE_VISION_QC and run_vision_qc:
+            try:
+                output_video, full_code, code_file, vision_messages = await run_with_deadline(
+                    self._run_vision_qc(
+                        output_video=output_video,
+                        full_code=full_code,
+                        code_file=code_file,
+                        scene_name=scene_name,
+                        section=section,
                         output_dir=output_dir,
                         section_index=section_index,
-                        code_content=full_code
-                    )
-                    rerendered_video = await render_scene(
-                        self,
-                        code_file,
-                        scene_name,
-                        output_dir,
-                        section_index,
-                        file_manager=self.file_manager,
-                        section=section,
-                        clean_retry=0
-                    )
-                    if rerendered_video:
-                        output_video = rerendered_video
-                        vision_messages, _ = await self._run_vision_verification(
-                            output_video=output_video,
-                            output_dir=output_dir,
-                            section_index=section_index,
-                        )
-        else:
-            vision_messages = []
+                    ),
+                    "vision_qc",
+                    VISION_QC_STAGE_TIMEOUT or None,
+                )
+            except DeadlineExceededError:
+                if DEGRADE_SKIP_VISION_QC not in DEGRADATION_ACTIONS or not Path(output_video).exists():
+                    raise
+                logger.warning(
+                    f"Visual QC timed out for section {section_index}, keeping the unverified render",
+                    extra={"section_index": section_index, "degradation": DEGRADE_SKIP_VISION_QC}
+                )
+                # A post-render fix may already be on disk; restore the rendered code
+                code_file = self.file_manager.prepare_scene_file(
+                    output_dir=output_dir,
+                    section_index=section_index,
+                    code_content=full_code
+                )
+                degraded.append(DEGRADE_SKIP_VISION_QC)
 
-        return {
+        result = {
             "video_path": output_video,
             "manim_code": full_code,
             "manim_code_path": str(code_file),
             "vision_issues": vision_messages,
         }
+        if degraded:
+            result["degraded"] = degraded
+        return result
+
+    async def _run_vision_qc(
+        self,
+        output_video: str,
+        full_code: str,
+        code_file: Path,
+        scene_name: str,
+        section: Dict[str, Any],
+        output_dir: str,
+        section_index: int,
+    ) -> Tuple[str, str, Path, List[str]]:
+        """Visual QC with one fix-and-re-render pass.
+
+        Returns the (possibly re-rendered) video, its code and code file, and
+        the remaining Visual QC messages.
+        """
+        vision_messages, confirmed_vision_issues = await self._run_vision_verification(
+            output_video=output_video,
+            output_dir=output_dir,
+            section_index=section_index,
+        )
+
+        # One-pass recovery loop: if Visual QC confirms real issues, try
+        # applying fixes and re-rendering once.
+        if not confirmed_vision_issues:
+            return output_video, full_code, code_file, vision_messages
+
+        logger.warning(
+            f"Applying post-render fixes for {len(confirmed_vision_issues)} "
+            f"Visual QC-confirmed issues in section {section_index}"
+        )
+        try:
+            fixed_code, triage_stats = await self.orchestrator.refiner.apply_issues(
+                code=full_code,
+                issues=confirmed_vision_issues,
+                section_title=section.get("title", f"section_{section_index}"),
+                context={"section_index": section_index, "stage": "visual_qc_post_render"},
+            )
+        except Exception as exc:
+            logger.warning(f"Post-render fix application failed: {exc}")
+            triage_stats = {"deterministic": 0, "llm": 0}
+            fixed_code = full_code
+
+        if (
+            fixed_code != full_code
+            and (triage_stats.get("deterministic", 0) > 0 or triage_stats.get("llm", 0) > 0)
+        ):
+            fixed_file = self.file_manager.prepare_scene_file(
+                output_dir=output_dir,
+                section_index=section_index,
+                code_content=fixed_code
+            )
+            rerendered_video = await render_scene(
+                self,
+                fixed_file,
+                scene_name,
+                output_dir,
+                section_index,
+                file_manager=self.file_manager,
+                section=section,
+                clean_retry=0
+            )
+            if rerendered_video:
+                output_video, full_code, code_file = rerendered_video, fixed_code, fixed_file
+                vision_messages, _ = await self._run_vision_verification(
+                    output_video=output_video,
+                    output_dir=output_dir,
+                    section_index=section_index,
+                )
+
+        return output_video, full_code, code_file, vision_messages
+
+    async def _render_title_card(
+        self,
+        section: Dict[str, Any],
+        output_dir: str,
+        section_index: int,
+        audio_duration: float,
+        style: str,
+    ) -> Dict[str, Any]:
+        """Narration-only fallback: the section title held over the audio."""
+        section_id = section.get("id", f"section_{section_index}").replace("-", "_").replace(" ", "_")
+        scene_name = f"Section{section_id.title().replace('_', '')}"
+        title = section.get("title") or f"Section {section_index + 1}"
+        return await self.process_code_and_render(
+            manim_code=build_title_card_code(scene_name, title, audio_duration),
+            section=section,
+            output_dir=output_dir,
+            section_index=section_index,
+            audio_duration=audio_duration,
+            style=style,
+            run_vision_qc=False,
+        )
 
     async def _run_vision_verification(
         self,
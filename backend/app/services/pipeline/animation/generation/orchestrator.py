@@ -7,23 +7,41 @@ Orchestrates the three stages:
 1. Choreography (visual planning)
 2. Implementation (code generation)  
 3. Refinement (validation + fixing)
+
+Each stage runs under its own time budget, capped by the section deadline.
+
+With stage checkpoints, each stage's output is saved with a hash of its
+inputs; a resumed section skips the stages whose inputs are unchanged.
 """
 
 import asyncio
-from typing import Dict, Any, Optional, Callable
+from typing import Dict, Any, List, Optional, Callable
 
-from app.core import get_logger
+from app.core import (
+    get_logger,
+    raise_if_cancelled,
+    run_with_deadline,
+    get_current_deadline,
+    DeadlineExceededError,
+)
 from app.services.infrastructure.llm import PromptingEngine, CostTracker
 from app.utils.section_status import SectionState
 
 from ..config import (
     BASE_GENERATION_TEMPERATURE,
     MAX_CLEAN_RETRIES,
-    TEMPERATURE_INCREMENT
+    TEMPERATURE_INCREMENT,
+    CHOREOGRAPHY_STAGE_TIMEOUT,
+    IMPLEMENTATION_STAGE_TIMEOUT,
+    REFINEMENT_STAGE_TIMEOUT,
+    DEGRADATION_ACTIONS,
+    DEGRADE_ACCEPT_LAST_VALID,
 )
 from .stages import Choreographer, Implementer, Refiner
 from .refinement import AdaptiveFixerAgent
 from .core import ChoreographyError, ImplementationError
+from .core import StageCheckpoints, hash_inputs, section_fingerprint
+from .core.checkpoints import STAGE_CHOREOGRAPHY, STAGE_IMPLEMENTATION, STAGE_REFINEMENT
 
 
 logger = get_logger(__name__, component="animation_orchestrator")
@@ -84,7 +102,8 @@ class AnimationOrchestrator:
         context: Optional[Dict[str, Any]] = None,
         on_choreography_plan: Optional[Callable[[str, int], None]] = None,
         on_raw_code: Optional[Callable[[str, int], None]] = None,
-        status_callback: Optional[Callable[[SectionState], None]] = None
+        status_callback: Optional[Callable[[SectionState], None]] = None,
+        checkpoints: Optional[StageCheckpoints] = None
     ) -> str:
         """Generate animation code for a section.
         
@@ -94,14 +113,22 @@ class AnimationOrchestrator:
             section: Section dictionary with title, narration, segments
             duration: Target animation duration in seconds
             context: Optional context for logging
+            checkpoints: Optional stage checkpoints of the section. The first
+                attempt reuses stages whose inputs are unchanged; retries
+                always regenerate (and overwrite the checkpoints).
             
         Returns:
             Manim code string (empty string if all retries fail)
+
+        Raises:
+            DeadlineExceededError: if the section deadline runs out. A stage
+                that only exceeds its own budget is retried like a failure.
         """
         section_title = section.get("title", f"Section {section.get('index', '')}")
         last_error = None
         
         for attempt_idx in range(MAX_CLEAN_RETRIES):
+            raise_if_cancelled()
             if attempt_idx > 0:
                 logger.warning(
                     f"Retry attempt {attempt_idx + 1}/{MAX_CLEAN_RETRIES} "
@@ -132,7 +159,8 @@ class AnimationOrchestrator:
                     retry_context,
                     on_choreography_plan=on_choreography_plan,
                     on_raw_code=on_raw_code,
-                    status_callback=status_callback
+                    status_callback=status_callback,
+                    checkpoints=checkpoints
                 )
                 
                 return code
@@ -146,14 +174,27 @@ class AnimationOrchestrator:
                     }
                 )
                 last_error = e
-                
-                # Exponential backoff before retry
-                if attempt_idx < MAX_CLEAN_RETRIES - 1:
-                    backoff_time = 2 ** attempt_idx
-                    logger.info(f"Waiting {backoff_time}s before retry...")
-                    await asyncio.sleep(backoff_time)
-                continue
-        
+
+            except DeadlineExceededError as e:
+                deadline = get_current_deadline()
+                if deadline is None or deadline.expired:
+                    logger.error(
+                        f"Section deadline exhausted for '{section_title}' in {e.stage}",
+                        extra={"attempt": attempt_idx + 1, "stage": e.stage}
+                    )
+                    raise
+                logger.error(
+                    f"Stage budget exceeded: {e}",
+                    extra={"attempt": attempt_idx + 1, "stage": e.stage}
+                )
+                last_error = e
+
+            # Exponential backoff before retry
+            if attempt_idx < MAX_CLEAN_RETRIES - 1:
+                backoff_time = 2 ** attempt_idx
+                logger.info(f"Waiting {backoff_time}s before retry...")
+                await asyncio.sleep(backoff_time)
+
         # All retries exhausted
         logger.error(
             f"All {MAX_CLEAN_RETRIES} attempts exhausted for '{section_title}'"
@@ -169,7 +210,8 @@ class AnimationOrchestrator:
         context: Dict[str, Any],
         on_choreography_plan: Optional[Callable[[str, int], None]] = None,
         on_raw_code: Optional[Callable[[str, int], None]] = None,
-        status_callback: Optional[Callable[[SectionState], None]] = None
+        status_callback: Optional[Callable[[SectionState], None]] = None,
+        checkpoints: Optional[StageCheckpoints] = None
     ) -> str:
         """Execute the three-stage pipeline.
         
@@ -179,13 +221,27 @@ class AnimationOrchestrator:
             section_title: Section title for logging
             attempt_idx: Current retry attempt
             context: Retry context
+            checkpoints: Optional stage checkpoints to resume from / update
             
         Returns:
             Final code string
         """
+        resume = checkpoints is not None and attempt_idx == 0
+
         # Stage 1: Choreography (visual planning)
-        logger.info(f"Stage 1: Choreography for '{section_title}'")
-        plan = await self.choreographer.plan(section, duration, context)
+        plan_hash = hash_inputs(section_fingerprint(section), duration)
+        plan = checkpoints.load_output(STAGE_CHOREOGRAPHY, plan_hash) if resume else None
+        if plan is not None:
+            logger.info(f"Stage 1: Reusing checkpointed choreography for '{section_title}'")
+        else:
+            logger.info(f"Stage 1: Choreography for '{section_title}'")
+            plan = await run_with_deadline(
+                self.choreographer.plan(section, duration, context),
+                "choreography",
+                CHOREOGRAPHY_STAGE_TIMEOUT or None,
+            )
+            if checkpoints is not None:
+                checkpoints.save(STAGE_CHOREOGRAPHY, plan_hash, output=plan)
 
         if on_choreography_plan:
             try:
@@ -197,17 +253,32 @@ class AnimationOrchestrator:
                 )
         
         # Stage 2: Implementation (code generation)
-        logger.info(f"Stage 2: Implementation for '{section_title}'")
-        retry_temperature = self._compute_retry_temperature(attempt_idx)
-        code = await self.implementer.implement(
-            section,
-            plan,
-            duration,
-            context,
-            temperature=retry_temperature
-        )
+        raise_if_cancelled()
+        code_hash = hash_inputs(plan_hash, plan)
+        code = checkpoints.load_output(STAGE_IMPLEMENTATION, code_hash) if resume else None
+        fresh_code = code is None
+        if not fresh_code:
+            logger.info(f"Stage 2: Reusing checkpointed implementation for '{section_title}'")
+        else:
+            logger.info(f"Stage 2: Implementation for '{section_title}'")
+            retry_temperature = self._compute_retry_temperature(attempt_idx)
+            code = await run_with_deadline(
+                self.implementer.implement(
+                    section,
+                    plan,
+                    duration,
+                    context,
+                    temperature=retry_temperature
+                ),
+                "implementation",
+                IMPLEMENTATION_STAGE_TIMEOUT or None,
+            )
+            if checkpoints is not None:
+                checkpoints.save(STAGE_IMPLEMENTATION, code_hash, output=code)
 
-        if on_raw_code:
+        # Reused code is already checkpointed; rewriting the scene file would
+        # clobber a checkpointed render
+        if on_raw_code and fresh_code:
             try:
                 on_raw_code(code, attempt_idx)
             except Exception as e:
@@ -217,13 +288,38 @@ class AnimationOrchestrator:
                 )
         
         # Stage 3: Refinement (validation + fixing)
+        raise_if_cancelled()
+        refined_hash = hash_inputs(code)
+        refined = checkpoints.load_output(STAGE_REFINEMENT, refined_hash) if resume else None
+        if refined is not None:
+            logger.info(f"Stage 3: Reusing checkpointed refinement for '{section_title}'")
+            return refined
+
         logger.info(f"Stage 3: Refinement for '{section_title}'")
-        code, stabilized = await self.refiner.refine(
-            code,
-            section_title,
-            context,
-            status_callback=status_callback
-        )
+        # Renderable versions reached by this call (the refiner is shared by
+        # concurrently generated sections, so this can't live on it)
+        valid_codes: List[str] = []
+        try:
+            code, stabilized = await run_with_deadline(
+                self.refiner.refine(
+                    code,
+                    section_title,
+                    context,
+                    status_callback=status_callback,
+                    on_valid_code=valid_codes.append,
+                ),
+                "refinement",
+                REFINEMENT_STAGE_TIMEOUT or None,
+            )
+        except DeadlineExceededError:
+            last_valid = valid_codes[-1] if valid_codes else None
+            if DEGRADE_ACCEPT_LAST_VALID not in DEGRADATION_ACTIONS or not last_valid:
+                raise
+            logger.warning(
+                f"Refinement timed out for '{section_title}', accepting last valid code",
+                extra={"section_title": section_title, "degradation": DEGRADE_ACCEPT_LAST_VALID}
+            )
+            return last_valid
         
         if not stabilized:
             logger.error(f"Code not stabilized for '{section_title}' after refinement")
@@ -231,7 +327,9 @@ class AnimationOrchestrator:
                 f"Refinement failed to stabilize code for '{section_title}' - "
                 f"max validation attempts exhausted"
             )
-        
+
+        if checkpoints is not None:
+            checkpoints.save(STAGE_REFINEMENT, refined_hash, output=code)
         return code
     
     def _build_retry_context(
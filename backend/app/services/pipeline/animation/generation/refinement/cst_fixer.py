@@ -5,7 +5,8 @@ text replacement on Python source.
 """
 
 import ast
-from typing import List, Optional, Sequence, Set, Tuple
+import re
+from typing import Dict, List, Optional, Sequence, Set, Tuple
 import libcst as cst
 import libcst.matchers as m
 from app.core import get_logger
@@ -324,6 +325,308 @@ class LatexRenderingTransformer(cst.CSTTransformer):
             return f'"{escaped}"'
         return repr(text)
 
+# Constructors whose string arguments are shown on screen. Tex-based ones
+# (Tex, Title) pass their strings through LaTeX.
+DISPLAY_TEXT_CONSTRUCTORS = frozenset({"Text", "MarkupText", "Paragraph", "Title", "Tex"})
+# Constructors taking any number of positional strings (Paragraph(*text), Tex(*tex_strings))
+_VARIADIC_TEXT_CONSTRUCTORS = frozenset({"Paragraph", "Title", "Tex"})
+
+_MATH_SEGMENT = re.compile(r"(\$[^$]+\$)")
+
+
+def string_literal(value: str, quote: str = '"', raw: bool = False) -> str:
+    """Python literal for ``value`` using the given quote style.
+
+    Raw literals are only emitted when they evaluate back to ``value``;
+    anything else falls back to an escaped (or ``repr``) literal.
+    """
+    candidates = []
+    if raw:
+        candidates.append(f"r{quote}{value}{quote}")
+    escaped = value.replace("\\", "\\\\").replace(quote[0], "\\" + quote[0])
+    if len(quote) == 1:
+        escaped = escaped.replace("\n", "\\n").replace("\r", "\\r")
+    candidates.append(f"{quote}{escaped}{quote}")
+
+    for candidate in candidates:
+        try:
+            if ast.literal_eval(candidate) == value:
+                return candidate
+        except (SyntaxError, ValueError):
+            continue
+    return repr(value)
+
+
+def split_math_segments(text: str) -> List[str]:
+    """Split Tex content into text and ``$...$`` math segments (empty ones dropped)."""
+    return [part for part in _MATH_SEGMENT.split(text) if part]
+
+
+def is_math_segment(segment: str) -> bool:
+    return len(segment) > 1 and segment.startswith("$") and segment.endswith("$")
+
+
+class DisplayTextCollector(cst.CSTVisitor):
+    """Collect the string literals displayed by Text-like constructors.
+
+    ``literals`` holds ``(node, constructor, value)`` in source order. Only
+    plain string literals are collected; f-strings, concatenations and
+    variables are left alone.
+    """
+
+    def __init__(self, constructors: Optional[Set[str]] = None) -> None:
+        self.constructors = constructors if constructors is not None else DISPLAY_TEXT_CONSTRUCTORS
+        self.literals: List[Tuple[cst.SimpleString, str, str]] = []
+
+    def visit_Call(self, node: cst.Call) -> None:
+        func_name = LatexRenderingTransformer._extract_func_name(node.func)
+        if func_name not in self.constructors:
+            return
+
+        positional = [arg for arg in node.args if arg.keyword is None and not arg.star]
+        if func_name not in _VARIADIC_TEXT_CONSTRUCTORS:
+            positional = positional[:1]
+        keyword = [
+            arg for arg in node.args
+            if arg.keyword is not None and arg.keyword.value == "text"
+        ]
+
+        for arg in positional + keyword:
+            if not isinstance(arg.value, cst.SimpleString):
+                continue
+            value = LatexRenderingTransformer._parse_simple_string(arg.value)
+            if value is not None:
+                self.literals.append((arg.value, func_name, value))
+
+
+class StringLiteralReplacer(cst.CSTTransformer):
+    """Replace specific string literal nodes with new values.
+
+    ``replacements`` maps original nodes (by identity) to their new value;
+    the quote style of each literal is kept.
+    """
+
+    def __init__(self, replacements: Dict[cst.SimpleString, str]) -> None:
+        self.replacements = replacements
+        self.count = 0
+
+    def leave_SimpleString(
+        self, original_node: cst.SimpleString, updated_node: cst.SimpleString
+    ) -> cst.BaseExpression:
+        value = self.replacements.get(original_node)
+        if value is None:
+            return updated_node
+        self.count += 1
+        return updated_node.with_changes(
+            value=string_literal(value, original_node.quote, raw="r" in original_node.prefix.lower())
+        )
+
+
+class TexSplitTransformer(cst.CSTTransformer):
+    """Move text out of Tex() so it can be rendered with Text().
+
+    Non-Latin scripts cannot go through LaTeX. Tex calls without math become
+    Text, math-only ones become MathTex, and ``name = Tex("text $math$ ...")``
+    assignments are split into Text/MathTex parts arranged in a VGroup.
+    """
+
+    def __init__(self) -> None:
+        self.count = 0
+
+    def leave_Call(self, original_node: cst.Call, updated_node: cst.Call) -> cst.BaseExpression:
+        content = self._tex_content(updated_node)
+        if content is None:
+            return updated_node
+
+        parts = split_math_segments(content)
+        if "$" not in content:
+            self.count += 1
+            return updated_node.with_changes(func=cst.Name("Text"))
+        if len(parts) == 1 and is_math_segment(parts[0]):
+            first = updated_node.args[0]
+            self.count += 1
+            return updated_node.with_changes(
+                func=cst.Name("MathTex"),
+                args=[
+                    first.with_changes(value=cst.SimpleString(string_literal(parts[0][1:-1], raw=True))),
+                    *updated_node.args[1:],
+                ],
+            )
+        return updated_node
+
+    def leave_SimpleStatementLine(
+        self, original_node: cst.SimpleStatementLine, updated_node: cst.SimpleStatementLine
+    ) -> cst.CSTNode:
+        if not m.matches(updated_node, m.SimpleStatementLine(
+            body=[m.Assign(targets=[m.AssignTarget(target=m.Name())], value=m.Call())]
+        )):
+            return updated_node
+
+        assign = updated_node.body[0]
+        content = self._tex_content(assign.value)
+        if content is None:
+            return updated_node
+        parts = [part for part in split_math_segments(content) if part.strip()]
+        if len(parts) < 2:
+            return updated_node
+
+        var_name = assign.targets[0].target.value
+        lines = []
+        element_names = []
+        for i, part in enumerate(parts):
+            elem_name = f"_tex_part_{i}"
+            element_names.append(elem_name)
+            if is_math_segment(part):
+                lines.append(f"{elem_name} = MathTex({string_literal(part[1:-1], raw=True)})")
+            else:
+                lines.append(f"{elem_name} = Text({string_literal(part)}, font_size=28)")
+        lines.append(f"{var_name} = VGroup({', '.join(element_names)}).arrange(RIGHT, buff=0.15)")
+
+        statements = [cst.parse_statement(line) for line in lines]
+        statements[0] = statements[0].with_changes(leading_lines=updated_node.leading_lines)
+        self.count += 1
+        return cst.FlattenSentinel(statements)
+
+    @staticmethod
+    def _tex_content(node: cst.BaseExpression) -> Optional[str]:
+        """Content of a ``Tex("...", ...)`` call with a single literal string"""
+        if not isinstance(node, cst.Call):
+            return None
+        if LatexRenderingTransformer._extract_func_name(node.func) != "Tex":
+            return None
+        positional = [arg for arg in node.args if arg.keyword is None]
+        if len(positional) != 1 or node.args[0] is not positional[0]:
+            return None
+        if positional[0].star or not isinstance(positional[0].value, cst.SimpleString):
+            return None
+        return LatexRenderingTransformer._parse_simple_string(positional[0].value)
+
+
+_HEX_COLOR = re.compile(r"#[0-9A-Fa-f]{6}")
+
+
+class ColorLiteralTransformer(cst.CSTTransformer):
+    """Swap colors: hex string literals via ``hex_map``, color constants via ``name_map``.
+
+    Hex keys match case-insensitively. Names are only replaced where they are
+    used as plain values (not in imports, assignment targets or attribute
+    reads), and by ``ManimColor("#...")`` rather than a string, because
+    functions such as ``interpolate_color`` need a color object. A module
+    that gets such a replacement imports ``ManimColor`` if it does not
+    already (explicitly or through ``from manim import *``).
+    """
+
+    def __init__(self, hex_map: Dict[str, str], name_map: Optional[Dict[str, str]] = None) -> None:
+        self.hex_map = {key.upper(): value for key, value in hex_map.items()}
+        self.name_map = dict(name_map or {})
+        self.count = 0
+        self.name_count = 0
+        self._skip_names: Set[cst.Name] = set()
+
+    def visit_ImportFrom(self, node: cst.ImportFrom) -> bool:
+        return False
+
+    def visit_AssignTarget(self, node: cst.AssignTarget) -> bool:
+        return False
+
+    def visit_Attribute(self, node: cst.Attribute) -> None:
+        self._skip_names.add(node.attr)
+        if isinstance(node.value, cst.Name):
+            self._skip_names.add(node.value)
+
+    def leave_SimpleString(
+        self, original_node: cst.SimpleString, updated_node: cst.SimpleString
+    ) -> cst.BaseExpression:
+        value = LatexRenderingTransformer._parse_simple_string(original_node)
+        if value is None or not _HEX_COLOR.fullmatch(value):
+            return updated_node
+        replacement = self.hex_map.get(value.upper())
+        if replacement is None or replacement.upper() == value.upper():
+            return updated_node
+        self.count += 1
+        return updated_node.with_changes(value=string_literal(replacement, original_node.quote))
+
+    def leave_Name(self, original_node: cst.Name, updated_node: cst.Name) -> cst.BaseExpression:
+        if original_node in self._skip_names:
+            return updated_node
+        replacement = self.name_map.get(original_node.value)
+        if replacement is None:
+            return updated_node
+        self.count += 1
+        self.name_count += 1
+        return cst.Call(
+            func=cst.Name("ManimColor"),
+            args=[cst.Arg(cst.SimpleString(string_literal(replacement)))],
+        )
+
+    def leave_Module(self, original_node: cst.Module, updated_node: cst.Module) -> cst.Module:
+        if not self.name_count or self._imports_manim_color(updated_node):
+            return updated_node
+        body = list(updated_node.body)
+        insert_at = 0
+        for index, stmt in enumerate(body):
+            if m.matches(stmt, m.SimpleStatementLine(body=[m.OneOf(m.Import(), m.ImportFrom())])):
+                insert_at = index + 1
+        body.insert(insert_at, cst.parse_statement("from manim import ManimColor"))
+        return updated_node.with_changes(body=body)
+
+    @staticmethod
+    def _imports_manim_color(module: cst.Module) -> bool:
+        for stmt in module.body:
+            if not m.matches(stmt, m.SimpleStatementLine(body=[m.ImportFrom(module=m.Name("manim"))])):
+                continue
+            names = stmt.body[0].names
+            if isinstance(names, cst.ImportStar):
+                return True
+            if any(m.matches(alias, m.ImportAlias(name=m.Name("ManimColor"), asname=None)) for alias in names):
+                return True
+        return False
+
+
+class ThemeSetupTransformer(cst.CSTTransformer):
+    """Replace the theme setup of ``construct`` with ``setup_statements``.
+
+    Top-level ``self.camera.background_color = ...`` and
+    ``<Mobject>.set_default(...)`` statements of ``construct`` are removed and
+    the new statements are inserted at its start (after a docstring).
+    """
+
+    def __init__(self, setup_statements: Sequence[str]) -> None:
+        self.setup_statements = [cst.parse_statement(line) for line in setup_statements]
+        self.count = 0
+        self.constructs = 0
+
+    def leave_FunctionDef(
+        self, original_node: cst.FunctionDef, updated_node: cst.FunctionDef
+    ) -> cst.CSTNode:
+        if updated_node.name.value != "construct" or not isinstance(updated_node.body, cst.IndentedBlock):
+            return updated_node
+
+        body = [stmt for stmt in updated_node.body.body if not self._is_theme_setup(stmt)]
+        self.count += len(updated_node.body.body) - len(body)
+        insert_at = 1 if body and m.matches(
+            body[0], m.SimpleStatementLine(body=[m.Expr(value=m.SimpleString())])
+        ) else 0
+        body[insert_at:insert_at] = self.setup_statements
+        self.constructs += 1
+        return updated_node.with_changes(body=updated_node.body.with_changes(body=body))
+
+    @staticmethod
+    def _is_theme_setup(stmt: cst.BaseStatement) -> bool:
+        if not isinstance(stmt, cst.SimpleStatementLine) or not stmt.body:
+            return False
+        return all(
+            m.matches(small, m.Assign(targets=[m.AssignTarget(target=m.Attribute(
+                value=m.Attribute(value=m.Name("self"), attr=m.Name("camera")),
+                attr=m.Name("background_color"),
+            ))]))
+            or m.matches(small, m.Expr(value=m.Call(
+                func=m.Attribute(value=m.Name(), attr=m.Name("set_default"))
+            )))
+            for small in stmt.body
+        )
+
+
 class ScaleInsertionTransformer(cst.CSTTransformer):
     """Inserts .scale_to_fit_width(...) after object creation Assign nodes."""
     
@@ -25,7 +25,7 @@ from typing import Dict, Any, List, Optional, Tuple, Callable
 import tempfile
 from pathlib import Path
 
-from app.core import get_logger
+from app.core import get_logger, raise_if_cancelled
 from app.utils.section_status import SectionState
 
 from ...config import (
@@ -84,6 +84,7 @@ class Refiner:
         section_title: str,
         context: Optional[Dict[str, Any]] = None,
         status_callback: Optional[Callable[[SectionState], None]] = None,
+        on_valid_code: Optional[Callable[[str], None]] = None,
     ) -> Tuple[str, bool]:
         """Execute the full refinement cycle with the Certain/Uncertain model.
 
@@ -100,6 +101,10 @@ class Refiner:
                   - Real + non-auto-fixable → LLM fixer
                   - False positive → add to whitelist
 
+        ``on_valid_code`` receives each renderable version of the code
+        (static-valid, at most spatial runtime issues) as it is reached, so a
+        caller whose deadline cancels this call can still use the latest one.
+
         Returns:
             Tuple of (refined_code, stabilized_bool).
         """
@@ -107,6 +112,8 @@ class Refiner:
             logger.info(f"Refinement disabled for '{section_title}'")
             self.last_runtime_issues = []
             self.pending_uncertain_issues = []
+            if on_valid_code:
+                on_valid_code(code)
             return code, True
 
         self.fixer.reset()
@@ -136,6 +143,7 @@ class Refiner:
         )
 
         for turn_idx in range(1, self.max_attempts + 1):
+            raise_if_cancelled()
             with tempfile.TemporaryDirectory() as frames_dir_str:
                 frames_dir = Path(frames_dir_str)
 
@@ -186,6 +194,14 @@ class Refiner:
                             issue.details["frame_path"] = str(frame_path)
 
                 self.last_runtime_issues = runtime_result.issues
+                if on_valid_code and (
+                    runtime_result.valid
+                    or (
+                        runtime_result.issues
+                        and self.router.only_spatial_remaining(runtime_result.issues)
+                    )
+                ):
+                    on_valid_code(current_code)
 
                 if runtime_result.valid:
                     logger.info(
@@ -8,15 +8,21 @@ Modules:
     - processor: FFmpeg video operations
     - progress: Job progress tracking
     - orchestrator: Parallel section processing
+    - scheduling: Render-time prediction for section ordering
     - sections: Individual section processing
     - ffmpeg: Low-level FFmpeg utilities
+    - recompile: Incremental rebuild of the final video from section files
+    - section_tasks: Background re-rendering of single sections
 """
 
 from .video_generator import VideoGenerator
 from .processor import VideoProcessor
 from .progress import ProgressTracker, JobProgress
 from .orchestrator import SectionOrchestrator
+from .scheduling import SectionRuntimePredictor, SectionFeatures
 from .ffmpeg import concatenate_videos, combine_sections, generate_thumbnail
+from .recompile import JobRecompiler
+from .section_tasks import SectionTaskRegistry, get_section_task_registry
 
 __all__ = [
     'VideoGenerator',
@@ -24,8 +30,13 @@ __all__ = [
     'ProgressTracker',
     'JobProgress',
     'SectionOrchestrator',
+    'SectionRuntimePredictor',
+    'SectionFeatures',
     'concatenate_videos',
     'combine_sections',
     'generate_thumbnail',
+    'JobRecompiler',
+    'SectionTaskRegistry',
+    'get_section_task_registry',
 ]
 
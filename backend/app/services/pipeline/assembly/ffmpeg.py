@@ -4,10 +4,11 @@ Audio and video utilities for ffmpeg operations
 
 import asyncio
 import subprocess
-import shutil
 from typing import List
 from pathlib import Path
 
+from app.core import JobCancelledError, place_file, run_process_async
+
 
 async def get_audio_duration(audio_path: str) -> float:
     """Get duration of audio file using ffprobe"""
@@ -85,7 +86,7 @@ async def concatenate_audio_files(
         return False
 
     if len(audio_paths) == 1:
-        shutil.copy(audio_paths[0], output_path)
+        await asyncio.to_thread(place_file, audio_paths[0], output_path)
         return True
 
     # Create concat file list
@@ -357,8 +358,7 @@ async def combine_sections(
         )
 
         try:
-            result = await asyncio.to_thread(
-                subprocess.run,
+            result = await run_process_async(
                 cmd,
                 capture_output=True,
                 text=True,
@@ -372,6 +372,8 @@ async def combine_sections(
             else:
                 print(f"Merged file not created for section {i}, using video")
                 merged_sections.append(video)
+        except JobCancelledError:
+            raise
         except Exception as e:
             print(f"Error merging section {i}: {e}")
             # Use original video if merge fails
@@ -382,16 +384,24 @@ async def combine_sections(
         await concatenate_videos(merged_sections, output_path)
 
 
-async def concatenate_videos(videos: List[str], output_path: str):
-    """Concatenate multiple videos into one"""
+async def concatenate_videos(videos: List[str], output_path: str, link: bool = False):
+    """Concatenate multiple videos into one
+
+    A single video is placed without re-muxing; ``link`` allows a hardlink
+    (see ``place_file``) when neither file is ever rewritten in place.
+    """
 
     if not videos:
         return
 
     if len(videos) == 1:
-        shutil.copy(videos[0], output_path)
+        await asyncio.to_thread(place_file, videos[0], output_path, link=link)
         return
 
+    # ffmpeg writes into an existing output; drop it first so a hardlinked
+    # output never changes the file it shares its inode with
+    Path(output_path).unlink(missing_ok=True)
+
     # Create concat file
     concat_file = Path(output_path).parent / "concat_list.txt"
     with open(concat_file, "w", encoding="utf-8") as f:
@@ -408,8 +418,7 @@ async def concatenate_videos(videos: List[str], output_path: str):
     ]
 
     try:
-        result = await asyncio.to_thread(
-            subprocess.run,
+        result = await run_process_async(
             cmd,
             capture_output=True,
             text=True,
@@ -428,11 +437,12 @@ async def concatenate_videos(videos: List[str], output_path: str):
                 "-c:a", "aac",
                 output_path
             ]
-            await asyncio.to_thread(
-                subprocess.run,
+            await run_process_async(
                 cmd,
                 capture_output=True,
                 timeout=300
             )
+    except JobCancelledError:
+        raise
     except Exception as e:
         print(f"Concatenation error: {e}")
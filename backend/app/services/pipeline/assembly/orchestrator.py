@@ -2,12 +2,18 @@
 Section Orchestration Module
 Coordinates section-level processing including parallel execution and resource management
 Separated from VideoGenerator for better testability and single responsibility
+
+With the section artifact store enabled (SECTION_ARTIFACT_STORE_ENABLED),
+finished sections are memoized across jobs by a hash of their content and
+generation settings; a section seen before is copied instead of rebuilt.
 """
 
 import asyncio
+import os
+import time
 from typing import Dict, Any, List, Optional
 from pathlib import Path
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
 
 from ..animation.generation import ManimGenerator
 from ..audio import TTSEngine, AnyTTSEngine
@@ -17,10 +23,53 @@ from .sections import (
     process_segments_audio_first,
 )
 from .progress import ProgressTracker
-from app.core import get_logger, LogTimer
+from .scheduling import SectionRuntimePredictor
+from ..animation.config import SECTION_DEADLINE, normalize_theme_style
+from ..animation.generation.core import hash_inputs, section_fingerprint
+from app.config.models import get_pipeline_models
+from app.core import (
+    get_logger,
+    LogTimer,
+    CancellationToken,
+    JobCancelledError,
+    deadline_scope,
+)
+from app.services.infrastructure.storage import SectionArtifactStore, get_section_artifact_store
 
 logger = get_logger(__name__, component="section_orchestrator")
 
+# Bump when section generation changes in a way that invalidates stored sections
+SECTION_ARTIFACT_VERSION = 1
+
+# Model steps whose output ends up in a section
+_SECTION_MODEL_STEPS = (
+    "animation_choreography",
+    "animation_implementation",
+    "animation_refinement",
+    "visual_qc",
+)
+
+
+def section_artifact_key(
+    section: Dict[str, Any],
+    voice: str,
+    style: str,
+    language: str,
+    tts_engine: Any = None,
+    pipeline_name: Optional[str] = None,
+) -> str:
+    """Content hash of everything that determines a finished section"""
+    models = get_pipeline_models(pipeline_name or "default")
+    return hash_inputs(
+        SECTION_ARTIFACT_VERSION,
+        section_fingerprint(section),
+        voice,
+        normalize_theme_style(style),
+        language,
+        type(tts_engine).__name__ if tts_engine is not None else None,
+        {step: asdict(getattr(models, step)) for step in _SECTION_MODEL_STEPS},
+    )
+
 
 @dataclass
 class SectionResult:
@@ -33,6 +82,8 @@ class SectionResult:
     manim_code_path: Optional[str] = None
     choreography_plan_path: Optional[str] = None
     error: Optional[str] = None
+    cached: bool = False
+    degraded: bool = False
 
     def is_successful(self) -> bool:
         """Check if section processing was successful"""
@@ -45,6 +96,7 @@ class SectionOrchestrator:
     
     Responsibilities:
     - Manage concurrent section processing with semaphore
+    - Schedule sections longest-predicted-first to reduce job makespan
     - Coordinate TTS and Manim generation
     - Handle section resume logic
     - Aggregate section results
@@ -59,7 +111,10 @@ class SectionOrchestrator:
         manim_generator: ManimGenerator,
         tts_engine: "AnyTTSEngine",
         progress_tracker: ProgressTracker,
-        max_concurrent: int = 3
+        max_concurrent: int = 3,
+        cancel_token: Optional[CancellationToken] = None,
+        predictor: Optional[SectionRuntimePredictor] = None,
+        artifact_store: Optional[SectionArtifactStore] = None
     ):
         """
         Initialize section orchestrator
@@ -69,12 +124,24 @@ class SectionOrchestrator:
             tts_engine: TTS engine instance
             progress_tracker: Progress tracker for reporting
             max_concurrent: Maximum number of sections to process concurrently
+            cancel_token: Job cancellation token; queued sections are not
+                started once it is cancelled
+            predictor: Render-time predictor used for longest-first scheduling
+                (disabled with SECTION_SCHEDULING=index)
+            artifact_store: Cross-job store of finished sections (defaults to
+                the shared store when SECTION_ARTIFACT_STORE_ENABLED is set)
         """
         self.manim_generator = manim_generator
         self.tts_engine = tts_engine
         self.progress_tracker = progress_tracker
         self.max_concurrent = max_concurrent
         self.semaphore = asyncio.Semaphore(max_concurrent)
+        self.cancel_token = cancel_token
+
+        scheduling = os.getenv("SECTION_SCHEDULING", "longest_first").strip().lower()
+        self.longest_first = scheduling != "index"
+        self.predictor = predictor or SectionRuntimePredictor()
+        self.artifact_store = artifact_store or get_section_artifact_store()
 
         logger.info("Initialized SectionOrchestrator", extra={
             "max_concurrent": max_concurrent
@@ -130,10 +197,27 @@ class SectionOrchestrator:
                 message=f"Processing {total_sections} sections (max {self.max_concurrent} concurrent)..."
             )
 
+            # Predict from features taken before processing mutates the sections
+            features = [self.predictor.extract_features(section) for section in sections]
+            predicted = [self.predictor.predict_features(f) for f in features]
+            if self.longest_first:
+                order = sorted(range(total_sections), key=lambda i: (-predicted[i], i))
+            else:
+                order = list(range(total_sections))
+
+            logger.info("Section schedule", extra={
+                "order": order,
+                "predicted_seconds": [round(p, 1) for p in predicted],
+                "longest_first": self.longest_first
+            })
+
             async def process_section(i: int, section: Dict[str, Any]) -> SectionResult:
                 """Process a single section with semaphore control"""
                 async with self.semaphore:
-                    return await self._process_single_section(
+                    if self.cancel_token:
+                        self.cancel_token.raise_if_cancelled()
+                    started = time.monotonic()
+                    result = await self._process_single_section(
                         section_index=i,
                         section=section,
                         sections_dir=sections_dir,
@@ -145,15 +229,36 @@ class SectionOrchestrator:
                         total_sections=total_sections,
                         job_id=job_id
                     )
+                    elapsed = time.monotonic() - started
+
+                if result.is_successful() and not result.cached:
+                    logger.info(f"Section {i} took {elapsed:.1f}s (predicted {predicted[i]:.1f}s)", extra={
+                        "section_index": i,
+                        "actual_seconds": round(elapsed, 1),
+                        "predicted_seconds": round(predicted[i], 1)
+                    })
+                    self.predictor.record(features[i], elapsed, job_id=job_id, section_index=i)
+                return result
 
-            # Create tasks for all sections
+            # Create tasks in schedule order: the semaphore admits them in
+            # creation order, so the longest sections start first
             section_tasks = [
-                process_section(i, section)
-                for i, section in enumerate(sections)
+                process_section(i, sections[i])
+                for i in order
             ]
 
-            # Execute with gather to collect all results
-            section_results = await asyncio.gather(*section_tasks, return_exceptions=True)
+            # Execute with gather, then restore index order
+            scheduled_results = await asyncio.gather(*section_tasks, return_exceptions=True)
+            section_results: List[Any] = [None] * total_sections
+            for position, i in enumerate(order):
+                section_results[i] = scheduled_results[position]
+
+            # A cancelled job must not be reported as a set of failed sections
+            if self.cancel_token:
+                self.cancel_token.raise_if_cancelled()
+            for result in section_results:
+                if isinstance(result, JobCancelledError):
+                    raise result
 
             # Convert exceptions to error results
             final_results = []
@@ -190,6 +295,47 @@ class SectionOrchestrator:
 
             return final_results
 
+    async def process_section(
+        self,
+        section_index: int,
+        section: Dict[str, Any],
+        sections_dir: Path,
+        voice: str,
+        style: str,
+        language: str,
+        total_sections: int,
+        job_id: Optional[str] = None
+    ) -> SectionResult:
+        """
+        Process one section on its own, outside a parallel batch
+
+        Used by queue workers that run each section as a separate task. A
+        section already completed on disk is returned as cached, so a retried
+        task does not redo finished work.
+        """
+        self.progress_tracker.check_existing_progress()
+        features = self.predictor.extract_features(section)
+        started = time.monotonic()
+
+        result = await self._process_single_section(
+            section_index=section_index,
+            section=section,
+            sections_dir=sections_dir,
+            voice=voice,
+            style=style,
+            language=language,
+            resume=True,
+            completed_count=[len(self.progress_tracker.completed_sections)],
+            total_sections=total_sections,
+            job_id=job_id
+        )
+
+        if result.is_successful() and not result.cached:
+            self.predictor.record(
+                features, time.monotonic() - started, job_id=job_id, section_index=section_index
+            )
+        return result
+
     async def _process_single_section(
         self,
         section_index: int,
@@ -242,10 +388,12 @@ class SectionOrchestrator:
             })
 
             result.video_path = existing_video_path
+            result.cached = True
             section_audio_path = section_dir / "section_audio.mp3"
             if section_audio_path.exists():
                 result.audio_path = str(section_audio_path)
 
+            self.progress_tracker.mark_section_complete(section_index)
             completed_count[0] += 1
             self.progress_tracker.report_section_progress(
                 completed_count=completed_count[0],
@@ -254,6 +402,24 @@ class SectionOrchestrator:
             )
             return result
 
+        # Memoized section from any job with the same content and settings
+        artifact_key = None
+        if self.artifact_store is not None and job_id:
+            artifact_key = section_artifact_key(
+                section, voice, style, language,
+                tts_engine=self.tts_engine,
+                pipeline_name=getattr(self.manim_generator, "pipeline_name", None),
+            )
+            if await self._reuse_artifact(artifact_key, job_id, section, section_dir, result):
+                self.progress_tracker.mark_section_complete(section_index)
+                completed_count[0] += 1
+                self.progress_tracker.report_section_progress(
+                    completed_count=completed_count[0],
+                    total_count=total_sections,
+                    is_cached=True
+                )
+                return result
+
         # Process section
         logger.info(f"[Parallel] Starting section {section_index + 1}/{total_sections}: {result.title}", extra={
             "section_index": section_index,
@@ -261,95 +427,160 @@ class SectionOrchestrator:
             "title": result.title
         })
 
-        try:
-            narration_segments = section.get("narration_segments", [])
+        # Every stage of the section (LLM calls, refinement, Visual QC) is
+        # bounded by the section deadline
+        with deadline_scope(SECTION_DEADLINE, name=f"section_{section_index}"):
+            try:
+                narration_segments = section.get("narration_segments", [])
 
-            if not narration_segments:
-                # Single narration processing
-                tts_text = section.get("tts_narration") or section.get("narration", "")
-                clean_narration = clean_narration_for_tts(tts_text)
+                if not narration_segments:
+                    # Single narration processing
+                    tts_text = section.get("tts_narration") or section.get("narration", "")
+                    clean_narration = clean_narration_for_tts(tts_text)
 
-                logger.debug(f"Processing section {section_index} as single narration", extra={
-                    "section_index": section_index,
-                    "narration_length": len(clean_narration)
-                })
+                    logger.debug(f"Processing section {section_index} as single narration", extra={
+                        "section_index": section_index,
+                        "narration_length": len(clean_narration)
+                    })
+
+                    subsection_results = await process_single_subsection(
+                        manim_generator=self.manim_generator,
+                        tts_engine=self.tts_engine,
+                        section=section,
+                        narration=clean_narration,
+                        section_dir=section_dir,
+                        section_index=section_index,
+                        voice=voice,
+                        style=style,
+                        language=language
+                    )
+
+                    result.video_path = subsection_results.get("video_path")
+                    result.audio_path = subsection_results.get("audio_path")
+                    result.duration = subsection_results.get("duration", 30)
+                    result.degraded = bool(subsection_results.get("degraded"))
+                    if subsection_results.get("manim_code_path"):
+                        result.manim_code_path = subsection_results["manim_code_path"]
+                        section["manim_code_path"] = subsection_results["manim_code_path"]
+                    if subsection_results.get("choreography_plan_path"):
+                        result.choreography_plan_path = subsection_results["choreography_plan_path"]
+                        section["choreography_plan_path"] = subsection_results["choreography_plan_path"]
 
-                subsection_results = await process_single_subsection(
-                    manim_generator=self.manim_generator,
-                    tts_engine=self.tts_engine,
-                    section=section,
-                    narration=clean_narration,
-                    section_dir=section_dir,
-                    section_index=section_index,
-                    voice=voice,
-                    style=style,
-                    language=language
+                else:
+                    # Multi-segment processing
+                    logger.debug(f"Processing section {section_index} with {len(narration_segments)} segments", extra={
+                        "section_index": section_index,
+                        "segment_count": len(narration_segments)
+                    })
+
+                    segment_result = await process_segments_audio_first(
+                        manim_generator=self.manim_generator,
+                        tts_engine=self.tts_engine,
+                        section=section,
+                        narration_segments=narration_segments,
+                        section_dir=section_dir,
+                        section_index=section_index,
+                        voice=voice,
+                        style=style,
+                        language=language
+                    )
+
+                    result.video_path = segment_result.get("video_path")
+                    result.audio_path = segment_result.get("audio_path")
+                    result.duration = segment_result.get("duration", 30)
+                    result.degraded = bool(segment_result.get("degraded"))
+                    if segment_result.get("manim_code_path"):
+                        result.manim_code_path = segment_result["manim_code_path"]
+                        section["manim_code_path"] = segment_result["manim_code_path"]
+                    if segment_result.get("choreography_plan_path"):
+                        result.choreography_plan_path = segment_result["choreography_plan_path"]
+                        section["choreography_plan_path"] = segment_result["choreography_plan_path"]
+
+                # Mark as complete and report progress
+                self.progress_tracker.mark_section_complete(section_index)
+                completed_count[0] += 1
+                self.progress_tracker.report_section_progress(
+                    completed_count=completed_count[0],
+                    total_count=total_sections,
+                    is_cached=False
                 )
 
-                result.video_path = subsection_results.get("video_path")
-                result.audio_path = subsection_results.get("audio_path")
-                result.duration = subsection_results.get("duration", 30)
-                if subsection_results.get("manim_code_path"):
-                    result.manim_code_path = subsection_results["manim_code_path"]
-                    section["manim_code_path"] = subsection_results["manim_code_path"]
-                if subsection_results.get("choreography_plan_path"):
-                    result.choreography_plan_path = subsection_results["choreography_plan_path"]
-                    section["choreography_plan_path"] = subsection_results["choreography_plan_path"]
+                if artifact_key and result.video_path and result.audio_path and not result.degraded:
+                    await self._store_artifact(artifact_key, job_id, result)
 
-            else:
-                # Multi-segment processing
-                logger.debug(f"Processing section {section_index} with {len(narration_segments)} segments", extra={
+                logger.info(f"[Parallel] Finished section {section_index + 1}/{total_sections}", extra={
                     "section_index": section_index,
-                    "segment_count": len(narration_segments)
+                    "total_sections": total_sections,
+                    "has_video": result.video_path is not None,
+                    "has_audio": result.audio_path is not None
                 })
 
-                segment_result = await process_segments_audio_first(
-                    manim_generator=self.manim_generator,
-                    tts_engine=self.tts_engine,
-                    section=section,
-                    narration_segments=narration_segments,
-                    section_dir=section_dir,
-                    section_index=section_index,
-                    voice=voice,
-                    style=style,
-                    language=language
-                )
-
-                result.video_path = segment_result.get("video_path")
-                result.audio_path = segment_result.get("audio_path")
-                result.duration = segment_result.get("duration", 30)
-                if segment_result.get("manim_code_path"):
-                    result.manim_code_path = segment_result["manim_code_path"]
-                    section["manim_code_path"] = segment_result["manim_code_path"]
-                if segment_result.get("choreography_plan_path"):
-                    result.choreography_plan_path = segment_result["choreography_plan_path"]
-                    section["choreography_plan_path"] = segment_result["choreography_plan_path"]
-
-            # Mark as complete and report progress
-            self.progress_tracker.mark_section_complete(section_index)
-            completed_count[0] += 1
-            self.progress_tracker.report_section_progress(
-                completed_count=completed_count[0],
-                total_count=total_sections,
-                is_cached=False
-            )
+                return result
 
-            logger.info(f"[Parallel] Finished section {section_index + 1}/{total_sections}", extra={
-                "section_index": section_index,
-                "total_sections": total_sections,
-                "has_video": result.video_path is not None,
-                "has_audio": result.audio_path is not None
-            })
+            except JobCancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Failed to process section {section_index}", extra={
+                    "section_index": section_index,
+                    "error": str(e)
+                }, exc_info=True)
+                result.error = str(e)
+                return result
 
-            return result
+    async def _reuse_artifact(
+        self,
+        key: str,
+        job_id: str,
+        section: Dict[str, Any],
+        section_dir: Path,
+        result: SectionResult
+    ) -> bool:
+        """Fill ``result`` from a stored section. Returns False on a miss."""
+        def reuse() -> Optional[tuple[Dict[str, Path], Dict[str, Any]]]:
+            artifact = self.artifact_store.acquire(key, job_id)
+            if artifact is None:
+                return None
+            return self.artifact_store.materialize(artifact, section_dir), artifact.metadata
 
-        except Exception as e:
-            logger.error(f"Failed to process section {section_index}", extra={
-                "section_index": section_index,
-                "error": str(e)
-            }, exc_info=True)
-            result.error = str(e)
-            return result
+        try:
+            reused = await asyncio.to_thread(reuse)
+        except OSError as e:
+            logger.warning(f"Could not reuse stored section {key[:12]}: {e}")
+            return False
+        if reused is None:
+            return False
+        placed, metadata = reused
+
+        result.video_path = str(placed["video"])
+        result.audio_path = str(placed["audio"])
+        if metadata.get("duration"):
+            result.duration = metadata["duration"]
+        if placed.get("manim_code"):
+            result.manim_code_path = str(placed["manim_code"])
+            section["manim_code_path"] = result.manim_code_path
+        if placed.get("choreography_plan"):
+            result.choreography_plan_path = str(placed["choreography_plan"])
+            section["choreography_plan_path"] = result.choreography_plan_path
+        result.cached = True
+        logger.info(f"Reused stored section {key[:12]} for section {result.index}", extra={
+            "section_index": result.index,
+            "artifact_key": key
+        })
+        return True
+
+    async def _store_artifact(self, key: str, job_id: str, result: SectionResult) -> None:
+        """Share a finished section with later jobs"""
+        files = {"video": Path(result.video_path), "audio": Path(result.audio_path)}
+        if result.manim_code_path and os.path.exists(result.manim_code_path):
+            files["manim_code"] = Path(result.manim_code_path)
+        if result.choreography_plan_path and os.path.exists(result.choreography_plan_path):
+            files["choreography_plan"] = Path(result.choreography_plan_path)
+        try:
+            await asyncio.to_thread(
+                self.artifact_store.put, key, job_id, files, {"duration": result.duration}
+            )
+        except OSError as e:
+            logger.warning(f"Could not store section {result.index}: {e}")
 
     def aggregate_results(
         self,
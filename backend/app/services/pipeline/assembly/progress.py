@@ -4,13 +4,14 @@ Manages job state, resume capability, and progress reporting
 Separated from generation logic for better testability and single responsibility
 """
 
-import json
 from typing import Dict, Any, List, Set, Optional, Callable
 from pathlib import Path
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 
-from app.core import get_logger
+from app.adapters.script_store import ScriptStore, can_store, uses_script_store
+from app.core import get_logger, publish_job_event, read_json, write_json
+from app.services.pipeline.animation.generation.core import StageCheckpoints
 
 logger = get_logger(__name__, component="progress_tracker")
 
@@ -50,6 +51,7 @@ class JobProgress:
         total_sections: Total number of sections in the script
         sections_dir: Path to sections directory
         job_dir: Path to job directory
+        checkpointed_sections: Stages already checkpointed for incomplete sections
     """
     job_id: str
     has_script: bool
@@ -59,6 +61,7 @@ class JobProgress:
     total_sections: int
     sections_dir: Path
     job_dir: Path
+    checkpointed_sections: Dict[int, List[str]] = field(default_factory=dict)
 
     def is_resumable(self) -> bool:
         """Check if this job can be resumed"""
@@ -107,6 +110,7 @@ class ProgressTracker:
         self.output_base_dir = output_base_dir
         self.job_dir = output_base_dir / job_id
         self.sections_dir = self.job_dir / "sections"
+        self.script_store = ScriptStore(self.job_dir)
         self.progress_callback = progress_callback
 
         self.completed_sections: Set[int] = set()
@@ -148,12 +152,10 @@ class ProgressTracker:
 
         # Check for script
         script_path = self.job_dir / "script.json"
-        if script_path.exists():
+        if self.script_store.exists() or script_path.exists():
             result.has_script = True
             try:
-                with open(script_path, encoding="utf-8") as f:
-                    raw_script = json.load(f)
-                result.script = _unwrap_script_with_metadata(raw_script)
+                result.script = _unwrap_script_with_metadata(self._read_script())
                 result.total_sections = len(result.script.get("sections", []))
                 logger.debug(f"Found existing script with {result.total_sections} sections", extra={
                     "total_sections": result.total_sections
@@ -180,6 +182,11 @@ class ProgressTracker:
 
                 if merged_path.exists() or final_section_path.exists():
                     result.completed_sections.add(section_index)
+                    continue
+
+                stages = self.section_checkpoints(section_index).stages()
+                if stages:
+                    result.checkpointed_sections[section_index] = stages
 
             self.completed_sections = result.completed_sections
             logger.info(f"Found {len(result.completed_sections)} completed sections", extra={
@@ -187,6 +194,10 @@ class ProgressTracker:
                 "total_sections": result.total_sections,
                 "completed_indices": sorted(result.completed_sections)
             })
+            if result.checkpointed_sections:
+                logger.info(f"Found stage checkpoints for {len(result.checkpointed_sections)} incomplete sections", extra={
+                    "checkpointed_sections": result.checkpointed_sections
+                })
 
         return result
 
@@ -198,6 +209,11 @@ class ProgressTracker:
             section_index: Index of the completed section
         """
         self.completed_sections.add(section_index)
+        publish_job_event(self.job_id, "section", {
+            "section_index": section_index,
+            "completed_sections": len(self.completed_sections),
+            "total_sections": self.total_sections,
+        })
         logger.debug(f"Marked section {section_index} as complete", extra={
             "section_index": section_index,
             "completed_count": len(self.completed_sections),
@@ -208,6 +224,10 @@ class ProgressTracker:
         """Check if a section is already completed"""
         return section_index in self.completed_sections
 
+    def section_checkpoints(self, section_index: int) -> StageCheckpoints:
+        """Stage checkpoints of a section (choreography, code, refinement, render)"""
+        return StageCheckpoints(self.sections_dir / str(section_index))
+
     def report_stage_progress(
         self,
         stage: str,
@@ -222,6 +242,11 @@ class ProgressTracker:
             progress: Progress percentage (0-100)
             message: Human-readable progress message
         """
+        publish_job_event(self.job_id, "stage", {
+            "stage": stage,
+            "progress": progress,
+            "message": message
+        })
         if self.progress_callback:
             self.progress_callback({
                 "stage": stage,
@@ -267,8 +292,11 @@ class ProgressTracker:
         script_path = self.job_dir / "script.json"
 
         try:
-            with open(script_path, "w", encoding="utf-8") as f:
-                json.dump(script, f, indent=2, ensure_ascii=False)
+            if uses_script_store(self.job_dir) and can_store(script):
+                # Only changed section records are rewritten (plus the export)
+                self.script_store.save(script)
+            else:
+                write_json(script_path, script)
 
             # Count sections from either wrapped or unwrapped format
             # Handle case where script might be a list or dict
@@ -304,8 +332,7 @@ class ProgressTracker:
         if not path.exists():
             return None
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                payload = json.load(f)
+            payload = read_json(path)
             if isinstance(payload, dict):
                 return payload
         except Exception:
@@ -320,8 +347,7 @@ class ProgressTracker:
             payload["created_at"] = datetime.now().isoformat()
         payload["updated_at"] = datetime.now().isoformat()
         self.job_dir.mkdir(parents=True, exist_ok=True)
-        with open(self.script_progress_path, "w", encoding="utf-8") as f:
-            json.dump(payload, f, indent=2, ensure_ascii=False)
+        write_json(self.script_progress_path, payload)
 
     def remove_script_progress(self) -> None:
         """Delete script-phase progress metadata once full script is ready."""
@@ -343,15 +369,12 @@ class ProgressTracker:
         """
         script_path = self.job_dir / "script.json"
 
-        if not script_path.exists():
+        if not self.script_store.exists() and not script_path.exists():
             logger.error(f"script.json not found at {script_path}")
             raise FileNotFoundError(f"Script not found: {script_path}")
 
         try:
-            with open(script_path, encoding="utf-8") as f:
-                raw_script = json.load(f)
-
-            script = _unwrap_script_with_metadata(raw_script)
+            script = _unwrap_script_with_metadata(self._read_script())
                 
             section_count = len(script.get('sections', []))
             logger.debug(f"Loaded script.json with {section_count} sections")
@@ -361,6 +384,12 @@ class ProgressTracker:
             logger.error("Failed to load script.json", exc_info=True)
             raise
 
+    def _read_script(self) -> Dict[str, Any]:
+        """The saved script as written (store records, else script.json)"""
+        if self.script_store.exists():
+            return self.script_store.load()
+        return read_json(self.job_dir / "script.json")
+
     def get_summary(self) -> Dict[str, Any]:
         """
         Get summary of current progress
@@ -0,0 +1,522 @@
+"""
+Job Recompiler - Rebuilds a job's final video from its section files
+
+Each section's video and audio are merged into ``combined_{i:03d}.mp4`` in the
+job directory, then all merged files are joined with a stream-copy concat.
+
+A manifest (``recompile_manifest.json``) records the inputs of every merged
+file. Sections whose inputs are unchanged since their last merge reuse the
+merged file, so a recompile after editing one section costs one section's
+encode. Inputs are compared by size and mtime first; when only the mtime
+differs the content hash decides. The remaining merges run concurrently, each
+admitted through the shared render admission.
+
+``splice_section()`` is the editing fast path: it re-merges only the edited
+section and splices it into the existing final video. The section boundaries
+come from the ``video_info.json`` chapters; they are snapped to keyframes of
+the final video so the untouched head and tail are stream-copied, and the
+chapters are updated in place.
+
+Splices and recompiles of one job are serialized by a per-job lock: both
+rewrite the final video and the manifest, splices also the chapters. Their
+temporary files carry unique names.
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import uuid
+import weakref
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from app.core import get_logger, run_process_async, JobCancelledError
+from app.core import PriorityClass, get_render_admission
+from app.core import load_video_info, save_video_info
+
+from .ffmpeg import concatenate_videos, get_media_duration
+
+logger = get_logger(__name__, component="recompile")
+
+MANIFEST_FILE_NAME = "recompile_manifest.json"
+FINAL_VIDEO_NAME = "final_video.mp4"
+FFMPEG_TIMEOUT = 300
+
+# How far a chapter boundary may be from a keyframe of the final video
+KEYFRAME_TOLERANCE = 0.5
+
+# Bump when the merge command changes so old merged files are not reused
+_MERGE_VERSION = 1
+_HASH_CHUNK = 1024 * 1024
+
+# Per-job locks, dropped once no recompiler of the job holds them
+_job_locks: "weakref.WeakValueDictionary[str, asyncio.Lock]" = weakref.WeakValueDictionary()
+
+
+def _job_lock(job_id: str) -> asyncio.Lock:
+    lock = _job_locks.get(job_id)
+    if lock is None:
+        lock = asyncio.Lock()
+        _job_locks[job_id] = lock
+    return lock
+
+
+@dataclass
+class RecompileSection:
+    """Inputs of one section's merge"""
+    index: int
+    section_id: str
+    video: str
+    audio: Optional[str] = None
+
+    @property
+    def combined_name(self) -> str:
+        return f"combined_{self.index:03d}.mp4"
+
+
+@dataclass
+class RecompileResult:
+    final_video: Optional[str]
+    merged: int
+    reused: int
+    skipped: int
+
+
+@dataclass
+class SpliceResult:
+    final_video: str
+    chapter_index: int
+    chapters: List[Dict[str, Any]]
+    duration: float
+
+
+def _file_hash(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(_HASH_CHUNK), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _stat_entry(path: str) -> Dict[str, Any]:
+    stat = os.stat(path)
+    return {"path": path, "size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+
+async def _probe(args: List[str], path: str) -> Optional[str]:
+    try:
+        result = await run_process_async(
+            ["ffprobe", "-v", "error", *args, path],
+            capture_output=True, text=True, errors="replace", timeout=60,
+        )
+    except JobCancelledError:
+        raise
+    except Exception as e:
+        logger.warning(f"ffprobe failed for {path}: {e}")
+        return None
+    return result.stdout if result.returncode == 0 else None
+
+
+async def _keyframe_times(path: str) -> List[float]:
+    """Presentation times of the video keyframes (from packet flags, no decoding)"""
+    output = await _probe(
+        ["-select_streams", "v:0", "-show_entries", "packet=pts_time,flags", "-of", "csv=p=0"],
+        path,
+    )
+    times = []
+    for line in (output or "").splitlines():
+        pts, _, flags = line.partition(",")
+        if "K" in flags:
+            try:
+                times.append(float(pts))
+            except ValueError:
+                continue
+    return sorted(times)
+
+
+async def _stream_signature(path: str) -> Optional[tuple]:
+    """Codec parameters that must match for a stream-copy concat"""
+    output = await _probe(
+        [
+            "-show_entries",
+            "stream=codec_type,codec_name,width,height,pix_fmt,r_frame_rate,sample_rate,channels",
+            "-of", "json",
+        ],
+        path,
+    )
+    if output is None:
+        return None
+    try:
+        streams = json.loads(output).get("streams", [])
+    except ValueError:
+        return None
+    return tuple(sorted(tuple(sorted(s.items())) for s in streams))
+
+
+def _snap_to_keyframe(time: float, keyframes: List[float]) -> Optional[float]:
+    if not keyframes:
+        return None
+    nearest = min(keyframes, key=lambda k: abs(k - time))
+    return nearest if abs(nearest - time) <= KEYFRAME_TOLERANCE else None
+
+
+def _find_section_video(section_path: Path) -> Optional[str]:
+    for root, dirs, files in os.walk(section_path):
+        dirs.sort()
+        for f in sorted(files):
+            if f.endswith(".mp4"):
+                return os.path.join(root, f)
+    return None
+
+
+def _find_section_audio(section_path: Path) -> Optional[str]:
+    for f in sorted(os.listdir(section_path)):
+        if f.endswith(".mp3"):
+            return str(section_path / f)
+    return None
+
+
+def resolve_sections(sections_dir: Path, ordered_sections: List[Dict[str, Any]]) -> List[RecompileSection]:
+    """Locate the video (and audio) of each script section, in order.
+
+    Sections without a video are left out.
+    """
+    resolved = []
+    for i, sec in enumerate(ordered_sections):
+        section_id = sec.get("id")
+        section_path = sections_dir / section_id
+
+        video_file = sec.get("video")
+        audio_file = sec.get("audio")
+        if video_file and not os.path.exists(video_file):
+            video_file = None
+        if audio_file and not os.path.exists(audio_file):
+            audio_file = None
+
+        if not video_file and section_path.is_dir():
+            video_file = _find_section_video(section_path)
+        if not audio_file and section_path.is_dir():
+            audio_file = _find_section_audio(section_path)
+
+        if not video_file:
+            logger.warning(f"Skipping section {section_id}: no video found")
+            continue
+        resolved.append(RecompileSection(index=i, section_id=section_id, video=video_file, audio=audio_file))
+    return resolved
+
+
+class JobRecompiler:
+    """Incremental, concurrent rebuild of ``final_video.mp4`` for one job."""
+
+    def __init__(self, job_id: str, job_dir: Path):
+        self.job_id = job_id
+        self.job_dir = Path(job_dir)
+        self.manifest_path = self.job_dir / MANIFEST_FILE_NAME
+        self._manifest = self._load_manifest()
+        self._lock = _job_lock(job_id)
+
+    # ------------------------------------------------------------------
+    # Manifest
+    # ------------------------------------------------------------------
+
+    def _load_manifest(self) -> Dict[str, Any]:
+        try:
+            with open(self.manifest_path, "r", encoding="utf-8") as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            return {"version": _MERGE_VERSION, "sections": {}}
+        if manifest.get("version") != _MERGE_VERSION:
+            return {"version": _MERGE_VERSION, "sections": {}}
+        return manifest
+
+    def _save_manifest(self) -> None:
+        tmp_path = self.manifest_path.with_suffix(".json.tmp")
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self._manifest, f, indent=2)
+            os.replace(tmp_path, self.manifest_path)
+        except OSError as e:
+            logger.warning(f"Failed to write recompile manifest: {e}")
+
+    @staticmethod
+    def _input_matches(recorded: Optional[Dict[str, Any]], path: Optional[str]) -> bool:
+        """Whether ``path`` still has the content recorded for the last merge"""
+        if recorded is None or path is None:
+            return recorded is None and path is None
+        if recorded.get("path") != path or not os.path.exists(path):
+            return False
+        current = _stat_entry(path)
+        if current["size"] != recorded.get("size"):
+            return False
+        if current["mtime_ns"] == recorded.get("mtime_ns"):
+            return True
+        # Touched (or rewritten with the same size): the content decides
+        return recorded.get("sha256") is not None and _file_hash(path) == recorded["sha256"]
+
+    def _is_reusable(self, section: RecompileSection) -> bool:
+        entry = self._manifest["sections"].get(section.combined_name)
+        if not entry:
+            return False
+        combined = self.job_dir / section.combined_name
+        if not combined.exists() or combined.stat().st_size != entry.get("output_size"):
+            return False
+        return (
+            self._input_matches(entry.get("video"), section.video)
+            and self._input_matches(entry.get("audio"), section.audio)
+        )
+
+    def _temp_path(self, name: str) -> Path:
+        """A job-directory path for a temporary file no other call uses"""
+        return self.job_dir / f"partial_{uuid.uuid4().hex[:8]}_{name}"
+
+    def _record(self, section: RecompileSection) -> None:
+        def describe(path: Optional[str]) -> Optional[Dict[str, Any]]:
+            if path is None:
+                return None
+            return {**_stat_entry(path), "sha256": _file_hash(path)}
+
+        self._manifest["sections"][section.combined_name] = {
+            "section_id": section.section_id,
+            "video": describe(section.video),
+            "audio": describe(section.audio),
+            "output_size": (self.job_dir / section.combined_name).stat().st_size,
+        }
+
+    # ------------------------------------------------------------------
+    # Merge / concat
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    async def _merge_cmd(section: RecompileSection, output_path: str) -> List[str]:
+        if not section.audio:
+            return ["ffmpeg", "-y", "-i", section.video, "-c", "copy", output_path]
+
+        video_duration, audio_duration = await asyncio.gather(
+            get_media_duration(section.video),
+            get_media_duration(section.audio),
+        )
+        if video_duration >= audio_duration:
+            return [
+                "ffmpeg", "-y",
+                "-i", section.video,
+                "-i", section.audio,
+                "-c:v", "libx264",
+                "-c:a", "aac",
+                "-shortest",
+                output_path,
+            ]
+        return [
+            "ffmpeg", "-y",
+            "-i", section.video,
+            "-i", section.audio,
+            "-filter_complex", "[0:v]tpad=stop=-1:stop_mode=clone,setpts=PTS-STARTPTS[v]",
+            "-map", "[v]",
+            "-map", "1:a:0",
+            "-c:v", "libx264",
+            "-c:a", "aac",
+            "-t", str(audio_duration),
+            output_path,
+        ]
+
+    async def _merge(self, section: RecompileSection) -> bool:
+        """Merge one section into its combined file (written atomically)"""
+        combined = self.job_dir / section.combined_name
+        partial = self._temp_path(section.combined_name)
+        cmd = await self._merge_cmd(section, str(partial))
+
+        try:
+            # Editor-initiated: admitted ahead of queued generation renders
+            async with get_render_admission().slot(PriorityClass.INTERACTIVE):
+                result = await run_process_async(
+                    cmd, capture_output=True, text=True, errors="replace", timeout=FFMPEG_TIMEOUT
+                )
+        except JobCancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"ffmpeg failed for section {section.section_id}: {e}")
+            partial.unlink(missing_ok=True)
+            return False
+
+        if result.returncode != 0 or not partial.exists():
+            logger.error(f"ffmpeg error for section {section.section_id}: {result.stderr}")
+            partial.unlink(missing_ok=True)
+            return False
+
+        os.replace(partial, combined)
+        await asyncio.to_thread(self._record, section)
+        return True
+
+    async def run(self, sections: List[RecompileSection]) -> RecompileResult:
+        """Merge changed sections concurrently, then stream-copy concat all of them."""
+        async with self._lock:
+            # Another recompile or splice may have updated it meanwhile
+            self._manifest = self._load_manifest()
+            return await self._run(sections)
+
+    async def _run(self, sections: List[RecompileSection]) -> RecompileResult:
+        reusable = await asyncio.to_thread(lambda: [self._is_reusable(s) for s in sections])
+        to_merge = [s for s, reuse in zip(sections, reusable) if not reuse]
+        logger.info(
+            f"Recompiling {self.job_id}: {len(sections) - len(to_merge)} section(s) reused, "
+            f"{len(to_merge)} to merge"
+        )
+
+        merged_ok = await asyncio.gather(*(self._merge(s) for s in to_merge))
+        self._save_manifest()
+
+        failed = {s.combined_name for s, ok in zip(to_merge, merged_ok) if not ok}
+        combined_files = [
+            str(self.job_dir / s.combined_name)
+            for s in sections
+            if s.combined_name not in failed
+        ]
+        result = RecompileResult(
+            final_video=None,
+            merged=sum(merged_ok),
+            reused=len(sections) - len(to_merge),
+            skipped=len(failed),
+        )
+        if not combined_files:
+            return result
+
+        final_video = self.job_dir / FINAL_VIDEO_NAME
+        partial_final = self._temp_path(FINAL_VIDEO_NAME)
+        try:
+            await concatenate_videos(combined_files, str(partial_final), link=True)
+            if partial_final.exists():
+                os.replace(partial_final, final_video)
+                result.final_video = str(final_video)
+        finally:
+            partial_final.unlink(missing_ok=True)
+        return result
+
+    # ------------------------------------------------------------------
+    # Single-section splice
+    # ------------------------------------------------------------------
+
+    async def splice_section(
+        self, sections: List[RecompileSection], section_index: int
+    ) -> Optional[SpliceResult]:
+        """Replace one section of the existing final video.
+
+        ``section_index`` is the script position of the edited section. Only
+        that section is merged; the rest of the final video is stream-copied.
+        Returns None when the final video cannot be spliced (no final video or
+        chapters, differing stream parameters, boundaries off keyframes) - use
+        ``run()`` then.
+        """
+        async with self._lock:
+            self._manifest = self._load_manifest()
+            return await self._splice_section(sections, section_index)
+
+    async def _splice_section(
+        self, sections: List[RecompileSection], section_index: int
+    ) -> Optional[SpliceResult]:
+        final_video = self.job_dir / FINAL_VIDEO_NAME
+        info = await asyncio.to_thread(load_video_info, self.job_id)
+        positions = [pos for pos, s in enumerate(sections) if s.index == section_index]
+        if not final_video.exists() or info is None or not positions:
+            return None
+        if len(info.chapters) != len(sections):
+            logger.info(f"Cannot splice {self.job_id}: chapters do not match the sections")
+            return None
+
+        chapter_index = positions[0]
+        section = sections[chapter_index]
+        if not await asyncio.to_thread(self._is_reusable, section):
+            merged = await self._merge(section)
+            self._save_manifest()
+            if not merged:
+                return None
+        combined = self.job_dir / section.combined_name
+
+        final_signature, section_signature = await asyncio.gather(
+            _stream_signature(str(final_video)),
+            _stream_signature(str(combined)),
+        )
+        if final_signature is None or final_signature != section_signature:
+            logger.info(f"Cannot splice {self.job_id}: stream parameters differ from the final video")
+            return None
+
+        chapter = info.chapters[chapter_index]
+        is_last = chapter_index == len(info.chapters) - 1
+        keyframes = await _keyframe_times(str(final_video))
+        start = 0.0 if chapter_index == 0 else _snap_to_keyframe(chapter.start_time, keyframes)
+        end = None if is_last else _snap_to_keyframe(chapter.start_time + chapter.duration, keyframes)
+        if start is None or (not is_last and end is None):
+            logger.info(f"Cannot splice {self.job_id}: section boundaries are not on keyframes")
+            return None
+
+        total_duration, section_duration = await asyncio.gather(
+            get_media_duration(str(final_video)),
+            get_media_duration(str(combined)),
+        )
+        head = self._temp_path("splice_head.mp4")
+        tail = self._temp_path("splice_tail.mp4")
+        partial_final = self._temp_path(FINAL_VIDEO_NAME)
+        parts = []
+        try:
+            if start > 0:
+                if not await self._cut(final_video, head, end=start):
+                    return None
+                parts.append(str(head))
+            parts.append(str(combined))
+            if end is not None:
+                if not await self._cut(final_video, tail, start=end):
+                    return None
+                parts.append(str(tail))
+
+            await concatenate_videos(parts, str(partial_final), link=True)
+            if not partial_final.exists():
+                return None
+            os.replace(partial_final, final_video)
+        finally:
+            head.unlink(missing_ok=True)
+            tail.unlink(missing_ok=True)
+            partial_final.unlink(missing_ok=True)
+
+        # Later chapters move by the change in this section's length
+        delta = section_duration - ((end if end is not None else total_duration) - start)
+        for later in info.chapters[chapter_index + 1:]:
+            later.start_time = round(later.start_time + delta, 3)
+        chapter.start_time = round(start, 3)
+        chapter.duration = round(section_duration, 3)
+        info.duration = round(info.duration + delta, 3)
+        await asyncio.to_thread(save_video_info, info)
+
+        logger.info(f"Spliced section {section.section_id} into {self.job_id}", extra={
+            "chapter_index": chapter_index,
+            "duration_delta": round(delta, 3),
+        })
+        return SpliceResult(
+            final_video=str(final_video),
+            chapter_index=chapter_index,
+            chapters=[ch.to_dict() for ch in info.chapters],
+            duration=info.duration,
+        )
+
+    async def _cut(
+        self,
+        source: Path,
+        output: Path,
+        start: Optional[float] = None,
+        end: Optional[float] = None,
+    ) -> bool:
+        """Stream-copy ``[start, end)`` of ``source`` (boundaries are keyframes)"""
+        cmd = ["ffmpeg", "-y"]
+        if start is not None:
+            cmd += ["-ss", f"{start:.3f}"]
+        cmd += ["-i", str(source)]
+        if end is not None:
+            cmd += ["-t", f"{end:.3f}"]
+        cmd += ["-c", "copy", "-avoid_negative_ts", "make_zero", str(output)]
+
+        result = await run_process_async(
+            cmd, capture_output=True, text=True, errors="replace", timeout=FFMPEG_TIMEOUT
+        )
+        if result.returncode != 0 or not output.exists():
+            logger.error(f"ffmpeg cut failed for {self.job_id}: {result.stderr}")
+            return False
+        return True
@@ -0,0 +1,254 @@
+"""
+Section Scheduling - Render-time prediction for longest-first ordering
+
+Sections are admitted to the SectionOrchestrator semaphore in the order their
+tasks are created. Starting the sections expected to take longest first
+reduces the makespan of a job: a long, math-heavy final section no longer
+starts last and dominates wall-clock time.
+
+The predictor is a small linear model over cheap section features, scaled by
+a calibration factor learned from recorded (predicted, actual) timings.
+"""
+
+import json
+import os
+import re
+import statistics
+import threading
+from dataclasses import dataclass, asdict
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from app.config import JOB_DATA_DIR
+from app.core import get_logger
+
+logger = get_logger(__name__, component="section_scheduling")
+
+DEFAULT_HISTORY_PATH = JOB_DATA_DIR / "render_timings.jsonl"
+
+# Seconds contributed per unit of each feature (before calibration)
+DEFAULT_WEIGHTS: Dict[str, float] = {
+    "base": 45.0,            # choreography + implementation LLM round trips
+    "audio_duration": 1.5,   # per second of narration
+    "segment_count": 6.0,    # per narration segment
+    "tex_count": 3.0,        # per Tex/MathTex object (LaTeX compile)
+    "code_kchars": 8.0,      # per 1000 characters of existing Manim code
+}
+
+WORDS_PER_SECOND = 2.5
+MIN_CALIBRATION_SAMPLES = 5
+CALIBRATION_WINDOW = 200
+# The history is trimmed to the calibration window once it grows past this
+HISTORY_MAX_BYTES = 256 * 1024
+CALIBRATION_BOUNDS = (0.25, 4.0)
+
+_TEX_CODE_PATTERN = re.compile(r"\b(?:Math)?Tex\s*\(")
+_TEX_TEXT_PATTERN = re.compile(r"\$[^$]+\$|\\(?:frac|sum|int|sqrt|begin|mathbf|alpha|beta|theta)\b")
+
+
+@dataclass
+class SectionFeatures:
+    """Cheap, pre-render features of a section"""
+    audio_duration: float
+    segment_count: int
+    tex_count: int
+    code_length: int
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+class SectionRuntimePredictor:
+    """
+    Predicts per-section processing time and orders sections longest-first.
+
+    Predictions and actual timings are appended to a JSONL history file; the
+    median actual/predicted ratio over recent records calibrates later
+    predictions. The file is cut back to the last CALIBRATION_WINDOW records
+    whenever it exceeds HISTORY_MAX_BYTES.
+    """
+
+    def __init__(
+        self,
+        history_path: Optional[Path] = DEFAULT_HISTORY_PATH,
+        weights: Optional[Dict[str, float]] = None
+    ):
+        self.history_path = Path(history_path) if history_path else None
+        self.weights = {**DEFAULT_WEIGHTS, **(weights or {})}
+        self._lock = threading.Lock()
+        self._calibration: Optional[float] = None
+
+    # ------------------------------------------------------------------
+    # Features
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _load_code(section: Dict[str, Any]) -> str:
+        code = section.get("manim_code")
+        if isinstance(code, str) and code:
+            return code
+        code_path = section.get("manim_code_path")
+        if code_path:
+            try:
+                return Path(code_path).read_text(encoding="utf-8")
+            except OSError:
+                pass
+        return ""
+
+    @staticmethod
+    def _estimate_audio_duration(section: Dict[str, Any]) -> float:
+        for key in ("actual_duration", "duration_seconds"):
+            try:
+                value = float(section.get(key) or 0)
+            except (TypeError, ValueError):
+                value = 0.0
+            if value > 0:
+                return value
+
+        segments = section.get("narration_segments") or []
+        total = 0.0
+        for segment in segments:
+            if not isinstance(segment, dict):
+                continue
+            try:
+                total += float(segment.get("duration") or segment.get("estimated_duration") or 0)
+            except (TypeError, ValueError):
+                continue
+        if total > 0:
+            return total
+
+        narration = section.get("tts_narration") or section.get("narration") or ""
+        return len(str(narration).split()) / WORDS_PER_SECOND
+
+    def extract_features(self, section: Dict[str, Any]) -> SectionFeatures:
+        code = self._load_code(section)
+        if code:
+            tex_count = len(_TEX_CODE_PATTERN.findall(code))
+        else:
+            text = " ".join(
+                str(section.get(key) or "")
+                for key in ("narration", "visual_description", "supporting_data")
+            )
+            tex_count = len(_TEX_TEXT_PATTERN.findall(text))
+
+        return SectionFeatures(
+            audio_duration=round(self._estimate_audio_duration(section), 2),
+            segment_count=len(section.get("narration_segments") or []) or 1,
+            tex_count=tex_count,
+            code_length=len(code),
+        )
+
+    # ------------------------------------------------------------------
+    # Prediction
+    # ------------------------------------------------------------------
+
+    def _raw_prediction(self, features: SectionFeatures) -> float:
+        w = self.weights
+        return (
+            w["base"]
+            + w["audio_duration"] * features.audio_duration
+            + w["segment_count"] * features.segment_count
+            + w["tex_count"] * features.tex_count
+            + w["code_kchars"] * features.code_length / 1000.0
+        )
+
+    def _load_history(self) -> List[Dict[str, Any]]:
+        if not self.history_path or not self.history_path.exists():
+            return []
+        records = []
+        try:
+            with open(self.history_path, "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        records.append(json.loads(line))
+                    except json.JSONDecodeError:
+                        continue
+        except OSError as e:
+            logger.warning(f"Failed to read render timing history: {e}")
+        return records[-CALIBRATION_WINDOW:]
+
+    def calibration(self) -> float:
+        """Median actual/raw-predicted ratio from history (1.0 if too little data)."""
+        if self._calibration is not None:
+            return self._calibration
+
+        ratios = []
+        for record in self._load_history():
+            try:
+                raw = float(record["raw_predicted_seconds"])
+                actual = float(record["actual_seconds"])
+            except (KeyError, TypeError, ValueError):
+                continue
+            if raw > 0 and actual > 0:
+                ratios.append(actual / raw)
+
+        factor = 1.0
+        if len(ratios) >= MIN_CALIBRATION_SAMPLES:
+            low, high = CALIBRATION_BOUNDS
+            factor = min(max(statistics.median(ratios), low), high)
+
+        self._calibration = factor
+        return factor
+
+    def predict_features(self, features: SectionFeatures) -> float:
+        """Predicted processing time in seconds for pre-extracted features"""
+        return self._raw_prediction(features) * self.calibration()
+
+    def predict(self, section: Dict[str, Any]) -> float:
+        """Predicted processing time for a section in seconds"""
+        return self.predict_features(self.extract_features(section))
+
+    def order(self, sections: List[Dict[str, Any]]) -> List[int]:
+        """Section indexes sorted by predicted time, longest first (stable on ties)"""
+        predictions = [self.predict(section) for section in sections]
+        return sorted(range(len(sections)), key=lambda i: (-predictions[i], i))
+
+    # ------------------------------------------------------------------
+    # History
+    # ------------------------------------------------------------------
+
+    def record(
+        self,
+        features: SectionFeatures,
+        actual_seconds: float,
+        job_id: Optional[str] = None,
+        section_index: Optional[int] = None,
+    ) -> None:
+        """Append a (features, predicted, actual) record for later tuning.
+
+        ``features`` should be the ones extracted at scheduling time, before
+        processing mutated the section.
+        """
+        if not self.history_path:
+            return
+
+        raw = self._raw_prediction(features)
+        record = {
+            "timestamp": datetime.now().isoformat(),
+            "job_id": job_id,
+            "section_index": section_index,
+            "features": features.to_dict(),
+            "raw_predicted_seconds": round(raw, 2),
+            "predicted_seconds": round(raw * self.calibration(), 2),
+            "actual_seconds": round(actual_seconds, 2),
+        }
+
+        with self._lock:
+            try:
+                self.history_path.parent.mkdir(parents=True, exist_ok=True)
+                with open(self.history_path, "a", encoding="utf-8") as f:
+                    f.write(json.dumps(record) + "\n")
+                if self.history_path.stat().st_size > HISTORY_MAX_BYTES:
+                    self._trim_history()
+            except OSError as e:
+                logger.warning(f"Failed to record render timing: {e}")
+
+    def _trim_history(self) -> None:
+        """Rewrite the history with only its last CALIBRATION_WINDOW records"""
+        with open(self.history_path, "r", encoding="utf-8") as f:
+            lines = f.readlines()[-CALIBRATION_WINDOW:]
+        tmp_path = self.history_path.with_name(self.history_path.name + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.writelines(lines)
+        os.replace(tmp_path, self.history_path)
@@ -0,0 +1,303 @@
+"""
+Section Tasks - Background re-rendering of single sections
+
+Regenerating a section (after a code edit) runs as a tracked background task
+instead of inside the HTTP request. The request returns a task handle whose
+status and progress can be polled; the render itself goes through the shared
+render admission like every other Manim render.
+
+Renders keep Manim's caches in the section directory (``Tex``, ``texts``,
+``images`` and the partial movie files), so glyphs and animations that did not
+change are not rebuilt. Only the stale output movie is cleared, and the
+previous section video stays in place until the new one replaces it.
+
+A new regeneration of a section supersedes one still running for it: the old
+task is cancelled (its render process is killed) before the new one starts.
+"""
+
+import asyncio
+import os
+import re
+import time
+import uuid
+from dataclasses import dataclass, field
+from enum import Enum
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from app.core import get_logger, run_process_async
+from app.core import PriorityClass, get_render_admission
+
+logger = get_logger(__name__, component="section_tasks")
+
+SECTION_RENDER_TIMEOUT = 120
+MANIM_QUALITY_FLAG = "-ql"
+
+# Manim's per-animation cache; kept between renders
+PARTIAL_MOVIE_DIR = "partial_movie_files"
+
+# Finished tasks kept for status polling
+MAX_FINISHED_TASKS = 200
+
+
+class SectionRenderError(Exception):
+    """A section could not be rendered"""
+
+
+class SectionTaskStatus(str, Enum):
+    QUEUED = "queued"
+    RENDERING = "rendering"
+    SPLICING = "splicing"
+    COMPLETED = "completed"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+
+_TERMINAL_STATUSES = frozenset({
+    SectionTaskStatus.COMPLETED,
+    SectionTaskStatus.FAILED,
+    SectionTaskStatus.CANCELLED,
+})
+
+
+@dataclass
+class SectionTask:
+    """Status of one section regeneration"""
+    task_id: str
+    job_id: str
+    section_id: str
+    status: SectionTaskStatus = SectionTaskStatus.QUEUED
+    progress: int = 0
+    message: str = "Queued"
+    video_path: Optional[str] = None
+    final_video_updated: bool = False
+    error: Optional[str] = None
+    created_at: float = field(default_factory=time.time)
+    updated_at: float = field(default_factory=time.time)
+
+    @property
+    def is_terminal(self) -> bool:
+        return self.status in _TERMINAL_STATUSES
+
+    def update(
+        self,
+        status: SectionTaskStatus,
+        progress: Optional[int] = None,
+        message: Optional[str] = None,
+    ) -> None:
+        self.status = status
+        if progress is not None:
+            self.progress = progress
+        if message is not None:
+            self.message = message
+        self.updated_at = time.time()
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "task_id": self.task_id,
+            "job_id": self.job_id,
+            "section_id": self.section_id,
+            "status": self.status.value,
+            "progress": self.progress,
+            "message": self.message,
+            "video_path": self.video_path,
+            "final_video_updated": self.final_video_updated,
+            "error": self.error,
+            "created_at": self.created_at,
+            "updated_at": self.updated_at,
+        }
+
+
+# ---------------------------------------------------------------------------
+# Rendering
+# ---------------------------------------------------------------------------
+
+def find_scene_file(section_dir: Path) -> Optional[Tuple[Path, int]]:
+    """The section's Manim scene file and the index in its name"""
+    for name in sorted(os.listdir(section_dir)):
+        if name.endswith(".py") and name.startswith("scene"):
+            idx_match = re.search(r"scene_(\d+)\.py", name)
+            return section_dir / name, int(idx_match.group(1)) if idx_match else 0
+    return None
+
+
+def find_scene_class(code: str) -> Optional[str]:
+    class_match = re.search(r"class\s+(\w+)\s*\(", code)
+    return class_match.group(1) if class_match else None
+
+
+def section_video_path(section_dir: Path, section_index: int) -> Path:
+    """The section's existing video, or where a new one goes"""
+    for name in sorted(os.listdir(section_dir)):
+        if name.endswith(".mp4"):
+            return section_dir / name
+    return section_dir / f"section_{section_index}.mp4"
+
+
+def _rendered_movies(section_dir: Path, output_name: str) -> List[Path]:
+    videos_dir = section_dir / "videos"
+    if not videos_dir.exists():
+        return []
+    return [
+        path for path in videos_dir.rglob(f"{output_name}.mp4")
+        if PARTIAL_MOVIE_DIR not in path.parts
+    ]
+
+
+def clear_stale_outputs(section_dir: Path, output_name: str) -> None:
+    """Remove previous output movies, keeping Manim's Tex/text/partial caches"""
+    for path in _rendered_movies(section_dir, output_name):
+        try:
+            path.unlink()
+        except OSError as e:
+            logger.warning(f"Could not remove stale render {path}: {e}")
+
+
+async def render_section_video(
+    section_dir: Path,
+    code_file: Path,
+    class_name: str,
+    output_video: Path,
+    timeout: float = SECTION_RENDER_TIMEOUT,
+    priority: PriorityClass = PriorityClass.INTERACTIVE,
+) -> Path:
+    """Render ``class_name`` from ``code_file`` into ``output_video``.
+
+    Raises:
+        SectionRenderError: if Manim fails or produces no video.
+        subprocess.TimeoutExpired: if the render exceeds ``timeout``.
+    """
+    output_name = output_video.stem
+    clear_stale_outputs(section_dir, output_name)
+
+    cmd = [
+        "manim",
+        MANIM_QUALITY_FLAG,
+        "--media_dir", str(section_dir),
+        "-o", output_name,
+        str(code_file),
+        class_name,
+    ]
+    async with get_render_admission().slot(priority):
+        result = await run_process_async(
+            cmd,
+            cwd=str(section_dir),
+            timeout=timeout,
+            capture_output=True,
+            text=True,
+        )
+
+    if result.returncode != 0:
+        raise SectionRenderError(f"Manim render failed: {(result.stderr or '')[:500]}")
+
+    rendered = _rendered_movies(section_dir, output_name)
+    if not rendered:
+        raise SectionRenderError("Manim did not produce a video file")
+    os.replace(rendered[0], output_video)
+    return output_video
+
+
+# ---------------------------------------------------------------------------
+# Task registry
+# ---------------------------------------------------------------------------
+
+SectionTaskRunner = Callable[[SectionTask], Awaitable[None]]
+
+
+class SectionTaskRegistry:
+    """In-process registry of section regeneration tasks."""
+
+    def __init__(self, max_finished: int = MAX_FINISHED_TASKS):
+        self.max_finished = max_finished
+        self._tasks: Dict[str, SectionTask] = {}
+        # asyncio tasks by task id, and the latest task id of each section
+        self._handles: Dict[str, asyncio.Task] = {}
+        self._latest: Dict[Tuple[str, str], str] = {}
+
+    def submit(self, job_id: str, section_id: str, runner: SectionTaskRunner) -> SectionTask:
+        """Start ``runner`` in the background and return its task handle.
+
+        ``runner`` reports progress through the task; the registry marks it
+        completed, failed or cancelled when the runner returns.
+        """
+        key = (job_id, section_id)
+        previous = self._supersede(self._latest.get(key))
+
+        task = SectionTask(task_id=uuid.uuid4().hex, job_id=job_id, section_id=section_id)
+        self._tasks[task.task_id] = task
+        self._latest[key] = task.task_id
+        handle = asyncio.create_task(self._execute(task, runner, previous))
+        handle.add_done_callback(lambda _: self._handles.pop(task.task_id, None))
+        self._handles[task.task_id] = handle
+        self._prune()
+        return task
+
+    def _supersede(self, task_id: Optional[str]) -> Optional[asyncio.Task]:
+        handle = self._handles.get(task_id) if task_id else None
+        if handle is None or handle.done():
+            return None
+        handle.cancel()
+        # A task cancelled before it started never reaches its handler
+        task = self._tasks.get(task_id)
+        if task is not None and not task.is_terminal:
+            task.update(SectionTaskStatus.CANCELLED, message="Superseded by a newer regeneration")
+        return handle
+
+    async def _execute(
+        self,
+        task: SectionTask,
+        runner: SectionTaskRunner,
+        previous: Optional[asyncio.Task],
+    ) -> None:
+        try:
+            if previous is not None:
+                # Let the superseded render release its output files first
+                await asyncio.wait([previous])
+            await runner(task)
+            task.update(SectionTaskStatus.COMPLETED, 100, "Section regenerated")
+        except asyncio.CancelledError:
+            task.update(SectionTaskStatus.CANCELLED, message="Superseded by a newer regeneration")
+        except Exception as e:
+            logger.warning(
+                f"Regenerating section {task.section_id} of job {task.job_id} failed: {e}",
+                extra={"job_id": task.job_id, "section_id": task.section_id},
+            )
+            task.error = str(e) or type(e).__name__
+            task.update(SectionTaskStatus.FAILED, message="Regeneration failed")
+
+    def _prune(self) -> None:
+        finished = [t for t in self._tasks.values() if t.is_terminal]
+        excess = len(finished) - self.max_finished
+        if excess <= 0:
+            return
+        for task in sorted(finished, key=lambda t: t.updated_at)[:excess]:
+            del self._tasks[task.task_id]
+            key = (task.job_id, task.section_id)
+            if self._latest.get(key) == task.task_id:
+                del self._latest[key]
+
+    def get(self, task_id: str) -> Optional[SectionTask]:
+        return self._tasks.get(task_id)
+
+    def list_for_job(self, job_id: str) -> List[SectionTask]:
+        """Tasks of a job, newest first"""
+        tasks = [t for t in self._tasks.values() if t.job_id == job_id]
+        return sorted(tasks, key=lambda t: t.created_at, reverse=True)
+
+    async def wait(self, task_id: str) -> Optional[SectionTask]:
+        """Wait for a task to finish (used by tests and shutdown)"""
+        task = self._tasks.get(task_id)
+        handle = self._handles.get(task_id)
+        if handle is not None:
+            await asyncio.wait([handle])
+        return task
+
+
+_section_task_registry: Optional[SectionTaskRegistry] = None
+
+
+def get_section_task_registry() -> SectionTaskRegistry:
+    global _section_task_registry
+    if _section_task_registry is None:
+        _section_task_registry = SectionTaskRegistry()
+    return _section_task_registry
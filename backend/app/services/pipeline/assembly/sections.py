@@ -7,7 +7,6 @@ import re
 import asyncio
 import struct
 import subprocess
-import shutil
 from typing import Dict, Any, List, Optional, TYPE_CHECKING
 from pathlib import Path
 
@@ -20,7 +19,14 @@ from .ffmpeg import (
     build_merge_no_cut_cmd,
 )
 from app.utils.section_status import write_status
-from app.core import get_logger
+from app.core import (
+    get_logger,
+    JobCancelledError,
+    place_file,
+    raise_if_cancelled,
+    run_process_async,
+    track_process,
+)
 
 if TYPE_CHECKING:
     from app.services.pipeline.animation import ManimGenerator
@@ -279,6 +285,8 @@ async def process_single_subsection(
         result["duration"] = audio_duration
         result["audio_path"] = str(audio_path)
         logger.info(f"Section {section_index} audio duration: {audio_duration:.1f}s")
+    except JobCancelledError:
+        raise
     except Exception as e:
         logger.error(f"TTS error for section {section_index}: {e}")
         write_status(section_dir, "fixing_error", str(e))
@@ -312,6 +320,10 @@ async def process_single_subsection(
                 result["manim_code_path"] = manim_result["manim_code_path"]
             if manim_result.get("choreography_plan_path"):
                 result["choreography_plan_path"] = manim_result["choreography_plan_path"]
+            if manim_result.get("degraded"):
+                result["degraded"] = manim_result["degraded"]
+    except JobCancelledError:
+        raise
     except Exception as e:
         import traceback
         logger.error(f"Manim error for section {section_index}: {e}")
@@ -567,7 +579,7 @@ async def _generate_audio_whole_section(
         # Single segment — no splitting needed
         seg_dir = section_dir / "seg_0"
         seg_dir.mkdir(exist_ok=True)
-        shutil.copy2(str(section_audio_path), str(seg_dir / "audio.mp3"))
+        place_file(section_audio_path, seg_dir / "audio.mp3")
         return [
             {
                 "segment_index": 0,
@@ -1084,7 +1096,7 @@ async def _trim_segment_edges(
 
     Uses ffmpeg's ``silenceremove`` filter with the *reverse* trick so
     that both the head and tail of the file are cleaned in one pass.
-    Falls back to a raw copy if the filter fails.
+    Falls back to the raw segment (moved into place) if the filter fails.
     """
     af_filter = (
         f"silenceremove=start_periods=1:start_silence={min_silence}:start_threshold={threshold},"
@@ -1105,14 +1117,19 @@ async def _trim_segment_edges(
             *cmd,
             stdout=asyncio.subprocess.PIPE,
             stderr=asyncio.subprocess.PIPE,
+            start_new_session=True,
         )
-        _, stderr = await proc.communicate()
+        with track_process(proc):
+            _, stderr = await proc.communicate()
+        raise_if_cancelled()
         if proc.returncode != 0:
             logger.warning(f"Edge trim failed, using raw segment: {stderr.decode()[:200]}")
-            shutil.copy2(input_path, output_path)
+            place_file(input_path, output_path, move=True)
+    except JobCancelledError:
+        raise
     except Exception as e:
         logger.warning(f"Edge trim error, using raw: {e}")
-        shutil.copy2(input_path, output_path)
+        place_file(input_path, output_path, move=True)
     finally:
         # Clean up the raw intermediate file
         try:
@@ -1160,8 +1177,11 @@ async def _split_audio_at_ranges(
                 *cmd,
                 stdout=asyncio.subprocess.PIPE,
                 stderr=asyncio.subprocess.PIPE,
+                start_new_session=True,
             )
-            await proc.communicate()
+            with track_process(proc):
+                await proc.communicate()
+            raise_if_cancelled()
 
             await _trim_segment_edges(str(raw_seg_path), str(seg_audio_path))
 
@@ -1183,6 +1203,8 @@ async def _split_audio_at_ranges(
                 f"(range {start_time:.2f}s\u2013{end_time:.2f}s)"
             )
 
+        except JobCancelledError:
+            raise
         except Exception as e:
             logger.error(f"Error extracting segment {seg_idx}: {e}")
             segment_info = {
@@ -1285,7 +1307,7 @@ async def process_segments_audio_first(
         if len(valid_audio_paths) > 1:
             await concatenate_audio_files(valid_audio_paths, str(section_audio_path))
         elif len(valid_audio_paths) == 1:
-            shutil.copy(valid_audio_paths[0], str(section_audio_path))
+            place_file(valid_audio_paths[0], section_audio_path)
         else:
             logger.warning(f"Section {section_index}: No valid audio segments")
             return result
@@ -1365,6 +1387,10 @@ async def process_segments_audio_first(
             result["manim_code_path"] = manim_result["manim_code_path"]
         if isinstance(manim_result, dict) and manim_result.get("choreography_plan_path"):
             result["choreography_plan_path"] = manim_result["choreography_plan_path"]
+        if isinstance(manim_result, dict) and manim_result.get("degraded"):
+            result["degraded"] = manim_result["degraded"]
+    except JobCancelledError:
+        raise
     except Exception as e:
         logger.error(f"Manim error for unified section {section_index}: {e}")
         import traceback
@@ -1400,9 +1426,12 @@ async def process_segments_audio_first(
         process = await asyncio.create_subprocess_exec(
             *cmd,
             stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE
+            stderr=asyncio.subprocess.PIPE,
+            start_new_session=True,
         )
-        _, stderr = await asyncio.wait_for(process.communicate(), timeout=300)
+        with track_process(process):
+            _, stderr = await asyncio.wait_for(process.communicate(), timeout=300)
+        raise_if_cancelled()
 
         if process.returncode == 0 and merged_path.exists():
             result["video_path"] = str(merged_path)
@@ -1412,6 +1441,8 @@ async def process_segments_audio_first(
         else:
             logger.error(f"Section {section_index}: FFmpeg merge failed: {stderr.decode()[:500]}")
             write_status(section_dir, "fixing_error", "FFmpeg merge failed")
+    except JobCancelledError:
+        raise
     except Exception as e:
         logger.error(f"Section {section_index}: Error merging video and audio: {e}")
         write_status(section_dir, "fixing_error", str(e))
@@ -1446,8 +1477,7 @@ async def merge_segments(
         )
 
         try:
-            result = await asyncio.to_thread(
-                subprocess.run,
+            result = await run_process_async(
                 cmd,
                 capture_output=True,
                 text=True,
@@ -1470,7 +1500,7 @@ async def merge_segments(
     except Exception as e:
         logger.error(f"Error concatenating segments: {e}")
         if merged_clips:
-            shutil.copy(merged_clips[0], str(final_video))
+            place_file(merged_clips[0], final_video)
 
     # Extract audio
     if final_video.exists():
@@ -1523,8 +1553,7 @@ async def merge_subsections(
         )
 
         try:
-            result = await asyncio.to_thread(
-                subprocess.run,
+            result = await run_process_async(
                 cmd,
                 capture_output=True,
                 text=True,
@@ -1548,7 +1577,7 @@ async def merge_subsections(
     except Exception as e:
         logger.error(f"Error concatenating subsections: {e}")
         if merged_clips:
-            shutil.copy(merged_clips[0], str(final_video))
+            place_file(merged_clips[0], final_video)
 
     # Extract audio from final video
     if final_video.exists():
@@ -4,7 +4,7 @@ Refactored to pure orchestration - delegates to specialized components
 """
 
 import shutil
-from typing import Dict, Any, Optional, Callable
+from typing import Dict, Any, List, Optional, Callable, Tuple
 from pathlib import Path
 
 from ..content_analysis import MaterialAnalyzer
@@ -14,9 +14,17 @@ from ..animation.config import normalize_theme_style
 from ..audio import TTSEngine, create_tts_engine
 
 from .processor import VideoProcessor
-from .progress import ProgressTracker
-from .orchestrator import SectionOrchestrator
-from app.core import get_logger, set_job_id, LogTimer
+from .progress import ProgressTracker, JobProgress
+from .orchestrator import SectionOrchestrator, SectionResult
+from app.core import (
+    get_logger,
+    set_job_id,
+    LogTimer,
+    JobCancelledError,
+    CancellationToken,
+    bind_cancellation_token,
+    get_cancellation_registry,
+)
 from app.services.pipeline.animation.generation.constants import DEFAULT_THEME_CODE
 
 logger = get_logger(__name__, component="video_generator")
@@ -176,10 +184,15 @@ class VideoGenerator:
             - chapters: List of chapter metadata
             - total_duration: Total video duration
             - cost_summary: Generation cost breakdown
-            - status: "completed" or "failed"
-            - error: Error message (if failed)
+            - status: "completed", "failed" or "cancelled"
+            - error: Error message (if failed or cancelled)
+
+        The run is bound to a job-scoped cancellation token; cancelling the job
+        (e.g. on deletion) stops in-flight stages and kills their subprocesses.
         """
-        with LogTimer(logger, f"generate_video (job: {job_id[:8]})"):
+        cancel_registry = get_cancellation_registry()
+        with LogTimer(logger, f"generate_video (job: {job_id[:8]})"), \
+                bind_cancellation_token(cancel_registry.open(job_id)) as cancel_token:
             set_job_id(job_id)
 
             try:
@@ -219,41 +232,18 @@ class VideoGenerator:
                     }
 
                 # Step 2: Generate or load script
-                if progress.has_script and resume:
-                    logger.info("Loading existing script for resume")
-                    tracker.report_stage_progress("script", 100, "Loaded existing script")
-                    script = tracker.load_script()
-                else:
-                    logger.info(f"Generating new script (video_mode: {video_mode})")
-                    script = await self._generate_script(
-                        job_id=job_id,
-                        material_path=material_path,
-                        topic=topic,
-                        language=language,
-                        video_mode=video_mode,
-                        content_focus=content_focus,
-                        document_context=document_context,
-                        tracker=tracker,
-                        artifacts_dir=str(sections_dir),
-                    )
-                    tracker.save_script(script)
-
-                # Extract sections from script (script generator wraps it in {"script": {...}})
-                script_data = script.get("script", script)  # Support both wrapped and unwrapped formats
-                sections = script_data.get("sections", [])
-                if not sections:
-                    raise ValueError("Script has no sections")
-
-                effective_language = self._resolve_output_language(language, script, script_data)
-                script_data["language"] = effective_language
-                script_data["output_language"] = effective_language
-                script["output_language"] = effective_language
-
-                for section in sections:
-                    section.setdefault("content_focus", content_focus)
-                    section.setdefault("video_mode", video_mode)
-                    section.setdefault("document_context", document_context)
-                    section["language"] = effective_language
+                script, sections, effective_language = await cancel_token.run(self.prepare_script(
+                    job_id=job_id,
+                    tracker=tracker,
+                    progress=progress,
+                    material_path=material_path,
+                    topic=topic,
+                    language=language,
+                    video_mode=video_mode,
+                    content_focus=content_focus,
+                    document_context=document_context,
+                    resume=resume,
+                ))
 
                 logger.info(f"Processing {len(sections)} sections", extra={
                     "section_count": len(sections),
@@ -261,14 +251,11 @@ class VideoGenerator:
                 })
 
                 # Step 3: Process sections in parallel
-                orchestrator = SectionOrchestrator(
-                    manim_generator=self.manim_generator,
-                    tts_engine=self.tts_engine,
-                    progress_tracker=tracker,
-                    max_concurrent=max_concurrent_sections
+                orchestrator = self._create_orchestrator(
+                    tracker, max_concurrent=max_concurrent_sections, cancel_token=cancel_token
                 )
 
-                section_results = await orchestrator.process_sections_parallel(
+                section_results = await cancel_token.run(orchestrator.process_sections_parallel(
                     sections=sections,
                     sections_dir=sections_dir,
                     voice=voice,
@@ -276,72 +263,27 @@ class VideoGenerator:
                     language=effective_language,
                     resume=resume,
                     job_id=job_id
-                )
+                ))
 
-                # Step 4: Aggregate results
-                section_videos, section_audios, chapters = orchestrator.aggregate_results(
+                # Steps 4-7: Aggregate, combine, report cost and clean up
+                return await cancel_token.run(self.assemble_video(
+                    job_id=job_id,
+                    script=script,
                     section_results=section_results,
-                    sections=sections
-                )
-
-                # Save updated script with section paths
-                tracker.save_script(script)
-                logger.info("Saved updated script with section metadata", extra={
-                    "section_count": len(sections)
-                })
-
-                # Step 5: Combine sections into final video
-                tracker.report_stage_progress("combining", 0, "Combining sections...")
-
-                final_video_path = job_dir / "final_video.mp4"
-
-                if section_videos and section_audios:
-                    await self.video_processor.combine_sections(
-                        videos=section_videos,
-                        audios=section_audios,
-                        output_path=str(final_video_path),
-                        sections_dir=str(sections_dir)
-                    )
-                elif section_videos:
-                    await self.video_processor.concatenate_videos(
-                        video_paths=section_videos,
-                        output_path=str(final_video_path)
-                    )
-                else:
-                    raise ValueError("No video sections were generated")
-
-                tracker.report_stage_progress("combining", 100, "Video complete!")
+                    tracker=tracker,
+                    orchestrator=orchestrator,
+                ))
 
-                # Step 6: Report cost summary
-                self.manim_generator.print_cost_summary()
-
-                cost_summary = self.manim_generator.get_cost_summary()
-
-                # Calculate total duration
-                total_duration = sum(chapter["duration"] for chapter in chapters)
-
-                # Step 7: Cleanup
-                await self._cleanup_intermediate_files(sections_dir)
-
-                logger.info("Video generation completed successfully", extra={
+            except JobCancelledError as e:
+                logger.warning("Video generation cancelled", extra={
                     "job_id": job_id,
-                    "video_path": str(final_video_path),
-                    "section_count": len(sections),
-                    "total_duration": total_duration,
-                    "total_cost": cost_summary.get("total_cost_usd", 0)
+                    "reason": e.reason
                 })
 
-                # Unwrap script for the return value (extract inner script from wrapper)
-                return_script = script_data  # script_data is already the unwrapped version
-
                 return {
                     "job_id": job_id,
-                    "video_path": str(final_video_path),
-                    "script": return_script,
-                    "chapters": chapters,
-                    "total_duration": total_duration,
-                    "cost_summary": cost_summary,
-                    "status": "completed"
+                    "error": str(e),
+                    "status": "cancelled"
                 }
 
             except Exception as e:
@@ -350,12 +292,212 @@ class VideoGenerator:
                     "error": str(e)
                 }, exc_info=True)
 
+                # Stop anything still running on behalf of the failed job
+                cancel_token.cancel("failed")
+
                 return {
                     "job_id": job_id,
                     "error": str(e),
                     "status": "failed"
                 }
 
+            finally:
+                cancel_registry.release(cancel_token)
+
+    def _create_orchestrator(
+        self,
+        tracker: ProgressTracker,
+        max_concurrent: int = 3,
+        cancel_token: Optional[CancellationToken] = None,
+    ) -> SectionOrchestrator:
+        return SectionOrchestrator(
+            manim_generator=self.manim_generator,
+            tts_engine=self.tts_engine,
+            progress_tracker=tracker,
+            max_concurrent=max_concurrent,
+            cancel_token=cancel_token
+        )
+
+    async def prepare_script(
+        self,
+        job_id: str,
+        tracker: ProgressTracker,
+        progress: Optional[JobProgress] = None,
+        material_path: Optional[str] = None,
+        topic: Optional[Dict[str, Any]] = None,
+        language: str = "en",
+        video_mode: str = "comprehensive",
+        content_focus: str = "as_document",
+        document_context: str = "auto",
+        resume: bool = False,
+    ) -> Tuple[Dict[str, Any], List[Dict[str, Any]], str]:
+        """
+        Generate or load the script and stamp per-section generation settings
+
+        Returns:
+            Tuple of (script, sections, effective_language). ``sections`` are
+            the live section dicts inside ``script``.
+        """
+        progress = progress or tracker.check_existing_progress()
+
+        if progress.has_script and resume:
+            logger.info("Loading existing script for resume")
+            tracker.report_stage_progress("script", 100, "Loaded existing script")
+            script = tracker.load_script()
+        else:
+            logger.info(f"Generating new script (video_mode: {video_mode})")
+            script = await self._generate_script(
+                job_id=job_id,
+                material_path=material_path,
+                topic=topic,
+                language=language,
+                video_mode=video_mode,
+                content_focus=content_focus,
+                document_context=document_context,
+                tracker=tracker,
+                artifacts_dir=str(tracker.sections_dir),
+            )
+            tracker.save_script(script)
+
+        # Extract sections from script (script generator wraps it in {"script": {...}})
+        script_data = script.get("script", script)  # Support both wrapped and unwrapped formats
+        sections = script_data.get("sections", [])
+        if not sections:
+            raise ValueError("Script has no sections")
+
+        effective_language = self._resolve_output_language(language, script, script_data)
+        script_data["language"] = effective_language
+        script_data["output_language"] = effective_language
+        script["output_language"] = effective_language
+
+        for section in sections:
+            section.setdefault("content_focus", content_focus)
+            section.setdefault("video_mode", video_mode)
+            section.setdefault("document_context", document_context)
+            section["language"] = effective_language
+
+        return script, sections, effective_language
+
+    async def process_section(
+        self,
+        job_id: str,
+        section_index: int,
+        voice: str = "en-US-Neural2-J",
+        style: str = DEFAULT_THEME_CODE,
+    ) -> SectionResult:
+        """
+        Process one section of a job whose script is already saved
+
+        Used by queue workers, which run sections as independent tasks.
+        Completed sections on disk are reused, so retries are idempotent.
+        """
+        tracker = ProgressTracker(job_id, self.output_base_dir)
+        progress = tracker.check_existing_progress()
+        if not progress.has_script or progress.script is None:
+            raise FileNotFoundError(f"No script saved for job {job_id}")
+
+        sections = progress.script.get("sections", [])
+        if section_index >= len(sections):
+            raise IndexError(f"Section {section_index} out of range ({len(sections)} sections)")
+        section = sections[section_index]
+
+        orchestrator = self._create_orchestrator(tracker, max_concurrent=1)
+        return await orchestrator.process_section(
+            section_index=section_index,
+            section=section,
+            sections_dir=tracker.sections_dir,
+            voice=voice,
+            style=normalize_theme_style(style),
+            language=section.get("language") or progress.script.get("language", "en"),
+            total_sections=len(sections),
+            job_id=job_id,
+        )
+
+    async def assemble_video(
+        self,
+        job_id: str,
+        script: Dict[str, Any],
+        section_results: List[SectionResult],
+        tracker: ProgressTracker,
+        orchestrator: Optional[SectionOrchestrator] = None,
+    ) -> Dict[str, Any]:
+        """
+        Combine processed sections into the final video
+
+        Aggregates section results into the script, combines the section
+        videos, reports cost and removes intermediates.
+
+        Returns:
+            The completed generation result (see generate_video)
+        """
+        orchestrator = orchestrator or self._create_orchestrator(tracker)
+        script_data = script.get("script", script)
+        sections = script_data.get("sections", [])
+        sections_dir = tracker.sections_dir
+
+        # Step 4: Aggregate results
+        section_videos, section_audios, chapters = orchestrator.aggregate_results(
+            section_results=section_results,
+            sections=sections
+        )
+
+        # Save updated script with section paths
+        tracker.save_script(script)
+        logger.info("Saved updated script with section metadata", extra={
+            "section_count": len(sections)
+        })
+
+        # Step 5: Combine sections into final video
+        tracker.report_stage_progress("combining", 0, "Combining sections...")
+
+        final_video_path = tracker.job_dir / "final_video.mp4"
+
+        if section_videos and section_audios:
+            await self.video_processor.combine_sections(
+                videos=section_videos,
+                audios=section_audios,
+                output_path=str(final_video_path),
+                sections_dir=str(sections_dir)
+            )
+        elif section_videos:
+            await self.video_processor.concatenate_videos(
+                video_paths=section_videos,
+                output_path=str(final_video_path)
+            )
+        else:
+            raise ValueError("No video sections were generated")
+
+        tracker.report_stage_progress("combining", 100, "Video complete!")
+
+        # Step 6: Report cost summary
+        self.manim_generator.print_cost_summary()
+
+        cost_summary = self.manim_generator.get_cost_summary()
+
+        # Calculate total duration
+        total_duration = sum(chapter["duration"] for chapter in chapters)
+
+        # Step 7: Cleanup
+        await self._cleanup_intermediate_files(sections_dir)
+
+        logger.info("Video generation completed successfully", extra={
+            "job_id": job_id,
+            "video_path": str(final_video_path),
+            "section_count": len(sections),
+            "total_duration": total_duration,
+            "total_cost": cost_summary.get("total_cost_usd", 0)
+        })
+
+        return {
+            "job_id": job_id,
+            "video_path": str(final_video_path),
+            "script": script_data,  # unwrapped script
+            "chapters": chapters,
+            "total_duration": total_duration,
+            "cost_summary": cost_summary,
+            "status": "completed"
+        }
+
     async def _generate_script(
         self,
         job_id: str,
@@ -10,11 +10,13 @@ Following Clean Architecture principles:
 Modules:
 - base: Base use case abstract class
 - file_upload_use_case: Handle file uploads
+- queued_generation: Generation as durable queue tasks for worker processes
 """
 
 from .base import UseCase
 from .file_upload_use_case import FileUploadUseCase, FileUploadRequest, FileUploadResponse
 from .generation_use_case import GenerationUseCase
+from .queued_generation import QueuedGeneration
 
 __all__ = [
     "UseCase",
@@ -22,4 +24,5 @@ __all__ = [
     "FileUploadRequest",
     "FileUploadResponse",
     "GenerationUseCase",
+    "QueuedGeneration",
 ]
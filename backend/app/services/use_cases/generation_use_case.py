@@ -8,6 +8,7 @@ HTTP to request objects and schedule work.
 
 import uuid
 import traceback
+from datetime import datetime
 from typing import Callable, Optional, Dict, Any, List
 
 from fastapi import HTTPException, BackgroundTasks
@@ -17,9 +18,19 @@ from app.config.models import list_available_pipelines
 from app.models import GenerationRequest, JobResponse, ResumeInfo
 from app.services.pipeline.assembly import VideoGenerator, generate_thumbnail
 from app.services.pipeline.animation.config import normalize_theme_style
-from app.services.infrastructure.orchestration import get_job_manager, JobStatus
+from app.services.infrastructure.orchestration import get_job_manager, JobStatus, task_queue_enabled
 from app.services.infrastructure.storage import FileBasedAnalysisRepository
-from app.core import find_uploaded_file, save_video_info, create_video_info_from_result
+from app.core import (
+    find_uploaded_file,
+    save_video_info,
+    create_video_info_from_result,
+    PriorityClass,
+    parse_priority,
+    priority_scope,
+    ErrorInfo,
+    save_error_info,
+)
+from .queued_generation import QueuedGeneration
 
 
 class GenerationUseCase:
@@ -56,7 +67,19 @@ class GenerationUseCase:
         }
         return aliases.get(value, "auto")
 
-    def _select_job(self, resume_job_id: Optional[str]) -> tuple[str, bool]:
+    @staticmethod
+    def _resolve_priority(priority: Optional[str]) -> PriorityClass:
+        """Full generations run as normal or bulk; interactive is reserved for editor actions."""
+        resolved = parse_priority(priority)
+        if resolved == PriorityClass.INTERACTIVE:
+            return PriorityClass.NORMAL
+        return resolved
+
+    def _select_job(
+        self,
+        resume_job_id: Optional[str],
+        priority: PriorityClass = PriorityClass.NORMAL,
+    ) -> tuple[str, bool]:
         """Create or reuse a job id; returns (job_id, resume_mode)."""
         resume_mode = False
         if resume_job_id:
@@ -65,7 +88,7 @@ class GenerationUseCase:
                 self.job_manager.update_job(resume_job_id, JobStatus.ANALYZING, 0, "Resuming generation...")
                 return resume_job_id, True
         job_id = str(uuid.uuid4())
-        self.job_manager.create_job(job_id)
+        self.job_manager.create_job(job_id, priority=priority.value)
         return job_id, resume_mode
 
     def _resolve_selected_topic_payload(self, request: GenerationRequest) -> Dict[str, Any]:
@@ -176,7 +199,11 @@ class GenerationUseCase:
         """Validate input, enqueue generation work, and return initial response."""
         pipeline_name = self._validate_pipeline(request.pipeline)
 
-        job_id, resume_mode = self._select_job(request.resume_job_id)
+        job_id, resume_mode = self._select_job(
+            request.resume_job_id, self._resolve_priority(request.priority)
+        )
+        job = self.job_manager.get_job(job_id)
+        priority = parse_priority(job.priority if job else request.priority)
 
         # Instantiate video generator (pipeline-scoped)
         video_generator = VideoGenerator(str(OUTPUT_DIR), pipeline_name=pipeline_name)
@@ -223,95 +250,47 @@ class GenerationUseCase:
                     f"{'Resuming' if resume_mode else 'Generating'} {request.video_mode} video..."
                 )
 
-                result = await video_generator.generate_video(
-                    job_id=job_id,
-                    material_path=file_path,
-                    topic=topic_payload,
-                    voice=request.voice,
-                    style=normalize_theme_style(request.style),
-                    language=request.language,
-                    video_mode=request.video_mode,
-                    content_focus=self._normalize_content_focus(request.content_focus),
-                    document_context=self._normalize_document_context(request.document_context),
-                    resume=resume_mode,
-                    progress_callback=self._get_progress_callback(job_id),
-                )
-
-                if result.get("status") == "completed":
-                    script = result.get("script", {})
-                    
-                    # Generate thumbnail
-                    duration = result.get("total_duration") or sum(c.get("duration", 0) for c in result.get("chapters", []))
-                    thumb_time = min(duration / 2, 5.0)  # Capture at 5s or halfway point
-    
-                    video_path = str(OUTPUT_DIR / job_id / "final_video.mp4")
-                    thumb_path = str(OUTPUT_DIR / job_id / "thumbnail.jpg")
-                    thumbnail_url = None
-                    
-                    if await generate_thumbnail(video_path, thumb_path, time=thumb_time):
-                        thumbnail_url = f"/outputs/{job_id}/thumbnail.jpg"
-
-                    video_result = {
-                        "video_id": job_id,
-                        "title": script.get("title", "Educational Video"),
-                        "duration": duration,
-                        "chapters": result.get("chapters", []),
-                        "download_url": f"/outputs/{job_id}/final_video.mp4",
-                        "thumbnail_url": thumbnail_url,
-                    }
-                    
-                    # Persist video metadata alongside the video file
-                    video_info = create_video_info_from_result(job_id, video_result)
-                    save_video_info(video_info)
-                    
-                    self.job_manager.update_job(
-                        job_id,
-                        JobStatus.COMPLETED,
-                        100,
-                        "Video generated successfully!",
-                        result=[video_result],
-                    )
-                else:
-                    error_msg = result.get("error", "Video generation failed")
-                    
-                    # Persist error info
-                    from datetime import datetime
-                    from app.core import ErrorInfo, save_error_info
-                    
-                    error_info = ErrorInfo(
+                with priority_scope(priority):
+                    result = await video_generator.generate_video(
                         job_id=job_id,
-                        error_message=error_msg,
-                        stage="generation",
-                        timestamp=datetime.now().isoformat(),
-                    )
-                    save_error_info(error_info)
-                    
-                    self.job_manager.update_job(
-                        job_id,
-                        JobStatus.FAILED,
-                        0,
-                        error_msg,
+                        material_path=file_path,
+                        topic=topic_payload,
+                        voice=request.voice,
+                        style=normalize_theme_style(request.style),
+                        language=request.language,
+                        video_mode=request.video_mode,
+                        content_focus=self._normalize_content_focus(request.content_focus),
+                        document_context=self._normalize_document_context(request.document_context),
+                        resume=resume_mode,
+                        progress_callback=self._get_progress_callback(job_id),
                     )
 
+                await self.record_result(job_id, result)
+
             except Exception as e:  # noqa: BLE001
                 traceback.print_exc()
-                error_msg = f"Error: {str(e)}"
-                
-                # Persist error info for exceptions too
-                from datetime import datetime
-                from app.core import ErrorInfo, save_error_info
-                
-                error_info = ErrorInfo(
-                    job_id=job_id,
-                    error_message=error_msg,
-                    stage="exception",
-                    timestamp=datetime.now().isoformat(),
-                )
-                save_error_info(error_info)
-                
-                self.job_manager.update_job(job_id, JobStatus.FAILED, 0, error_msg)
-
-        background_tasks.add_task(run_generation)
+                self.record_failure(job_id, f"Error: {str(e)}", stage="exception")
+
+        if task_queue_enabled():
+            # Durable path: worker processes pick the job up from the task queue
+            QueuedGeneration(use_case=self).enqueue(
+                job_id,
+                priority=priority,
+                params={
+                    "pipeline": pipeline_name,
+                    "material_path": file_path,
+                    "topic": topic_payload,
+                    "voice": request.voice,
+                    "style": normalize_theme_style(request.style),
+                    "language": request.language,
+                    "video_mode": request.video_mode,
+                    "content_focus": self._normalize_content_focus(request.content_focus),
+                    "document_context": self._normalize_document_context(request.document_context),
+                    "resume": resume_mode,
+                },
+            )
+        else:
+            background_tasks.add_task(run_generation)
 
         return JobResponse(
             job_id=job_id,
@@ -320,6 +299,63 @@ class GenerationUseCase:
             message="Resuming video generation..." if resume_mode else "Video generation started",
         )
 
+    async def record_result(self, job_id: str, result: Dict[str, Any]) -> None:
+        """Persist the outcome of a generation run and update the job."""
+        if result.get("status") == "cancelled":
+            # Job was deleted/cancelled while running; nothing left to record
+            print(f"[Generation] Job {job_id} cancelled: {result.get('error')}")
+            return
+
+        if result.get("status") != "completed":
+            self.record_failure(job_id, result.get("error", "Video generation failed"), stage="generation")
+            return
+
+        script = result.get("script", {})
+
+        # Generate thumbnail
+        duration = result.get("total_duration") or sum(c.get("duration", 0) for c in result.get("chapters", []))
+        thumb_time = min(duration / 2, 5.0)  # Capture at 5s or halfway point
+
+        video_path = str(OUTPUT_DIR / job_id / "final_video.mp4")
+        thumb_path = str(OUTPUT_DIR / job_id / "thumbnail.jpg")
+        thumbnail_url = None
+
+        if await generate_thumbnail(video_path, thumb_path, time=thumb_time):
+            thumbnail_url = f"/outputs/{job_id}/thumbnail.jpg"
+
+        video_result = {
+            "video_id": job_id,
+            "title": script.get("title", "Educational Video"),
+            "duration": duration,
+            "chapters": result.get("chapters", []),
+            "download_url": f"/outputs/{job_id}/final_video.mp4",
+            "thumbnail_url": thumbnail_url,
+        }
+
+        # Persist video metadata alongside the video file
+        video_info = create_video_info_from_result(job_id, video_result)
+        save_video_info(video_info)
+
+        self.job_manager.update_job(
+            job_id,
+            JobStatus.COMPLETED,
+            100,
+            "Video generated successfully!",
+            result=[video_result],
+        )
+
+    def record_failure(self, job_id: str, error_msg: str, stage: str = "generation") -> None:
+        """Persist error info and mark the job failed."""
+        error_info = ErrorInfo(
+            job_id=job_id,
+            error_message=error_msg,
+            stage=stage,
+            timestamp=datetime.now().isoformat(),
+        )
+        save_error_info(error_info)
+
+        self.job_manager.update_job(job_id, JobStatus.FAILED, 0, error_msg)
+
     def get_resume_info(self, job_id: str) -> ResumeInfo:
         job = self.job_manager.get_job(job_id)
         if not job:
@@ -0,0 +1,260 @@
+"""
+QueuedGeneration - video generation as durable, section-level queue tasks
+
+With TASK_QUEUE_ENABLED the API does not run generation in-process. It
+enqueues a script task; worker processes (``python -m app.worker``) then run:
+
+1. ``generation.script``   - generate/load the script, fan out the tasks below
+2. ``generation.section``  - TTS + animation + merge for one section (retried)
+3. ``generation.assemble`` - waits for all sections, combines the final video
+
+Every task is idempotent: the script task reuses a saved script on retry,
+section tasks reuse completed section outputs, and fan-out uses dedupe keys.
+Workers update the JobManager directly, so job status survives API restarts.
+"""
+
+import uuid
+from dataclasses import asdict
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+from app.config import OUTPUT_DIR
+from app.core import get_logger, PriorityClass
+from app.models.status import JobStatus
+from app.services.infrastructure.orchestration import (
+    get_job_manager,
+    get_task_queue,
+    QueuedTask,
+    SqliteTaskQueue,
+    TaskDeferred,
+    TaskStatus,
+)
+from app.services.pipeline.assembly import VideoGenerator
+from app.services.pipeline.assembly.orchestrator import SectionResult
+from app.services.pipeline.assembly.progress import ProgressTracker
+
+if TYPE_CHECKING:
+    from .generation_use_case import GenerationUseCase
+
+logger = get_logger(__name__, component="queued_generation")
+
+SCRIPT_TASK = "generation.script"
+SECTION_TASK = "generation.section"
+ASSEMBLE_TASK = "generation.assemble"
+
+ASSEMBLE_POLL_INTERVAL = 3.0
+# Assembly only fails on ffmpeg errors or missing sections; waiting is free
+ASSEMBLE_MAX_ATTEMPTS = 2
+
+
+class QueuedGeneration:
+    """Producer and worker-side handlers for queued generation jobs."""
+
+    def __init__(
+        self,
+        queue: Optional[SqliteTaskQueue] = None,
+        use_case: Optional["GenerationUseCase"] = None,
+    ):
+        self.queue = queue or get_task_queue()
+        self.job_manager = get_job_manager()
+        self._use_case = use_case
+        self._generators: Dict[Optional[str], VideoGenerator] = {}
+
+    @property
+    def use_case(self) -> "GenerationUseCase":
+        if self._use_case is None:
+            from .generation_use_case import GenerationUseCase
+            self._use_case = GenerationUseCase()
+        return self._use_case
+
+    def _generator(self, pipeline: Optional[str]) -> VideoGenerator:
+        """One VideoGenerator per pipeline per worker process"""
+        if pipeline not in self._generators:
+            self._generators[pipeline] = VideoGenerator(str(OUTPUT_DIR), pipeline_name=pipeline)
+        return self._generators[pipeline]
+
+    # ------------------------------------------------------------------
+    # Producer
+    # ------------------------------------------------------------------
+
+    def enqueue(
+        self,
+        job_id: str,
+        params: Dict[str, Any],
+        priority: PriorityClass = PriorityClass.NORMAL,
+    ) -> str:
+        """Enqueue the script task of a new generation run."""
+        run_id = uuid.uuid4().hex
+        payload = {**params, "job_id": job_id, "run_id": run_id, "priority": priority.value}
+        self.job_manager.update_job(job_id, JobStatus.PENDING, 0, "Queued for generation...")
+        return self.queue.enqueue(
+            SCRIPT_TASK,
+            payload,
+            job_id=job_id,
+            priority=priority,
+            dedupe_key=f"{run_id}:script",
+        )
+
+    def handlers(self) -> Dict[str, Any]:
+        return {
+            SCRIPT_TASK: self.handle_script,
+            SECTION_TASK: self.handle_section,
+            ASSEMBLE_TASK: self.handle_assemble,
+        }
+
+    # ------------------------------------------------------------------
+    # Handlers
+    # ------------------------------------------------------------------
+
+    async def handle_script(self, task: QueuedTask) -> Dict[str, Any]:
+        p = task.payload
+        job_id = p["job_id"]
+        generator = self._generator(p.get("pipeline"))
+        tracker = ProgressTracker(
+            job_id, generator.output_base_dir, self.use_case._get_progress_callback(job_id)
+        )
+        tracker.sections_dir.mkdir(parents=True, exist_ok=True)
+
+        self.job_manager.update_job(
+            job_id,
+            JobStatus.GENERATING_SCRIPT,
+            0,
+            f"{'Resuming' if p.get('resume') else 'Generating'} {p.get('video_mode')} video...",
+        )
+
+        # A retried script task reuses the script saved by the failed attempt
+        script, sections, _ = await generator.prepare_script(
+            job_id=job_id,
+            tracker=tracker,
+            material_path=p.get("material_path"),
+            topic=p.get("topic"),
+            language=p.get("language", "en"),
+            video_mode=p.get("video_mode", "comprehensive"),
+            content_focus=p.get("content_focus", "as_document"),
+            document_context=p.get("document_context", "auto"),
+            resume=bool(p.get("resume")) or task.attempts > 1,
+        )
+        tracker.save_script(script)
+
+        section_payload = {
+            key: p.get(key) for key in ("job_id", "run_id", "pipeline", "voice", "style", "priority")
+        }
+        section_payload["section_count"] = len(sections)
+        for i in range(len(sections)):
+            self.queue.enqueue(
+                SECTION_TASK,
+                {**section_payload, "section_index": i},
+                job_id=job_id,
+                priority=p.get("priority"),
+                dedupe_key=f"{p['run_id']}:section:{i}",
+            )
+        self.queue.enqueue(
+            ASSEMBLE_TASK,
+            section_payload,
+            job_id=job_id,
+            priority=p.get("priority"),
+            max_attempts=ASSEMBLE_MAX_ATTEMPTS,
+            dedupe_key=f"{p['run_id']}:assemble",
+        )
+
+        self._report_sections(job_id, p["run_id"], len(sections))
+        return {"section_count": len(sections)}
+
+    async def handle_section(self, task: QueuedTask) -> Dict[str, Any]:
+        p = task.payload
+        result = await self._generator(p.get("pipeline")).process_section(
+            job_id=p["job_id"],
+            section_index=p["section_index"],
+            voice=p.get("voice") or "en-US-Neural2-J",
+            style=p.get("style"),
+        )
+        if not result.is_successful():
+            # Raise so the queue retries the section with backoff
+            raise RuntimeError(result.error or f"Section {p['section_index']} produced no video")
+
+        # Count this section as done before the task row is marked succeeded
+        self._report_sections(p["job_id"], p["run_id"], p["section_count"], extra_done=1)
+        return asdict(result)
+
+    async def handle_assemble(self, task: QueuedTask) -> Dict[str, Any]:
+        p = task.payload
+        job_id = p["job_id"]
+        section_tasks = self._run_tasks(job_id, p["run_id"], SECTION_TASK)
+
+        if any(not t.is_terminal for t in section_tasks):
+            raise TaskDeferred(ASSEMBLE_POLL_INTERVAL, reason="sections still running")
+        if any(t.status == TaskStatus.CANCELLED for t in section_tasks):
+            return {"status": "cancelled"}
+
+        section_results = self._section_results(section_tasks, p["section_count"])
+
+        generator = self._generator(p.get("pipeline"))
+        tracker = ProgressTracker(
+            job_id, generator.output_base_dir, self.use_case._get_progress_callback(job_id)
+        )
+        result = await generator.assemble_video(
+            job_id=job_id,
+            script=tracker.load_script(),
+            section_results=section_results,
+            tracker=tracker,
+        )
+        await self.use_case.record_result(job_id, result)
+        return {"status": result.get("status"), "total_duration": result.get("total_duration")}
+
+    async def on_dead(self, task: QueuedTask) -> None:
+        """Fail the job when its script or assembly task runs out of attempts.
+
+        Dead section tasks are left to the assembly task, which - like the
+        in-process pipeline - combines the sections that did succeed.
+        """
+        if task.kind == SECTION_TASK or not task.job_id:
+            return
+        stage = "script" if task.kind == SCRIPT_TASK else "assembly"
+        self.use_case.record_failure(
+            task.job_id,
+            f"Error: {stage} failed after {task.attempts} attempt(s): {task.error}",
+            stage=f"queue_{stage}",
+        )
+        self.queue.cancel_job(task.job_id)
+
+    # ------------------------------------------------------------------
+    # Helpers
+    # ------------------------------------------------------------------
+
+    def _run_tasks(self, job_id: str, run_id: str, kind: str) -> List[QueuedTask]:
+        return [
+            t for t in self.queue.list_tasks(job_id=job_id, kind=kind)
+            if t.payload.get("run_id") == run_id
+        ]
+
+    @staticmethod
+    def _section_results(section_tasks: List[QueuedTask], section_count: int) -> List[SectionResult]:
+        by_index = {t.payload["section_index"]: t for t in section_tasks}
+        results = []
+        for i in range(section_count):
+            t = by_index.get(i)
+            if t is not None and t.status == TaskStatus.SUCCEEDED and t.result:
+                results.append(SectionResult(**t.result))
+            else:
+                results.append(SectionResult(
+                    index=i,
+                    video_path=None,
+                    audio_path=None,
+                    duration=0.0,
+                    title=f"Section {i + 1}",
+                    error=(t.error if t is not None else None) or "Section task missing",
+                ))
+        return results
+
+    def _report_sections(self, job_id: str, run_id: str, total: int, extra_done: int = 0) -> None:
+        done = extra_done + sum(
+            1 for t in self._run_tasks(job_id, run_id, SECTION_TASK)
+            if t.status in (TaskStatus.SUCCEEDED, TaskStatus.FAILED)
+        )
+        done = min(done, total)
+        progress = 10 + (done / total * 80 if total else 0)
+        self.job_manager.update_job(
+            job_id,
+            JobStatus.CREATING_ANIMATIONS,
+            progress,
+            f"Section {done}/{total} completed",
+        )
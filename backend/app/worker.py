@@ -0,0 +1,108 @@
+"""
+Task worker entrypoint
+
+Runs queued generation work (see services/use_cases/queued_generation.py)
+outside the API process:
+
+    python -m app.worker --processes 3
+
+Each process executes one task at a time, so the process count bounds how
+many sections render concurrently. Workers can be stopped and restarted at
+any time; leased tasks of a killed worker are retried once their visibility
+timeout expires.
+"""
+
+import argparse
+import asyncio
+import multiprocessing
+import os
+import signal
+from pathlib import Path
+from typing import List, Optional
+
+from .core import setup_logging, get_logger
+from .services.infrastructure.orchestration import TaskWorker, get_job_manager, get_task_queue
+from .services.use_cases.queued_generation import QueuedGeneration
+
+logger = get_logger(__name__, service="worker")
+
+
+def _setup_logging() -> None:
+    log_file = os.getenv("LOG_FILE")
+    pipeline_log_file = os.getenv("PIPELINE_LOG_FILE", "logs/animation_pipeline.jsonl")
+    setup_logging(
+        level=os.getenv("LOG_LEVEL", "INFO"),
+        log_file=Path(log_file) if log_file else None,
+        use_json=os.getenv("JSON_LOGS", "false").lower() == "true",
+        pipeline_log_file=Path(pipeline_log_file) if pipeline_log_file else None,
+    )
+
+
+async def run_worker(poll_interval: float = 1.0) -> None:
+    """Run a single worker until SIGINT/SIGTERM."""
+    generation = QueuedGeneration()
+    worker = TaskWorker(
+        get_task_queue(),
+        generation.handlers(),
+        poll_interval=poll_interval,
+        on_dead=generation.on_dead,
+    )
+
+    stop_event = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, stop_event.set)
+        except (NotImplementedError, RuntimeError):
+            pass  # Windows: rely on KeyboardInterrupt
+
+    try:
+        await worker.run(stop_event)
+    finally:
+        get_job_manager().flush()
+
+
+def _worker_process_main(poll_interval: float) -> None:
+    _setup_logging()
+    try:
+        asyncio.run(run_worker(poll_interval))
+    except KeyboardInterrupt:
+        pass
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="EduViz task queue worker")
+    parser.add_argument(
+        "--processes",
+        type=int,
+        default=int(os.getenv("TASK_WORKER_PROCESSES", "3")),
+        help="Number of worker processes (default: TASK_WORKER_PROCESSES or 3)",
+    )
+    parser.add_argument("--poll-interval", type=float, default=1.0)
+    args = parser.parse_args(argv)
+
+    if args.processes <= 1:
+        _worker_process_main(args.poll_interval)
+        return
+
+    ctx = multiprocessing.get_context("spawn")
+    processes = [
+        ctx.Process(target=_worker_process_main, args=(args.poll_interval,), name=f"eduviz-worker-{i}")
+        for i in range(args.processes)
+    ]
+    for process in processes:
+        process.start()
+    logger.info(f"Started {len(processes)} worker processes")
+
+    try:
+        for process in processes:
+            process.join()
+    except KeyboardInterrupt:
+        for process in processes:
+            process.terminate()
+        for process in processes:
+            process.join()
+
+
+if __name__ == "__main__":
+    main()
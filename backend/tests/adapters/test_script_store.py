@@ -0,0 +1,154 @@
+"""
+Tests for adapters/script_store module
+"""
+
+import json
+from unittest.mock import patch
+
+import pytest
+from fastapi import HTTPException
+
+from app.adapters.script_store import ScriptStore
+from app.adapters.scripts_io import (
+    export_script,
+    load_script,
+    load_script_raw,
+    load_script_section,
+    load_section_script,
+    save_script,
+    update_section_fields,
+)
+from app.services.pipeline.assembly.progress import ProgressTracker
+
+
+def _wrapped_script(sections=3):
+    return {
+        "script": {
+            "title": "Waves",
+            "sections": [
+                {"id": f"sec{i}", "title": f"Part {i}", "narration": "é" * 50}
+                for i in range(sections)
+            ],
+            "total_duration_seconds": 90,
+        },
+        "mode": "comprehensive",
+        "output_language": "fr",
+    }
+
+
+@pytest.fixture
+def output_dir(tmp_path):
+    with patch("app.adapters.scripts_io.OUTPUT_DIR", tmp_path):
+        yield tmp_path
+
+
+def test_save_round_trips_and_exports_the_legacy_format(tmp_path):
+    script = _wrapped_script()
+    store = ScriptStore(tmp_path / "job")
+    store.save(script)
+
+    assert store.load() == script
+    assert json.loads(store.legacy_path.read_text(encoding="utf-8")) == script
+    assert list(store.load()["script"]) == ["title", "sections", "total_duration_seconds"]
+    assert store.load_section(1)["title"] == "Part 1"
+    assert store.find_section("sec2")[0] == 2
+
+    unwrapped = {"title": "Plain", "sections": [{"id": "a"}]}
+    store.save(unwrapped)
+    assert store.load() == unwrapped
+    assert sorted(p.name for p in store.sections_dir.iterdir()) == ["0.json"]
+
+
+def test_save_rewrites_only_changed_section_records(tmp_path):
+    script = _wrapped_script()
+    store = ScriptStore(tmp_path / "job")
+    assert store.save(script) == 3
+
+    mtimes = [store.section_path(i).stat().st_mtime_ns for i in range(3)]
+    script["script"]["sections"][1]["video"] = "part1.mp4"
+    assert store.save(script) == 1
+    assert store.section_path(0).stat().st_mtime_ns == mtimes[0]
+    assert store.section_path(2).stat().st_mtime_ns == mtimes[2]
+
+
+def test_unchanged_save_keeps_the_revision_and_files(tmp_path):
+    script = _wrapped_script()
+    store = ScriptStore(tmp_path / "job")
+    store.save(script)
+    revision = store.load_meta()["revision"]
+    mtimes = [p.stat().st_mtime_ns for p in (store.meta_path, store.legacy_path)]
+
+    assert store.save(_wrapped_script()) == 0
+    assert store.load_meta()["revision"] == revision
+    assert [p.stat().st_mtime_ns for p in (store.meta_path, store.legacy_path)] == mtimes
+    assert store.is_exported()
+
+    script["mode"] = "quick"
+    assert store.save(script) == 0
+    assert store.load_meta()["revision"] == revision + 1
+    assert json.loads(store.legacy_path.read_text(encoding="utf-8"))["mode"] == "quick"
+
+
+def test_section_update_writes_one_record_and_exports_on_demand(tmp_path):
+    store = ScriptStore(tmp_path / "job")
+    store.save(_wrapped_script())
+    legacy_mtime = store.legacy_path.stat().st_mtime_ns
+    other_mtime = store.section_path(0).stat().st_mtime_ns
+
+    assert store.update_section(2, {"manim_code": "code"})
+    assert not store.update_section(2, {"manim_code": "code"})
+    assert store.section_path(0).stat().st_mtime_ns == other_mtime
+    assert store.legacy_path.stat().st_mtime_ns == legacy_mtime
+    assert not store.is_exported()
+
+    assert store.export()
+    assert not store.export()
+    legacy = json.loads(store.legacy_path.read_text(encoding="utf-8"))
+    assert legacy["script"]["sections"][2]["manim_code"] == "code"
+
+    assert store.update_section(0, {"id": "intro"})
+    assert store.find_section("intro")[1]["title"] == "Part 0"
+    assert store.find_section("sec0") is None
+
+
+def test_scripts_io_uses_the_store_once_a_job_has_one(output_dir, monkeypatch):
+    monkeypatch.setenv("SCRIPT_STORE_ENABLED", "true")
+    save_script("job-1", _wrapped_script())
+    monkeypatch.delenv("SCRIPT_STORE_ENABLED")
+
+    assert ScriptStore(output_dir / "job-1").exists()
+    assert load_script_raw("job-1")["mode"] == "comprehensive"
+    assert load_script("job-1")["title"] == "Waves"
+    assert load_section_script("job-1", "sec1")["title"] == "Part 1"
+    section, total = load_script_section("job-1", 2)
+    assert (section["id"], total) == ("sec2", 3)
+    with pytest.raises(HTTPException):
+        load_script_section("job-1", 3)
+
+    assert update_section_fields("job-1", "sec1", {"video": "v.mp4"})
+    assert not update_section_fields("job-1", "missing", {"video": "v.mp4"})
+    assert load_section_script("job-1", "sec1")["video"] == "v.mp4"
+    assert export_script("job-1")
+    legacy = json.loads((output_dir / "job-1" / "script.json").read_text(encoding="utf-8"))
+    assert legacy["script"]["sections"][1]["video"] == "v.mp4"
+
+    # Jobs without a store keep using script.json
+    save_script("job-2", _wrapped_script())
+    assert not ScriptStore(output_dir / "job-2").exists()
+    assert load_script_section("job-2", 0)[0]["id"] == "sec0"
+    assert not export_script("job-2")
+
+
+def test_progress_tracker_saves_and_resumes_from_the_store(tmp_path, monkeypatch):
+    monkeypatch.setenv("SCRIPT_STORE_ENABLED", "true")
+    tracker = ProgressTracker("job-1", tmp_path)
+    tracker.job_dir.mkdir()
+    tracker.save_script(_wrapped_script())
+
+    assert tracker.script_store.exists()
+    progress = ProgressTracker("job-1", tmp_path).check_existing_progress()
+    assert progress.has_script
+    assert progress.total_sections == 3
+    # Wrapper language metadata is merged into the unwrapped script
+    assert progress.script["output_language"] == "fr"
+    assert tracker.load_script()["sections"][0]["id"] == "sec0"
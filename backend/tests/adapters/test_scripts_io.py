@@ -19,6 +19,7 @@ from app.adapters.scripts_io import (
     save_script,
     get_script_metadata,
     load_section_script,
+    update_section_fields,
 )
 
 
@@ -356,3 +357,50 @@ class TestLoadSectionScript:
             result = load_section_script(job_id, "wrapped-sec")
         
         assert result["id"] == "wrapped-sec"
+
+
+class TestUpdateSectionFields:
+    """Test suite for update_section_fields function"""
+
+    def test_updates_one_section_and_keeps_wrapper(self, tmp_path):
+        """Test that only the section changes and wrapper metadata survives"""
+        job_id = "test-job"
+        script_data = {
+            "script": {
+                "title": "Wrapped",
+                "sections": [{"id": "sec1", "video": "old.mp4"}, {"id": "sec2"}]
+            },
+            "mode": "comprehensive",
+            "output_language": "en"
+        }
+
+        with patch("app.adapters.scripts_io.OUTPUT_DIR", tmp_path):
+            job_dir = tmp_path / job_id
+            job_dir.mkdir()
+            (job_dir / "script.json").write_text(json.dumps(script_data))
+
+            assert update_section_fields(job_id, "sec1", {"video": "new.mp4"})
+            saved = json.loads((job_dir / "script.json").read_text())
+
+        assert saved["mode"] == "comprehensive"
+        assert saved["script"]["sections"] == [{"id": "sec1", "video": "new.mp4"}, {"id": "sec2"}]
+
+    def test_unchanged_values_do_not_rewrite(self, tmp_path):
+        """Test that an identical update leaves the file untouched"""
+        job_id = "test-job"
+
+        with patch("app.adapters.scripts_io.OUTPUT_DIR", tmp_path):
+            job_dir = tmp_path / job_id
+            job_dir.mkdir()
+            script_path = job_dir / "script.json"
+            script_path.write_text(json.dumps({"sections": [{"id": "sec1", "video": "a.mp4"}]}))
+            mtime = script_path.stat().st_mtime_ns
+
+            assert not update_section_fields(job_id, "sec1", {"video": "a.mp4"})
+            assert not update_section_fields(job_id, "missing", {"video": "b.mp4"})
+            assert script_path.stat().st_mtime_ns == mtime
+
+    def test_missing_script(self, tmp_path):
+        """Test that a missing script is not an error"""
+        with patch("app.adapters.scripts_io.OUTPUT_DIR", tmp_path):
+            assert not update_section_fields("nonexistent-job", "sec1", {"video": "a.mp4"})
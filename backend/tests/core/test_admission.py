@@ -0,0 +1,95 @@
+"""
+Tests for priority classes and fair-share admission
+"""
+
+import asyncio
+
+import pytest
+
+from app.core.admission import (
+    AdmissionController,
+    PriorityClass,
+    get_current_priority,
+    parse_priority,
+    priority_scope,
+)
+
+
+def test_parse_priority():
+    assert parse_priority("Interactive") == PriorityClass.INTERACTIVE
+    assert parse_priority("bulk") == PriorityClass.BULK
+    assert parse_priority("unknown") == PriorityClass.NORMAL
+    assert parse_priority(None, default=PriorityClass.BULK) == PriorityClass.BULK
+
+
+def test_priority_scope_sets_and_restores():
+    assert get_current_priority() == PriorityClass.NORMAL
+    with priority_scope("bulk"):
+        assert get_current_priority() == PriorityClass.BULK
+    assert get_current_priority() == PriorityClass.NORMAL
+
+
+@pytest.mark.asyncio
+class TestAdmissionController:
+    async def test_interactive_jumps_queue(self):
+        controller = AdmissionController("render", capacity=1, interactive_burst=0)
+        order = []
+        release = asyncio.Event()
+
+        async def hold():
+            async with controller.slot(PriorityClass.NORMAL):
+                await release.wait()
+
+        async def work(name, priority):
+            async with controller.slot(priority):
+                order.append(name)
+
+        holder = asyncio.create_task(hold())
+        await asyncio.sleep(0)
+        waiters = [
+            asyncio.create_task(work("normal", PriorityClass.NORMAL)),
+            asyncio.create_task(work("bulk", PriorityClass.BULK)),
+            asyncio.create_task(work("interactive", PriorityClass.INTERACTIVE)),
+        ]
+        await asyncio.sleep(0)
+        release.set()
+        await asyncio.gather(holder, *waiters)
+
+        assert order == ["interactive", "normal", "bulk"]
+
+    async def test_interactive_burst_above_capacity(self):
+        controller = AdmissionController("render", capacity=1, interactive_burst=1)
+        await controller.acquire(PriorityClass.NORMAL)
+
+        await asyncio.wait_for(controller.acquire(PriorityClass.INTERACTIVE), timeout=1)
+        assert controller.active == 2
+
+    async def test_bulk_share_is_capped(self):
+        controller = AdmissionController("llm", capacity=4, bulk_share=0.5)
+        for _ in range(2):
+            await controller.acquire(PriorityClass.BULK)
+
+        blocked = asyncio.create_task(controller.acquire(PriorityClass.BULK))
+        await asyncio.sleep(0)
+        assert not blocked.done()
+
+        # Normal work still gets the remaining capacity
+        await asyncio.wait_for(controller.acquire(PriorityClass.NORMAL), timeout=1)
+
+        controller.release(PriorityClass.BULK)
+        await asyncio.wait_for(blocked, timeout=1)
+        assert controller.stats()["active"]["bulk"] == 2
+
+    async def test_uses_current_priority_and_cancelled_waiter_is_removed(self):
+        controller = AdmissionController("render", capacity=1, interactive_burst=0)
+        await controller.acquire()
+
+        with priority_scope(PriorityClass.BULK):
+            waiter = asyncio.create_task(controller.acquire())
+        await asyncio.sleep(0)
+        assert controller.stats()["waiting"]["bulk"] == 1
+
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        assert controller.stats()["waiting"]["bulk"] == 0
@@ -0,0 +1,115 @@
+"""
+Tests for job-scoped cancellation and process-group control
+"""
+
+import asyncio
+import subprocess
+import sys
+import threading
+import time
+
+import pytest
+
+from app.core.cancellation import (
+    CancellationRegistry,
+    CancellationToken,
+    JobCancelledError,
+    bind_cancellation_token,
+    raise_if_cancelled,
+    run_process,
+    run_process_async,
+)
+
+SLEEP_CMD = [sys.executable, "-c", "import time; time.sleep(30)"]
+
+
+class TestCancellationToken:
+    def test_cancel_is_idempotent(self):
+        token = CancellationToken("job-1")
+        assert token.cancel("deleted") is True
+        assert token.cancel("again") is False
+        assert token.reason == "deleted"
+        with pytest.raises(JobCancelledError):
+            token.raise_if_cancelled()
+
+    def test_raise_if_cancelled_uses_bound_token(self):
+        token = CancellationToken("job-1")
+        with bind_cancellation_token(token):
+            raise_if_cancelled()
+            token.cancel()
+            with pytest.raises(JobCancelledError):
+                raise_if_cancelled()
+        # Unbound context is never cancelled
+        raise_if_cancelled()
+
+    async def test_run_converts_task_cancellation(self):
+        token = CancellationToken("job-1")
+
+        async def slow():
+            await asyncio.sleep(30)
+
+        asyncio.get_running_loop().call_later(0.05, token.cancel, "deleted")
+        with pytest.raises(JobCancelledError) as exc:
+            await token.run(slow())
+        assert exc.value.reason == "deleted"
+
+    async def test_run_returns_result(self):
+        token = CancellationToken("job-1")
+
+        async def work():
+            return 42
+
+        assert await token.run(work()) == 42
+
+
+class TestCancellationRegistry:
+    def test_open_release_and_cancel(self):
+        registry = CancellationRegistry()
+        token = registry.open("job-1")
+        assert registry.open("job-1") is token
+
+        assert registry.cancel("job-1") is True
+        assert registry.cancel("missing") is False
+        # A cancelled token is replaced when the job runs again
+        assert registry.open("job-1") is not token
+
+        registry.release(registry.get("job-1"))
+        assert registry.get("job-1") is None
+
+
+class TestRunProcess:
+    def test_returns_completed_process(self):
+        result = run_process(
+            [sys.executable, "-c", "print('hi')"], capture_output=True, text=True
+        )
+        assert result.returncode == 0
+        assert result.stdout.strip() == "hi"
+
+    def test_timeout_kills_process(self):
+        start = time.monotonic()
+        with pytest.raises(subprocess.TimeoutExpired):
+            run_process(SLEEP_CMD, timeout=0.2)
+        assert time.monotonic() - start < 10
+
+    def test_cancel_kills_running_process(self):
+        token = CancellationToken("job-1")
+        threading.Timer(0.2, token.cancel, args=("deleted",)).start()
+
+        start = time.monotonic()
+        with pytest.raises(JobCancelledError):
+            run_process(SLEEP_CMD, token=token)
+        assert time.monotonic() - start < 10
+
+    def test_already_cancelled_does_not_start(self):
+        token = CancellationToken("job-1")
+        token.cancel()
+        with pytest.raises(JobCancelledError):
+            run_process(SLEEP_CMD, token=token)
+
+    async def test_async_uses_bound_token(self):
+        token = CancellationToken("job-1")
+        asyncio.get_running_loop().call_later(0.2, token.cancel, "failed")
+
+        with bind_cancellation_token(token):
+            with pytest.raises(JobCancelledError):
+                await run_process_async(SLEEP_CMD, timeout=30)
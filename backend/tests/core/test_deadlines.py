@@ -0,0 +1,77 @@
+"""
+Tests for section/stage deadlines
+"""
+
+import asyncio
+
+import pytest
+
+from app.core.deadlines import (
+    DeadlineExceededError,
+    deadline_scope,
+    get_current_deadline,
+    remaining_budget,
+    run_with_deadline,
+)
+
+
+class TestDeadlineScope:
+    def test_no_deadline_by_default(self):
+        assert get_current_deadline() is None
+        assert remaining_budget() is None
+        assert remaining_budget(30) == 30
+
+    def test_scope_caps_stage_budget(self):
+        with deadline_scope(5, name="section_0") as deadline:
+            assert get_current_deadline() is deadline
+            assert remaining_budget(60) <= 5
+            assert remaining_budget(1) == 1
+        assert get_current_deadline() is None
+
+    def test_nested_scope_never_extends_outer(self):
+        with deadline_scope(2) as outer:
+            with deadline_scope(100) as inner:
+                assert inner is outer
+            with deadline_scope(1) as shorter:
+                assert shorter is not outer
+                assert shorter.remaining() <= 1
+
+    def test_disabled_scope_is_noop(self):
+        with deadline_scope(0) as deadline:
+            assert deadline is None
+            assert get_current_deadline() is None
+
+
+class TestRunWithDeadline:
+    @pytest.mark.asyncio
+    async def test_returns_result_within_budget(self):
+        async def work():
+            return "done"
+
+        assert await run_with_deadline(work(), "stage", 5) == "done"
+
+    @pytest.mark.asyncio
+    async def test_stage_timeout_raises(self):
+        with pytest.raises(DeadlineExceededError) as exc_info:
+            await run_with_deadline(asyncio.sleep(5), "vision_qc", 0.05)
+        assert exc_info.value.stage == "vision_qc"
+
+    @pytest.mark.asyncio
+    async def test_section_deadline_bounds_stage(self):
+        with deadline_scope(0.05):
+            with pytest.raises(DeadlineExceededError):
+                await run_with_deadline(asyncio.sleep(5), "refinement", 60)
+
+    @pytest.mark.asyncio
+    async def test_expired_deadline_raises_without_running(self):
+        started = []
+
+        async def work():
+            started.append(True)
+
+        with deadline_scope(0.01) as deadline:
+            await asyncio.sleep(0.02)
+            assert deadline.expired
+            with pytest.raises(DeadlineExceededError):
+                await run_with_deadline(work(), "implementation")
+        assert started == []
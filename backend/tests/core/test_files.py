@@ -1,6 +1,10 @@
 
+import errno
+import os
 from pathlib import Path
-from app.core.files import find_file_by_id, ensure_directory, get_file_extension
+
+from app.core import files
+from app.core.files import find_file_by_id, ensure_directory, get_file_extension, place_file
 
 def test_find_file_by_id(tmp_path):
     # Setup
@@ -33,3 +37,65 @@ def test_get_file_extension():
     assert get_file_extension(Path("FILE.PNG")) == ".png"
     assert get_file_extension(Path("path/to/file.txt")) == ".txt"
     assert get_file_extension(Path("no_ext")) == ""
+
+
+def _no_reflink(monkeypatch):
+    monkeypatch.setattr(files, "_reflink", lambda src, dst: False)
+
+
+def test_place_file_moves_by_rename(tmp_path):
+    src = tmp_path / "raw.mp3"
+    src.write_bytes(b"audio")
+    inode = src.stat().st_ino
+
+    assert place_file(src, tmp_path / "audio.mp3", move=True) == "rename"
+    assert not src.exists()
+    assert (tmp_path / "audio.mp3").stat().st_ino == inode
+
+
+def test_place_file_moves_across_filesystems_by_copy(tmp_path, monkeypatch):
+    _no_reflink(monkeypatch)
+    src = tmp_path / "raw.mp3"
+    src.write_bytes(b"audio")
+    real_replace = os.replace
+
+    def replace(a, b):
+        if Path(a) == src:
+            raise OSError(errno.EXDEV, "Invalid cross-device link")
+        real_replace(a, b)
+
+    monkeypatch.setattr(files.os, "replace", replace)
+    assert place_file(src, tmp_path / "audio.mp3", move=True) == "copy"
+    assert not src.exists()
+    assert (tmp_path / "audio.mp3").read_bytes() == b"audio"
+
+
+def test_place_file_hardlinks_only_when_allowed(tmp_path, monkeypatch):
+    _no_reflink(monkeypatch)
+    src = tmp_path / "combined_000.mp4"
+    src.write_bytes(b"video")
+
+    assert place_file(src, tmp_path / "copy.mp4") == "copy"
+    assert (tmp_path / "copy.mp4").stat().st_ino != src.stat().st_ino
+
+    assert place_file(src, tmp_path / "final.mp4", link=True) == "hardlink"
+    assert (tmp_path / "final.mp4").stat().st_ino == src.stat().st_ino
+
+    monkeypatch.setenv("FILE_PLACEMENT_HARDLINKS", "false")
+    assert place_file(src, tmp_path / "other.mp4", link=True) == "copy"
+
+
+def test_place_file_replaces_instead_of_writing_through_a_link(tmp_path, monkeypatch):
+    _no_reflink(monkeypatch)
+    src = tmp_path / "combined_000.mp4"
+    src.write_bytes(b"old")
+    final = tmp_path / "final.mp4"
+    place_file(src, final, link=True)
+
+    new = tmp_path / "new.mp4"
+    new.write_bytes(b"new")
+    place_file(new, final)
+
+    assert final.read_bytes() == b"new"
+    assert src.read_bytes() == b"old"
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["combined_000.mp4", "final.mp4", "new.mp4"]
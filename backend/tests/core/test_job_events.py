@@ -0,0 +1,97 @@
+"""
+Tests for in-process job progress events
+"""
+
+import asyncio
+import json
+import threading
+
+import pytest
+
+from app.core.job_events import JobEventBus, format_sse
+
+
+def test_events_have_increasing_ids_per_job_and_build_a_snapshot():
+    bus = JobEventBus(history=10)
+    bus.publish("a", "job", {"status": "analyzing", "progress": 5, "updated_at": "t1"})
+    bus.publish("b", "job", {"status": "pending", "updated_at": "t1"})
+    bus.publish("a", "stage", {"stage": "sections", "progress": 50, "message": "Section 1/2 completed"})
+    event = bus.publish("a", "section", {"section_index": 0, "completed_sections": 1, "total_sections": 2})
+    bus.publish("a", "job", {"progress": 50, "updated_at": "t2"})
+
+    assert event.id == 3
+    snapshot = bus.snapshot("a")
+    assert snapshot["last_event_id"] == 4
+    assert snapshot["job"] == {"status": "analyzing", "progress": 50, "updated_at": "t2"}
+    assert snapshot["stage"]["stage"] == "sections"
+    assert snapshot["completed_sections"] == [0]
+    assert snapshot["total_sections"] == 2
+    assert bus.snapshot("unknown")["last_event_id"] == 0
+
+
+def test_events_since_resumes_only_within_the_history():
+    bus = JobEventBus(history=3)
+    for progress in range(5):
+        bus.publish("a", "job", {"progress": progress})
+
+    assert [e.id for e in bus.events_since("a", 2)] == [3, 4, 5]
+    assert bus.events_since("a", 5) == []
+    assert bus.events_since("a", 1) is None  # event 2 is gone
+    assert bus.events_since("a", 9) is None  # ids from before a restart
+    assert bus.events_since("other", 0) is None
+
+
+def test_sync_job_publishes_only_newer_records():
+    bus = JobEventBus()
+    bus.publish("a", "job", {"status": "analyzing", "updated_at": "t1"})
+
+    assert bus.sync_job("a", {"status": "analyzing", "updated_at": "t1"}) is None
+    assert bus.sync_job("a", {"status": "completed", "updated_at": "t2"}).id == 2
+    assert bus.snapshot("a")["job"]["status"] == "completed"
+
+
+@pytest.mark.asyncio
+async def test_subscribers_receive_events_from_other_threads():
+    bus = JobEventBus()
+    subscription = bus.subscribe("a")
+
+    worker = threading.Thread(target=bus.publish, args=("a", "job", {"progress": 10}))
+    worker.start()
+    worker.join()
+
+    event = await subscription.get(timeout=1)
+    assert (event.id, event.data) == (1, {"progress": 10})
+    assert await subscription.get(timeout=0.01) is None
+
+    subscription.close()
+    bus.publish("a", "job", {"progress": 20})
+    await asyncio.sleep(0)
+    assert subscription.queue.empty()
+
+
+@pytest.mark.asyncio
+async def test_slow_subscribers_are_flagged_and_idle_jobs_pruned(monkeypatch):
+    monkeypatch.setattr("app.core.job_events.SUBSCRIBER_QUEUE_SIZE", 2)
+    bus = JobEventBus(max_channels=2)
+    subscription = bus.subscribe("watched")
+    for progress in range(3):
+        bus.publish("watched", "job", {"progress": progress})
+    await asyncio.sleep(0)
+
+    assert subscription.lagged
+    subscription.reset()
+    assert not subscription.lagged and subscription.queue.empty()
+
+    bus.publish("old", "job", {})
+    bus.publish("new", "job", {})
+    assert bus.snapshot("old")["last_event_id"] == 0
+    assert bus.snapshot("watched")["last_event_id"] == 3
+
+
+def test_format_sse():
+    text = format_sse("job", {"message": "Section 1/2"}, 7)
+    lines = text.split("\n")
+    assert lines[:2] == ["id: 7", "event: job"]
+    assert json.loads(lines[2][len("data: "):]) == {"message": "Section 1/2"}
+    assert text.endswith("\n\n")
+    assert format_sse("deleted", {}).startswith("event: deleted")
@@ -0,0 +1,99 @@
+"""
+Tests for app.core.serialization
+"""
+
+import json
+from enum import Enum
+
+import pytest
+
+from app.core import serialization
+from app.core.serialization import (
+    FastJSONResponse,
+    dumps_json,
+    dumps_json_bytes,
+    loads_json,
+    read_json,
+    set_json_backend,
+    write_json,
+)
+
+BACKENDS = [
+    name for name in serialization.JSON_BACKENDS
+    if name == "stdlib" or getattr(serialization, name) is not None
+]
+
+
+class Color(str, Enum):
+    RED = "red"
+
+
+DOCUMENT = {
+    "title": "Ondes — été",
+    "status": Color.RED,
+    "progress": 42.5,
+    "sections": [{"id": "s1", "empty": {}, "items": []}, None, True],
+}
+
+
+@pytest.fixture(params=BACKENDS)
+def backend(request):
+    set_json_backend(request.param)
+    yield request.param
+    set_json_backend()
+
+
+def test_backends_produce_stdlib_compatible_output(backend):
+    expected = json.loads(json.dumps(DOCUMENT))
+
+    compact = dumps_json(DOCUMENT)
+    assert compact == json.dumps(expected, ensure_ascii=False, separators=(",", ":"))
+    assert dumps_json(DOCUMENT, indent=True) == json.dumps(expected, indent=2, ensure_ascii=False)
+    assert loads_json(dumps_json_bytes(DOCUMENT)) == expected
+
+
+def test_values_the_fast_backends_reject_fall_back_to_stdlib(backend):
+    assert loads_json(dumps_json({"big": 2 ** 70})) == {"big": 2 ** 70}
+    assert dumps_json({"when": object()}, default=lambda value: "x") == '{"when":"x"}'
+    with pytest.raises(TypeError):
+        dumps_json({"when": object()})
+
+
+def test_invalid_json_raises_json_decode_error(backend):
+    with pytest.raises(json.JSONDecodeError):
+        loads_json("{ invalid")
+
+
+def test_files_round_trip_atomically(tmp_path, backend):
+    path = tmp_path / "job.json"
+    write_json(path, DOCUMENT, atomic=True)
+
+    assert read_json(path)["title"] == "Ondes — été"
+    assert path.read_text(encoding="utf-8").startswith('{\n  "title"')
+    assert [p.name for p in tmp_path.iterdir()] == ["job.json"]
+
+
+def test_failed_atomic_writes_leave_no_temp_file(tmp_path, monkeypatch):
+    path = tmp_path / "job.json"
+    write_json(path, {"status": "running"}, atomic=True)
+
+    def replace(src, dst):
+        raise FileNotFoundError(src)
+
+    monkeypatch.setattr(serialization.os, "replace", replace)
+    with pytest.raises(FileNotFoundError):
+        write_json(path, {"status": "cancelled"}, atomic=True)
+
+    assert read_json(path) == {"status": "running"}
+    assert [p.name for p in tmp_path.iterdir()] == ["job.json"]
+
+
+def test_response_class_matches_the_default_encoding():
+    response = FastJSONResponse({"title": "été", "values": [1, 2]})
+    assert response.body == '{"title":"été","values":[1,2]}'.encode("utf-8")
+    assert response.headers["content-type"] == "application/json"
+
+
+def test_unknown_backends_are_rejected():
+    with pytest.raises(ValueError):
+        set_json_backend("simplejson")
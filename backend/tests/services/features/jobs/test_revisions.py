@@ -0,0 +1,87 @@
+"""
+Tests for app.services.features.jobs.revisions
+"""
+
+import os
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app.services.features.jobs.revisions import ResponseCache, job_files_revision
+
+MODULE = "app.services.features.jobs.revisions"
+
+
+@pytest.fixture
+def job_dir(tmp_path):
+    job_dir = tmp_path / "job-1"
+    (job_dir / "sections" / "0").mkdir(parents=True)
+    (job_dir / "sections" / "1").mkdir()
+    (job_dir / "script.json").write_text('{"sections": []}')
+    (job_dir / "sections" / "0" / "scene_0.py").write_text("code")
+    with patch(f"{MODULE}.OUTPUT_DIR", tmp_path):
+        yield job_dir
+
+
+def _bump(path, content):
+    """Rewrite a file in place with a distinct mtime"""
+    stat = path.stat()
+    path.write_text(content)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+
+def test_revision_is_stable_until_an_input_changes(job_dir):
+    first = job_files_revision("job-1", state=("creating_animations", 40))
+    assert job_files_revision("job-1", state=("creating_animations", 40)) == first
+    assert job_files_revision("job-1", state=("creating_animations", 45)) != first
+
+    # In-place edit of a section file
+    _bump(job_dir / "sections" / "0" / "scene_0.py", "edit")
+    second = job_files_revision("job-1", state=("creating_animations", 40))
+    assert second != first
+
+    # New file in a section directory
+    (job_dir / "sections" / "1" / "status.json").write_text("{}")
+    assert job_files_revision("job-1", state=("creating_animations", 40)) != second
+
+
+def test_scoped_revisions_ignore_other_sections(job_dir):
+    script_only = job_files_revision("job-1", sections=False)
+    section_1 = job_files_revision("job-1", section_index=1)
+
+    _bump(job_dir / "sections" / "0" / "scene_0.py", "edit")
+    assert job_files_revision("job-1", sections=False) == script_only
+    assert job_files_revision("job-1", section_index=1) == section_1
+
+    _bump(job_dir / "script.json", '{"sections": [{}]}')
+    assert job_files_revision("job-1", sections=False) != script_only
+    assert job_files_revision("job-1", section_index=1) != section_1
+
+
+def test_missing_job_has_a_revision(tmp_path):
+    with patch(f"{MODULE}.OUTPUT_DIR", tmp_path):
+        assert job_files_revision("missing") == job_files_revision("missing")
+
+
+def test_response_cache_builds_once_per_revision_and_evicts_lru():
+    cache = ResponseCache(max_entries=2)
+    build = MagicMock(side_effect=lambda: object())
+
+    first = cache.get_or_build(("details", "a"), "r1", build)
+    assert cache.get_or_build(("details", "a"), "r1", build) is first
+    assert build.call_count == 1
+
+    assert cache.get_or_build(("details", "a"), "r2", build) is not first
+    assert build.call_count == 2
+
+    cache.get_or_build(("details", "b"), "r1", build)
+    cache.get_or_build(("details", "c"), "r1", build)
+    cache.get_or_build(("details", "a"), "r2", build)
+    assert build.call_count == 5  # "a" was evicted
+
+
+def test_failed_builds_are_not_cached():
+    cache = ResponseCache(max_entries=4)
+    with pytest.raises(ValueError):
+        cache.get_or_build("key", "r1", MagicMock(side_effect=ValueError("missing")))
+    assert cache.get_or_build("key", "r1", lambda: "built") == "built"
@@ -0,0 +1,78 @@
+"""
+Tests for app.services.features.retheme.manim_theme
+"""
+
+import pytest
+
+from app.services.features.retheme.manim_theme import (
+    RethemeError,
+    detect_theme_style,
+    retheme_manim_code,
+    theme_color_maps,
+)
+
+DARK_SCENE = '''from manim import *
+
+
+class SectionIntro(Scene):
+    def construct(self):
+        self.camera.background_color = "#171717"  # Slate dark
+        Text.set_default(color="#FFFFFF")
+        Tex.set_default(color="#FFFFFF")
+        MathTex.set_default(color="#FFFFFF")
+        title = Text("Energy", color=WHITE)
+        note = Text("kinetic", color="#AFC6FF")
+        arrow = Arrow(LEFT, RIGHT, color="#83c167")
+        self.play(Write(title), GrowArrow(arrow))
+        self.wait(2)
+'''
+
+
+def test_detects_theme_from_background():
+    assert detect_theme_style(DARK_SCENE) == "3b1b"
+    assert detect_theme_style('self.camera.background_color = "#282a36"') == "dracula"
+    assert detect_theme_style("self.play(Write(t))") is None
+
+
+def test_dark_to_light_maps_palette_and_readable_foreground():
+    code = retheme_manim_code(DARK_SCENE, "light")
+
+    assert 'self.camera.background_color = "#FFFFFF"' in code
+    assert 'VMobject.set_default(color="#111111")' in code
+    assert 'Text.set_default(color="#111111")' in code
+    assert 'title = Text("Energy", color=ManimColor("#111111"))' in code
+    assert 'note = Text("kinetic", color="#334155")' in code
+    assert 'arrow = Arrow(LEFT, RIGHT, color="#0F766E")' in code
+    assert "#171717" not in code
+    assert code.count("background_color") == 1
+    compile(code, "<rethemed>", "exec")
+
+
+def test_dark_to_dark_keeps_color_constants():
+    code = retheme_manim_code(DARK_SCENE, "nord")
+
+    assert 'self.camera.background_color = "#2E3440"' in code
+    assert 'title = Text("Energy", color=WHITE)' in code
+    assert 'arrow = Arrow(LEFT, RIGHT, color="#A3BE8C")' in code
+    assert "VMobject.set_default" not in code
+
+
+def test_round_trip_restores_the_original_palette():
+    there = retheme_manim_code(DARK_SCENE, "dracula")
+    back = retheme_manim_code(there, "3b1b")
+
+    assert 'note = Text("kinetic", color="#AFC6FF")' in back
+    assert 'arrow = Arrow(LEFT, RIGHT, color="#83C167")' in back
+    assert 'self.camera.background_color = "#171717"' in back
+
+
+def test_light_to_dark_maps_black():
+    _, name_map = theme_color_maps("clean", "3b1b")
+    assert name_map == {"BLACK": "#FFFFFF"}
+
+
+def test_unusable_code_raises():
+    with pytest.raises(RethemeError):
+        retheme_manim_code("def construct(self:\n", "clean")
+    with pytest.raises(RethemeError):
+        retheme_manim_code("x = Text('no scene')\n", "clean")
@@ -0,0 +1,108 @@
+"""
+Tests for app.services.features.retheme.video_rethemer
+"""
+
+import subprocess
+from pathlib import Path
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from app.services.features.retheme.video_rethemer import (
+    SECTION_VIDEO_NAME,
+    RethemedVideoGenerator,
+    read_retheme_progress,
+)
+from app.services.features.translation.video_translator import SourceSection
+
+MODULE = "app.services.features.retheme.video_rethemer"
+
+SCENE = '''from manim import *
+
+
+class Section{index}(Scene):
+    def construct(self):
+        self.camera.background_color = "#171717"
+        self.add(Text("Section {index}", color=WHITE))
+        self.wait(1)
+'''
+
+
+def _fake_ffmpeg(cmd, **kwargs):
+    """Write the output file named last on the ffmpeg command line"""
+    Path(cmd[-1]).write_bytes(b"video")
+    return subprocess.CompletedProcess(cmd, 0, "", "")
+
+
+async def _fake_render(section_dir, code_file, class_name, output_video, **kwargs):
+    output_video.write_bytes(b"render")
+    return output_video
+
+
+def _sources(tmp_path, count, code=SCENE):
+    sources = []
+    for i in range(count):
+        original = tmp_path / "original" / f"section_{i}"
+        original.mkdir(parents=True)
+        (original / "section_audio.mp3").write_bytes(b"audio")
+        sources.append(SourceSection(str(original), code.format(index=i) if code else ""))
+    return sources
+
+
+@pytest.fixture(autouse=True)
+def media_tools():
+    with patch(f"{MODULE}.get_media_duration", AsyncMock(return_value=10.0)), \
+         patch(f"{MODULE}.run_process_async", AsyncMock(side_effect=_fake_ffmpeg)) as ffmpeg:
+        yield ffmpeg
+
+
+@pytest.mark.asyncio
+async def test_sections_are_rethemed_rendered_and_merged_with_original_audio(tmp_path, media_tools):
+    script = {"sections": [{"id": "s0"}, {"id": "s1"}]}
+    output_dir = tmp_path / "themes" / "clean"
+    render = AsyncMock(side_effect=_fake_render)
+
+    with patch(f"{MODULE}.render_section_video", render):
+        generator = RethemedVideoGenerator("job", str(output_dir), "light")
+        final_video = await generator.generate(script, _sources(tmp_path, 2))
+
+    assert final_video == str(output_dir / "final_video.mp4")
+    assert render.await_count == 2
+    assert render.await_args.args[2] in ("Section0", "Section1")
+
+    scene = (output_dir / "section_0" / "scene_0.py").read_text()
+    assert 'self.camera.background_color = "#FFFFFF"' in scene
+    assert 'Text("Section 0", color=ManimColor("#111111"))' in scene
+
+    merges = [call.args[0] for call in media_tools.await_args_list if "-f" not in call.args[0]]
+    assert len(merges) == 2
+    assert all(str(tmp_path / "original") in " ".join(cmd) for cmd in merges)
+    assert read_retheme_progress(output_dir)["status"] == "completed"
+
+
+@pytest.mark.asyncio
+async def test_failed_section_fails_the_retheme_and_resume_skips_finished(tmp_path):
+    script = {"sections": [{"id": "s0"}, {"id": "s1"}]}
+    sources = _sources(tmp_path, 2)
+    sources[1] = SourceSection(sources[1].original_section_dir, "")
+    output_dir = tmp_path / "themes" / "nord"
+    render = AsyncMock(side_effect=_fake_render)
+
+    with patch(f"{MODULE}.render_section_video", render):
+        first = await RethemedVideoGenerator("job", str(output_dir), "nord").generate(script, sources)
+
+        assert first is None
+        assert not (output_dir / "final_video.mp4").exists()
+        progress = read_retheme_progress(output_dir)
+        assert progress["status"] == "failed"
+        assert progress["failed_sections"] == [1]
+        assert (output_dir / "section_0" / SECTION_VIDEO_NAME).exists()
+
+        render.reset_mock()
+        second = await RethemedVideoGenerator("job", str(output_dir), "nord").generate(
+            script, _sources(tmp_path / "retry", 2)
+        )
+
+    assert second == str(output_dir / "final_video.mp4")
+    assert render.await_count == 1
+    assert read_retheme_progress(output_dir)["cached_sections"] == [0]
@@ -0,0 +1,55 @@
+"""
+Tests for app.services.features.translation.manim_text
+"""
+
+import ast
+
+from app.services.features.translation.manim_text import analyze_manim_code, apply_translations
+
+
+def test_tex_math_segments_are_not_translated():
+    code = 'eq = Tex(r"Energy $E = mc^2$ is conserved")\n'
+
+    analysis = analyze_manim_code(code, is_non_latin=False)
+    assert analysis.texts == ["Energy", "is conserved"]
+
+    result = apply_translations(analysis, ["Energie", "bleibt erhalten"])
+    assert result == 'eq = Tex(r"Energie $E = mc^2$ bleibt erhalten")\n'
+
+
+def test_escaped_and_nested_strings_round_trip():
+    code = (
+        "group = VGroup(Text('Don\\'t stop'), Text(\"Say \\\"hi\\\"\\nnow\"))\n"
+        "label = Text(f\"{count} items\")\n"
+    )
+
+    analysis = analyze_manim_code(code, is_non_latin=False)
+    assert analysis.texts == ["Don't stop", 'Say "hi"\nnow']
+
+    result = apply_translations(analysis, ["N'arrête pas", 'Dis "salut"\nmaintenant'])
+    group = ast.parse(result).body[0].value
+    values = [call.args[0].value for call in group.args]
+    assert values == ["N'arrête pas", 'Dis "salut"\nmaintenant']
+    assert 'label = Text(f"{count} items")' in result
+
+
+def test_missing_translation_keeps_original():
+    code = 'a = Text("First")\nb = Text("Second")\n'
+    analysis = analyze_manim_code(code, is_non_latin=False)
+
+    assert apply_translations(analysis, ["Erste", None]) == 'a = Text("Erste")\nb = Text("Second")\n'
+
+
+def test_unparseable_code_is_left_untranslated():
+    code = 'Text("Hello"'
+    analysis = analyze_manim_code(code, is_non_latin=False)
+
+    assert analysis.texts == []
+    assert apply_translations(analysis, []) == code
+
+
+def test_non_latin_skips_unsplittable_tex():
+    code = 'eq = Tex("Value $x$").scale(2)\nt = Text("Keep me")\n'
+    analysis = analyze_manim_code(code, is_non_latin=True)
+
+    assert analysis.texts == ["Keep me"]
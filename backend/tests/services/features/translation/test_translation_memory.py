@@ -0,0 +1,46 @@
+"""
+Tests for app.services.features.translation.translation_memory
+"""
+
+from app.services.features.translation.translation_memory import (
+    TranslationMemory,
+    normalize_text,
+)
+
+
+def test_normalize_text_collapses_whitespace():
+    assert normalize_text("  Hello \n  world ") == "Hello world"
+
+
+def test_lookup_many_preserves_order_and_misses(tmp_path):
+    memory = TranslationMemory(tmp_path / "tm.db")
+    memory.store_many([("Hello", "Bonjour"), ("Bye", "Salut")], "en", "fr", "model-a", "manim")
+
+    assert memory.lookup_many(["Bye", "Other", "Hello "], "en", "fr", "model-a", "manim") == [
+        "Salut", None, "Bonjour"
+    ]
+    stats = memory.stats()
+    assert stats["hits"] == 2
+    assert stats["misses"] == 1
+    assert stats["entries"] == 2
+    assert stats["total_hits"] == 2
+
+
+def test_key_separates_language_model_and_domain(tmp_path):
+    memory = TranslationMemory(tmp_path / "tm.db")
+    memory.store("Hello", "Bonjour", "en", "fr", "model-a", "manim")
+
+    assert memory.lookup("Hello", "en", "fr", "model-a", "manim") == "Bonjour"
+    assert memory.lookup("Hello", "en", "de", "model-a", "manim") is None
+    assert memory.lookup("Hello", "en", "fr", "model-b", "manim") is None
+    assert memory.lookup("Hello", "en", "fr", "model-a", "narration") is None
+
+
+def test_memory_persists_across_instances(tmp_path):
+    TranslationMemory(tmp_path / "tm.db").store("Title", "Titre", "en", "fr", "m")
+    assert TranslationMemory(tmp_path / "tm.db").lookup("Title", "en", "fr", "m") == "Titre"
+
+
+def test_blank_or_empty_pairs_are_not_stored(tmp_path):
+    memory = TranslationMemory(tmp_path / "tm.db")
+    assert memory.store_many([("  ", "x"), ("Hello", "")], "en", "fr", "m") == 0
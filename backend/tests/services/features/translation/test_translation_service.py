@@ -5,6 +5,8 @@ Tests for app.services.features.translation.translation_service
 import pytest
 from unittest.mock import MagicMock, patch, AsyncMock
 from app.services.features.translation.translation_service import TranslationService, get_translation_service
+from app.services.features.translation.manim_text import analyze_manim_code
+from app.services.features.translation.translation_memory import TranslationMemory
 
 
 @pytest.mark.asyncio
@@ -12,7 +14,7 @@ class TestTranslationService:
     """Test TranslationService logic."""
 
     @pytest.fixture
-    def service(self):
+    def service(self, tmp_path):
         # Patch PromptingEngine which is imported locally in __init__
         with patch("app.services.infrastructure.llm.PromptingEngine") as mock_engine_class:
             mock_engine = MagicMock()
@@ -20,7 +22,8 @@ class TestTranslationService:
             mock_engine.generate = AsyncMock()
             mock_engine_class.return_value = mock_engine
             
-            svc = TranslationService()
+            # Fresh translation memory per test so cached strings never leak
+            svc = TranslationService(memory=TranslationMemory(tmp_path / "tm.db"))
             svc.mock_engine = mock_engine  # Attach for access in tests
             return svc
 
@@ -155,8 +158,10 @@ Perevod dva
         # Check that math is preserved
         assert 'MathTex(r"x")' in result
 
-    async def test_singleton(self):
+    async def test_singleton(self, monkeypatch):
         """Test get_translation_service singleton behavior."""
+        # The default memory would create its database under JOB_DATA_DIR
+        monkeypatch.setenv("TRANSLATION_MEMORY_ENABLED", "false")
         with patch("app.services.infrastructure.llm.PromptingEngine"):
             import app.services.features.translation.translation_service as ts_mod
             # Save original
@@ -170,3 +175,70 @@ Perevod dva
             finally:
                 # Restore original
                 ts_mod._translation_service = original
+
+    async def test_translation_memory_serves_repeated_strings(self, service):
+        """Only strings not translated before are sent to the LLM."""
+        service.mock_engine.generate.return_value = {
+            "success": True,
+            "response": "[TEXT_0]\nUn\n[/TEXT_0]\n[TEXT_1]\nDeux\n[/TEXT_1]",
+        }
+        assert await service._translate_manim_texts(["One", "Two"], "en", "fr") == ["Un", "Deux"]
+
+        service.mock_engine.generate.reset_mock()
+        service.mock_engine.generate.return_value = {
+            "success": True,
+            "response": "[TEXT_0]\nTrois\n[/TEXT_0]",
+        }
+        result = await service._translate_manim_texts(["One", "Three", "Two"], "en", "fr")
+
+        assert result == ["Un", "Trois", "Deux"]
+        prompt = service.mock_engine.generate.call_args.kwargs["prompt"]
+        assert "Three" in prompt
+        assert "One" not in prompt
+        assert service.memory.stats()["hits"] == 2
+
+    async def test_failed_translation_is_not_remembered(self, service):
+        """A string the LLM did not return falls back to the original and is retried next time."""
+        service.mock_engine.generate.return_value = {"success": False}
+        assert await service._translate_section_texts(["Hello"], "en", "fr") == ["Hello"]
+
+        service.mock_engine.generate.return_value = {
+            "success": True,
+            "response": "[TEXT_0]\nBonjour\n[/TEXT_0]",
+        }
+        assert await service._translate_section_texts(["Hello"], "en", "fr") == ["Bonjour"]
+        assert service.mock_engine.generate.call_count == 2
+
+    async def test_translate_script_multi_collects_texts_once(self, service):
+        """Source texts are collected once and every language is translated."""
+        script = {"sections": [{"title": "Intro", "narration": "Hello"}]}
+
+        async def fake_translate(texts, source, target, section_context=""):
+            return [f"{target}:{t}" for t in texts]
+
+        service._translate_section_texts = AsyncMock(side_effect=fake_translate)
+        with patch.object(
+            TranslationService, "collect_section_texts", wraps=TranslationService.collect_section_texts
+        ) as collect:
+            result = await service.translate_script_multi(script, ["fr", "de", "fr"], "en")
+
+        assert set(result) == {"fr", "de"}
+        assert result["fr"]["sections"][0]["narration"] == "fr:Hello"
+        assert result["de"]["sections"][0]["title"] == "de:Intro"
+        assert collect.call_count == 1
+
+    async def test_manim_code_analysis_is_shared_across_languages(self, service):
+        """Languages of the same script class reuse one code analysis."""
+        code = 'Text("Hello"), Text("World")'
+        service._translate_manim_texts = AsyncMock(side_effect=[["Bonjour", "Monde"], ["Hallo", "Welt"]])
+
+        with patch(
+            "app.services.features.translation.translation_service.analyze_manim_code",
+            wraps=analyze_manim_code,
+        ) as analyze:
+            fr = await service.translate_manim_code(code, "fr")
+            de = await service.translate_manim_code(code, "de")
+
+        assert fr == 'Text("Bonjour"), Text("Monde")'
+        assert de == 'Text("Hallo"), Text("Welt")'
+        assert analyze.call_count == 1
@@ -0,0 +1,158 @@
+"""
+Tests for app.services.features.translation.video_translator
+"""
+
+import asyncio
+import subprocess
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.services.features.translation.video_translator import (
+    SECTION_VIDEO_NAME,
+    TranslatedVideoGenerator,
+    read_translation_progress,
+    resolve_source_sections,
+)
+
+MODULE = "app.services.features.translation.video_translator"
+
+
+def _fake_ffmpeg(cmd, **kwargs):
+    """Write the output file named last on the ffmpeg command line"""
+    Path(cmd[-1]).write_bytes(b"video")
+    return subprocess.CompletedProcess(cmd, 0, "", "")
+
+
+def _script(count):
+    return {
+        "translated_from": "en",
+        "sections": [
+            {"id": f"s{i}", "narration": f"Bonjour {i}", "manim_code": "Text('Hello')"}
+            for i in range(count)
+        ],
+    }
+
+
+@pytest.fixture
+def collaborators(tmp_path):
+    source_video = tmp_path / "rendered.mp4"
+    source_video.write_bytes(b"render")
+
+    tts = MagicMock()
+    tts.generate_speech = AsyncMock()
+    translator = MagicMock()
+    translator.translate_manim_code = AsyncMock(return_value="Text('Bonjour')")
+    manim = MagicMock()
+    manim.render_from_code = AsyncMock(return_value=str(source_video))
+    return {"tts_engine": tts, "translation_service": translator, "manim_generator": manim}
+
+
+@pytest.fixture(autouse=True)
+def media_tools():
+    with patch(f"{MODULE}.get_media_duration", AsyncMock(return_value=10.0)), \
+         patch(f"{MODULE}.run_process_async", AsyncMock(side_effect=_fake_ffmpeg)) as ffmpeg:
+        yield ffmpeg
+
+
+@pytest.mark.asyncio
+async def test_sections_run_concurrently_within_limit(tmp_path, collaborators):
+    active = 0
+    peak = 0
+    render = collaborators["manim_generator"].render_from_code.return_value
+
+    async def slow_render(*args, **kwargs):
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.02)
+        active -= 1
+        return render
+
+    collaborators["manim_generator"].render_from_code.side_effect = slow_render
+    generator = TranslatedVideoGenerator(
+        "job-1", str(tmp_path / "fr"), "fr", "voice", max_concurrent=2, **collaborators
+    )
+
+    final_video = await generator.generate(_script(5))
+
+    assert final_video == str(tmp_path / "fr" / "final_video.mp4")
+    assert peak == 2
+    progress = read_translation_progress(tmp_path / "fr")
+    assert progress["status"] == "completed"
+    assert progress["completed_sections"] == 5
+    assert progress["failed_sections"] == []
+
+
+@pytest.mark.asyncio
+async def test_resume_skips_finished_sections(tmp_path, collaborators):
+    output_dir = tmp_path / "fr"
+    done = output_dir / "section_0"
+    done.mkdir(parents=True)
+    (done / SECTION_VIDEO_NAME).write_bytes(b"done")
+
+    generator = TranslatedVideoGenerator(
+        "job-1", str(output_dir), "fr", "voice", **collaborators
+    )
+    await generator.generate(_script(3))
+
+    assert collaborators["tts_engine"].generate_speech.await_count == 2
+    assert read_translation_progress(output_dir)["cached_sections"] == [0]
+    concat_list = (output_dir / "concat.txt").read_text().splitlines()
+    assert len(concat_list) == 3
+    assert str(done / SECTION_VIDEO_NAME) in concat_list[0]
+
+
+@pytest.mark.asyncio
+async def test_failed_merge_leaves_no_section_output(tmp_path, collaborators, media_tools):
+    def failing_merge(cmd, **kwargs):
+        if "concat" in cmd:
+            return _fake_ffmpeg(cmd)
+        Path(cmd[-1]).write_bytes(b"partial")
+        return subprocess.CompletedProcess(cmd, 1, "", "boom")
+
+    media_tools.side_effect = failing_merge
+    output_dir = tmp_path / "fr"
+    generator = TranslatedVideoGenerator(
+        "job-1", str(output_dir), "fr", "voice", **collaborators
+    )
+
+    assert await generator.generate(_script(1)) is None
+    section_dir = output_dir / "section_0"
+    assert not (section_dir / SECTION_VIDEO_NAME).exists()
+    assert list(section_dir.glob("partial_*")) == []
+    progress = read_translation_progress(output_dir)
+    assert progress["status"] == "failed"
+    assert progress["failed_sections"] == [0]
+
+
+@pytest.mark.asyncio
+async def test_languages_share_one_section_limit(tmp_path, collaborators):
+    active = 0
+    peak = 0
+    render = collaborators["manim_generator"].render_from_code.return_value
+
+    async def slow_render(*args, **kwargs):
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.02)
+        active -= 1
+        return render
+
+    collaborators["manim_generator"].render_from_code.side_effect = slow_render
+    semaphore = asyncio.Semaphore(2)
+    sources = resolve_source_sections("job-1", _script(3)["sections"])
+    generators = [
+        TranslatedVideoGenerator(
+            "job-1", str(tmp_path / lang), lang, "voice", semaphore=semaphore, **collaborators
+        )
+        for lang in ("fr", "de", "es")
+    ]
+
+    results = await asyncio.gather(*(g.generate(_script(3), sources) for g in generators))
+
+    assert all(results)
+    assert peak == 2
+    assert collaborators["manim_generator"].render_from_code.await_count == 9
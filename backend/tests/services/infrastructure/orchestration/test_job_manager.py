@@ -5,6 +5,8 @@ Tests job tracking and file-based persistence.
 """
 
 import json
+import time
+
 import pytest
 from app.services.infrastructure.orchestration.job_manager import Job, JobManager, JobStatus
 
@@ -62,6 +64,14 @@ class TestJobManager:
             assert data["id"] == "job-abc"
             assert data["status"] == "pending"
 
+    def test_create_job_persists_priority(self, manager, temp_job_dir):
+        """Verify the priority class is stored and reloaded."""
+        manager.create_job("bulk-job", priority="bulk")
+
+        reloaded = JobManager(storage_dir=str(temp_job_dir))
+        assert reloaded.get_job("bulk-job").priority == "bulk"
+        assert Job.from_dict({"id": "old", "status": "pending"}).priority == "normal"
+
     def test_update_job_updates_disk(self, manager, temp_job_dir):
         """Verify that updating a job updates the file."""
         manager.create_job("job-123")
@@ -169,3 +179,99 @@ class TestJobManager:
 
         # Cache should stay bounded by cache_limit for terminal jobs
         assert len(manager._jobs) <= 25
+
+    def test_sees_updates_from_another_process(self, temp_job_dir):
+        """Task workers write job files from separate processes."""
+        api = JobManager(storage_dir=str(temp_job_dir))
+        worker = JobManager(storage_dir=str(temp_job_dir))
+
+        api.create_job("queued-job")
+        assert api.get_job("queued-job").status == JobStatus.PENDING
+
+        # The worker was started before the job existed
+        worker.update_job("queued-job", status=JobStatus.CREATING_ANIMATIONS, progress=42.0)
+        worker.flush()
+
+        job = api.get_job("queued-job")
+        assert job.status == JobStatus.CREATING_ANIMATIONS
+        assert job.progress == 42.0
+
+
+class TestJobManagerWriteBehind:
+    """Progress updates are coalesced in memory and written off the caller's thread."""
+
+    @pytest.fixture
+    def temp_job_dir(self, tmp_path):
+        return tmp_path / "job_data"
+
+    def _read(self, temp_job_dir, job_id):
+        with open(temp_job_dir / f"{job_id}.json", "r") as f:
+            return json.load(f)
+
+    def test_progress_updates_are_coalesced(self, temp_job_dir):
+        manager = JobManager(storage_dir=str(temp_job_dir), write_delay=60)
+        manager.create_job("job-1")
+
+        for progress in range(1, 50):
+            manager.update_job("job-1", status=JobStatus.CREATING_ANIMATIONS, progress=float(progress))
+
+        # Reads see the latest state; the file still holds the created job
+        assert manager.get_job("job-1").progress == 49.0
+        assert self._read(temp_job_dir, "job-1")["status"] == "pending"
+
+        manager.flush()
+        data = self._read(temp_job_dir, "job-1")
+        assert data["status"] == "creating_animations"
+        assert data["progress"] == 49.0
+        assert list(temp_job_dir.glob("*.tmp")) == []
+
+    def test_pending_updates_are_written_by_the_background_flush(self, temp_job_dir):
+        manager = JobManager(storage_dir=str(temp_job_dir), write_delay=0.05)
+        manager.create_job("job-1")
+        manager.update_job("job-1", status=JobStatus.ANALYZING, progress=5.0)
+
+        deadline = time.monotonic() + 5
+        while self._read(temp_job_dir, "job-1")["status"] != "analyzing":
+            assert time.monotonic() < deadline, "background flush did not run"
+            time.sleep(0.02)
+
+    def test_settled_states_are_written_through(self, temp_job_dir):
+        manager = JobManager(storage_dir=str(temp_job_dir), write_delay=60)
+        manager.create_job("job-1")
+        manager.update_job("job-1", status=JobStatus.COMPOSING_VIDEO, progress=95.0)
+        manager.update_job("job-1", status=JobStatus.FAILED, error="boom")
+
+        data = self._read(temp_job_dir, "job-1")
+        assert data["status"] == "failed"
+        assert data["progress"] == 95.0
+        assert data["error"] == "boom"
+
+    def test_dirty_jobs_are_not_evicted_and_deletes_stay_deleted(self, temp_job_dir):
+        manager = JobManager(storage_dir=str(temp_job_dir), cache_limit=25, write_delay=60)
+        manager.create_job("running")
+        manager.update_job("running", status=JobStatus.CREATING_ANIMATIONS, progress=10.0)
+        for i in range(40):
+            manager.create_job(f"done-{i}")
+            manager.update_job(f"done-{i}", status=JobStatus.COMPLETED)
+
+        assert manager.get_job("running").progress == 10.0
+
+        manager.delete_job("running")
+        manager.flush()
+        assert not (temp_job_dir / "running.json").exists()
+
+
+def test_job_updates_are_published_as_events(tmp_path):
+    from app.core import get_job_event_bus
+
+    manager = JobManager(storage_dir=str(tmp_path / "job_data"), write_delay=60)
+    manager.create_job("events-1")
+    manager.update_job("events-1", status=JobStatus.ANALYZING, progress=5.0, message="Reading")
+
+    snapshot = get_job_event_bus().snapshot("events-1")
+    assert snapshot["last_event_id"] == 2
+    assert snapshot["job"]["status"] == "analyzing"
+    assert snapshot["job"]["message"] == "Reading"
+
+    manager.delete_job("events-1")
+    assert get_job_event_bus().snapshot("events-1")["job"] == {}
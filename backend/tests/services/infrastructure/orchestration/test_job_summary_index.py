@@ -0,0 +1,152 @@
+"""
+Tests for app.services.infrastructure.orchestration.job_summary_index
+"""
+
+import json
+from unittest.mock import patch
+
+import pytest
+from fastapi import HTTPException
+
+from app.core.video_info import ErrorInfo, VideoChapter, VideoInfo, save_error_info, save_video_info
+from app.services.infrastructure.orchestration import job_summary_index as summary_module
+from app.services.infrastructure.orchestration.job_manager import JobManager, JobStatus
+from app.services.infrastructure.orchestration.job_summary_index import (
+    JobSummaryIndex,
+    filter_job_summaries,
+    parse_status_filter,
+    validate_listing_params,
+)
+
+MODULE = "app.services.infrastructure.orchestration.job_summary_index"
+
+
+@pytest.fixture
+def output_dir(tmp_path):
+    path = tmp_path / "outputs"
+    path.mkdir()
+    with patch(f"{MODULE}.OUTPUT_DIR", path), \
+         patch("app.core.video_info.OUTPUT_DIR", path), \
+         patch("app.adapters.scripts_io.OUTPUT_DIR", path):
+        yield path
+
+
+@pytest.fixture
+def index(tmp_path, output_dir):
+    index = JobSummaryIndex(tmp_path / "summaries.db")
+    with patch(f"{MODULE}.job_summary_index_enabled", return_value=True), \
+         patch(f"{MODULE}.get_job_summary_index", return_value=index):
+        yield index
+
+
+def _finish_video(output_dir, job_id, title, duration, chapters=2):
+    (output_dir / job_id).mkdir(exist_ok=True)
+    (output_dir / job_id / "final_video.mp4").write_bytes(b"video")
+    save_video_info(VideoInfo(
+        video_id=job_id,
+        title=title,
+        duration=duration,
+        chapters=[VideoChapter(f"c{i}", i * 10.0, 10.0) for i in range(chapters)],
+        created_at="2026-01-01T00:00:00",
+        thumbnail_url=f"/outputs/{job_id}/thumbnail.jpg",
+    ))
+
+
+def test_transitions_keep_the_index_current(tmp_path, output_dir, index):
+    manager = JobManager(storage_dir=str(tmp_path / "job_data"), write_delay=0)
+    manager.create_job("job-1")
+    assert index.get("job-1")["status"] == "pending"
+
+    (output_dir / "job-1").mkdir()
+    (output_dir / "job-1" / "script.json").write_text(json.dumps({
+        "script": {"title": "Waves", "total_duration_seconds": 42, "sections": [{}, {}, {}]},
+    }))
+    manager.update_job("job-1", JobStatus.CREATING_ANIMATIONS, 40)
+    summary = index.get("job-1")
+    assert (summary["status"], summary["title"], summary["sections_count"]) == ("creating_animations", "Waves", 3)
+
+    # Progress within a status does not touch the index
+    manager.update_job("job-1", JobStatus.CREATING_ANIMATIONS, 60, "Section 2")
+    assert index.get("job-1")["progress"] == 40
+
+    _finish_video(output_dir, "job-1", "Waves", 42.5)
+    manager.update_job("job-1", JobStatus.COMPLETED, 100, "Done")
+    summary = index.get("job-1")
+    assert summary["video_exists"] is True
+    assert summary["video_url"] == "/outputs/job-1/final_video.mp4"
+    assert summary["total_duration"] == 42.5
+    assert summary["thumbnail_url"] == "/outputs/job-1/thumbnail.jpg"
+
+    # Job data cleaned up: the video stays listed as an orphan
+    manager.delete_job("job-1")
+    assert index.get("job-1")["message"] == "Video ready"
+
+
+def test_rebuild_lists_jobs_orphans_and_failures(output_dir, index):
+    _finish_video(output_dir, "orphan", "Orphaned", 30.0)
+    save_error_info(ErrorInfo(job_id="failed-job", error_message="boom", stage="script", timestamp="2026-01-02"))
+    (output_dir / "empty").mkdir()
+
+    jobs = [{"id": "running", "status": "analyzing", "progress": 5, "message": "",
+             "created_at": "2026-01-03", "updated_at": "2026-01-03"}]
+    assert index.rebuild(jobs) == 3
+    assert index.is_built()
+
+    rows, total = index.query()
+    assert total == 3
+    assert [row["id"] for row in rows] == ["running", "failed-job", "orphan"]
+    assert rows[1]["title"] == "Failed Job (failed-j)"
+
+    rows, total = index.query(completed_only=True)
+    assert [row["id"] for row in rows] == ["orphan"]
+
+
+def test_query_filters_sorts_and_pages_like_the_in_memory_fallback(output_dir, index):
+    summaries = []
+    for i, (status, title) in enumerate([
+        ("completed", "Beta"), ("failed", "alpha"), ("completed", None), ("completed", "Gamma"),
+    ]):
+        summary = {
+            "id": f"job-{i}", "status": status, "progress": 0, "message": "", "error": None,
+            "result": None, "created_at": f"2026-01-0{i + 1}", "updated_at": "",
+            "title": title, "total_duration": None, "sections_count": None,
+            "thumbnail_url": None, "video_exists": status == "completed",
+        }
+        summaries.append(summary)
+        with index._connect() as conn:
+            index._upsert(conn, summary)
+
+    cases = [
+        dict(),
+        dict(sort="title", descending=False),
+        dict(sort="title", descending=True, limit=2, offset=1),
+        dict(statuses=("failed",)),
+        dict(query="a", completed_only=True),
+    ]
+    for params in cases:
+        rows, total = index.query(**params)
+        expected, expected_total = filter_job_summaries(
+            [dict(s, video_url=None) for s in summaries], **params
+        )
+        assert [row["id"] for row in rows] == [s["id"] for s in expected], params
+        assert total == expected_total
+
+    rows, _ = index.query(sort="title", descending=False)
+    assert [row["id"] for row in rows] == ["job-1", "job-0", "job-3", "job-2"]
+
+
+def test_listing_parameters_are_validated():
+    assert parse_status_filter("completed, FAILED") == ("completed", "failed")
+    assert validate_listing_params(None, None, None, 0) == ("created_at", True)
+    assert validate_listing_params("title", "asc", 10, 20) == ("title", False)
+    for args in [("size", None, None, 0), (None, "up", None, 0), (None, None, 0, 0), (None, None, None, -1)]:
+        with pytest.raises(HTTPException):
+            validate_listing_params(*args)
+    with pytest.raises(HTTPException):
+        parse_status_filter("done")
+
+
+def test_record_job_change_is_a_no_op_when_disabled(tmp_path):
+    with patch(f"{MODULE}.get_job_summary_index") as get_index:
+        summary_module.record_job_change("job-1", {"id": "job-1"})
+    get_index.assert_not_called()
@@ -0,0 +1,104 @@
+"""
+Tests for app.services.infrastructure.orchestration.sqlite_job_manager
+"""
+
+import json
+
+import pytest
+
+from app.services.infrastructure.orchestration.job_manager import JobStatus
+from app.services.infrastructure.orchestration.sqlite_job_manager import SqliteJobManager
+from app.services.infrastructure.storage.job_repository import SqliteJobRepository
+
+
+@pytest.fixture
+def json_dir(tmp_path):
+    path = tmp_path / "job_data"
+    path.mkdir()
+    return path
+
+
+@pytest.fixture
+def manager(tmp_path, json_dir):
+    return SqliteJobManager(tmp_path / "jobs.db", json_dir=json_dir)
+
+
+def _write_job_file(json_dir, job_id, status, **fields):
+    data = {"id": job_id, "status": status, "progress": 0.0, "message": "", **fields}
+    (json_dir / f"{job_id}.json").write_text(json.dumps(data))
+
+
+def test_create_update_and_delete(manager):
+    manager.create_job("job-1", priority="bulk")
+    manager.update_job("job-1", JobStatus.COMPLETED, 100, "Done", result=[{"video": "v.mp4"}])
+    manager.update_job("job-1", message="Renamed")
+
+    job = manager.get_job("job-1")
+    assert job.status == JobStatus.COMPLETED
+    assert job.progress == 100
+    assert job.message == "Renamed"
+    assert job.result == [{"video": "v.mp4"}]
+    assert job.priority == "bulk"
+
+    assert manager.delete_job("job-1")["status"] == "completed"
+    assert manager.get_job("job-1") is None
+    assert manager.delete_job("job-1") is None
+
+
+def test_update_of_unknown_job_is_ignored(manager):
+    manager.update_job("missing", JobStatus.FAILED)
+    assert manager.get_job("missing") is None
+
+
+def test_interrupted_jobs_are_found_and_failed_by_status(manager):
+    manager.create_job("running")
+    manager.update_job("running", JobStatus.CREATING_ANIMATIONS, 40)
+    manager.create_job("done")
+    manager.update_job("done", JobStatus.COMPLETED, 100)
+
+    assert [job.id for job in manager.get_interrupted_jobs()] == ["running"]
+
+    manager.mark_interrupted_jobs_failed()
+    running = manager.get_job("running")
+    assert running.status == JobStatus.FAILED
+    assert running.message == "Job was interrupted by server restart"
+    assert manager.get_interrupted_jobs() == []
+    assert manager.get_job("done").status == JobStatus.COMPLETED
+
+
+def test_json_jobs_are_imported_once(tmp_path, json_dir):
+    _write_job_file(json_dir, "old-done", "completed", result=[{"id": "s0"}])
+    _write_job_file(json_dir, "old-running", "analyzing")
+    (json_dir / "broken.json").write_text("{not json")
+
+    first = SqliteJobManager(tmp_path / "jobs.db", json_dir=json_dir)
+    assert sorted(job["id"] for job in first.list_all_jobs()) == ["old-done", "old-running"]
+    assert first.get_job("old-done").result == [{"id": "s0"}]
+
+    # Later files (and deletions) are not re-imported by other processes
+    first.delete_job("old-done")
+    _write_job_file(json_dir, "late", "pending")
+    second = SqliteJobManager(tmp_path / "jobs.db", json_dir=json_dir)
+    assert [job["id"] for job in second.list_all_jobs()] == ["old-running"]
+
+
+def test_processes_share_the_store(tmp_path, json_dir):
+    api = SqliteJobManager(tmp_path / "jobs.db", json_dir=json_dir)
+    worker = SqliteJobManager(tmp_path / "jobs.db", json_dir=json_dir)
+
+    api.create_job("job-1")
+    worker.update_job("job-1", JobStatus.COMPOSING_VIDEO, 90)
+
+    assert api.get_job("job-1").status == JobStatus.COMPOSING_VIDEO
+
+
+def test_repository_lists_completed_from_status_index(manager):
+    for job_id, status in (("a", JobStatus.COMPLETED), ("b", JobStatus.FAILED), ("c", JobStatus.COMPLETED)):
+        manager.create_job(job_id)
+        manager.update_job(job_id, status)
+
+    repo = SqliteJobRepository(manager)
+
+    assert [record.id for record in repo.list_all()] == ["a", "b", "c"]
+    assert [record.id for record in repo.list_completed()] == ["c", "a"]
+    assert repo.update("b", status="completed").status == "completed"
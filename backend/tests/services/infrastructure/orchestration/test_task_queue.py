@@ -0,0 +1,153 @@
+"""
+Tests for the durable SQLite task queue and task worker
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from app.services.infrastructure.orchestration.task_queue import SqliteTaskQueue, TaskStatus
+from app.services.infrastructure.orchestration.task_worker import TaskDeferred, TaskWorker
+
+
+@pytest.fixture
+def queue(tmp_path):
+    return SqliteTaskQueue(tmp_path / "queue.db", visibility_timeout=30)
+
+
+class TestSqliteTaskQueue:
+    def test_claim_orders_by_priority_then_age(self, queue):
+        queue.enqueue("work", {"n": 1}, priority="bulk")
+        queue.enqueue("work", {"n": 2}, priority="normal")
+        queue.enqueue("work", {"n": 3}, priority="interactive")
+
+        claimed = [queue.claim("w1").payload["n"] for _ in range(3)]
+        assert claimed == [3, 2, 1]
+        assert queue.claim("w1") is None
+
+    def test_claim_is_exclusive_and_filters_kinds(self, queue):
+        queue.enqueue("render", {})
+        assert queue.claim("w1", kinds=["tts"]) is None
+
+        task = queue.claim("w1", kinds=["render"])
+        assert task.status == TaskStatus.RUNNING
+        assert task.attempts == 1
+        assert queue.claim("w2") is None
+
+    def test_dedupe_key_is_idempotent(self, queue):
+        first = queue.enqueue("section", {"i": 0}, dedupe_key="run:section:0")
+        second = queue.enqueue("section", {"i": 0}, dedupe_key="run:section:0")
+        assert first == second
+        assert len(queue.list_tasks()) == 1
+
+    def test_fail_retries_with_backoff_then_dead(self, queue):
+        task_id = queue.enqueue("work", {}, max_attempts=2)
+
+        task = queue.claim("w1")
+        assert queue.fail(task.id, "w1", "boom") == TaskStatus.QUEUED
+        assert queue.claim("w1") is None  # backoff delay not elapsed
+        assert queue.get(task_id).available_at > time.time()
+
+        with queue._connect() as conn:
+            conn.execute("UPDATE tasks SET available_at = 0 WHERE id = ?", (task_id,))
+        task = queue.claim("w1")
+        assert task.attempts == 2
+        assert queue.fail(task.id, "w1", "boom again") == TaskStatus.FAILED
+        assert queue.get(task_id).error == "boom again"
+
+    def test_expired_lease_is_requeued(self, queue):
+        task_id = queue.enqueue("work", {}, max_attempts=2)
+        queue.claim("w1", visibility_timeout=0.01)
+        time.sleep(0.05)
+
+        assert queue.requeue_expired() == []
+        assert queue.heartbeat(task_id, "w1") is False  # w1 lost the lease
+
+        task = queue.claim("w2", visibility_timeout=0.01)
+        assert task.id == task_id
+        time.sleep(0.05)
+        dead = queue.requeue_expired()
+        assert [t.id for t in dead] == [task_id]
+        assert queue.get(task_id).status == TaskStatus.FAILED
+
+    def test_defer_does_not_use_an_attempt(self, queue):
+        task_id = queue.enqueue("assemble", {}, max_attempts=1)
+        task = queue.claim("w1")
+        assert queue.defer(task.id, "w1", delay=0)
+        assert queue.get(task_id).attempts == 0
+        assert queue.claim("w1").id == task_id
+
+    def test_cancel_job_revokes_leases(self, queue):
+        queued_id = queue.enqueue("work", {}, job_id="job-1")
+        running_id = queue.enqueue("work", {}, job_id="job-1")
+        queue.enqueue("work", {}, job_id="job-2")
+        with queue._connect() as conn:
+            conn.execute("UPDATE tasks SET available_at = 0 WHERE id = ?", (running_id,))
+        assert queue.claim("w1").id == running_id
+
+        assert queue.cancel_job("job-1") == 2
+        assert queue.heartbeat(running_id, "w1") is False
+        assert queue.get(queued_id).status == TaskStatus.CANCELLED
+        assert not queue.has_pending("job-1")
+        assert queue.has_pending("job-2")
+
+
+@pytest.mark.asyncio
+class TestTaskWorker:
+    async def test_completes_task_with_result(self, queue):
+        async def handler(task):
+            return {"doubled": task.payload["n"] * 2}
+
+        task_id = queue.enqueue("double", {"n": 21})
+        worker = TaskWorker(queue, {"double": handler}, worker_id="w1")
+
+        assert await worker.run_once() is True
+        task = queue.get(task_id)
+        assert task.status == TaskStatus.SUCCEEDED
+        assert task.result == {"doubled": 42}
+        assert await worker.run_once() is False
+
+    async def test_failure_is_retried_and_reported_dead(self, queue):
+        dead = []
+
+        async def handler(task):
+            raise RuntimeError("render failed")
+
+        async def on_dead(task):
+            dead.append(task)
+
+        task_id = queue.enqueue("render", {}, max_attempts=1)
+        worker = TaskWorker(queue, {"render": handler}, worker_id="w1", on_dead=on_dead)
+        await worker.run_once()
+
+        assert queue.get(task_id).status == TaskStatus.FAILED
+        assert [t.id for t in dead] == [task_id]
+
+    async def test_deferred_task_is_requeued(self, queue):
+        async def handler(task):
+            raise TaskDeferred(delay=0)
+
+        task_id = queue.enqueue("assemble", {}, max_attempts=1)
+        worker = TaskWorker(queue, {"assemble": handler}, worker_id="w1")
+        await worker.run_once()
+
+        task = queue.get(task_id)
+        assert task.status == TaskStatus.QUEUED
+        assert task.attempts == 0
+
+    async def test_lost_lease_cancels_running_handler(self, queue):
+        started = asyncio.Event()
+
+        async def handler(task):
+            started.set()
+            await asyncio.sleep(30)
+
+        task_id = queue.enqueue("render", {}, job_id="job-1")
+        worker = TaskWorker(queue, {"render": handler}, worker_id="w1", heartbeat_interval=0.05)
+        run = asyncio.create_task(worker.run_once())
+        await asyncio.wait_for(started.wait(), timeout=5)
+
+        queue.cancel_job("job-1")
+        await asyncio.wait_for(run, timeout=5)
+        assert queue.get(task_id).status == TaskStatus.CANCELLED
@@ -0,0 +1,84 @@
+import os
+import time
+
+from app.services.infrastructure.storage.artifact_store import SectionArtifactStore
+
+
+def _section_files(directory):
+    directory.mkdir(parents=True, exist_ok=True)
+    video = directory / "final_section.mp4"
+    audio = directory / "audio.mp3"
+    video.write_bytes(b"video")
+    audio.write_bytes(b"audio")
+    return {"video": video, "audio": audio}
+
+
+def _age(store, key, hours):
+    ts = time.time() - hours * 3600
+    with store._connect() as conn:
+        conn.execute("UPDATE artifacts SET last_used_at = ? WHERE key = ?", (ts, key))
+
+
+def test_put_then_acquire_from_another_job(tmp_path):
+    store = SectionArtifactStore(tmp_path / "store")
+    files = _section_files(tmp_path / "job-a" / "0")
+
+    stored = store.put("k" * 64, "job-a", files, {"duration": 12.5})
+    assert stored is not None
+
+    artifact = store.acquire("k" * 64, "job-b")
+    assert artifact.metadata == {"duration": 12.5}
+    assert store.refcount("k" * 64) == 2
+
+    placed = store.materialize(artifact, tmp_path / "job-b" / "0")
+    assert placed["video"].read_bytes() == b"video"
+    # Jobs get copies: editing one never changes the shared artifact
+    placed["video"].write_bytes(b"edited")
+    assert artifact.files["video"].read_bytes() == b"video"
+
+
+def test_acquire_miss_and_incomplete_artifact(tmp_path):
+    store = SectionArtifactStore(tmp_path / "store")
+    assert store.acquire("missing", "job") is None
+
+    stored = store.put("k" * 64, "job-a", _section_files(tmp_path / "a"))
+    os.remove(stored.files["audio"])
+
+    assert store.acquire("k" * 64, "job-b") is None
+    assert store.stats()["artifacts"] == 0
+
+
+def test_put_existing_key_keeps_first_artifact(tmp_path):
+    store = SectionArtifactStore(tmp_path / "store")
+    store.put("k" * 64, "job-a", _section_files(tmp_path / "a"))
+    files = _section_files(tmp_path / "b")
+    files["video"].write_bytes(b"other")
+
+    artifact = store.put("k" * 64, "job-b", files)
+
+    assert artifact.files["video"].read_bytes() == b"video"
+    assert store.refcount("k" * 64) == 2
+
+
+def test_garbage_collection_honours_references(tmp_path):
+    store = SectionArtifactStore(tmp_path / "store")
+    kept = store.put("a" * 64, "job-a", _section_files(tmp_path / "a"))
+    released = store.put("b" * 64, "job-b", _section_files(tmp_path / "b"))
+    _age(store, "a" * 64, 10)
+    _age(store, "b" * 64, 10)
+
+    assert store.release_jobs_except({"job-a"}) == 1
+    assert store.collect_garbage(min_idle_hours=1, max_deletions=10) == 1
+
+    assert kept.files["video"].exists()
+    assert not released.files["video"].exists()
+    assert store.acquire("b" * 64, "job-c") is None
+
+
+def test_garbage_collection_waits_for_idle_period(tmp_path):
+    store = SectionArtifactStore(tmp_path / "store")
+    store.put("a" * 64, "job-a", _section_files(tmp_path / "a"))
+    store.release_job("job-a")
+
+    assert store.collect_garbage(min_idle_hours=1, max_deletions=10) == 0
+    assert store.stats()["artifacts"] == 1
@@ -1,4 +1,7 @@
+import asyncio
 import os
+import shutil
+import tarfile
 import time
 from pathlib import Path
 
@@ -33,6 +36,8 @@ def test_cleanup_prunes_completed_output_to_final_video_only(tmp_path, monkeypat
     (job_output / "translations" / "es" / "final_video.mp4").write_text("translated")
     (job_output / "translations" / "es" / "script.json").write_text("{}")
     (job_output / "translations" / "es" / "section_0").mkdir()
+    (job_output / "themes" / "clean" / "section_0").mkdir(parents=True)
+    (job_output / "themes" / "clean" / "final_video.mp4").write_text("rethemed")
     _set_old_mtime(job_output, hours_ago=2)
 
     monkeypatch.setenv("OUTPUT_CLEANUP_ENABLED", "true")
@@ -53,6 +58,8 @@ def test_cleanup_prunes_completed_output_to_final_video_only(tmp_path, monkeypat
     assert (job_output / "translations" / "es" / "final_video.mp4").exists()
     assert not (job_output / "translations" / "es" / "script.json").exists()
     assert not (job_output / "translations" / "es" / "section_0").exists()
+    assert (job_output / "themes" / "clean" / "final_video.mp4").exists()
+    assert not (job_output / "themes" / "clean" / "section_0").exists()
     assert not (job_output / "sections").exists()
     assert not (job_output / "script.json").exists()
     assert job_manager.get_job(job_id) is not None
@@ -140,3 +147,245 @@ def test_cleanup_deletes_old_upload_files(tmp_path, monkeypatch):
     assert summary["deleted_uploads"] == 1
     assert not old_upload.exists()
     assert fresh_upload.exists()
+
+
+def test_cleanup_releases_pruned_jobs_and_keeps_shared_artifacts(tmp_path, monkeypatch):
+    from app.services.infrastructure.storage.artifact_store import SectionArtifactStore
+
+    output_dir = tmp_path / "outputs"
+    output_dir.mkdir()
+    job_manager = JobManager(storage_dir=str(tmp_path / "job_data"), cache_limit=10)
+    store = SectionArtifactStore(tmp_path / "artifacts")
+
+    section_file = tmp_path / "video.mp4"
+    section_file.write_text("video")
+    for job_id in ("completed-job", "running-job"):
+        (output_dir / job_id / "sections").mkdir(parents=True)
+        store.put("shared" + "0" * 58, job_id, {"video": section_file})
+    store.put("unused" + "0" * 58, "completed-job", {"video": section_file})
+    with store._connect() as conn:
+        conn.execute("UPDATE artifacts SET last_used_at = ?", (time.time() - 2 * 3600,))
+
+    job_manager.create_job("completed-job")
+    job_manager.update_job("completed-job", status=JobStatus.COMPLETED, progress=100)
+    job_manager.create_job("running-job")
+    job_manager.update_job("running-job", status=JobStatus.CREATING_ANIMATIONS, progress=50)
+    (output_dir / "completed-job" / "final_video.mp4").write_text("video")
+
+    monkeypatch.setenv("OUTPUT_KEEP_ONLY_FINAL", "true")
+    monkeypatch.setenv("SECTION_ARTIFACT_RETENTION_HOURS", "1")
+
+    service = OutputCleanupService(output_dir=output_dir, job_manager=job_manager, artifact_store=store)
+    summary = service.run_once()
+
+    assert summary["released_artifact_refs"] == 2
+    assert summary["deleted_artifacts"] == 1
+    assert store.refcount("shared" + "0" * 58) == 1
+    assert store.acquire("shared" + "0" * 58, "new-job") is not None
+    assert store.acquire("unused" + "0" * 58, "new-job") is None
+
+
+def _make_output(output_dir: Path, job_id: str, final: int = 0, intermediates: int = 0, hours_ago: float = 0) -> Path:
+    job_output = output_dir / job_id
+    (job_output / "sections" / "0").mkdir(parents=True)
+    if intermediates:
+        (job_output / "sections" / "0" / "section.mp4").write_bytes(b"x" * intermediates)
+    if final:
+        (job_output / "final_video.mp4").write_bytes(b"v" * final)
+        _set_old_mtime(job_output / "final_video.mp4", hours_ago)
+    _set_old_mtime(job_output, hours_ago)
+    return job_output
+
+
+def test_quota_evicts_least_recently_used_intermediates_first(tmp_path, monkeypatch):
+    output_dir = tmp_path / "outputs"
+    output_dir.mkdir()
+    job_manager = JobManager(storage_dir=str(tmp_path / "job_data"), cache_limit=10)
+    job_manager.create_job("running-job")
+    job_manager.update_job("running-job", status=JobStatus.CREATING_ANIMATIONS, progress=50)
+
+    older = _make_output(output_dir, "older", final=1000, intermediates=3000, hours_ago=3)
+    newer = _make_output(output_dir, "newer", final=1000, intermediates=3000, hours_ago=1)
+    running = _make_output(output_dir, "running-job", intermediates=2000)
+
+    monkeypatch.setenv("OUTPUT_KEEP_ONLY_FINAL", "false")
+    service = OutputCleanupService(output_dir=output_dir, job_manager=job_manager)
+    service.quota_bytes = 8000
+    summary = service.run_once()
+
+    assert summary["quota_pruned_jobs"] == 1
+    assert summary["quota_deleted_output_dirs"] == 0
+    assert summary["output_bytes"] == 7000
+    assert (older / "final_video.mp4").exists()
+    assert not (older / "sections").exists()
+    assert (newer / "sections" / "0" / "section.mp4").exists()
+    assert (running / "sections" / "0" / "section.mp4").exists()
+
+
+def test_quota_deletes_whole_jobs_when_pruning_is_not_enough(tmp_path, monkeypatch):
+    output_dir = tmp_path / "outputs"
+    output_dir.mkdir()
+    job_manager = JobManager(storage_dir=str(tmp_path / "job_data"), cache_limit=10)
+    job_manager.create_job("failed-job")
+    job_manager.update_job("failed-job", status=JobStatus.FAILED, progress=10)
+    job_manager.create_job("running-job")
+    job_manager.update_job("running-job", status=JobStatus.CREATING_ANIMATIONS, progress=50)
+
+    failed = _make_output(output_dir, "failed-job", intermediates=5000)
+    final_only = _make_output(output_dir, "final-only", final=1000, hours_ago=1)
+    shutil.rmtree(final_only / "sections")
+    _set_old_mtime(final_only, hours_ago=1)
+    running = _make_output(output_dir, "running-job", intermediates=2000)
+
+    monkeypatch.setenv("OUTPUT_KEEP_ONLY_FINAL", "false")
+    monkeypatch.setenv("OUTPUT_QUOTA_GB", str(5000 / 1024 ** 3))
+    service = OutputCleanupService(output_dir=output_dir, job_manager=job_manager)
+    summary = service.run_once()
+
+    # The failed job was used more recently than final-only, but the
+    # final-only video is evicted first and is not enough on its own
+    assert summary["quota_deleted_output_dirs"] == 2
+    assert not failed.exists()
+    assert not final_only.exists()
+    assert job_manager.get_job("failed-job") is None
+    assert running.exists()
+    assert service.job_usage["running-job"] == 2000
+
+
+def test_quota_measures_each_directory_once_and_evicts_in_slices(tmp_path, monkeypatch):
+    from app.services.infrastructure.storage import output_cleanup
+
+    output_dir = tmp_path / "outputs"
+    output_dir.mkdir()
+    job_manager = JobManager(storage_dir=str(tmp_path / "job_data"), cache_limit=10)
+    for i in range(3):
+        _make_output(output_dir, f"orphan-{i}", intermediates=1000, hours_ago=3 - i)
+
+    walked = []
+    real_usage = output_cleanup._dir_usage
+
+    def counting_usage(path, seen_inodes):
+        walked.append(path.name)
+        return real_usage(path, seen_inodes)
+
+    monkeypatch.setattr(output_cleanup, "_dir_usage", counting_usage)
+    monkeypatch.setenv("OUTPUT_KEEP_ONLY_FINAL", "false")
+    monkeypatch.setenv("OUTPUT_QUOTA_GB", str(1500 / 1024 ** 3))
+    service = OutputCleanupService(output_dir=output_dir, job_manager=job_manager)
+    service.slice_seconds = 0.0
+
+    evictions = [summary["quota_deleted_output_dirs"] for summary in service.iter_sweep()]
+
+    assert sorted(walked) == ["orphan-0", "orphan-1", "orphan-2"]
+    # Each evicted job ends its own slice
+    assert 1 in evictions and evictions[-1] == 2
+    assert [p.name for p in output_dir.iterdir()] == ["orphan-2"]
+    assert service.job_usage == {"orphan-2": 1000}
+
+
+def test_pruning_can_archive_text_intermediates(tmp_path, monkeypatch):
+    output_dir = tmp_path / "outputs"
+    output_dir.mkdir()
+    job_manager = JobManager(storage_dir=str(tmp_path / "job_data"), cache_limit=10)
+    job_manager.create_job("completed-job")
+    job_manager.update_job("completed-job", status=JobStatus.COMPLETED, progress=100)
+
+    job_output = _make_output(output_dir, "completed-job", final=10, intermediates=10)
+    (job_output / "sections" / "0" / "scene.py").write_text("class Scene: pass")
+    (job_output / "script.json").write_text("{}")
+
+    monkeypatch.setenv("OUTPUT_KEEP_ONLY_FINAL", "true")
+    monkeypatch.setenv("OUTPUT_ARCHIVE_INTERMEDIATES", "true")
+    service = OutputCleanupService(output_dir=output_dir, job_manager=job_manager)
+    service.run_once()
+
+    assert sorted(p.name for p in job_output.iterdir()) == ["final_video.mp4", "intermediates.tar.gz"]
+    with tarfile.open(job_output / "intermediates.tar.gz") as archive:
+        assert sorted(archive.getnames()) == ["script.json", "sections/0/scene.py"]
+        assert archive.extractfile("sections/0/scene.py").read() == b"class Scene: pass"
+
+
+def test_sweeps_resume_from_the_cursor(tmp_path, monkeypatch):
+    output_dir = tmp_path / "outputs"
+    output_dir.mkdir()
+    job_manager = JobManager(storage_dir=str(tmp_path / "job_data"), cache_limit=10)
+    for name in ("a", "b", "c"):
+        (output_dir / name).mkdir()
+        _set_old_mtime(output_dir / name, hours_ago=12)
+
+    monkeypatch.setenv("ORPHAN_OUTPUT_RETENTION_HOURS", "1")
+    monkeypatch.setenv("OUTPUT_CLEANUP_MAX_DELETIONS", "1")
+    service = OutputCleanupService(output_dir=output_dir, job_manager=job_manager)
+
+    remaining = []
+    for _ in range(3):
+        assert service.run_once()["deleted_output_dirs"] == 1
+        remaining.append(sorted(p.name for p in output_dir.iterdir()))
+    assert remaining == [["b", "c"], ["c"], []]
+
+    # The next sweep wraps around to names before the cursor
+    (output_dir / "a").mkdir()
+    _set_old_mtime(output_dir / "a", hours_ago=12)
+    assert service.run_once()["deleted_output_dirs"] == 1
+
+
+async def test_run_sweep_yields_the_event_loop_between_slices(tmp_path, monkeypatch):
+    output_dir = tmp_path / "outputs"
+    output_dir.mkdir()
+    job_manager = JobManager(storage_dir=str(tmp_path / "job_data"), cache_limit=10)
+    for i in range(5):
+        (output_dir / f"orphan-{i}" / "sections").mkdir(parents=True)
+        (output_dir / f"orphan-{i}" / "sections" / "video.mp4").write_bytes(b"x" * 100)
+        _set_old_mtime(output_dir / f"orphan-{i}", hours_ago=12)
+
+    monkeypatch.setenv("ORPHAN_OUTPUT_RETENTION_HOURS", "1")
+    service = OutputCleanupService(output_dir=output_dir, job_manager=job_manager)
+    service.slice_seconds = 0.0
+    service.slice_pause_seconds = 0.0
+
+    ticks = 0
+
+    async def ticker():
+        nonlocal ticks
+        while True:
+            ticks += 1
+            await asyncio.sleep(0)
+
+    task = asyncio.create_task(ticker())
+    summary = await service.run_sweep()
+    task.cancel()
+
+    assert summary["deleted_output_dirs"] == 5
+    assert list(output_dir.iterdir()) == []
+    assert ticks >= 5
+
+
+def test_tree_deletion_is_throttled(tmp_path, monkeypatch):
+    from app.services.infrastructure.storage import output_cleanup
+
+    class FakeClock:
+        now = 0.0
+
+        def monotonic(self):
+            return self.now
+
+        def sleep(self, delay):
+            delays.append(delay)
+            self.now += delay
+
+    delays = []
+    monkeypatch.setattr(output_cleanup, "time", FakeClock())
+    monkeypatch.setenv("OUTPUT_CLEANUP_DELETE_FILES_PER_SECOND", "2")
+    monkeypatch.setenv("OUTPUT_CLEANUP_DELETE_MB_PER_SECOND", "0")
+    service = OutputCleanupService(output_dir=tmp_path, job_manager=None)
+
+    tree = tmp_path / "job" / "sections"
+    tree.mkdir(parents=True)
+    for i in range(6):
+        (tree / f"{i}.mp4").write_bytes(b"x")
+    service._remove_tree(tmp_path / "job")
+
+    assert not (tmp_path / "job").exists()
+    # Two files fit in the burst; the other four wait half a second each
+    assert len(delays) == 4
+    assert delays == [0.5] * 4
@@ -0,0 +1,60 @@
+from app.services.pipeline.animation.generation.core import (
+    StageCheckpoints,
+    hash_inputs,
+    section_fingerprint,
+)
+from app.services.pipeline.animation.generation.core.checkpoints import (
+    CHECKPOINT_FILE_NAME,
+    STAGE_CHOREOGRAPHY,
+    STAGE_IMPLEMENTATION,
+    STAGE_REFINEMENT,
+    STAGE_RENDER,
+)
+
+
+def test_hash_inputs_is_order_independent_for_dicts():
+    assert hash_inputs({"a": 1, "b": 2}, 3.0) == hash_inputs({"b": 2, "a": 1}, 3.0)
+    assert hash_inputs({"a": 1}, 3.0) != hash_inputs({"a": 1}, 3.5)
+
+
+def test_section_fingerprint_ignores_pipeline_outputs():
+    section = {"title": "Intro", "narration": "Hello"}
+    written = dict(section, video="/tmp/v.mp4", manim_code="code", order=0)
+    assert section_fingerprint(written) == section
+
+
+def test_save_and_reload(tmp_path):
+    checkpoints = StageCheckpoints(tmp_path)
+    checkpoints.save(STAGE_CHOREOGRAPHY, "h1", output="plan")
+
+    reloaded = StageCheckpoints(tmp_path)
+    assert (tmp_path / CHECKPOINT_FILE_NAME).exists()
+    assert reloaded.load_output(STAGE_CHOREOGRAPHY, "h1") == "plan"
+    assert reloaded.load_output(STAGE_CHOREOGRAPHY, "other") is None
+    assert reloaded.load_output(STAGE_IMPLEMENTATION, "h1") is None
+
+
+def test_saving_a_stage_drops_later_stages(tmp_path):
+    checkpoints = StageCheckpoints(tmp_path)
+    for stage in (STAGE_CHOREOGRAPHY, STAGE_IMPLEMENTATION, STAGE_REFINEMENT, STAGE_RENDER):
+        checkpoints.save(stage, "h", output=stage)
+    assert checkpoints.stages() == [STAGE_CHOREOGRAPHY, STAGE_IMPLEMENTATION, STAGE_REFINEMENT, STAGE_RENDER]
+
+    checkpoints.save(STAGE_IMPLEMENTATION, "h2", output="new code")
+
+    assert StageCheckpoints(tmp_path).stages() == [STAGE_CHOREOGRAPHY, STAGE_IMPLEMENTATION]
+
+
+def test_saving_an_identical_output_keeps_later_stages(tmp_path):
+    checkpoints = StageCheckpoints(tmp_path)
+    checkpoints.save(STAGE_IMPLEMENTATION, "h", output="code")
+    checkpoints.save(STAGE_REFINEMENT, "h2", output="refined")
+
+    checkpoints.save(STAGE_IMPLEMENTATION, "h3", output="code")
+
+    assert checkpoints.load_output(STAGE_REFINEMENT, "h2") == "refined"
+
+
+def test_corrupt_file_is_ignored(tmp_path):
+    (tmp_path / CHECKPOINT_FILE_NAME).write_text("{not json", encoding="utf-8")
+    assert StageCheckpoints(tmp_path).stages() == []
@@ -33,7 +33,7 @@ async def test_render_scene_success():
     mock_file_manager = Mock()
     mock_file_manager.get_expected_video_path.return_value = "video.mp4"
     
-    with patch("subprocess.run") as mock_run, \
+    with patch("app.core.cancellation.run_process") as mock_run, \
          patch("app.services.pipeline.animation.generation.core.renderer.validate_video_file", new_callable=AsyncMock) as mock_val:
         
         mock_run.return_value.returncode = 0
@@ -56,7 +56,7 @@ async def test_render_scene_success():
 async def test_render_scene_manim_failure():
     mock_file_manager = Mock()
     
-    with patch("subprocess.run") as mock_run:
+    with patch("app.core.cancellation.run_process") as mock_run:
         mock_run.return_value.returncode = 1
         mock_run.return_value.stderr = "Error"
         
@@ -76,7 +76,7 @@ async def test_render_scene_video_not_found():
     # Returns None or validator returns False
     mock_file_manager.get_expected_video_path.return_value = None
     
-    with patch("subprocess.run") as mock_run:
+    with patch("app.core.cancellation.run_process") as mock_run:
         mock_run.return_value.returncode = 0
         
         with pytest.raises(RenderingError):
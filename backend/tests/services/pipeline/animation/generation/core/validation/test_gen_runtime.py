@@ -11,7 +11,7 @@ def validator():
 
 @pytest.mark.asyncio
 async def test_validate_success(validator):
-    with patch("subprocess.run") as mock_run:
+    with patch("app.core.cancellation.run_process") as mock_run:
         mock_run.return_value.returncode = 0
         mock_run.return_value.stderr = ""
         
@@ -26,7 +26,7 @@ async def test_validate_with_spatial_issues(validator):
     Random log
     SPATIAL_ISSUES_JSON:[{"severity": "critical", "confidence": "high", "category": "text_overlap", "message": "Overlap"}]
     """
-    with patch("subprocess.run") as mock_run, \
+    with patch("app.core.cancellation.run_process") as mock_run, \
          patch("app.services.pipeline.animation.generation.core.validation.spatial.SpatialCheckInjector") as MockInjector:
         
         mock_run.return_value.returncode = 1 # Exit 1 is common when sys.exit called
@@ -47,7 +47,7 @@ async def test_validate_with_spatial_issues_in_stdout(validator):
     Random log
     SPATIAL_ISSUES_JSON:[{"severity": "critical", "confidence": "high", "category": "out_of_bounds", "message": "Off-screen text"}]
     """
-    with patch("subprocess.run") as mock_run, \
+    with patch("app.core.cancellation.run_process") as mock_run, \
          patch("app.services.pipeline.animation.generation.core.validation.spatial.SpatialCheckInjector") as MockInjector:
 
         mock_run.return_value.returncode = 1
@@ -70,7 +70,7 @@ async def test_validate_runtime_error(validator):
         x = 1 / 0
     ZeroDivisionError: division by zero
     """
-    with patch("subprocess.run") as mock_run:
+    with patch("app.core.cancellation.run_process") as mock_run:
         mock_run.return_value.returncode = 1
         mock_run.return_value.stderr = stderr
         
@@ -119,7 +119,7 @@ class SceneA(Scene):
         t = MathTable([["1"]])
         x = t.grid_lines
 """
-    with patch("subprocess.run") as mock_run:
+    with patch("app.core.cancellation.run_process") as mock_run:
         result = await validator.validate(code)
         assert result.valid is False
         assert any("grid_lines" in issue.message for issue in result.issues)
@@ -139,7 +139,7 @@ class SceneA(Scene):
         )
         grid = t.get_grid_lines()
 """
-    with patch("subprocess.run") as mock_run:
+    with patch("app.core.cancellation.run_process") as mock_run:
         result = await validator.validate(code)
         assert result.valid is False
         assert any(
@@ -169,7 +169,7 @@ class SceneA(Scene):
         )
         grid = t.get_horizontal_lines()
 """
-    with patch("subprocess.run") as mock_run:
+    with patch("app.core.cancellation.run_process") as mock_run:
         result = await validator.validate(code)
         assert result.valid is False
         assert any(
@@ -193,7 +193,7 @@ class SceneA(Scene):
         )
         bad = t.get_cell((8, 8))
 """
-    with patch("subprocess.run") as mock_run:
+    with patch("app.core.cancellation.run_process") as mock_run:
         result = await validator.validate(code)
         assert result.valid is False
         assert any(
@@ -212,7 +212,7 @@ class SceneA(Scene):
     def construct(self):
         self.wait(1.0 - 2.5)
 """
-    with patch("subprocess.run") as mock_run:
+    with patch("app.core.cancellation.run_process") as mock_run:
         result = await validator.validate(code)
         assert result.valid is False
         assert any(
@@ -236,7 +236,7 @@ class SceneA(Scene):
         )
         bad = t.get_columns()[10][0]
 """
-    with patch("subprocess.run") as mock_run:
+    with patch("app.core.cancellation.run_process") as mock_run:
         result = await validator.validate(code)
         assert result.valid is False
         assert any(
@@ -255,7 +255,7 @@ class SceneA(Scene):
     def construct(self):
         label = Text("$x^2$")
 """
-    with patch("subprocess.run") as mock_run:
+    with patch("app.core.cancellation.run_process") as mock_run:
         result = await validator.validate(code)
         assert result.valid is False
         assert any(
@@ -274,7 +274,7 @@ class SceneA(Scene):
     def construct(self):
         relation = Text(r"\in")
 """
-    with patch("subprocess.run") as mock_run:
+    with patch("app.core.cancellation.run_process") as mock_run:
         result = await validator.validate(code)
         assert result.valid is False
         assert any(
@@ -294,7 +294,7 @@ class SceneA(Scene):
         price = Text("$5")
         note = Text("Cost is $12.99")
 """
-    with patch("subprocess.run") as mock_run:
+    with patch("app.core.cancellation.run_process") as mock_run:
         mock_run.return_value.returncode = 0
         mock_run.return_value.stderr = ""
         result = await validator.validate(code)
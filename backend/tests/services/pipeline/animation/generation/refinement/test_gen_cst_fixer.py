@@ -276,3 +276,121 @@ class Scene(Scene):
     assert count == 1
     assert "headers.set_z_index(10)" in fixed
     assert "guide.set_stroke(opacity=0.35)" in fixed or "guide.set_stroke(opacity = 0.35)" in fixed
+
+
+def test_display_text_collector_finds_literal_arguments_only():
+    import libcst as cst
+    from app.services.pipeline.animation.generation.refinement.cst_fixer import DisplayTextCollector
+
+    code = '''
+title = Text("It's \\"quoted\\"", font_size=36)
+para = Paragraph("Line one", "Line two")
+label = MarkupText(text='<b>Bold</b>')
+dynamic = Text(f"Value {x}")
+joined = Text("a" "b")
+other = Circle(label="not shown")
+'''
+    collector = DisplayTextCollector()
+    cst.parse_module(code).visit(collector)
+
+    assert [(func, value) for _, func, value in collector.literals] == [
+        ("Text", 'It\'s "quoted"'),
+        ("Paragraph", "Line one"),
+        ("Paragraph", "Line two"),
+        ("MarkupText", "<b>Bold</b>"),
+    ]
+
+
+def test_string_literal_replacer_keeps_quote_style():
+    import libcst as cst
+    from app.services.pipeline.animation.generation.refinement.cst_fixer import (
+        DisplayTextCollector,
+        StringLiteralReplacer,
+    )
+
+    module = cst.parse_module("a = Text('one')\nb = Tex(r\"two $x$\")\n")
+    collector = DisplayTextCollector()
+    module.visit(collector)
+    first, second = (node for node, _, _ in collector.literals)
+
+    fixed = module.visit(StringLiteralReplacer({first: "l'un", second: "deux $x$"})).code
+    assert "a = Text('l\\'un')" in fixed
+    assert 'b = Tex(r"deux $x$")' in fixed
+
+
+def test_tex_split_transformer_splits_mixed_assignments():
+    import libcst as cst
+    from app.services.pipeline.animation.generation.refinement.cst_fixer import TexSplitTransformer
+
+    code = '''
+class S(Scene):
+    def construct(self):
+        # formula
+        eq = Tex(r"Area $\\pi r^2$ here", font_size=32)
+        plain = VGroup(Tex("Only text"))
+'''
+    transformer = TexSplitTransformer()
+    fixed = cst.parse_module(code).visit(transformer).code
+
+    assert transformer.count == 2
+    assert "        # formula\n        _tex_part_0 = Text(\"Area \", font_size=28)" in fixed
+    assert '_tex_part_1 = MathTex(r"\\pi r^2")' in fixed
+    assert "eq = VGroup(_tex_part_0, _tex_part_1, _tex_part_2).arrange(RIGHT, buff=0.15)" in fixed
+    assert 'plain = VGroup(Text("Only text"))' in fixed
+    compile(fixed, "<fixed>", "exec")
+
+
+def test_color_literal_transformer_maps_values_only():
+    import libcst as cst
+    from app.services.pipeline.animation.generation.refinement.cst_fixer import ColorLiteralTransformer
+
+    code = '''from manim import WHITE
+WHITE_ISH = "#fafafa"
+a = Text("x", color=WHITE)
+b = Dot(color="#58c4dd").set_color(WHITE.interpolate(BLUE, 0.5))
+c = Text("#58C4DD is a color")
+'''
+    transformer = ColorLiteralTransformer({"#58C4DD": "#1D4ED8"}, {"WHITE": "#111111"})
+    fixed = cst.parse_module(code).visit(transformer).code
+
+    assert transformer.count == 2
+    assert fixed.startswith("from manim import WHITE\nfrom manim import ManimColor\n")
+    assert 'a = Text("x", color=ManimColor("#111111"))' in fixed
+    assert 'b = Dot(color="#1D4ED8").set_color(WHITE.interpolate(BLUE, 0.5))' in fixed
+    assert 'c = Text("#58C4DD is a color")' in fixed
+
+
+def test_color_literal_transformer_keeps_constants_color_objects_in_calls():
+    import libcst as cst
+    from app.services.pipeline.animation.generation.refinement.cst_fixer import ColorLiteralTransformer
+
+    code = '''from manim import *
+mid = interpolate_color(WHITE, BLUE, 0.5)
+'''
+    fixed = cst.parse_module(code).visit(ColorLiteralTransformer({}, {"WHITE": "#111111"})).code
+
+    assert fixed == '''from manim import *
+mid = interpolate_color(ManimColor("#111111"), BLUE, 0.5)
+'''
+
+
+def test_theme_setup_transformer_replaces_setup_of_construct():
+    import libcst as cst
+    from app.services.pipeline.animation.generation.refinement.cst_fixer import ThemeSetupTransformer
+
+    code = '''
+class S(Scene):
+    def construct(self):
+        """Intro"""
+        self.camera.background_color = "#171717"  # Slate dark
+        Text.set_default(color="#FFFFFF")
+        title = Text("Hi")
+        title.set_color(RED)
+'''
+    transformer = ThemeSetupTransformer(['self.camera.background_color = "#FFFFFF"'])
+    fixed = cst.parse_module(code).visit(transformer).code
+
+    assert transformer.constructs == 1
+    assert transformer.count == 2
+    assert '"""Intro"""\n        self.camera.background_color = "#FFFFFF"\n        title = Text("Hi")' in fixed
+    assert "#171717" not in fixed and "Text.set_default" not in fixed
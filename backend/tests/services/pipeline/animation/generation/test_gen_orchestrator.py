@@ -1,10 +1,13 @@
 
+import asyncio
+
 import pytest
 from unittest.mock import AsyncMock, Mock, patch
 
 from app.services.pipeline.animation.generation.orchestrator import AnimationOrchestrator
 from app.services.pipeline.animation.generation.core import ChoreographyError, ImplementationError
 from app.utils.section_status import SectionState
+from app.core.deadlines import DeadlineExceededError, deadline_scope
 from app.services.infrastructure.llm import PromptingEngine
 
 @pytest.fixture
@@ -110,3 +113,140 @@ def test_compute_retry_temperature(orchestrator):
     temp0 = orchestrator._compute_retry_temperature(0)
     temp1 = orchestrator._compute_retry_temperature(1)
     assert temp1 > temp0
+
+@pytest.mark.asyncio
+async def test_refinement_timeout_accepts_last_valid_code(orchestrator, mock_stages):
+    async def slow_refine(code, title, *args, on_valid_code=None, **kwargs):
+        on_valid_code(f"valid_{title}")
+        await asyncio.sleep(5)
+
+    mock_stages["choreographer"].plan = AsyncMock(return_value="plan")
+    mock_stages["implementer"].implement = AsyncMock(return_value="code")
+    mock_stages["refiner"].refine = slow_refine
+
+    with patch(
+        "app.services.pipeline.animation.generation.orchestrator.REFINEMENT_STAGE_TIMEOUT", 0.05
+    ):
+        result = await orchestrator.generate({"title": "Slow"}, 60.0)
+
+    assert result == "valid_Slow"
+
+
+@pytest.mark.asyncio
+async def test_concurrent_refinement_timeouts_keep_their_own_code(orchestrator, mock_stages):
+    async def slow_refine(code, title, *args, on_valid_code=None, **kwargs):
+        if title == "B":
+            # B reaches a valid version later than A
+            await asyncio.sleep(0.01)
+        on_valid_code(f"valid_{title}")
+        await asyncio.sleep(5)
+
+    mock_stages["choreographer"].plan = AsyncMock(return_value="plan")
+    mock_stages["implementer"].implement = AsyncMock(return_value="code")
+    mock_stages["refiner"].refine = slow_refine
+
+    with patch(
+        "app.services.pipeline.animation.generation.orchestrator.REFINEMENT_STAGE_TIMEOUT", 0.05
+    ):
+        results = await asyncio.gather(
+            orchestrator.generate({"title": "A"}, 60.0),
+            orchestrator.generate({"title": "B"}, 60.0),
+        )
+
+    assert results == ["valid_A", "valid_B"]
+
+@pytest.mark.asyncio
+async def test_expired_section_deadline_is_not_retried(orchestrator, mock_stages):
+    mock_stages["choreographer"].plan = AsyncMock(return_value="plan")
+    mock_stages["implementer"].implement = AsyncMock(return_value="code")
+
+    with deadline_scope(0.01):
+        await asyncio.sleep(0.02)
+        with pytest.raises(DeadlineExceededError):
+            await orchestrator.generate({"title": "Late"}, 60.0)
+
+    assert mock_stages["choreographer"].plan.call_count == 1
+    mock_stages["implementer"].implement.assert_not_called()
+
+
+def _setup_successful_stages(mock_stages):
+    mock_stages["choreographer"].plan = AsyncMock(return_value="plan")
+    mock_stages["implementer"].implement = AsyncMock(return_value="code")
+    mock_stages["refiner"].refine = AsyncMock(return_value=("final_code", True))
+
+
+@pytest.mark.asyncio
+async def test_checkpoints_skip_completed_stages(orchestrator, mock_stages, tmp_path):
+    from app.services.pipeline.animation.generation.core import StageCheckpoints
+
+    _setup_successful_stages(mock_stages)
+    section = {"title": "Test Section", "narration": "Hello"}
+    await orchestrator.generate(section, 60.0, checkpoints=StageCheckpoints(tmp_path))
+
+    on_raw_code = Mock()
+    result = await orchestrator.generate(
+        section, 60.0, on_raw_code=on_raw_code, checkpoints=StageCheckpoints(tmp_path)
+    )
+
+    assert result == "final_code"
+    mock_stages["choreographer"].plan.assert_called_once()
+    mock_stages["implementer"].implement.assert_called_once()
+    mock_stages["refiner"].refine.assert_called_once()
+    on_raw_code.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_checkpoints_rerun_from_first_changed_input(orchestrator, mock_stages, tmp_path):
+    from app.services.pipeline.animation.generation.core import StageCheckpoints
+
+    _setup_successful_stages(mock_stages)
+    section = {"title": "Test Section", "narration": "Hello"}
+    await orchestrator.generate(section, 60.0, checkpoints=StageCheckpoints(tmp_path))
+
+    # A different audio duration invalidates the plan and everything after it
+    await orchestrator.generate(section, 42.0, checkpoints=StageCheckpoints(tmp_path))
+    assert mock_stages["choreographer"].plan.call_count == 2
+    assert mock_stages["implementer"].implement.call_count == 2
+    # The implementer produced identical code, so its refinement is reused
+    assert mock_stages["refiner"].refine.call_count == 1
+
+    # Edited narration changes the section fingerprint
+    edited = dict(section, narration="Hello again")
+    mock_stages["implementer"].implement = AsyncMock(return_value="other code")
+    await orchestrator.generate(edited, 42.0, checkpoints=StageCheckpoints(tmp_path))
+    assert mock_stages["choreographer"].plan.call_count == 3
+    mock_stages["implementer"].implement.assert_called_once()
+    assert mock_stages["refiner"].refine.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_retry_does_not_reuse_checkpoints(orchestrator, mock_stages, tmp_path):
+    from app.services.pipeline.animation.generation.core import StageCheckpoints
+
+    section = {"title": "Test Section"}
+    checkpoints = StageCheckpoints(tmp_path)
+    # First attempt checkpoints the plan, then implementation fails
+    mock_stages["choreographer"].plan = AsyncMock(return_value="plan")
+    mock_stages["implementer"].implement = AsyncMock(side_effect=[ImplementationError("Fail"), "code"])
+    mock_stages["refiner"].refine = AsyncMock(return_value=("final_code", True))
+
+    with patch("asyncio.sleep", AsyncMock()):
+        result = await orchestrator.generate(section, 60.0, checkpoints=checkpoints)
+
+    assert result == "final_code"
+    assert mock_stages["choreographer"].plan.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_unstabilized_refinement_is_not_checkpointed(orchestrator, mock_stages, tmp_path):
+    from app.services.pipeline.animation.generation.core import StageCheckpoints
+    from app.services.pipeline.animation.generation.core.checkpoints import STAGE_REFINEMENT
+
+    mock_stages["choreographer"].plan = AsyncMock(return_value="plan")
+    mock_stages["implementer"].implement = AsyncMock(return_value="code")
+    mock_stages["refiner"].refine = AsyncMock(return_value=("bad_code", False))
+
+    with patch("asyncio.sleep", AsyncMock()):
+        await orchestrator.generate({"title": "Test Section"}, 60.0, checkpoints=StageCheckpoints(tmp_path))
+
+    assert STAGE_REFINEMENT not in StageCheckpoints(tmp_path).stages()
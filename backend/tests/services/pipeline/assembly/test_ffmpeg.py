@@ -113,7 +113,7 @@ class TestFFmpegAsync:
         audios = ["a1.mp3", "a2.mp3"] # Equal length
         
         with patch("app.services.pipeline.assembly.ffmpeg.get_media_duration", side_effect=[10.0, 10.0, 10.0, 10.0]), \
-             patch("subprocess.run") as mock_run, \
+             patch("app.core.cancellation.run_process") as mock_run, \
              patch("app.services.pipeline.assembly.ffmpeg.concatenate_videos") as mock_concat, \
              patch("pathlib.Path.exists", return_value=True):
              
@@ -123,7 +123,7 @@ class TestFFmpegAsync:
              
              await combine_sections(videos, audios, "final.mp4", str(tmp_path))
              
-             # Should have called subprocess.run 2 times (once per section)
+             # Should have run ffmpeg 2 times (once per section)
              assert mock_run.call_count == 2
              
              # Should have concatenated
@@ -0,0 +1,200 @@
+"""
+Tests for app.services.pipeline.assembly.recompile
+"""
+
+import os
+import subprocess
+
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from app.services.pipeline.assembly.recompile import JobRecompiler, resolve_sections
+
+MODULE = "app.services.pipeline.assembly.recompile"
+
+
+def _fake_ffmpeg(calls):
+    async def run(cmd, **kwargs):
+        calls.append(cmd)
+        with open(cmd[-1], "wb") as out:
+            out.write(b"merged:" + open(cmd[cmd.index("-i") + 1], "rb").read())
+        return subprocess.CompletedProcess(cmd, 0, "", "")
+    return run
+
+
+async def _fake_concat(videos, output_path, link=False):
+    with open(output_path, "wb") as out:
+        for video in videos:
+            out.write(open(video, "rb").read())
+
+
+@pytest.fixture
+def job_dir(tmp_path):
+    for i in range(3):
+        section = tmp_path / "sections" / f"section_{i}"
+        section.mkdir(parents=True)
+        (section / "video.mp4").write_bytes(f"video-{i}".encode())
+        (section / "audio.mp3").write_bytes(f"audio-{i}".encode())
+    return tmp_path
+
+
+def _sections(job_dir):
+    return resolve_sections(job_dir / "sections", [{"id": f"section_{i}"} for i in range(3)])
+
+
+async def _recompile(job_dir, calls):
+    with patch(f"{MODULE}.run_process_async", side_effect=_fake_ffmpeg(calls)), \
+         patch(f"{MODULE}.get_media_duration", AsyncMock(return_value=5.0)), \
+         patch(f"{MODULE}.concatenate_videos", side_effect=_fake_concat):
+        return await JobRecompiler("job", job_dir).run(_sections(job_dir))
+
+
+@pytest.mark.asyncio
+async def test_recompile_reuses_unchanged_sections(job_dir):
+    calls = []
+    first = await _recompile(job_dir, calls)
+    assert (first.merged, first.reused) == (3, 0)
+    assert os.path.exists(first.final_video)
+
+    calls.clear()
+    second = await _recompile(job_dir, calls)
+    assert (second.merged, second.reused) == (0, 3)
+    assert calls == []
+
+    (job_dir / "sections" / "section_1" / "video.mp4").write_bytes(b"edited video")
+    third = await _recompile(job_dir, calls)
+    assert (third.merged, third.reused) == (1, 2)
+    assert calls[0][calls[0].index("-i") + 1].endswith(os.path.join("section_1", "video.mp4"))
+    assert b"merged:edited video" in open(third.final_video, "rb").read()
+
+
+@pytest.mark.asyncio
+async def test_touched_input_with_same_content_is_reused(job_dir):
+    calls = []
+    await _recompile(job_dir, calls)
+
+    audio = job_dir / "sections" / "section_2" / "audio.mp3"
+    stat = audio.stat()
+    os.utime(audio, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10_000_000_000))
+
+    calls.clear()
+    result = await _recompile(job_dir, calls)
+    assert result.reused == 3
+    assert calls == []
+
+
+@pytest.mark.asyncio
+async def test_failed_merge_is_left_out_and_retried(job_dir):
+    async def flaky(cmd, **kwargs):
+        if "section_0" in cmd[cmd.index("-i") + 1]:
+            return subprocess.CompletedProcess(cmd, 1, "", "boom")
+        return await _fake_ffmpeg([])(cmd, **kwargs)
+
+    with patch(f"{MODULE}.run_process_async", side_effect=flaky), \
+         patch(f"{MODULE}.get_media_duration", AsyncMock(return_value=5.0)), \
+         patch(f"{MODULE}.concatenate_videos", side_effect=_fake_concat):
+        result = await JobRecompiler("job", job_dir).run(_sections(job_dir))
+
+    assert (result.merged, result.skipped) == (2, 1)
+    assert not list(job_dir.glob("partial_*"))
+
+    calls = []
+    retry = await _recompile(job_dir, calls)
+    assert (retry.merged, retry.reused) == (1, 2)
+
+
+def _write_video_info(job_dir, durations):
+    from app.core.video_info import VideoChapter, VideoInfo, save_video_info
+
+    chapters, start = [], 0.0
+    for i, duration in enumerate(durations):
+        chapters.append(VideoChapter(title=f"Section {i + 1}", start_time=start, duration=duration))
+        start += duration
+    save_video_info(VideoInfo(video_id=job_dir.name, title="Video", duration=start, chapters=chapters))
+
+
+async def _splice(job_dir, section_index, keyframes, calls, signatures=("sig", "sig")):
+    durations = {"final_video.mp4": 30.0, "combined_001.mp4": 12.0}
+
+    async def duration(path):
+        return durations.get(os.path.basename(path), 5.0)
+
+    with patch("app.core.video_info.OUTPUT_DIR", job_dir.parent), \
+         patch(f"{MODULE}.run_process_async", side_effect=_fake_ffmpeg(calls)), \
+         patch(f"{MODULE}.get_media_duration", side_effect=duration), \
+         patch(f"{MODULE}.concatenate_videos", side_effect=_fake_concat), \
+         patch(f"{MODULE}._keyframe_times", AsyncMock(return_value=keyframes)), \
+         patch(f"{MODULE}._stream_signature", AsyncMock(side_effect=list(signatures))):
+        result = await JobRecompiler(job_dir.name, job_dir).splice_section(_sections(job_dir), section_index)
+
+        from app.core import load_video_info
+        return result, load_video_info(job_dir.name)
+
+
+@pytest.fixture
+def spliceable_job(job_dir):
+    (job_dir / "final_video.mp4").write_bytes(b"original final video")
+    with patch("app.core.video_info.OUTPUT_DIR", job_dir.parent):
+        _write_video_info(job_dir, [10.0, 10.0, 10.0])
+    return job_dir
+
+
+@pytest.mark.asyncio
+async def test_splice_merges_only_the_edited_section(spliceable_job):
+    calls = []
+    result, info = await _splice(spliceable_job, 1, [0.0, 10.02, 19.98, 25.0], calls)
+
+    assert result is not None and result.chapter_index == 1
+    merged = [c for c in calls if "-c:v" in c]
+    assert len(merged) == 1 and "section_1" in merged[0][merged[0].index("-i") + 1]
+    # Head and tail are stream copies cut at the snapped keyframes
+    cuts = [c for c in calls if "-avoid_negative_ts" in c]
+    assert ["-t", "10.020"] == cuts[0][cuts[0].index("-t"):cuts[0].index("-t") + 2]
+    assert ["-ss", "19.980"] == cuts[1][cuts[1].index("-ss"):cuts[1].index("-ss") + 2]
+
+    # Section grew from 9.96s to 12s: later chapters shift, total follows
+    assert [c.start_time for c in info.chapters] == [0.0, 10.02, 22.04]
+    assert info.chapters[1].duration == 12.0
+    assert info.duration == pytest.approx(32.04)
+    assert not list(spliceable_job.glob("partial_*"))
+
+
+@pytest.mark.asyncio
+async def test_concurrent_splices_of_one_job_keep_both_chapter_updates(spliceable_job):
+    import asyncio
+
+    async def duration(path):
+        return {"final_video.mp4": 30.0}.get(os.path.basename(path), 12.0)
+
+    with patch("app.core.video_info.OUTPUT_DIR", spliceable_job.parent), \
+         patch(f"{MODULE}.run_process_async", side_effect=_fake_ffmpeg([])), \
+         patch(f"{MODULE}.get_media_duration", side_effect=duration), \
+         patch(f"{MODULE}.concatenate_videos", side_effect=_fake_concat), \
+         patch(f"{MODULE}._keyframe_times", AsyncMock(return_value=[0.0, 10.0, 12.0, 20.0, 22.0])), \
+         patch(f"{MODULE}._stream_signature", AsyncMock(return_value="sig")):
+        results = await asyncio.gather(*(
+            JobRecompiler(spliceable_job.name, spliceable_job).splice_section(_sections(spliceable_job), i)
+            for i in (0, 1)
+        ))
+
+        from app.core import load_video_info
+        info = load_video_info(spliceable_job.name)
+
+    assert all(results)
+    assert [(c.start_time, c.duration) for c in info.chapters] == [(0.0, 12.0), (12.0, 12.0), (24.0, 10.0)]
+    assert not list(spliceable_job.glob("partial_*"))
+
+
+@pytest.mark.asyncio
+async def test_splice_refuses_boundaries_off_keyframes(spliceable_job):
+    result, info = await _splice(spliceable_job, 1, [0.0, 14.0], [])
+
+    assert result is None
+    assert open(spliceable_job / "final_video.mp4", "rb").read() == b"original final video"
+    assert [c.start_time for c in info.chapters] == [0.0, 10.0, 20.0]
+
+
+@pytest.mark.asyncio
+async def test_splice_refuses_mismatched_streams(spliceable_job):
+    result, _ = await _splice(spliceable_job, 1, [0.0, 10.0, 20.0], [], signatures=("a", "b"))
+    assert result is None
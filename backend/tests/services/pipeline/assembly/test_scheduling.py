@@ -0,0 +1,149 @@
+"""
+Tests for render-time prediction and longest-first section scheduling
+"""
+
+import json
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app.services.pipeline.assembly.orchestrator import SectionOrchestrator, SectionResult
+from app.services.pipeline.assembly.scheduling import SectionFeatures, SectionRuntimePredictor
+
+MODULE = "app.services.pipeline.assembly.scheduling"
+
+
+def _section(duration: float, segments: int = 1, narration: str = "") -> dict:
+    return {
+        "title": f"{duration}s",
+        "duration_seconds": duration,
+        "narration": narration,
+        "narration_segments": [{"text": "x"} for _ in range(segments)] if segments > 1 else [],
+    }
+
+
+class TestSectionRuntimePredictor:
+    def test_extract_features_from_code(self, tmp_path):
+        code_path = tmp_path / "scene.py"
+        code_path.write_text("a = MathTex('x')\nb = Tex('y')\nc = Text('z')\n", encoding="utf-8")
+        predictor = SectionRuntimePredictor(history_path=None)
+
+        features = predictor.extract_features({
+            "duration_seconds": 40,
+            "narration_segments": [{}, {}, {}],
+            "manim_code_path": str(code_path),
+        })
+
+        assert features.audio_duration == 40
+        assert features.segment_count == 3
+        assert features.tex_count == 2
+        assert features.code_length == len(code_path.read_text(encoding="utf-8"))
+
+    def test_audio_duration_falls_back_to_word_count(self):
+        predictor = SectionRuntimePredictor(history_path=None)
+        features = predictor.extract_features({"narration": "word " * 25})
+        assert features.audio_duration == pytest.approx(10.0)
+
+    def test_order_is_longest_first_and_stable(self):
+        predictor = SectionRuntimePredictor(history_path=None)
+        sections = [_section(20), _section(120, segments=4), _section(20), _section(60)]
+        assert predictor.order(sections) == [1, 3, 0, 2]
+
+    def test_record_and_calibrate(self, tmp_path):
+        history = tmp_path / "timings.jsonl"
+        predictor = SectionRuntimePredictor(history_path=history)
+        features = SectionFeatures(audio_duration=10, segment_count=1, tex_count=0, code_length=0)
+        raw = predictor.predict_features(features)
+
+        for _ in range(5):
+            predictor.record(features, raw * 2, job_id="job", section_index=0)
+
+        lines = history.read_text(encoding="utf-8").splitlines()
+        assert len(lines) == 5
+        assert json.loads(lines[0])["actual_seconds"] == pytest.approx(raw * 2, abs=0.01)
+
+        fresh = SectionRuntimePredictor(history_path=history)
+        assert fresh.calibration() == pytest.approx(2.0, rel=0.01)
+        assert fresh.predict_features(features) == pytest.approx(raw * 2, rel=0.01)
+
+    def test_history_is_trimmed_to_the_calibration_window(self, tmp_path):
+        history = tmp_path / "timings.jsonl"
+        predictor = SectionRuntimePredictor(history_path=history)
+        features = SectionFeatures(audio_duration=10, segment_count=1, tex_count=0, code_length=0)
+
+        with patch(f"{MODULE}.CALIBRATION_WINDOW", 10), patch(f"{MODULE}.HISTORY_MAX_BYTES", 4096):
+            for i in range(100):
+                predictor.record(features, 30.0, job_id="job", section_index=i)
+                assert history.stat().st_size <= 4096
+
+        indexes = [json.loads(line)["section_index"] for line in history.read_text(encoding="utf-8").splitlines()]
+        assert indexes == list(range(100 - len(indexes), 100))
+        assert len(indexes) < 100
+
+
+@pytest.mark.asyncio
+class TestLongestFirstScheduling:
+    async def test_sections_start_longest_first_and_results_keep_index_order(self, tmp_path):
+        tracker = MagicMock()
+        predictor = SectionRuntimePredictor(history_path=tmp_path / "timings.jsonl")
+        orchestrator = SectionOrchestrator(
+            manim_generator=MagicMock(),
+            tts_engine=MagicMock(),
+            progress_tracker=tracker,
+            max_concurrent=1,
+            predictor=predictor,
+        )
+        sections = [_section(10), _section(200), _section(50)]
+        started = []
+
+        async def fake_process(section_index, **kwargs):
+            started.append(section_index)
+            return SectionResult(
+                index=section_index,
+                video_path=f"v{section_index}.mp4",
+                audio_path=None,
+                duration=1.0,
+                title="t",
+            )
+
+        with patch.object(orchestrator, "_process_single_section", side_effect=fake_process):
+            results = await orchestrator.process_sections_parallel(
+                sections=sections,
+                sections_dir=Path(tmp_path),
+                voice="v",
+                style="s",
+                language="en",
+                job_id="job",
+            )
+
+        assert started == [1, 2, 0]
+        assert [r.index for r in results] == [0, 1, 2]
+        assert len((tmp_path / "timings.jsonl").read_text(encoding="utf-8").splitlines()) == 3
+
+    async def test_index_scheduling_env(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("SECTION_SCHEDULING", "index")
+        orchestrator = SectionOrchestrator(
+            manim_generator=MagicMock(),
+            tts_engine=MagicMock(),
+            progress_tracker=MagicMock(),
+            max_concurrent=1,
+            predictor=SectionRuntimePredictor(history_path=None),
+        )
+        started = []
+
+        async def fake_process(section_index, **kwargs):
+            started.append(section_index)
+            return SectionResult(index=section_index, video_path=None, audio_path=None,
+                                 duration=1.0, title="t", cached=True)
+
+        with patch.object(orchestrator, "_process_single_section", side_effect=fake_process):
+            await orchestrator.process_sections_parallel(
+                sections=[_section(10), _section(200)],
+                sections_dir=Path(tmp_path),
+                voice="v",
+                style="s",
+                language="en",
+            )
+
+        assert started == [0, 1]
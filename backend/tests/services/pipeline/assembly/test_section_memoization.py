@@ -0,0 +1,104 @@
+"""
+Tests for cross-job section memoization in SectionOrchestrator
+"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app.services.infrastructure.storage.artifact_store import SectionArtifactStore
+from app.services.pipeline.assembly.orchestrator import SectionOrchestrator, section_artifact_key
+from app.services.pipeline.assembly.scheduling import SectionRuntimePredictor
+
+MODULE = "app.services.pipeline.assembly.orchestrator"
+
+SECTION = {"id": "intro", "title": "Intro", "narration": "Hello there", "visual_description": "A circle"}
+
+
+def _orchestrator(store):
+    manim_generator = MagicMock()
+    manim_generator.pipeline_name = None
+    return SectionOrchestrator(
+        manim_generator=manim_generator,
+        tts_engine=MagicMock(),
+        progress_tracker=MagicMock(),
+        max_concurrent=1,
+        predictor=SectionRuntimePredictor(history_path=None),
+        artifact_store=store,
+    )
+
+
+def _fake_subsection(calls, degraded=False):
+    async def process(section_dir, section_index, **kwargs):
+        calls.append(section_dir)
+        video = section_dir / f"section_{section_index}.mp4"
+        audio = section_dir / "audio.mp3"
+        code = section_dir / f"scene_{section_index}.py"
+        video.write_bytes(b"video")
+        audio.write_bytes(b"audio")
+        code.write_text("class Intro(Scene): pass")
+        result = {
+            "video_path": str(video),
+            "audio_path": str(audio),
+            "duration": 12.0,
+            "manim_code_path": str(code),
+        }
+        if degraded:
+            result["degraded"] = ["title_card"]
+        return result
+    return process
+
+
+async def _run(orchestrator, tmp_path, job_id, section=SECTION, voice="Kore"):
+    return await orchestrator.process_sections_parallel(
+        sections=[dict(section)],
+        sections_dir=tmp_path / job_id / "sections",
+        voice=voice,
+        style="3b1b",
+        language="en",
+        job_id=job_id,
+    )
+
+
+def test_artifact_key_covers_generation_settings():
+    base = section_artifact_key(SECTION, "Kore", "3b1b", "en")
+    assert base == section_artifact_key(dict(SECTION, video="/out/v.mp4"), "Kore", "3b1b", "en")
+    assert base != section_artifact_key(dict(SECTION, narration="Bye"), "Kore", "3b1b", "en")
+    assert base != section_artifact_key(SECTION, "Puck", "3b1b", "en")
+    assert base != section_artifact_key(SECTION, "Kore", "3b1b", "fr")
+
+
+@pytest.mark.asyncio
+async def test_repeat_job_reuses_stored_section(tmp_path):
+    store = SectionArtifactStore(tmp_path / "store")
+    calls = []
+
+    with patch(f"{MODULE}.process_single_subsection", side_effect=_fake_subsection(calls)):
+        first = await _run(_orchestrator(store), tmp_path, "job-a")
+        second = await _run(_orchestrator(store), tmp_path, "job-b")
+
+    assert len(calls) == 1
+    assert not first[0].cached
+    assert second[0].cached
+    assert second[0].duration == 12.0
+    assert second[0].video_path == str(tmp_path / "job-b" / "sections" / "0" / "section_0.mp4")
+    assert (tmp_path / "job-b" / "sections" / "0" / "scene_0.py").exists()
+    assert second[0].manim_code_path.endswith("scene_0.py")
+    key = section_artifact_key(SECTION, "Kore", "3b1b", "en", tts_engine=MagicMock())
+    assert store.refcount(key) == 2
+
+
+@pytest.mark.asyncio
+async def test_changed_settings_and_degraded_sections_are_not_reused(tmp_path):
+    store = SectionArtifactStore(tmp_path / "store")
+    calls = []
+
+    with patch(f"{MODULE}.process_single_subsection", side_effect=_fake_subsection(calls, degraded=True)):
+        await _run(_orchestrator(store), tmp_path, "job-a")
+    assert store.stats()["artifacts"] == 0
+
+    with patch(f"{MODULE}.process_single_subsection", side_effect=_fake_subsection(calls)):
+        await _run(_orchestrator(store), tmp_path, "job-b")
+        await _run(_orchestrator(store), tmp_path, "job-c", voice="Puck")
+
+    assert len(calls) == 3
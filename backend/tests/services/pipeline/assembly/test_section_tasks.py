@@ -0,0 +1,167 @@
+"""
+Tests for app.services.pipeline.assembly.section_tasks
+"""
+
+import asyncio
+import os
+import subprocess
+
+import pytest
+from unittest.mock import patch
+
+from app.services.pipeline.assembly.section_tasks import (
+    SectionRenderError,
+    SectionTaskRegistry,
+    SectionTaskStatus,
+    find_scene_file,
+    render_section_video,
+    section_video_path,
+)
+
+MODULE = "app.services.pipeline.assembly.section_tasks"
+
+
+@pytest.fixture
+def section_dir(tmp_path):
+    section = tmp_path / "sections" / "intro"
+    section.mkdir(parents=True)
+    (section / "scene_2.py").write_text("class IntroScene(Scene):\n    pass\n")
+    return section
+
+
+def _fake_manim(calls, returncode=0):
+    async def run(cmd, **kwargs):
+        calls.append(cmd)
+        media_dir = cmd[cmd.index("--media_dir") + 1]
+        output_name = cmd[cmd.index("-o") + 1]
+        if returncode == 0:
+            out_dir = f"{media_dir}/videos/scene_2/480p15"
+            partial_dir = f"{out_dir}/partial_movie_files/IntroScene"
+            os.makedirs(partial_dir, exist_ok=True)
+            with open(f"{partial_dir}/{output_name}.mp4", "wb") as f:
+                f.write(b"partial")
+            with open(f"{out_dir}/{output_name}.mp4", "wb") as f:
+                f.write(b"rendered")
+        return subprocess.CompletedProcess(cmd, returncode, "", "boom")
+    return run
+
+
+def test_find_scene_file_and_video_path(section_dir):
+    code_file, index = find_scene_file(section_dir)
+    assert code_file.name == "scene_2.py"
+    assert index == 2
+    assert section_video_path(section_dir, index).name == "section_2.mp4"
+
+    (section_dir / "existing.mp4").write_bytes(b"old")
+    assert section_video_path(section_dir, index).name == "existing.mp4"
+
+
+@pytest.mark.asyncio
+async def test_render_keeps_manim_caches(section_dir):
+    tex_cache = section_dir / "Tex" / "abc.svg"
+    tex_cache.parent.mkdir()
+    tex_cache.write_text("glyph")
+    output_video = section_dir / "section_2.mp4"
+    output_video.write_bytes(b"old")
+    calls = []
+
+    with patch(f"{MODULE}.run_process_async", side_effect=_fake_manim(calls)):
+        result = await render_section_video(
+            section_dir, section_dir / "scene_2.py", "IntroScene", output_video
+        )
+
+    assert result == output_video
+    assert output_video.read_bytes() == b"rendered"
+    assert tex_cache.exists()
+    assert list(section_dir.rglob("partial_movie_files/*/section_2.mp4"))
+    assert calls[0][-1] == "IntroScene"
+
+
+@pytest.mark.asyncio
+async def test_render_failure_keeps_previous_video(section_dir):
+    output_video = section_dir / "section_2.mp4"
+    output_video.write_bytes(b"old")
+
+    with patch(f"{MODULE}.run_process_async", side_effect=_fake_manim([], returncode=1)):
+        with pytest.raises(SectionRenderError, match="boom"):
+            await render_section_video(
+                section_dir, section_dir / "scene_2.py", "IntroScene", output_video
+            )
+
+    assert output_video.read_bytes() == b"old"
+
+
+@pytest.mark.asyncio
+async def test_registry_tracks_progress_and_result():
+    registry = SectionTaskRegistry()
+    release = asyncio.Event()
+
+    async def runner(task):
+        task.update(SectionTaskStatus.RENDERING, 10, "Rendering section")
+        await release.wait()
+        task.video_path = "/tmp/section.mp4"
+
+    task = registry.submit("job", "intro", runner)
+    await asyncio.sleep(0)
+    assert registry.get(task.task_id).status == SectionTaskStatus.RENDERING
+
+    release.set()
+    await registry.wait(task.task_id)
+
+    assert task.status == SectionTaskStatus.COMPLETED
+    assert task.progress == 100
+    assert task.to_dict()["video_path"] == "/tmp/section.mp4"
+    assert registry.list_for_job("job") == [task]
+
+
+@pytest.mark.asyncio
+async def test_registry_records_failures():
+    registry = SectionTaskRegistry()
+
+    async def runner(task):
+        raise SectionRenderError("Manim render failed")
+
+    task = registry.submit("job", "intro", runner)
+    await registry.wait(task.task_id)
+
+    assert task.status == SectionTaskStatus.FAILED
+    assert task.error == "Manim render failed"
+
+
+@pytest.mark.asyncio
+async def test_newer_regeneration_supersedes_running_one():
+    registry = SectionTaskRegistry()
+    order = []
+
+    async def slow(task):
+        order.append("slow started")
+        await asyncio.sleep(10)
+
+    async def fast(task):
+        order.append("fast")
+
+    first = registry.submit("job", "intro", slow)
+    await asyncio.sleep(0)
+    second = registry.submit("job", "intro", fast)
+    await registry.wait(second.task_id)
+
+    assert first.status == SectionTaskStatus.CANCELLED
+    assert second.status == SectionTaskStatus.COMPLETED
+    assert order == ["slow started", "fast"]
+
+
+@pytest.mark.asyncio
+async def test_finished_tasks_are_pruned():
+    registry = SectionTaskRegistry(max_finished=2)
+
+    async def runner(task):
+        pass
+
+    tasks = []
+    for i in range(4):
+        tasks.append(registry.submit("job", f"section-{i}", runner))
+        await registry.wait(tasks[-1].task_id)
+    registry.submit("job", "last", runner)
+
+    assert registry.get(tasks[0].task_id) is None
+    assert registry.get(tasks[-1].task_id) is not None
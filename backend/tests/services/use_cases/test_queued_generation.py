@@ -0,0 +1,98 @@
+"""
+Tests for app.services.use_cases.queued_generation
+"""
+
+from dataclasses import asdict
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.services.infrastructure.orchestration import SqliteTaskQueue, TaskDeferred
+from app.services.pipeline.assembly.orchestrator import SectionResult
+from app.services.use_cases.queued_generation import (
+    ASSEMBLE_TASK,
+    SCRIPT_TASK,
+    SECTION_TASK,
+    QueuedGeneration,
+)
+
+
+@pytest.fixture
+def queue(tmp_path):
+    return SqliteTaskQueue(tmp_path / "queue.db")
+
+
+@pytest.fixture
+def generation(queue):
+    with patch("app.services.use_cases.queued_generation.get_job_manager") as mock_get_mgr:
+        mock_get_mgr.return_value = MagicMock()
+        gen = QueuedGeneration(queue=queue, use_case=MagicMock())
+    gen.use_case.record_result = AsyncMock()
+    return gen
+
+
+def _finish_sections(queue, results):
+    for result in results:
+        task = queue.claim("w1", kinds=[SECTION_TASK])
+        if result is None:
+            queue.fail(task.id, "w1", "render failed")
+        else:
+            queue.complete(task.id, "w1", asdict(result))
+
+
+@pytest.mark.asyncio
+class TestQueuedGeneration:
+    async def test_script_task_fans_out_sections_idempotently(self, generation, queue):
+        generator = MagicMock()
+        generator.output_base_dir = MagicMock()
+        generator.prepare_script = AsyncMock(return_value=({}, [{}, {}, {}], "en"))
+        generation._generators["default"] = generator
+        generation.enqueue("job-1", {"pipeline": "default"})
+
+        with patch("app.services.use_cases.queued_generation.ProgressTracker"):
+            task = queue.claim("w1")
+            assert task.kind == SCRIPT_TASK
+            await generation.handle_script(task)
+            # A retried script task must not duplicate the fan-out
+            await generation.handle_script(task)
+
+        sections = queue.list_tasks(job_id="job-1", kind=SECTION_TASK)
+        assert sorted(t.payload["section_index"] for t in sections) == [0, 1, 2]
+        assert len(queue.list_tasks(job_id="job-1", kind=ASSEMBLE_TASK)) == 1
+
+    async def test_assemble_waits_then_combines_successful_sections(self, generation, queue):
+        payload = {"job_id": "job-1", "run_id": "run-1", "section_count": 2}
+        for i in range(2):
+            queue.enqueue(SECTION_TASK, {**payload, "section_index": i}, job_id="job-1", max_attempts=1)
+        assemble_id = queue.enqueue(ASSEMBLE_TASK, payload, job_id="job-1")
+        assemble = queue.get(assemble_id)
+
+        with pytest.raises(TaskDeferred):
+            await generation.handle_assemble(assemble)
+
+        _finish_sections(queue, [
+            SectionResult(index=0, video_path="/v0.mp4", audio_path="/a0.mp3", duration=12.0, title="Intro"),
+            None,
+        ])
+
+        generator = MagicMock()
+        generator.assemble_video = AsyncMock(return_value={"status": "completed", "total_duration": 12.0})
+        generation._generators[None] = generator
+        with patch("app.services.use_cases.queued_generation.ProgressTracker"):
+            result = await generation.handle_assemble(assemble)
+
+        assert result["status"] == "completed"
+        section_results = generator.assemble_video.await_args.kwargs["section_results"]
+        assert section_results[0].video_path == "/v0.mp4"
+        assert section_results[1].error == "render failed"
+        generation.use_case.record_result.assert_awaited_once()
+
+    async def test_dead_section_task_does_not_fail_job(self, generation, queue):
+        task_id = queue.enqueue(SECTION_TASK, {"section_index": 0}, job_id="job-1")
+        await generation.on_dead(queue.get(task_id))
+        generation.use_case.record_failure.assert_not_called()
+
+        task_id = queue.enqueue(SCRIPT_TASK, {}, job_id="job-1")
+        await generation.on_dead(queue.get(task_id))
+        generation.use_case.record_failure.assert_called_once()
+        assert not queue.has_pending("job-1")
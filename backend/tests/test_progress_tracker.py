@@ -129,6 +129,24 @@ def test_check_existing_progress_with_completed_sections(tracker):
     assert progress.is_resumable()
 
 
+def test_check_existing_progress_reports_stage_checkpoints(tracker):
+    """Test incomplete sections report their checkpointed stages"""
+    tracker.sections_dir.mkdir(parents=True)
+    with open(tracker.job_dir / "script.json", "w") as f:
+        json.dump({"sections": [{"title": "Section 1"}, {"title": "Section 2"}]}, f)
+
+    (tracker.sections_dir / "0").mkdir()
+    (tracker.sections_dir / "merged_0.mp4").touch()
+    tracker.section_checkpoints(0).save("choreography", "h", output="plan")
+    tracker.section_checkpoints(1).save("choreography", "h", output="plan")
+    tracker.section_checkpoints(1).save("implementation", "h2", output="code")
+
+    progress = tracker.check_existing_progress()
+
+    assert progress.completed_sections == {0}
+    assert progress.checkpointed_sections == {1: ["choreography", "implementation"]}
+
+
 def test_job_progress_is_resumable():
     """Test JobProgress.is_resumable() logic"""
     # Not resumable - no script
@@ -1,5 +1,8 @@
 import api from '../config/api.config'
-import { JobResponse, DetailedProgress, ResumeInfo, GalleryJob, SectionDetails, SectionEdit } from '../types/job.types'
+import { JobResponse, DetailedProgress, ResumeInfo, GalleryJob, SectionDetails, SectionEdit, SectionTask } from '../types/job.types'
+
+const SECTION_TASK_POLL_MS = 1000
+const SECTION_TASK_DONE = ['completed', 'failed', 'cancelled']
 
 export const jobService = {
   getJobStatus: async (jobId: string): Promise<JobResponse> => {
@@ -55,8 +58,23 @@ export const jobService = {
     await api.put(`/job/${jobId}/section/${sectionId}/code`, { manim_code: code })
   },
 
-  regenerateSection: async (jobId: string, sectionId: string): Promise<void> => {
-    await api.post(`/job/${jobId}/section/${sectionId}/regenerate`)
+  regenerateSection: async (jobId: string, sectionId: string): Promise<SectionTask> => {
+    // Regeneration runs in the background; poll its task until it finishes
+    const response = await api.post<SectionTask>(`/job/${jobId}/section/${sectionId}/regenerate`)
+    let task = response.data
+    while (!SECTION_TASK_DONE.includes(task.status)) {
+      await new Promise(resolve => setTimeout(resolve, SECTION_TASK_POLL_MS))
+      task = await jobService.getSectionTask(jobId, task.task_id)
+    }
+    if (task.status !== 'completed') {
+      throw new Error(task.error || task.message)
+    }
+    return task
+  },
+
+  getSectionTask: async (jobId: string, taskId: string): Promise<SectionTask> => {
+    const response = await api.get<SectionTask>(`/job/${jobId}/section-tasks/${taskId}`)
+    return response.data
   },
 
   fixSection: async (jobId: string, sectionId: string, error: string, code: string): Promise<{ fixed_code: string }> => {
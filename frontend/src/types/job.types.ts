@@ -81,6 +81,18 @@ export interface SectionEdit {
   audio?: string;
 }
 
+export interface SectionTask {
+  task_id: string
+  job_id: string
+  section_id: string
+  status: 'queued' | 'rendering' | 'splicing' | 'completed' | 'failed' | 'cancelled'
+  progress: number
+  message: string
+  video_path?: string | null
+  final_video_updated: boolean
+  error?: string | null
+}
+
 export interface SectionDetails {
   index: number
   id: string